@@ -1,5 +1,6 @@
 """controllers パッケージ"""
 
 from src.app.controllers.game_controller import router as game_router
+from src.app.controllers.metrics_controller import router as metrics_router
 
-__all__ = ["game_router"]
+__all__ = ["game_router", "metrics_router"]
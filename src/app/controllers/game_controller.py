@@ -12,12 +12,18 @@ import traceback
 import asyncio
 import uuid
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
-from rich.pretty import pprint
+from fastapi.responses import JSONResponse, StreamingResponse
+from src.core.log import get_logger
 
-from src.app.schemas.game_responses import GameStartResponse, SpeakRequest
+from src.app.schemas.game_responses import GameStartResponse, JobResponse, SpeakRequest
 from src.app.services.game_service import GameService
+from src.app.services.job_service import job_service
 from src.app.repositories import SessionRepository
+from src.app.executor import game_executor, record_timeout
+from src.app.streaming import stream_game_step
+from src.config.session import GAME_JOB_TIMEOUT, GAME_STEP_TIMEOUT
+
+logger = get_logger("app.controller")
 
 
 router = APIRouter(prefix="/api/game", tags=["game"])
@@ -38,18 +44,18 @@ async def start_game(request: Request):
         try:
             # 新規セッションを作成
             session_id = str(uuid.uuid4())
-            pprint(f"[GameController] New session created: {session_id}")
+            logger.info("New session created: %s", session_id)
 
             # 夜フェーズ開始
-            result = GameService.run_night(session_id=session_id)
-            pprint(f"[GameController] Night response prepared successfully")
+            # 同期処理はワーカープールで実行し、イベントループを塞がない
+            result = await game_executor.run(GameService.run_night, session_id=session_id)
+            logger.debug("Night response prepared successfully")
 
             return session_id, GameStartResponse(session_id=session_id, **result)
 
         except Exception as e:
             error_detail = traceback.format_exc()
-            pprint(f"[GameController] Error occurred: {e}")
-            pprint(f"[GameController] Traceback:\n{error_detail}")
+            logger.exception("Error occurred: %s", e)
 
             raise HTTPException(
                 status_code=500,
@@ -61,7 +67,7 @@ async def start_game(request: Request):
             )
 
     try:
-        session_id, game_response = await asyncio.wait_for(run_game_with_timeout(), timeout=120.0)
+        session_id, game_response = await asyncio.wait_for(run_game_with_timeout(), timeout=GAME_STEP_TIMEOUT)
 
         response = JSONResponse(content=game_response.model_dump())
         response.set_cookie(
@@ -72,11 +78,12 @@ async def start_game(request: Request):
             samesite="lax",
         )
 
-        pprint(f"[GameController] Session cookie set: {session_id}")
+        logger.debug("Session cookie set: %s", session_id)
         return response
 
     except asyncio.TimeoutError:
-        pprint(f"[GameController] Request timeout after 120 seconds")
+        record_timeout(GameService.run_night)
+        logger.warning("Request timeout after %s seconds", GAME_STEP_TIMEOUT)
         raise HTTPException(
             status_code=504,
             detail={
@@ -111,10 +118,10 @@ async def get_game_state(request: Request):
                 },
             )
 
-        pprint(f"[GameController] Retrieving session state: {session_id}")
+        logger.debug("Retrieving session state: %s", session_id)
 
         # Redis からセッション状態を取得
-        result = SessionRepository.get(session_id)
+        result = await game_executor.run(SessionRepository.get, session_id)
 
         if not result:
             raise HTTPException(
@@ -132,8 +139,7 @@ async def get_game_state(request: Request):
         raise
     except Exception as e:
         error_detail = traceback.format_exc()
-        pprint(f"[GameController] Error occurred: {e}")
-        pprint(f"[GameController] Traceback:\n{error_detail}")
+        logger.exception("Error occurred: %s", e)
 
         raise HTTPException(
             status_code=500,
@@ -165,7 +171,9 @@ async def run_day(request: Request, day_steps: int = 1):
                     },
                 )
 
-            result = GameService.run_day(session_id=session_id, day_steps=day_steps)
+            result = await game_executor.run(
+                GameService.run_day, session_id=session_id, day_steps=day_steps
+            )
 
             if not result:
                 raise HTTPException(
@@ -183,8 +191,7 @@ async def run_day(request: Request, day_steps: int = 1):
             raise
         except Exception as e:
             error_detail = traceback.format_exc()
-            pprint(f"[GameController] Error occurred: {e}")
-            pprint(f"[GameController] Traceback:\n{error_detail}")
+            logger.exception("Error occurred: %s", e)
 
             raise HTTPException(
                 status_code=500,
@@ -196,7 +203,7 @@ async def run_day(request: Request, day_steps: int = 1):
             )
 
     try:
-        session_id, game_response = await asyncio.wait_for(run_day_with_timeout(), timeout=120.0)
+        session_id, game_response = await asyncio.wait_for(run_day_with_timeout(), timeout=GAME_STEP_TIMEOUT)
 
         response = JSONResponse(content=game_response.model_dump())
         response.set_cookie(
@@ -209,7 +216,8 @@ async def run_day(request: Request, day_steps: int = 1):
         return response
 
     except asyncio.TimeoutError:
-        pprint(f"[GameController] Request timeout after 120 seconds (day)")
+        record_timeout(GameService.run_day)
+        logger.warning("Request timeout after %s seconds (day)", GAME_STEP_TIMEOUT)
         raise HTTPException(
             status_code=504,
             detail={
@@ -238,10 +246,12 @@ async def add_speak(request: Request, speak_data: SpeakRequest):
                 },
             )
 
-        result = GameService.add_human_speak(
+        result = await game_executor.run(
+            GameService.add_human_speak,
             session_id=session_id,
             player_name=speak_data.player_name,
-            message=speak_data.message
+            message=speak_data.message,
+            timeout=GAME_STEP_TIMEOUT,
         )
 
         if not result:
@@ -267,10 +277,19 @@ async def add_speak(request: Request, speak_data: SpeakRequest):
 
     except HTTPException:
         raise
+    except asyncio.TimeoutError:
+        logger.warning("Request timeout after %s seconds (speak)", GAME_STEP_TIMEOUT)
+        raise HTTPException(
+            status_code=504,
+            detail={
+                "status": "error",
+                "error": "Request timeout",
+                "detail": "Adding the speech took too long to complete.",
+            },
+        )
     except Exception as e:
         error_detail = traceback.format_exc()
-        pprint(f"[GameController] Error occurred: {e}")
-        pprint(f"[GameController] Traceback:\n{error_detail}")
+        logger.exception("Error occurred: %s", e)
 
         raise HTTPException(
             status_code=500,
@@ -280,3 +299,172 @@ async def add_speak(request: Request, speak_data: SpeakRequest):
                 "detail": error_detail,
             },
         )
+
+
+
+# =========================================================
+# バックグラウンドジョブ
+# =========================================================
+# 夜フェーズ / 昼ステップをジョブとして投入し、すぐに 202 を返す。
+# クライアントは GET /jobs/{job_id} で進捗と結果をポーリングする。
+
+
+def _job_response(job: JobResponse, session_id: str) -> JSONResponse:
+    response = JSONResponse(status_code=202, content=job.model_dump())
+    response.set_cookie(
+        key="session_id",
+        value=session_id,
+        max_age=86400,
+        httponly=True,
+        samesite="lax",
+    )
+    return response
+
+
+def _job_not_found(job_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail={
+            "status": "error",
+            "error": "Job not found",
+            "detail": f"Job {job_id} has expired or was not found.",
+        },
+    )
+
+
+@router.post("/jobs/start", response_model=JobResponse, status_code=202)
+async def start_game_job(request: Request):
+    """
+    新規セッションの夜フェーズをバックグラウンドジョブとして投入する。
+    """
+    session_id = str(uuid.uuid4())
+    logger.info("New session created (job): %s", session_id)
+
+    job = job_service.submit(kind="start", session_id=session_id, fn=GameService.run_night)
+    return _job_response(job, session_id)
+
+
+@router.post("/jobs/day", response_model=JobResponse, status_code=202)
+async def run_day_job(request: Request, day_steps: int = 1):
+    """
+    昼フェーズを指定回数だけ進めるジョブを投入する。
+    """
+    session_id = _get_session_id(request)
+    if not session_id:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "status": "error",
+                "error": "No session found",
+                "detail": "Please start a game first (/api/game/jobs/start)",
+            },
+        )
+
+    job = job_service.submit(
+        kind="day",
+        session_id=session_id,
+        fn=GameService.run_day,
+        day_steps=day_steps,
+    )
+    return _job_response(job, session_id)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str):
+    """
+    ジョブの状態・進捗・結果を取得する。
+
+    このワーカーに無いジョブは Redis を同期的に参照するため、
+    async にせずスレッドプールで実行する（イベントループを止めない）。
+    """
+    job = job_service.get(job_id)
+    if job is None:
+        raise _job_not_found(job_id)
+    return job
+
+
+@router.delete("/jobs/{job_id}", response_model=JobResponse)
+def cancel_job(job_id: str):
+    """
+    ジョブに中断要求を出す（次の区切りで中断される）。
+
+    get_job と同じく Redis を参照するため、スレッドプールで実行する。
+    """
+    job = job_service.cancel(job_id)
+    if job is None:
+        raise _job_not_found(job_id)
+    return job
+
+
+# =========================================================
+# ストリーミング（Server-Sent Events）
+# =========================================================
+# ステップ全体の完了を待たずに、公開イベントが確定するたびに送出する。
+# プレイヤーの内部状態は含まないため、完了後に必要なら GET /state で取得する。
+# stream_speech=true の場合、AI の発言テキストも確定前から speech_delta として送出する。
+# レビューで差し替えられた下書きは speech_discard で取り消す（確定内容は speak イベント）。
+#
+# 状態を変更する操作のため POST とする（fetch のストリーム読み出しで受信する）。
+
+
+def _event_stream_response(stream, session_id: str) -> StreamingResponse:
+    response = StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # リバースプロキシによるバッファリングを無効化する
+            "X-Accel-Buffering": "no",
+        },
+    )
+    response.set_cookie(
+        key="session_id",
+        value=session_id,
+        max_age=86400,
+        httponly=True,
+        samesite="lax",
+    )
+    return response
+
+
+@router.post("/start/stream")
+async def start_game_stream(request: Request, stream_speech: bool = True):
+    """
+    新規セッションで夜フェーズを実行し、確定したイベントを逐次送出する。
+    """
+    session_id = str(uuid.uuid4())
+    logger.info("New session created (stream): %s", session_id)
+
+    stream = stream_game_step(
+        GameService.run_night,
+        session_id=session_id,
+        timeout=GAME_JOB_TIMEOUT,
+        stream_speech=stream_speech,
+    )
+    return _event_stream_response(stream, session_id)
+
+
+@router.post("/day/stream")
+async def run_day_stream(request: Request, day_steps: int = 1, stream_speech: bool = True):
+    """
+    昼フェーズを指定回数だけ進め、確定したイベントを逐次送出する。
+    """
+    session_id = _get_session_id(request)
+    if not session_id:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "status": "error",
+                "error": "No session found",
+                "detail": "Please start a game first (/api/game/start)",
+            },
+        )
+
+    stream = stream_game_step(
+        GameService.run_day,
+        session_id=session_id,
+        timeout=GAME_JOB_TIMEOUT,
+        stream_speech=stream_speech,
+        day_steps=day_steps,
+    )
+    return _event_stream_response(stream, session_id)
@@ -0,0 +1,37 @@
+"""
+メトリクスAPI - コントローラー
+
+責務:
+- プロセス内メトリクスレジストリの内容を Prometheus のテキスト形式で返す
+
+公開するメトリクス（主なもの）:
+- llm_call_duration_seconds           LLM 呼び出しの所要時間（用途・モデル・出力スキーマ別）
+- redis_operation_duration_seconds    Redis への保存 / 取得の所要時間
+- session_restore_duration_seconds    セッション復元時間（cache / redis 別）
+- game_active_sessions                ステップ実行中のセッション数
+- game_step_duration_seconds          ステップの所要時間（フェーズ別）
+- game_step_timeouts_total            タイムアウト回数
+- graph_node_duration_seconds         Graph ノードの所要時間
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.core.metrics import format_prometheus, metrics
+
+# Prometheus のテキスト形式（exposition format 0.0.4）
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    現在のメトリクスを Prometheus のテキスト形式で返す。
+    """
+    return PlainTextResponse(
+        format_prometheus(metrics.snapshot()),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
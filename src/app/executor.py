@@ -0,0 +1,108 @@
+"""
+ゲームステップ実行プール
+
+責務:
+- 同期処理である GameService の呼び出しをイベントループの外で実行する
+- 同時実行数を上限で制限する
+- タイムアウト / クライアント切断時に実行中のステップへ中断要求を出す
+- タイムアウトの回数を操作ごとに記録する
+
+設計方針:
+- FastAPI のエンドポイントは async のまま、重い処理はワーカースレッドへ逃がす
+  → 1 つのゲームが実行中でも、他のリクエストはイベントループで処理される
+- スレッドは強制停止できないため、CancellationToken による協調的キャンセルを行う
+  （GameSession はプレイヤーターン / GM ステップの開始時に中断要求を確認する）
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from src.core.log import get_logger
+
+from src.config.session import GAME_EXECUTOR_MAX_WORKERS
+from src.core.cancellation import CancellationToken, StepCancelled, cancellation_scope
+from src.core.metrics import metrics
+
+logger = get_logger("app.executor")
+
+T = TypeVar("T")
+
+metrics.describe("game_step_timeouts_total", "Game operations that exceeded their timeout")
+
+
+def record_timeout(fn: Callable[..., Any]) -> None:
+    """fn の呼び出しがタイムアウトしたことを記録する"""
+    metrics.inc("game_step_timeouts_total", operation=getattr(fn, "__name__", str(fn)))
+
+
+class GameExecutor:
+    """ゲームステップを実行する有界ワーカープール"""
+
+    def __init__(self, max_workers: int = GAME_EXECUTOR_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="game-step",
+        )
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        token: Optional[CancellationToken] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        fn(*args, **kwargs) をワーカースレッドで実行し、結果を待つ。
+
+        - timeout を超えた場合は中断要求を出し、asyncio.TimeoutError を送出する
+        - 呼び出し元のタスクがキャンセルされた場合も中断要求を出す
+        - 中断要求を受けたステップは次の区切りで StepCancelled により終了する
+
+        Parameters
+        ----------
+        token : Optional[CancellationToken]
+            外部から中断要求を出したい場合に渡す（省略時は新規作成）
+        """
+        token = token or CancellationToken()
+        loop = asyncio.get_running_loop()
+
+        # 呼び出し元の contextvars を引き継いだ上で、token を紐づけて実行する
+        context = contextvars.copy_context()
+        call = functools.partial(_run_in_scope, token, fn, *args, **kwargs)
+        future = loop.run_in_executor(self._pool, context.run, call)
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if isinstance(e, asyncio.TimeoutError):
+                record_timeout(fn)
+            token.cancel()
+            logger.info("Cancellation requested for %s", getattr(fn, "__name__", fn))
+            raise
+
+    def shutdown(self) -> None:
+        """実行中のステップを中断せずにプールを閉じる"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_in_scope(
+    token: CancellationToken,
+    fn: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    with cancellation_scope(token):
+        try:
+            return fn(*args, **kwargs)
+        except StepCancelled:
+            logger.info("%s cancelled", getattr(fn, "__name__", fn))
+            raise
+
+
+# --- グローバルに1つだけ ---
+game_executor = GameExecutor()
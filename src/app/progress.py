@@ -0,0 +1,72 @@
+"""
+ゲームステップの進捗通知
+
+責務:
+- 長時間のゲームステップ（夜フェーズ / 複数回の昼ステップ）の進捗を
+  呼び出し元（ジョブなど）へ通知する
+- 公開ログに確定したゲームイベントを、ステップ完了を待たずに
+  呼び出し元（ストリーミング配信など）へ通知する
+
+設計方針:
+- 通知先は contextvars で実行コンテキストに紐づける
+  （GameService のシグネチャを変更せずに、ジョブ実行時のみ通知を受け取れる）
+- 通知先が無い場合（通常の同期 API 呼び出し）は何もしない
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from src.core.types import GameEvent
+
+ProgressCallback = Callable[[int, int], None]
+EventCallback = Callable[[GameEvent], None]
+
+_current_callback: ContextVar[Optional[ProgressCallback]] = ContextVar(
+    "progress_callback", default=None
+)
+_current_event_callback: ContextVar[Optional[EventCallback]] = ContextVar(
+    "event_callback", default=None
+)
+
+
+@contextmanager
+def progress_scope(callback: ProgressCallback) -> Iterator[None]:
+    """
+    with ブロック内の report_progress 呼び出しを callback に通知する。
+    """
+    reset = _current_callback.set(callback)
+    try:
+        yield
+    finally:
+        _current_callback.reset(reset)
+
+
+def report_progress(done: int, total: int) -> None:
+    """
+    進捗（done / total）を通知する。
+    """
+    callback = _current_callback.get()
+    if callback is not None:
+        callback(done, total)
+
+
+@contextmanager
+def event_scope(callback: EventCallback) -> Iterator[None]:
+    """
+    with ブロック内の report_event 呼び出しを callback に通知する。
+    """
+    reset = _current_event_callback.set(callback)
+    try:
+        yield
+    finally:
+        _current_event_callback.reset(reset)
+
+
+def report_event(event: GameEvent) -> None:
+    """
+    公開ログに確定したゲームイベントを通知する。
+    """
+    callback = _current_event_callback.get()
+    if callback is not None:
+        callback(event)
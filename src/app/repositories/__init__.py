@@ -4,8 +4,12 @@
 責務:
 - データ永続化層の抽象化
 - Redis などの外部ストレージとのやり取り
+- 復元済みセッションのプロセス内キャッシュ
+- バックグラウンドジョブ状態の保存
 """
 
 from src.app.repositories.session_repository import SessionRepository
+from src.app.repositories.session_cache import SessionCache, session_cache
+from src.app.repositories.job_repository import JobRepository
 
-__all__ = ["SessionRepository"]
+__all__ = ["SessionRepository", "SessionCache", "session_cache", "JobRepository"]
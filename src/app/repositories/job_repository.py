@@ -0,0 +1,63 @@
+"""
+ジョブリポジトリ
+
+責務:
+- バックグラウンドジョブの状態の Redis への保存/取得
+- 他のワーカーで実行中のジョブもポーリングできるようにする
+"""
+
+from typing import Optional
+from src.core.log import get_logger
+
+from src.app.schemas.game_responses import JobResponse
+from src.config.redis import RedisClient
+from src.core.metrics import metrics
+
+logger = get_logger("app.repository")
+
+
+class JobRepository:
+    """ジョブ状態の永続化を担当するリポジトリ"""
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"game:job:{job_id}"
+
+    @staticmethod
+    @metrics.time("redis_operation_duration_seconds", operation="job_save")
+    def save(job: JobResponse, ttl: int) -> None:
+        """
+        ジョブ状態を Redis に保存（1 往復）
+
+        Redis が利用できない場合でもジョブの実行は続行する。
+        """
+        try:
+            redis_client = RedisClient.get_client()
+            redis_client.setex(JobRepository._key(job.job_id), ttl, job.model_dump_json())
+
+        except Exception as e:
+            metrics.inc("redis_errors_total", operation="job_save")
+            logger.warning("Failed to save job to Redis: %s", e)
+
+    @staticmethod
+    @metrics.time("redis_operation_duration_seconds", operation="job_get")
+    def get(job_id: str) -> Optional[JobResponse]:
+        """
+        Redis からジョブ状態を取得
+
+        Returns
+        -------
+        Optional[JobResponse]
+            ジョブ状態、または存在しない場合は None
+        """
+        try:
+            redis_client = RedisClient.get_client()
+            data = redis_client.get(JobRepository._key(job_id))
+            if not data:
+                return None
+            return JobResponse.model_validate_json(data)
+
+        except Exception as e:
+            metrics.inc("redis_errors_total", operation="job_get")
+            logger.warning("Failed to retrieve job from Redis: %s", e)
+            return None
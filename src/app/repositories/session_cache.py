@@ -0,0 +1,96 @@
+"""
+セッションキャッシュ
+
+責務:
+- 復元済みの GameSession をプロセス内に保持する（LRU）
+- Redis 上の version と照合し、古いセッションを返さない
+
+設計方針:
+- Redis が唯一の永続ストアであり、このキャッシュは Write-through の前段に過ぎない
+  （保存は必ず SessionRepository 経由で行い、成功した場合のみキャッシュに戻す）
+- take は取り出したエントリをキャッシュから外す
+    - 同じセッションへの同時リクエストが 1 つの GameSession を共有しない
+    - ステップ途中で例外が発生しても、中途半端な状態がキャッシュに残らない
+"""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from src.config.session import SESSION_CACHE_SIZE
+from src.core.metrics import metrics
+
+if TYPE_CHECKING:
+    from src.core.session import GameSession
+
+
+class CachedSession:
+    """キャッシュされた GameSession と、その保存時点の cursors"""
+
+    __slots__ = ("session", "cursors")
+
+    def __init__(self, session: "GameSession", cursors: Dict[str, Any]):
+        self.session = session
+        self.cursors = cursors
+
+    @property
+    def version(self) -> int:
+        return self.cursors["version"]
+
+
+class SessionCache:
+    """session_id をキーとする GameSession の LRU キャッシュ"""
+
+    def __init__(self, max_size: int = SESSION_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CachedSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, session_id: str, *, version: Optional[int]) -> Optional[CachedSession]:
+        """
+        version が一致するエントリを取り出す（キャッシュからは削除される）。
+
+        - エントリが無い、または version が一致しない場合は None
+        - version が一致しないエントリは破棄する（他ワーカーが更新済み）
+        """
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+
+            if entry is None or version is None or entry.version != version:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return entry
+
+    def put(self, session_id: str, session: "GameSession", cursors: Dict[str, Any]) -> None:
+        """
+        保存済みのセッションをキャッシュに戻す。
+
+        cursors は SessionRepository.save の戻り値（version を含む）。
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[session_id] = CachedSession(session, cursors)
+            self._entries.move_to_end(session_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# --- グローバルに1つだけ ---
+session_cache = SessionCache()
+
+metrics.describe("session_cache_entries", "Restored sessions held in the in-process cache")
+metrics.gauge_function("session_cache_entries", lambda: len(session_cache))
@@ -4,23 +4,99 @@
 責務:
 - ゲームセッションの Redis への保存/取得
 - データ永続化の詳細を隠蔽
+
+保存形式:
+- game:session:{id}                  (Hash)
+    definition / world_state / player_states / assigned_roles / gm_internal
+    ※ world_state / player_states からはイベントログを除いたもの
+- game:session:{id}:public_events    (List) 公開イベント
+- game:session:{id}:observed_events  (List) 各プレイヤーの観測イベント
+- game:session:{id}:history          (List) 各プレイヤーの履歴
+    ※ プレイヤー別のログは {"player": ..., "item": ...} として 1 つの List に混在させる
+
+イベントログは追記専用のため、前回保存時の件数（cursors）を渡せば
+差分のみを RPUSH する。1 ステップあたりの書き込み量はゲームの長さに依存しない。
+
+Hash の version フィールドは保存のたびに HINCRBY で増加する。
+プロセス内キャッシュ（SessionCache）が保持するセッションが最新かどうかの判定に使う。
+
+各操作の所要時間（シリアライズを含む）と失敗回数は src.core.metrics に記録する。
 """
 
 import json
-from typing import Dict, Any, Optional
-from rich.pretty import pprint
+from typing import Dict, Any, List, Optional
+from src.core.log import get_logger
 
 from src.config.redis import RedisClient
+from src.core.metrics import metrics
+
+logger = get_logger("app.repository")
+
+metrics.describe("redis_operation_duration_seconds", "Wall time of a Redis repository operation")
+metrics.describe("redis_errors_total", "Redis repository operations that failed")
+
+
+# Hash に保存するフィールド
+# 1 セッション = 1 つの Redis Hash（game:session:{session_id}）とし、
+# 各要素を Hash のフィールドとして JSON で保存する
+SNAPSHOT_FIELDS = (
+    "definition",
+    "world_state",
+    "player_states",
+    "assigned_roles",
+    "gm_internal",
+)
+
+# 復元に必須のフィールド（これが欠けていればセッションは存在しないものとする）
+REQUIRED_FIELDS = ("definition", "world_state", "player_states")
+
+# プレイヤー別に List として追記保存するログ（memory 内のフィールド名）
+PLAYER_LOG_FIELDS = ("observed_events", "history")
+
+# cursors:
+#   前回保存時点での version と各ログの件数
+#   {
+#       "version": int,
+#       "public_events": int,
+#       "observed_events": {player: int},
+#       "history": {player: int},
+#   }
+Cursors = Dict[str, Any]
 
 
 class SessionRepository:
     """ゲームセッションの永続化を担当するリポジトリ"""
 
     @staticmethod
-    def save(session_id: str, snapshot: Dict[str, Any], ttl: int = 86400) -> None:
+    def _key(session_id: str) -> str:
+        return f"game:session:{session_id}"
+
+    @staticmethod
+    def _log_keys(session_id: str) -> Dict[str, str]:
+        key = SessionRepository._key(session_id)
+        return {
+            "public_events": f"{key}:public_events",
+            **{field: f"{key}:{field}" for field in PLAYER_LOG_FIELDS},
+        }
+
+    @staticmethod
+    @metrics.time("redis_operation_duration_seconds", operation="session_save")
+    def save(
+        session_id: str,
+        snapshot: Dict[str, Any],
+        ttl: int = 86400,
+        *,
+        cursors: Optional[Cursors] = None,
+    ) -> Optional[Cursors]:
         """
         セッションスナップショットを Redis に保存
 
+        - イベントログ以外は 1 つの Hash に書き込む
+        - イベントログは cursors 以降の差分のみを List に追記する
+        - cursors が None の場合は全体を書き直す（新規セッション）
+        - definition は静的なため、全体書き直し時のみ保存する
+        - 全コマンドを pipeline（MULTI/EXEC）で 1 往復にまとめ、TTL を共有する
+
         Parameters
         ----------
         session_id : str
@@ -29,49 +105,97 @@ class SessionRepository:
             ゲーム結果＋内部状態（assigned_roles / gm_internal を含む）
         ttl : int
             有効期限（秒）、デフォルト: 86400秒（24時間）
+        cursors : Optional[Cursors]
+            前回の get / save が返した cursors
+
+        Returns
+        -------
+        Optional[Cursors]
+            今回保存した時点の cursors（保存に失敗した場合は None）
         """
         try:
             redis_client = RedisClient.get_client()
+            key = SessionRepository._key(session_id)
+            log_keys = SessionRepository._log_keys(session_id)
+
+            # --- イベントログとそれ以外に分離 ---
+            world_state = dict(snapshot["world_state"])
+            public_events = world_state.pop("public_events", [])
+
+            player_states = {}
+            player_logs: Dict[str, Dict[str, List[Any]]] = {
+                field: {} for field in PLAYER_LOG_FIELDS
+            }
+            for player, state in snapshot["player_states"].items():
+                memory = dict(state["memory"])
+                for field in PLAYER_LOG_FIELDS:
+                    player_logs[field][player] = memory.pop(field, [])
+                player_states[player] = {**state, "memory": memory}
 
             # JSON にシリアライズして保存
-            redis_client.setex(
-                f"game:session:{session_id}:definition",
-                ttl,
-                json.dumps(snapshot["definition"], ensure_ascii=False),
-            )
-            redis_client.setex(
-                f"game:session:{session_id}:world_state",
-                ttl,
-                json.dumps(snapshot["world_state"], ensure_ascii=False),
-            )
-            redis_client.setex(
-                f"game:session:{session_id}:player_states",
-                ttl,
-                json.dumps(snapshot["player_states"], ensure_ascii=False),
-            )
+            mapping = {
+                "world_state": json.dumps(world_state, ensure_ascii=False),
+                "player_states": json.dumps(player_states, ensure_ascii=False),
+                "assigned_roles": json.dumps(snapshot.get("assigned_roles"), ensure_ascii=False),
+                "gm_internal": json.dumps(snapshot.get("gm_internal"), ensure_ascii=False),
+            }
 
-            # 内部状態も保存（復元用）
-            redis_client.setex(
-                f"game:session:{session_id}:assigned_roles",
-                ttl,
-                json.dumps(snapshot.get("assigned_roles"), ensure_ascii=False),
-            )
-            redis_client.setex(
-                f"game:session:{session_id}:gm_internal",
-                ttl,
-                json.dumps(snapshot.get("gm_internal"), ensure_ascii=False),
+            pipe = redis_client.pipeline(transaction=True)
+
+            if cursors is None:
+                # 全体書き直し
+                pipe.delete(key, *log_keys.values())
+                mapping["definition"] = json.dumps(snapshot["definition"], ensure_ascii=False)
+
+            pipe.hset(key, mapping=mapping)
+
+            version_index = len(pipe)
+            pipe.hincrby(key, "version", 1)
+
+            SessionRepository._append_log(
+                pipe,
+                log_keys["public_events"],
+                public_events,
+                base=None if cursors is None else cursors["public_events"],
             )
+            for field in PLAYER_LOG_FIELDS:
+                SessionRepository._append_player_log(
+                    pipe,
+                    log_keys[field],
+                    player_logs[field],
+                    base=None if cursors is None else cursors[field],
+                )
+
+            pipe.expire(key, ttl)
+            for log_key in log_keys.values():
+                pipe.expire(log_key, ttl)
+
+            results = pipe.execute()
 
-            pprint(f"[SessionRepository] Session {session_id} saved to Redis (TTL: {ttl}s)")
+            logger.debug("Session %s saved to Redis (TTL: %ss)", session_id, ttl)
+
+            return {
+                "version": int(results[version_index]),
+                "public_events": len(public_events),
+                **{
+                    field: {player: len(items) for player, items in logs.items()}
+                    for field, logs in player_logs.items()
+                },
+            }
 
         except Exception as e:
-            pprint(f"[SessionRepository] Failed to save session to Redis: {e}")
+            metrics.inc("redis_errors_total", operation="session_save")
+            logger.warning("Failed to save session to Redis: %s", e)
             # Redis が利用できない場合でもゲームは続行
+            return None
 
     @staticmethod
+    @metrics.time("redis_operation_duration_seconds", operation="session_get")
     def get(session_id: str) -> Optional[Dict[str, Any]]:
         """
-        Redis からセッションスナップショットを取得
+        Redis からセッションスナップショットを取得（pipeline による 1 往復）
+
+        戻り値には、次回の差分保存に使う "cursors" が含まれる。
 
         Parameters
         ----------
@@ -85,32 +209,143 @@ class SessionRepository:
         """
         try:
             redis_client = RedisClient.get_client()
+            log_keys = SessionRepository._log_keys(session_id)
 
-            definition = redis_client.get(f"game:session:{session_id}:definition")
-            world_state = redis_client.get(f"game:session:{session_id}:world_state")
-            player_states = redis_client.get(f"game:session:{session_id}:player_states")
-            assigned_roles = redis_client.get(f"game:session:{session_id}:assigned_roles")
-            gm_internal = redis_client.get(f"game:session:{session_id}:gm_internal")
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.hgetall(SessionRepository._key(session_id))
+            for log_key in log_keys.values():
+                pipe.lrange(log_key, 0, -1)
+            stored, *raw_logs = pipe.execute()
 
-            if not (definition and world_state and player_states):
-                pprint(f"[SessionRepository] Session {session_id} not found in Redis")
+            if not all(stored.get(field) for field in REQUIRED_FIELDS):
+                logger.info("Session %s not found in Redis", session_id)
                 return None
 
             result = {
-                "definition": json.loads(definition),
-                "world_state": json.loads(world_state),
-                "player_states": json.loads(player_states),
+                field: json.loads(stored[field])
+                for field in REQUIRED_FIELDS
             }
 
             # 追加の内部情報（再開専用）
-            if assigned_roles:
-                result["assigned_roles"] = json.loads(assigned_roles)
-            if gm_internal:
-                result["gm_internal"] = json.loads(gm_internal)
+            for field in SNAPSHOT_FIELDS:
+                if field in result or not stored.get(field):
+                    continue
+                value = json.loads(stored[field])
+                if value is not None:
+                    result[field] = value
 
-            pprint(f"[SessionRepository] Session {session_id} retrieved from Redis")
+            # --- イベントログを戻す ---
+            logs = dict(zip(log_keys, raw_logs))
+
+            public_events = [json.loads(e) for e in logs["public_events"]]
+            result["world_state"]["public_events"] = public_events
+
+            cursors: Cursors = {
+                "version": int(stored.get("version", 0)),
+                "public_events": len(public_events),
+            }
+            for field in PLAYER_LOG_FIELDS:
+                per_player: Dict[str, List[Any]] = {
+                    player: [] for player in result["player_states"]
+                }
+                for raw in logs[field]:
+                    entry = json.loads(raw)
+                    per_player.setdefault(entry["player"], []).append(entry["item"])
+
+                for player, state in result["player_states"].items():
+                    state["memory"][field] = per_player[player]
+                cursors[field] = {player: len(items) for player, items in per_player.items()}
+
+            result["cursors"] = cursors
+
+            logger.debug("Session %s retrieved from Redis", session_id)
             return result
 
         except Exception as e:
-            pprint(f"[SessionRepository] Failed to retrieve session from Redis: {e}")
+            metrics.inc("redis_errors_total", operation="session_get")
+            logger.warning("Failed to retrieve session from Redis: %s", e)
+            return None
+
+    @staticmethod
+    @metrics.time("redis_operation_duration_seconds", operation="session_get_version")
+    def get_version(session_id: str) -> Optional[int]:
+        """
+        保存済みセッションの version を取得する（HGET の 1 往復）
+
+        Returns
+        -------
+        Optional[int]
+            version、またはセッションが存在しない / 取得に失敗した場合は None
+        """
+        try:
+            redis_client = RedisClient.get_client()
+            version = redis_client.hget(SessionRepository._key(session_id), "version")
+            return int(version) if version is not None else None
+
+        except Exception as e:
+            metrics.inc("redis_errors_total", operation="session_get_version")
+            logger.warning("Failed to retrieve session version from Redis: %s", e)
             return None
+
+    @staticmethod
+    def _append_log(pipe, key: str, items: List[Any], *, base: Optional[int]) -> None:
+        """
+        List に base 件目以降の要素を JSON にして追記する。
+
+        base が None の場合は全件を書き直す。
+        JSON へのシリアライズは追記する要素のみに行う（ゲームが長くなってもコストが増えない）。
+        """
+        if base is not None and len(items) < base:
+            # 追記専用の前提が崩れている → 全体を書き直す
+            base = None
+
+        new_items = [
+            json.dumps(item, ensure_ascii=False)
+            for item in (items if base is None else items[base:])
+        ]
+        SessionRepository._push(pipe, key, new_items, base=base)
+
+    @staticmethod
+    def _append_player_log(
+        pipe,
+        key: str,
+        logs: Dict[str, List[Any]],
+        *,
+        base: Optional[Dict[str, int]],
+    ) -> None:
+        """
+        プレイヤー別ログを 1 つの List に差分追記する。
+
+        各プレイヤーのログは追記専用のため、
+        「List の先頭 sum(base) 件 = 前回保存分」が成り立つ。
+        """
+        if base is not None and any(
+            len(logs.get(player, [])) < count for player, count in base.items()
+        ):
+            # 追記専用の前提が崩れている → 全体を書き直す
+            base = None
+
+        new_items = [
+            json.dumps({"player": player, "item": item}, ensure_ascii=False)
+            for player, items in logs.items()
+            for item in items[(base or {}).get(player, 0):]
+        ]
+        total = None if base is None else sum(base.values())
+        SessionRepository._push(pipe, key, new_items, base=total)
+
+    @staticmethod
+    def _push(pipe, key: str, new_items: List[str], *, base: Optional[int]) -> None:
+        """
+        List を先頭 base 件に揃えてから new_items を追記する。
+
+        - base が None / 0 の場合は List を作り直す
+        - LTRIM で先に base 件に揃えるため、同じ base からの保存を
+          繰り返しても要素が重複しない（後勝ち）
+        """
+        if not base:
+            pipe.delete(key)
+        else:
+            pipe.ltrim(key, 0, base - 1)
+
+        if new_items:
+            pipe.rpush(key, *new_items)
@@ -1,5 +1,10 @@
 """schemas パッケージ"""
 
-from src.app.schemas.game_responses import GameStartResponse, SpeakRequest
+from src.app.schemas.game_responses import (
+    GameStartResponse,
+    SpeakRequest,
+    JobResponse,
+    JobStatus,
+)
 
-__all__ = ["GameStartResponse", "SpeakRequest"]
+__all__ = ["GameStartResponse", "SpeakRequest", "JobResponse", "JobStatus"]
@@ -6,7 +6,7 @@
 - Pydantic BaseModel を用いた型安全性の確保
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Literal, Optional
 from pydantic import BaseModel
 
 
@@ -22,3 +22,20 @@ class SpeakRequest(BaseModel):
     """発言投稿リクエスト"""
     player_name: str
     message: str
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class JobResponse(BaseModel):
+    """バックグラウンドジョブの状態"""
+    job_id: str
+    kind: str
+    session_id: str
+    status: JobStatus
+    progress_done: int = 0
+    progress_total: int = 0
+    # status == "succeeded" の場合のみ設定される
+    result: Optional[GameStartResponse] = None
+    # status == "failed" の場合のみ設定される
+    error: Optional[str] = None
@@ -94,6 +94,7 @@ class GameSerializer:
                 ),
                 "log_summary": memory.log_summary,
                 "last_summarized_event_index": memory.last_summarized_event_index,
+                "last_belief_event_index": memory.last_belief_event_index,
             },
             "input": {
                 "request": (
@@ -127,7 +128,7 @@ class GameSerializer:
     def deserialize_game_definition(data: Dict[str, Any]) -> GameDefinition:
         """辞書から GameDefinition を復元"""
         roles = {
-            name: RoleDefinition(**role_def)
+            name: RoleDefinition(**{"name": name, **role_def})
             for name, role_def in data.get("roles", {}).items()
         }
         return GameDefinition(
@@ -173,6 +174,7 @@ class GameSerializer:
             strategy_plan=strategy_plan,
             log_summary=memory_data.get("log_summary", ""),
             last_summarized_event_index=memory_data.get("last_summarized_event_index", 0),
+            last_belief_event_index=memory_data.get("last_belief_event_index", 0),
             milestone_status=memory_data.get("milestone_status"),
             policy_weights=memory_data.get("policy_weights"),
         )
@@ -1,5 +1,6 @@
 """services パッケージ"""
 
 from src.app.services.game_service import GameService
+from src.app.services.job_service import JobService, job_service
 
-__all__ = ["GameService"]
+__all__ = ["GameService", "JobService", "job_service"]
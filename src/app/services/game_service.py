@@ -5,10 +5,14 @@
 - ゲームセッションの実行オーケストレーション
 - 夜/昼フェーズの進行制御
 - セッション復元と状態管理の調整
+- プロセス内セッションキャッシュ（SessionCache）と Redis の整合管理
+- セッション復元時間・実行中セッション数・ステップ所要時間の記録
 """
 
-from typing import Dict, Any, Optional
-from rich.pretty import pprint
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, Tuple
+from src.core.log import get_logger
 
 from src.core.session import GameSession
 from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
@@ -16,8 +20,18 @@ from src.graphs.gm.gm_graph import gm_graph
 from src.graphs.player.player_graph import player_graph
 from src.core.controller import AIPlayerController, PlayerController
 from src.core.types import GameEvent
+from src.core.cancellation import StepCancelled, raise_if_cancelled
+from src.core.instrumentation import session_scope
+from src.core.metrics import metrics
+from src.app.progress import report_event, report_progress
 from src.app.serializers import GameSerializer
-from src.app.repositories import SessionRepository
+from src.app.repositories import SessionRepository, session_cache
+
+logger = get_logger("app.service")
+
+metrics.describe("session_restore_duration_seconds", "Time to load a session from cache or Redis")
+metrics.describe("game_active_sessions", "Sessions with a game step in progress")
+metrics.describe("game_step_duration_seconds", "Wall time of a night phase or day step by phase")
 
 
 class GameService:
@@ -91,6 +105,111 @@ class GameService:
             gm_internal=gm_internal,
         )
 
+    @staticmethod
+    def _load_session(session_id: str) -> Optional[Tuple[GameSession, Optional[Dict[str, Any]]]]:
+        """
+        セッションを取得する（キャッシュ優先）。
+
+        - プロセス内キャッシュの version が Redis と一致すれば、それをそのまま使う
+        - 一致しなければ Redis のスナップショットから復元する
+
+        Returns
+        -------
+        Optional[Tuple[GameSession, Optional[Dict[str, Any]]]]
+            (session, cursors)、またはセッションが存在しない場合は None
+        """
+        started = time.perf_counter()
+
+        version = SessionRepository.get_version(session_id)
+        cached = session_cache.take(session_id, version=version)
+        if cached is not None:
+            logger.debug("Session %s restored from cache (version %s)", session_id, version)
+            metrics.observe(
+                "session_restore_duration_seconds", time.perf_counter() - started, source="cache"
+            )
+            return cached.session, cached.cursors
+
+        snapshot = SessionRepository.get(session_id)
+        if not snapshot:
+            return None
+
+        session = GameService.restore_session(snapshot)
+        metrics.observe(
+            "session_restore_duration_seconds", time.perf_counter() - started, source="redis"
+        )
+        return session, snapshot.get("cursors")
+
+    @staticmethod
+    def _save_session(
+        session_id: str,
+        session: GameSession,
+        cursors: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        セッションを Redis に保存し（Write-through）、成功すればキャッシュに戻す。
+
+        cursors を渡した場合は、前回保存以降のイベントログのみを追記する。
+
+        Returns
+        -------
+        Dict[str, Any]
+            クライアント返却用ペイロード
+        """
+        response_payload, snapshot = GameService._build_payload_and_snapshot(session)
+
+        new_cursors = SessionRepository.save(session_id, snapshot, cursors=cursors)
+        if new_cursors is not None:
+            session_cache.put(session_id, session, new_cursors)
+
+        return response_payload
+
+    @staticmethod
+    @contextmanager
+    def _publishing_events(session: GameSession) -> Iterator[None]:
+        """
+        with ブロック内で確定した公開イベントを report_event へ流す。
+
+        セッションはキャッシュ経由で再利用されるため、
+        ブロックを抜けたら必ず通知先を解除する。
+        """
+        session.add_event_listener(report_event)
+        try:
+            yield
+        finally:
+            session.remove_event_listener(report_event)
+
+    @staticmethod
+    @contextmanager
+    def _active_session(session_id: str) -> Iterator[None]:
+        """with ブロックの間、セッションを実行中として数え、計測値をセッションに紐づける"""
+        metrics.add_gauge("game_active_sessions", 1)
+        try:
+            with session_scope(session_id):
+                yield
+        finally:
+            metrics.add_gauge("game_active_sessions", -1)
+
+    @staticmethod
+    @contextmanager
+    def _timed_step(session: GameSession) -> Iterator[None]:
+        """with ブロックを、開始時点のフェーズの 1 ステップとして所要時間を記録する"""
+        phase = session.world_state.phase
+        started = time.perf_counter()
+        status = "error"
+        try:
+            yield
+            status = "ok"
+        except StepCancelled:
+            status = "cancelled"
+            raise
+        finally:
+            metrics.observe(
+                "game_step_duration_seconds",
+                time.perf_counter() - started,
+                phase=phase,
+                status=status,
+            )
+
     @staticmethod
     def run_night(session_id: str) -> Dict[str, Any]:
         """
@@ -98,13 +217,15 @@ class GameService:
         """
         session = GameSession.create(definition=ONE_NIGHT_GAME_DEFINITION)
 
-        pprint(f"[GameService] Running night phase...")
-        session.run_night_phase()
-        pprint(f"[GameService] Night phase completed")
+        logger.debug("Running night phase...")
+        report_progress(0, 1)
+        with GameService._active_session(session_id), GameService._publishing_events(session):
+            with GameService._timed_step(session):
+                session.run_night_phase()
+        report_progress(1, 1)
+        logger.info("Night phase completed")
 
-        response_payload, snapshot = GameService._build_payload_and_snapshot(session)
-        SessionRepository.save(session_id, snapshot)
-        return response_payload
+        return GameService._save_session(session_id, session)
 
 
     @staticmethod
@@ -112,24 +233,28 @@ class GameService:
         """
         Redis に保存されたセッションを復元し、昼フェーズを指定回数実行して保存する。
         """
-        snapshot = SessionRepository.get(session_id)
-        if not snapshot:
+        loaded = GameService._load_session(session_id)
+        if loaded is None:
             return None
 
-        session = GameService.restore_session(snapshot)
+        session, cursors = loaded
 
-        # 必要なら昼に入る前の夜をスキップ/実行
-        if session.world_state.phase == "night":
-            session.run_night_phase()
+        with GameService._active_session(session_id), GameService._publishing_events(session):
+            # 必要なら昼に入る前の夜をスキップ/実行
+            if session.world_state.phase == "night":
+                with GameService._timed_step(session):
+                    session.run_night_phase()
 
-        pprint(f"[GameService] Running {day_steps} day steps...")
-        for i in range(day_steps):
-            pprint(f"[GameService] Day step {i+1}/{day_steps}")
-            session.run_day_step()
+            logger.debug("Running %d day steps...", day_steps)
+            for i in range(day_steps):
+                # 中断要求（タイムアウトなど）があれば、次のステップに入らずに打ち切る
+                raise_if_cancelled()
+                logger.debug("Day step %d/%d", i + 1, day_steps)
+                with GameService._timed_step(session):
+                    session.run_day_step()
+                report_progress(i + 1, day_steps)
 
-        response_payload, snapshot = GameService._build_payload_and_snapshot(session)
-        SessionRepository.save(session_id, snapshot)
-        return response_payload
+        return GameService._save_session(session_id, session, cursors)
 
     @staticmethod
     def add_human_speak(session_id: str, player_name: str, message: str) -> Optional[Dict[str, Any]]:
@@ -150,11 +275,11 @@ class GameService:
         Optional[Dict[str, Any]]
             更新後のゲーム状態、またはセッションが存在しない場合は None
         """
-        snapshot = SessionRepository.get(session_id)
-        if not snapshot:
+        loaded = GameService._load_session(session_id)
+        if loaded is None:
             return None
 
-        session = GameService.restore_session(snapshot)
+        session, cursors = loaded
 
         # 発言イベントを作成
         speak_event = GameEvent(
@@ -166,14 +291,13 @@ class GameService:
         )
 
         # public_events に追加（全員に共有）
-        session.world_state.public_events.append(speak_event)
+        with GameService._publishing_events(session):
+            session.commit_public_events([speak_event])
 
         # 各プレイヤーの observed_events にも追加
         for player, state in session.player_states.items():
             state["memory"].observed_events.append(speak_event)
 
-        pprint(f"[GameService] Human speak added: {player_name}: {message}")
+        logger.info("Human speak added: %s: %s", player_name, message)
 
-        response_payload, snapshot = GameService._build_payload_and_snapshot(session)
-        SessionRepository.save(session_id, snapshot)
-        return response_payload
+        return GameService._save_session(session_id, session, cursors)
@@ -0,0 +1,202 @@
+"""
+バックグラウンドジョブサービス
+
+責務:
+- 夜フェーズ / 昼ステップをバックグラウンドジョブとして実行する
+- ジョブの状態（待機中 / 実行中 / 完了 / 失敗 / 中断）と進捗を管理する
+- ジョブ状態を Redis に保存し、別ワーカーからもポーリング可能にする
+
+設計方針:
+- ジョブはイベントループ上のタスクとして管理し、実処理は GameExecutor で実行する
+  （同時実行数の上限はリクエスト実行と共有する）
+- HTTP 接続はジョブ投入時にすぐ返すため、長いゲームでも 504 にならない
+- 中断は CancellationToken による協調的キャンセル
+- Redis への保存・参照はイベントループ上で行わない
+  （ジョブのタスクからは asyncio.to_thread 経由、get / cancel はスレッドプールから呼ぶ）
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from src.core.log import get_logger
+
+from src.app.executor import GameExecutor, game_executor
+from src.app.progress import progress_scope
+from src.app.repositories import JobRepository
+from src.app.schemas.game_responses import GameStartResponse, JobResponse
+from src.config.session import GAME_JOB_TIMEOUT, GAME_JOB_TTL
+from src.core.cancellation import CancellationToken, StepCancelled
+
+logger = get_logger("app.job")
+
+
+class JobService:
+    """バックグラウンドジョブの投入・状態管理を担当するサービス"""
+
+    def __init__(
+        self,
+        executor: GameExecutor = game_executor,
+        *,
+        timeout: float = GAME_JOB_TIMEOUT,
+        ttl: int = GAME_JOB_TTL,
+    ):
+        self.executor = executor
+        self.timeout = timeout
+        self.ttl = ttl
+
+        self._jobs: Dict[str, JobResponse] = {}
+        self._tokens: Dict[str, CancellationToken] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._finished_at: Dict[str, float] = {}
+        # 進捗はワーカースレッドから更新されるため、状態の更新はロック下で行う
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        *,
+        kind: str,
+        session_id: str,
+        fn: Callable[..., Optional[Dict[str, Any]]],
+        **kwargs: Any,
+    ) -> JobResponse:
+        """
+        ジョブを投入し、すぐに状態（queued）を返す。
+
+        イベントループ上（async エンドポイント内）から呼び出すこと。
+        queued 状態の Redis への保存は、ジョブのタスク内でイベントループの外で行う。
+
+        Parameters
+        ----------
+        kind : str
+            ジョブの種類（"start" / "day" など）
+        session_id : str
+            対象のセッション ID
+        fn : Callable
+            GameService のメソッド（レスポンスペイロード、または None を返す）。
+            fn(session_id=session_id, **kwargs) として呼び出される。
+        """
+        self._prune()
+
+        job = JobResponse(
+            job_id=str(uuid.uuid4()),
+            kind=kind,
+            session_id=session_id,
+            status="queued",
+        )
+        token = CancellationToken()
+
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._tokens[job.job_id] = token
+
+        task = asyncio.get_running_loop().create_task(
+            self._run(job.job_id, token, fn, {"session_id": session_id, **kwargs})
+        )
+        # タスクへの参照を保持しないと GC される可能性がある
+        self._tasks[job.job_id] = task
+
+        logger.info("Job %s (%s) queued for session %s", job.job_id, kind, session_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[JobResponse]:
+        """
+        ジョブ状態を取得する（このワーカーに無ければ Redis を参照）。
+
+        Redis を同期的に参照するため、イベントループ上では呼ばないこと。
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        return JobRepository.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[JobResponse]:
+        """
+        ジョブに中断要求を出す。
+
+        - 実行中のジョブは次の区切りで中断され、status が "cancelled" になる
+        - このワーカーで実行されていないジョブは中断できない（状態のみ返す）
+        """
+        with self._lock:
+            token = self._tokens.get(job_id)
+        if token is not None:
+            token.cancel()
+            logger.info("Cancellation requested for job %s", job_id)
+        return self.get(job_id)
+
+    async def _run(
+        self,
+        job_id: str,
+        token: CancellationToken,
+        fn: Callable[..., Optional[Dict[str, Any]]],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """ジョブ本体（イベントループ上のタスク）"""
+
+        def on_progress(done: int, total: int) -> None:
+            self._update(job_id, progress_done=done, progress_total=total)
+
+        try:
+            await self._aupdate(job_id)
+
+            if token.cancelled:
+                raise StepCancelled("Job was cancelled before start")
+
+            await self._aupdate(job_id, status="running")
+
+            # progress_scope はこのタスクのコンテキストに設定され、
+            # GameExecutor がワーカースレッドへ引き継ぐ
+            with progress_scope(on_progress):
+                result = await self.executor.run(
+                    fn, timeout=self.timeout, token=token, **kwargs
+                )
+
+            session_id = kwargs["session_id"]
+            if not result:
+                await self._aupdate(job_id, status="failed", error=f"Session {session_id} was not found")
+            else:
+                await self._aupdate(
+                    job_id,
+                    status="succeeded",
+                    result=GameStartResponse(session_id=session_id, **result),
+                )
+
+        except StepCancelled:
+            await self._aupdate(job_id, status="cancelled")
+        except asyncio.TimeoutError:
+            await self._aupdate(job_id, status="failed", error=f"Job timed out after {self.timeout} seconds")
+        except Exception as e:
+            logger.error("Job %s failed: %s", job_id, e)
+            await self._aupdate(job_id, status="failed", error=str(e))
+        finally:
+            self._tasks.pop(job_id, None)
+            with self._lock:
+                self._tokens.pop(job_id, None)
+                self._finished_at[job_id] = time.monotonic()
+
+    def _update(self, job_id: str, **changes: Any) -> None:
+        """ジョブ状態を更新し、Redis に保存する（進捗通知ではワーカースレッドから呼ばれる）"""
+        with self._lock:
+            job = self._jobs[job_id].model_copy(update=changes)
+            self._jobs[job_id] = job
+        JobRepository.save(job, self.ttl)
+
+    async def _aupdate(self, job_id: str, **changes: Any) -> None:
+        """_update の非同期版（Redis への保存をイベントループの外で行う）"""
+        await asyncio.to_thread(self._update, job_id, **changes)
+
+    def _prune(self) -> None:
+        """保持期間を過ぎた完了済みジョブをメモリから削除する"""
+        deadline = time.monotonic() - self.ttl
+        with self._lock:
+            expired = [j for j, t in self._finished_at.items() if t < deadline]
+            for job_id in expired:
+                self._finished_at.pop(job_id, None)
+                self._jobs.pop(job_id, None)
+
+
+# --- グローバルに1つだけ ---
+job_service = JobService()
@@ -0,0 +1,169 @@
+"""
+ゲームイベントのストリーミング配信（Server-Sent Events）
+
+責務:
+- ゲームステップをワーカープールで実行しながら、
+  公開ログに確定したイベントを 1 件ずつ SSE 形式で送出する
+- AI プレイヤーの発言テキストを、確定前から差分（speech_delta）として送出する
+- 送出済みの下書きがレビューで差し替えられた場合は、speech_discard を送出する
+- ステップ完了 / 失敗を終端イベントとして送出する
+
+設計方針:
+- GameService のシグネチャは変更せず、event_scope で通知先を実行コンテキストに紐づける
+- イベントはワーカースレッドで確定するため、call_soon_threadsafe でイベントループへ渡す
+- 配信するのは公開イベントと発言の差分のみ（プレイヤーの内部状態は含めない）
+- speech_delta は表示用の先行配信であり、確定内容は後続の speak イベントが正とする
+  （speech_discard を受け取ったら、その player の差分の表示を破棄する）
+- クライアントが切断した場合は、実行中のステップに中断要求を出す
+"""
+
+import asyncio
+import contextlib
+import json
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from src.core.log import get_logger
+
+from src.app.executor import GameExecutor, game_executor
+from src.app.progress import event_scope
+from src.core.cancellation import CancellationToken, StepCancelled
+from src.core.speech_stream import speech_stream_scope
+from src.core.types import GameEvent
+
+logger = get_logger("app.streaming")
+
+# ステップ終了を表す番兵
+_DONE = object()
+
+
+class _SpeechDelta:
+    """キュー上で GameEvent と区別するための発言差分"""
+
+    __slots__ = ("player", "delta")
+
+    def __init__(self, player: str, delta: str):
+        self.player = player
+        self.delta = delta
+
+
+class _SpeechDiscard:
+    """キュー上で GameEvent と区別するための下書きの取り消し"""
+
+    __slots__ = ("player",)
+
+    def __init__(self, player: str):
+        self.player = player
+
+
+def format_sse(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    """
+    1 件の SSE メッセージを組み立てる。
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_game_step(
+    fn: Callable[..., Optional[Dict[str, Any]]],
+    *,
+    session_id: str,
+    timeout: Optional[float] = None,
+    stream_speech: bool = True,
+    executor: GameExecutor = game_executor,
+    **kwargs: Any,
+) -> AsyncIterator[str]:
+    """
+    fn(session_id=session_id, **kwargs) を実行し、確定したイベントを順に送出する。
+
+    送出されるイベント:
+    - event: <event_type>（gm_comment / speak / vote / game_end など）
+      data: {"event_type": ..., "payload": ...}
+    - event: speech_delta（stream_speech=True の場合のみ、id なし）
+      data: {"player": ..., "delta": ...}
+    - event: speech_discard（stream_speech=True の場合のみ、id なし）
+      data: {"player": ...}
+    - event: done
+      data: {"session_id": ..., "phase": ...}
+    - event: error
+      data: {"error": ..., "detail": ...}
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    token = CancellationToken()
+
+    def on_event(event: GameEvent) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    def on_speech_delta(player: str, delta: str) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, _SpeechDelta(player, delta))
+
+    def on_speech_discard(player: str) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, _SpeechDiscard(player))
+
+    # create_task は現在のコンテキストを複製するため、
+    # 通知先がワーカースレッド（プレイヤーターンを含む）まで引き継がれる
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(event_scope(on_event))
+        if stream_speech:
+            stack.enter_context(speech_stream_scope(on_speech_delta, on_speech_discard))
+        task = asyncio.create_task(
+            executor.run(fn, session_id=session_id, timeout=timeout, token=token, **kwargs)
+        )
+    # イベントの通知はステップ完了より先にループへ積まれるため、番兵は必ず最後に届く
+    task.add_done_callback(lambda _task: queue.put_nowait(_DONE))
+
+    sequence = 0
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _SpeechDelta):
+                yield format_sse("speech_delta", {"player": item.player, "delta": item.delta})
+                continue
+            if isinstance(item, _SpeechDiscard):
+                yield format_sse("speech_discard", {"player": item.player})
+                continue
+            sequence += 1
+            yield format_sse(item.event_type, item.model_dump(), sequence)
+
+        try:
+            result = task.result()
+        except StepCancelled:
+            yield format_sse("error", {"error": "Cancelled", "detail": "The game step was cancelled."})
+            return
+        except asyncio.TimeoutError:
+            yield format_sse(
+                "error",
+                {"error": "Request timeout", "detail": f"The game step took longer than {timeout} seconds."},
+            )
+            return
+        except Exception as e:
+            logger.exception("Error occurred: %s", e)
+            yield format_sse("error", {"error": "Internal error", "detail": str(e)})
+            return
+
+        if not result:
+            yield format_sse(
+                "error",
+                {
+                    "error": "Session not found",
+                    "detail": f"Session {session_id} has expired or was not found. Please start a new game.",
+                },
+            )
+            return
+
+        yield format_sse(
+            "done",
+            {"session_id": session_id, "phase": result["world_state"]["phase"]},
+        )
+
+    finally:
+        # クライアント切断などでジェネレータが途中で閉じられた場合
+        if not task.done():
+            token.cancel()
+            logger.info("Client disconnected; cancelling session %s", session_id)
@@ -0,0 +1,232 @@
+"""
+ヘッドレス一括対戦ランナー
+
+責務:
+- Redis / HTTP を介さずに、ゲームを最初から最後まで（夜 → 昼 → 投票 → 結果）実行する
+- 複数のゲームを同時実行数の上限付きで並行実行する
+- 1 ゲーム 1 行の結果ファイル（JSON Lines）に集計値を出力する
+
+用途:
+- 戦略・プロンプト変更の効果を、数百ゲーム単位の勝率などで評価する
+
+使い方:
+    python -m src.batch_runner --games 100 --concurrency 8 --output results.jsonl
+
+Python API:
+    from src.batch_runner import run_games
+    records = run_games(10, concurrency=4)
+"""
+
+import argparse
+import json
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from langchain_core.callbacks import get_usage_metadata_callback
+from pydantic import BaseModel, Field
+
+from src.core.instrumentation import session_scope
+from src.core.log import configure_logging
+from src.core.session import GameSession
+from src.core.types import GameDefinition
+from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
+
+# 1 ゲームあたりの GM ステップ数の上限（進行が止まった場合の安全装置）
+DEFAULT_MAX_STEPS = 60
+
+
+class TokenUsage(BaseModel):
+    """1 ゲームで消費したトークン数（全モデルの合計）"""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+
+
+class GameRecord(BaseModel):
+    """1 ゲーム分の結果（結果ファイルの 1 行）"""
+
+    game_id: str
+    seed: Optional[int] = None
+    winner: Optional[str] = None
+    executed_players: List[str] = Field(default_factory=list)
+    roles: Dict[str, str] = Field(default_factory=dict)
+    # フェーズごとの GM ステップ数（例: {"night": 1, "day": 12, "vote": 2, "result": 1}）
+    turns: Dict[str, int] = Field(default_factory=dict)
+    speeches: int = 0
+    latency_sec: float = 0.0
+    tokens: TokenUsage = Field(default_factory=TokenUsage)
+    # 失敗した場合のみ設定される
+    error: Optional[str] = None
+
+
+def _run_phase_step(session: GameSession) -> None:
+    """現在のフェーズに応じて GM ステップを 1 回実行する"""
+    phase = session.world_state.phase
+    if phase == "night":
+        session.run_night_phase()
+    elif phase == "day":
+        session.run_day_step()
+    elif phase == "vote":
+        session.run_vote_step()
+    elif phase == "result":
+        session.run_result_step()
+    else:
+        raise ValueError(f"Unknown phase: {phase}")
+
+
+def _sum_usage(usage_metadata: dict) -> TokenUsage:
+    usage = TokenUsage()
+    for metadata in usage_metadata.values():
+        usage.input_tokens += metadata.get("input_tokens", 0)
+        usage.output_tokens += metadata.get("output_tokens", 0)
+        usage.total_tokens += metadata.get("total_tokens", 0)
+    return usage
+
+
+def run_game(
+    game_id: Optional[str] = None,
+    *,
+    seed: Optional[int] = None,
+    definition: GameDefinition = ONE_NIGHT_GAME_DEFINITION,
+    max_steps: int = DEFAULT_MAX_STEPS,
+) -> GameRecord:
+    """
+    1 ゲームを最後まで実行し、結果を返す。
+
+    seed を指定した場合、役職配布はシードのみで決まる。
+    例外は送出せず、GameRecord.error に記録する（他のゲームの実行は止めない）。
+    """
+    record = GameRecord(game_id=game_id or str(uuid.uuid4()), seed=seed)
+    turns: Counter = Counter()
+    started = time.perf_counter()
+
+    # ゲーム内のすべての LLM 呼び出し（プレイヤーターンのワーカースレッドを含む）の
+    # トークン使用量を集計する
+    # ノード・LLM 呼び出しの計測はゲーム ID をセッションとして集計する
+    with session_scope(record.game_id), get_usage_metadata_callback() as usage_callback:
+        try:
+            session = GameSession.create(definition=definition, seed=seed)
+
+            while session.world_state.result is None:
+                if sum(turns.values()) >= max_steps:
+                    raise RuntimeError(f"Game did not finish within {max_steps} steps")
+                turns[session.world_state.phase] += 1
+                _run_phase_step(session)
+
+            result = session.world_state.result
+            record.winner = result.winner
+            record.executed_players = list(result.executed_players)
+            record.roles = dict(result.roles)
+            record.speeches = sum(
+                1 for event in session.world_state.public_events if event.event_type == "speak"
+            )
+
+        except Exception as e:
+            record.error = f"{type(e).__name__}: {e}"
+
+        record.tokens = _sum_usage(usage_callback.usage_metadata)
+
+    record.turns = dict(turns)
+    record.latency_sec = round(time.perf_counter() - started, 3)
+    return record
+
+
+def run_games(
+    n_games: int,
+    *,
+    concurrency: int = 4,
+    base_seed: Optional[int] = None,
+    definition: GameDefinition = ONE_NIGHT_GAME_DEFINITION,
+    max_steps: int = DEFAULT_MAX_STEPS,
+    on_record: Optional[Callable[[GameRecord], None]] = None,
+) -> List[GameRecord]:
+    """
+    n_games 個のゲームを最大 concurrency 並列で実行する。
+
+    Parameters
+    ----------
+    base_seed : Optional[int]
+        指定した場合、i 番目のゲームのシードは base_seed + i となる
+    on_record : Optional[Callable[[GameRecord], None]]
+        ゲームが終わるたびに（完了順に）呼び出される
+    """
+    records: List[GameRecord] = []
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch-game") as pool:
+        futures = [
+            pool.submit(
+                run_game,
+                f"game-{i:04d}",
+                seed=None if base_seed is None else base_seed + i,
+                definition=definition,
+                max_steps=max_steps,
+            )
+            for i in range(n_games)
+        ]
+        for future in as_completed(futures):
+            record = future.result()
+            records.append(record)
+            if on_record is not None:
+                on_record(record)
+
+    records.sort(key=lambda r: r.game_id)
+    return records
+
+
+def summarize(records: List[GameRecord], elapsed_sec: float) -> dict:
+    """結果ファイルの集計値（勝率・スループット・トークン合計）"""
+    finished = [r for r in records if r.error is None]
+    latencies = sorted(r.latency_sec for r in finished)
+
+    return {
+        "games": len(records),
+        "finished": len(finished),
+        "failed": len(records) - len(finished),
+        "wins": dict(Counter(r.winner for r in finished)),
+        "elapsed_sec": round(elapsed_sec, 3),
+        "games_per_min": round(len(records) / elapsed_sec * 60, 2) if elapsed_sec > 0 else None,
+        "latency_p50_sec": latencies[len(latencies) // 2] if latencies else None,
+        "latency_max_sec": latencies[-1] if latencies else None,
+        "total_tokens": sum(r.tokens.total_tokens for r in records),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run many headless werewolf games concurrently.")
+    parser.add_argument("--games", type=int, default=10, help="number of games to run")
+    parser.add_argument("--concurrency", type=int, default=4, help="max games running at once")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS, help="GM step limit per game")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for role assignment")
+    parser.add_argument("--output", default="batch_results.jsonl", help="results file (JSON Lines)")
+    parser.add_argument("--log-level", default="WARNING", help="log level (DEBUG / INFO / WARNING)")
+    args = parser.parse_args(argv)
+
+    configure_logging(args.log_level)
+
+    started = time.perf_counter()
+
+    # 結果は完了順に追記し、途中で中断しても完了分は残るようにする
+    with open(args.output, "w", encoding="utf-8") as f:
+
+        def write_record(record: GameRecord) -> None:
+            f.write(record.model_dump_json() + "\n")
+            f.flush()
+
+        records = run_games(
+            args.games,
+            concurrency=args.concurrency,
+            base_seed=args.seed,
+            max_steps=args.max_steps,
+            on_record=write_record,
+        )
+
+    summary = summarize(records, time.perf_counter() - started)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+"""
+エンドツーエンドのベンチマーク
+
+責務:
+- シミュレーション LLM（または設定済みのローカル LLM）に対してゲームを最後まで実行し、
+  次の指標を計測する
+  - スループット（games / min）
+  - フェーズごとの 1 ステップの待ち時間（night / day の各ステップ / vote / result の p50・p95）
+  - player_graph / gm_graph のノードごとの実行時間
+  - PlayerState の deepcopy / fork と、セッションのシリアライズ・復元のコスト
+  - ピーク RSS
+- 結果を JSON に保存し、コミット間で比較できるようにする
+
+設計方針:
+- LLM の設定はモジュール読み込み時に参照されるため、
+  CLI では環境変数を設定してから GameSession / Graph を遅延 import する
+- ノードの実行時間は LangChain のコールバック（configure hook）で計測する
+  - Graph 側は compile(name=...) で名前を付けるだけで、ノードの実装には手を入れない
+  - 計測はスコープ（node_timing_scope）内の実行に限られる
+
+使い方:
+    python -m src.benchmark --games 20 --concurrency 4 --latency 0.2 --output bench.json
+    python -m src.benchmark --compare bench_before.json bench.json
+"""
+
+import argparse
+import copy
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+
+# NOTE: src.batch_runner（→ GameSession / Graph）は実行時に遅延 import する。
+
+DEFAULT_MAX_STEPS = 60
+DEFAULT_OVERHEAD_REPEAT = 20
+
+# 比較時に表示する指標（値が小さいほど良いもの）
+COMPARE_METRICS = (
+    "phase_latency_sec.night.p50",
+    "phase_latency_sec.day.p50",
+    "phase_latency_sec.day.p95",
+    "phase_latency_sec.vote.p50",
+    "phase_latency_sec.result.p50",
+    "state_overhead_ms.deepcopy_player_state",
+    "state_overhead_ms.fork_player_state",
+    "state_overhead_ms.serialize_session",
+    "state_overhead_ms.deserialize_session",
+    "peak_rss_mb",
+)
+
+
+# =========================================================
+# 統計
+# =========================================================
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """線形補間によるパーセンタイル（q は 0〜100）"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def latency_stats(values: List[float]) -> dict:
+    """待ち時間のリストを集計する（秒）"""
+    if not values:
+        return {"count": 0, "mean": None, "p50": None, "p95": None, "max": None}
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 6),
+        "p50": round(percentile(values, 50), 6),
+        "p95": round(percentile(values, 95), 6),
+        "max": round(max(values), 6),
+    }
+
+
+def peak_rss_mb() -> float:
+    """このプロセスのピーク RSS（MB）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux は KB、macOS は byte 単位
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+# =========================================================
+# ノードの実行時間
+# =========================================================
+class NodeTimer(BaseCallbackHandler):
+    """
+    Graph のノードごとの実行時間を記録するコールバック。
+
+    - compile(name=...) で付けた Graph 名と、ノード名の組で集計する
+    - Graph の直下の実行（= ノード）のみを対象とし、
+      ノード内部のルーターや LLM 呼び出しは含めない
+    - 複数スレッドから同時に呼ばれてよい
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # run_id → Graph 名（Graph 自体の実行）
+        self._graphs: Dict[UUID, str] = {}
+        # run_id → (Graph 名, ノード名, 開始時刻)
+        self._running: Dict[UUID, Tuple[str, str, float]] = {}
+        self.durations: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+
+    def on_chain_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        with self._lock:
+            if node is None:
+                if parent_run_id is None or parent_run_id in self._graphs:
+                    self._graphs[run_id] = kwargs.get("name") or "graph"
+                return
+            graph = self._graphs.get(parent_run_id)
+            if graph is not None:
+                self._running[run_id] = (graph, node, time.perf_counter())
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def _finish(self, run_id: UUID) -> None:
+        ended = time.perf_counter()
+        with self._lock:
+            self._graphs.pop(run_id, None)
+            running = self._running.pop(run_id, None)
+            if running is not None:
+                graph, node, started = running
+                self.durations[(graph, node)].append(ended - started)
+
+    def summary(self) -> Dict[str, Dict[str, dict]]:
+        """{Graph 名: {ノード名: 集計値}}（合計時間の降順）"""
+        with self._lock:
+            durations = {key: list(values) for key, values in self.durations.items()}
+
+        summary: Dict[str, Dict[str, dict]] = defaultdict(dict)
+        for (graph, node), values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+            summary[graph][node] = {**latency_stats(values), "total": round(sum(values), 6)}
+        return dict(summary)
+
+
+_node_timer: ContextVar[Optional[NodeTimer]] = ContextVar("benchmark_node_timer", default=None)
+# スコープ内で実行されるすべての Runnable（別スレッドで実行されるものを含む）に
+# コールバックを付与する
+register_configure_hook(_node_timer, inheritable=True)
+
+
+@contextmanager
+def node_timing_scope(timer: NodeTimer) -> Iterator[NodeTimer]:
+    """スコープ内で実行される Graph のノードの実行時間を timer に記録する"""
+    token = _node_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _node_timer.reset(token)
+
+
+# =========================================================
+# 状態のコピー・シリアライズのコスト
+# =========================================================
+def _mean_ms(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return round((time.perf_counter() - started) / repeat * 1000, 4)
+
+
+def measure_state_overhead(session, repeat: int = DEFAULT_OVERHEAD_REPEAT) -> dict:
+    """
+    終了時点のセッションに対して、状態のコピー・シリアライズの平均時間（ms）を計測する。
+
+    - deepcopy_player_state : 全プレイヤーの PlayerState の deepcopy
+    - fork_player_state     : 全プレイヤーの fork_player_state（構造共有コピー）
+    - serialize_session     : スナップショット（dict）の生成と JSON 化
+    - deserialize_session   : JSON からの WorldState / PlayerState の復元
+    """
+    from src.app.serializers.game_serializer import GameSerializer
+    from src.core.types.player import fork_player_state
+
+    states = list(session.player_states.values())
+
+    def serialize() -> str:
+        return json.dumps(
+            {
+                "world_state": GameSerializer.serialize_world_state(session.world_state),
+                "player_states": {
+                    player: GameSerializer.serialize_player_state(state)
+                    for player, state in session.player_states.items()
+                },
+            },
+            ensure_ascii=False,
+        )
+
+    payload = serialize()
+
+    def deserialize() -> None:
+        data = json.loads(payload)
+        GameSerializer.deserialize_world_state(data["world_state"])
+        for state in data["player_states"].values():
+            GameSerializer.deserialize_player_state(state)
+
+    return {
+        "deepcopy_player_state": _mean_ms(lambda: [copy.deepcopy(s) for s in states], repeat),
+        "fork_player_state": _mean_ms(lambda: [fork_player_state(s) for s in states], repeat),
+        "serialize_session": _mean_ms(serialize, repeat),
+        "deserialize_session": _mean_ms(deserialize, repeat),
+        "snapshot_bytes": len(payload.encode("utf-8")),
+    }
+
+
+# =========================================================
+# 実行
+# =========================================================
+def run_benchmark_game(
+    game_id: str,
+    *,
+    seed: Optional[int] = None,
+    max_steps: int = DEFAULT_MAX_STEPS,
+    overhead_repeat: int = DEFAULT_OVERHEAD_REPEAT,
+) -> dict:
+    """
+    1 ゲームを最後まで実行し、ステップごとの待ち時間と状態のコストを返す。
+
+    例外は送出せず、"error" に記録する。
+    """
+    from src import batch_runner
+
+    steps: List[Tuple[str, float]] = []
+    result: dict = {"game_id": game_id, "seed": seed, "error": None}
+    started = time.perf_counter()
+
+    try:
+        session = batch_runner.GameSession.create(
+            definition=batch_runner.ONE_NIGHT_GAME_DEFINITION, seed=seed
+        )
+        while session.world_state.result is None:
+            if len(steps) >= max_steps:
+                raise RuntimeError(f"Game did not finish within {max_steps} steps")
+            phase = session.world_state.phase
+            step_started = time.perf_counter()
+            batch_runner._run_phase_step(session)
+            steps.append((phase, time.perf_counter() - step_started))
+
+        result["winner"] = session.world_state.result.winner
+        if overhead_repeat > 0:
+            result["state_overhead_ms"] = measure_state_overhead(session, overhead_repeat)
+
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["steps"] = steps
+    result["latency_sec"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_benchmark(
+    n_games: int,
+    *,
+    concurrency: int = 1,
+    base_seed: int = 0,
+    max_steps: int = DEFAULT_MAX_STEPS,
+    overhead_repeat: int = DEFAULT_OVERHEAD_REPEAT,
+) -> dict:
+    """
+    n_games 個のゲームを最大 concurrency 並列で実行し、ベンチマーク結果を返す。
+    """
+    timer = NodeTimer()
+    started = time.perf_counter()
+
+    # contextvars はワーカースレッドに引き継がれないため、ゲームごとにスコープを張る
+    def play(i: int) -> dict:
+        with node_timing_scope(timer):
+            return run_benchmark_game(
+                f"bench-{i:04d}",
+                seed=base_seed + i,
+                max_steps=max_steps,
+                overhead_repeat=overhead_repeat,
+            )
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="benchmark-game") as pool:
+        games = list(pool.map(play, range(n_games)))
+
+    elapsed = time.perf_counter() - started
+    finished = [g for g in games if g["error"] is None]
+
+    phase_latencies: Dict[str, List[float]] = defaultdict(list)
+    for game in finished:
+        for phase, seconds in game["steps"]:
+            phase_latencies[phase].append(seconds)
+
+    overheads = [g["state_overhead_ms"] for g in finished if "state_overhead_ms" in g]
+    state_overhead = {
+        key: round(sum(o[key] for o in overheads) / len(overheads), 4)
+        for key in (overheads[0] if overheads else {})
+    }
+
+    return {
+        "games": n_games,
+        "finished": len(finished),
+        "failed": n_games - len(finished),
+        "errors": sorted({g["error"] for g in games if g["error"] is not None}),
+        "concurrency": concurrency,
+        "elapsed_sec": round(elapsed, 3),
+        "games_per_min": round(len(finished) / elapsed * 60, 2) if elapsed > 0 else None,
+        "game_latency_sec": latency_stats([g["latency_sec"] for g in finished]),
+        "phase_latency_sec": {
+            phase: latency_stats(values) for phase, values in phase_latencies.items()
+        },
+        "node_latency_sec": timer.summary(),
+        "state_overhead_ms": state_overhead,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+# =========================================================
+# 結果の保存・比較
+# =========================================================
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _lookup(report: dict, path: str) -> Optional[float]:
+    value: Any = report
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value if isinstance(value, (int, float)) else None
+
+
+def compare(baseline: dict, current: dict) -> Dict[str, dict]:
+    """
+    2 つのベンチマーク結果の主要な指標を比較する。
+
+    change_pct が正の場合は current の方が遅い（大きい）。
+    games_per_min のみ、値が大きいほど良い。
+    """
+    comparison = {}
+    for path in ("games_per_min",) + COMPARE_METRICS:
+        before = _lookup(baseline["results"], path)
+        after = _lookup(current["results"], path)
+        if before is None or after is None:
+            continue
+        comparison[path] = {
+            "baseline": before,
+            "current": after,
+            "change_pct": round((after - before) / before * 100, 1) if before else None,
+        }
+    return comparison
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark full werewolf games end to end.")
+    parser.add_argument("--games", type=int, default=10, help="number of games to run")
+    parser.add_argument("--concurrency", type=int, default=1, help="max games running at once")
+    parser.add_argument("--seed", type=int, default=0, help="base seed (game i uses seed + i)")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS, help="GM step limit per game")
+    parser.add_argument(
+        "--backend",
+        choices=("simulated", "configured"),
+        default="simulated",
+        help="simulated LLM, or the backend selected in src/config/llm.py",
+    )
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated mean LLM latency (sec)")
+    parser.add_argument("--jitter", type=float, default=0.5, help="simulated lognormal sigma")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="simulated LLM failure rate")
+    parser.add_argument(
+        "--overhead-repeat",
+        type=int,
+        default=DEFAULT_OVERHEAD_REPEAT,
+        help="repetitions for copy/serialization timings (0 to skip)",
+    )
+    parser.add_argument("--output", default="benchmark_results.json", help="results file (JSON)")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="compare two results files instead of running",
+    )
+    parser.add_argument("--log-level", default="WARNING", help="log level (DEBUG / INFO / WARNING)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            current = json.load(f)
+        print(json.dumps(compare(baseline, current), ensure_ascii=False, indent=2))
+        return
+
+    config = {"backend": args.backend}
+    if args.backend == "simulated":
+        # Graph（LLM クライアント）の構築より前に設定する
+        simulated_env = {
+            "LLM_SIMULATED": "1",
+            "LLM_SIMULATED_LATENCY": str(args.latency),
+            "LLM_SIMULATED_JITTER": str(args.jitter),
+            "LLM_SIMULATED_FAILURE_RATE": str(args.failure_rate),
+            "LLM_SIMULATED_SEED": str(args.seed),
+        }
+        os.environ.update(simulated_env)
+        config.update(simulated_env)
+
+    # src.core の import で Graph が構築されるため、環境変数の設定後に import する
+    from src.core.log import configure_logging
+
+    configure_logging(args.log_level)
+
+    results = run_benchmark(
+        args.games,
+        concurrency=args.concurrency,
+        base_seed=args.seed,
+        max_steps=args.max_steps,
+        overhead_repeat=args.overhead_repeat,
+    )
+    report = {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "config": config,
+        "results": results,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(json.dumps({k: results[k] for k in ("games", "finished", "elapsed_sec", "games_per_min")}))
+    print(f"Saved benchmark results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
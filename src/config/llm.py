@@ -7,13 +7,33 @@ LLM クライアント生成に関する設定モジュール。
 - 実装側（PlayerGraph / Node / Generator）が
   「どのモデルを使うか」を意識しなくて済むようにする
 - テストやデバッグ時に DummyLLM へ一括切り替えできるようにする
+- ベンチマーク時にシミュレーション LLM へ一括切り替えできるようにする
+- 必要に応じて LLM 応答の永続キャッシュを付与する
+- モデル単位のレート制限・同時実行数の適応制御を付与する
+- リトライ・ヘッジ・フォールバック（別バックエンドのモデル）を付与する
+- 用途ごとのファクトリを共有レジストリ（src.core.llm.registry）に登録する
+
+遅延生成について:
+- バックエンドの実装クラスは src.core.llm.backends 経由で参照し、
+  実際に選択されたものだけを import する
+- Generator のシングルトンには get_llm(用途名) のプロキシを渡し、
+  LLMClient は初回使用時に 1 度だけ生成する
+  （import 時に API キーの検証やバックエンドの import が走らない）
 """
 
-from src.core.llm.ollama_client import OllamaLangChainClient
-from src.core.llm.vllm_client import VLLMLangChainClient
-from src.core.llm.gemini_client import GeminiLangChainClient
+import os
+from functools import partial, wraps
+from typing import Callable, Dict, List, Optional
+
+from src.core.llm import backends
 from src.core.llm.dummy import DummyLLMClient
+from src.core.llm.simulated import SimulatedLatency, SimulatedLLMClient
 from src.core.llm.client import LLMClient
+from src.core.llm.cache import CachedLLMClient, LLMResponseCache
+from src.core.llm.instrumented import InstrumentedLLMClient
+from src.core.llm.rate_limit import RateGovernor, RateLimitedLLMClient, RateLimitSettings
+from src.core.llm.resilient import ResilientLLMClient, RetryPolicy
+from src.core.llm.registry import LazyLLMClient, llm_registry
 from src.core.memory.reflection import Reflection
 from src.core.memory.reaction import Reaction
 from src.core.memory.gm_comment import GMComment
@@ -44,10 +64,265 @@ USE_GEMINI = True
 GEMINI_MODEL = "gemini-2.5-flash-lite"
 GEMINI_MODEL_2 = "gemini-2.5-flash"
 
+# =========================================================
+# シミュレーション LLM
+# =========================================================
+# True の場合:
+#   - すべての LLM 呼び出しを SimulatedLLMClient に差し替える（USE_DUMMY より優先）
+#   - 出力スキーマを満たす応答を、指定した待ち時間・失敗率で返す
+#   - ネットワークなしで Graph を最後まで実行し、並行実行やキャッシュの効果を計測する用途
+USE_SIMULATED = os.getenv("LLM_SIMULATED", "0") == "1"
+# 待ち時間の分布（fixed / uniform / lognormal）・平均（秒）・ばらつき
+SIMULATED_LATENCY = SimulatedLatency(
+    distribution=os.getenv("LLM_SIMULATED_DISTRIBUTION", "lognormal"),
+    mean_sec=float(os.getenv("LLM_SIMULATED_LATENCY", "1.0")),
+    jitter=float(os.getenv("LLM_SIMULATED_JITTER", "0.5")),
+)
+# 呼び出しが失敗（SimulatedLLMError）する確率
+SIMULATED_FAILURE_RATE = float(os.getenv("LLM_SIMULATED_FAILURE_RATE", "0.0"))
+# 乱数シード（未設定の場合は毎回異なる応答）
+SIMULATED_SEED = int(os.environ["LLM_SIMULATED_SEED"]) if os.getenv("LLM_SIMULATED_SEED") else None
+
+# =========================================================
+# LLM 応答キャッシュ
+# =========================================================
+# True の場合:
+#   - (モデル名, 出力スキーマ, system, prompt) が一致する呼び出しは
+#     ディスク上のキャッシュから応答を返す（API 呼び出しなし）
+#   - リプレイ / 回帰テスト / CI での再実行向け
+#
+# 同じ prompt でも毎回異なる応答が欲しい通常のプレイでは無効にしておく
+USE_LLM_CACHE = os.getenv("LLM_CACHE", "0") == "1"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite3")
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """シングルトンの LLMResponseCache を取得する（全 LLM で共有）"""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache(LLM_CACHE_PATH, max_bytes=LLM_CACHE_MAX_BYTES)
+    return _llm_cache
+
+
+# =========================================================
+# レート制限・同時実行数の制御
+# =========================================================
+# True の場合:
+#   - すべての LLM 呼び出しに、モデル単位のトークンバケットと
+#     同時実行数の適応制御（応答時間・429 応答に応じて増減）を適用する
+#   - 並行ファンアウト時の急な呼び出しを失敗させずに平滑化する
+#
+# シミュレーション LLM ではスループットの計測を歪めないよう、既定で無効にする
+USE_RATE_LIMIT = os.getenv("LLM_RATE_LIMIT", "0" if USE_SIMULATED else "1") == "1"
+RATE_LIMIT_SETTINGS = RateLimitSettings(
+    requests_per_sec=float(os.getenv("LLM_RATE_LIMIT_RPS", "5")),
+    burst=int(os.getenv("LLM_RATE_LIMIT_BURST", "10")),
+    initial_concurrency=int(os.getenv("LLM_CONCURRENCY_INITIAL", "4")),
+    min_concurrency=int(os.getenv("LLM_CONCURRENCY_MIN", "1")),
+    max_concurrency=int(os.getenv("LLM_CONCURRENCY_MAX", "16")),
+    latency_target_sec=float(os.getenv("LLM_LATENCY_TARGET_SEC", "20")),
+)
+
+_rate_governors: Dict[str, RateGovernor] = {}
+
+
+def get_rate_governor(model_name: str) -> RateGovernor:
+    """モデルごとのシングルトンの RateGovernor を取得する（同じモデルの全 LLM で共有）"""
+    governor = _rate_governors.get(model_name)
+    if governor is None:
+        governor = _rate_governors.setdefault(
+            model_name, RateGovernor(model_name, RATE_LIMIT_SETTINGS)
+        )
+    return governor
+
+
+def _with_rate_limit(client: LLMClient) -> LLMClient:
+    """USE_RATE_LIMIT が True の場合、client にモデル単位のレート制限を付与する"""
+    if not USE_RATE_LIMIT or USE_DUMMY:
+        return client
+    model_name = getattr(client, "model_name", type(client).__name__)
+    return RateLimitedLLMClient(client, get_rate_governor(model_name))
+
+
+def _rate_limited(factory: Callable[[], LLMClient]) -> Callable[[], LLMClient]:
+    """
+    LLM ファクトリの戻り値にレート制限を付与するデコレータ。
+
+    - USE_RATE_LIMIT が False の場合は何もしない
+    - DummyLLMClient は外部呼び出しを行わないため対象外
+    - _cacheable より内側に付け、キャッシュヒットはレート制限の対象にしない
+    """
+
+    @wraps(factory)
+    def wrapper() -> LLMClient:
+        return _with_rate_limit(factory())
+
+    return wrapper
+
+
+# =========================================================
+# リトライ・ヘッジ・フォールバック
+# =========================================================
+# 1 つのモデルに対する試行回数・バックオフ・ヘッジ（p95 を超えたら同じ呼び出しをもう 1 つ投げる）
+RETRY_POLICY = RetryPolicy(
+    max_attempts=int(os.getenv("LLM_RETRY_MAX_ATTEMPTS", "3")),
+    base_delay_sec=float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5")),
+    max_delay_sec=float(os.getenv("LLM_RETRY_MAX_DELAY", "8")),
+    hedge=os.getenv("LLM_HEDGE", "0") == "1",
+)
+
+# 主モデルでリトライし尽くした後に試すバックエンド（gemini / vllm / ollama を順に）
+#
+# 例: LLM_FALLBACKS="vllm,ollama"
+#   → gemini-2.5-flash-lite → ローカル vLLM → Ollama
+# 主モデルと同じバックエンドは飛ばす。空の場合はフォールバックしない
+LLM_FALLBACKS = [name.strip() for name in os.getenv("LLM_FALLBACKS", "").split(",") if name.strip()]
+
+# 出力スキーマごとのフォールバック（指定したものは LLM_FALLBACKS より優先）
+#
+# 例: {"Speak": ["vllm"], "RoleBeliefsOutput": []}
+FALLBACK_CHAINS: Dict[str, List[str]] = {}
+
+# フォールバックで使うモデル
+FALLBACK_VLLM_MODEL = "google/gemma-3-12b-it"
+FALLBACK_OLLAMA_MODEL = "nemotron-3-nano:30b"
+
+
+def _primary_backend() -> str:
+    if USE_GEMINI:
+        return "gemini"
+    if USE_VLLM:
+        return "vllm"
+    return "ollama"
+
+
+def _fallback_client(backend: str, output_model) -> LLMClient:
+    """フォールバック用に backend の LLMClient を生成する（レート制限付き）"""
+    if backend == "gemini":
+        client = backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=output_model)
+    elif backend == "vllm":
+        client = backends.VLLMLangChainClient(model=FALLBACK_VLLM_MODEL, output_model=output_model)
+    elif backend == "ollama":
+        client = backends.OllamaLangChainClient(
+            model=FALLBACK_OLLAMA_MODEL, output_model=output_model
+        )
+    else:
+        raise ValueError(f"Unknown LLM backend: {backend}")
+    return _with_rate_limit(client)
+
+
+def _resilient(factory: Callable[[], LLMClient]) -> Callable[[], LLMClient]:
+    """
+    LLM ファクトリの戻り値にリトライ・ヘッジ・フォールバックを付与するデコレータ。
+
+    - DummyLLMClient は失敗しないため対象外
+    - シミュレーション LLM ではフォールバックしない（リトライのみ）
+    - _cacheable より内側・_rate_limited より外側に付け、
+      リトライ・フォールバックの各呼び出しもレート制限の対象にする
+    """
+
+    @wraps(factory)
+    def wrapper() -> LLMClient:
+        client = factory()
+        if USE_DUMMY:
+            return client
+
+        output_model = getattr(client, "output_model", None)
+        chain: List[str] = []
+        if not USE_SIMULATED and output_model is not None:
+            chain = FALLBACK_CHAINS.get(output_model.__name__, LLM_FALLBACKS)
+        fallbacks = [
+            partial(_fallback_client, backend, output_model)
+            for backend in chain
+            if backend != _primary_backend()
+        ]
+        return ResilientLLMClient(client, policy=RETRY_POLICY, fallbacks=fallbacks)
+
+    return wrapper
+
+
+def _cacheable(factory: Callable[[], LLMClient]) -> Callable[[], LLMClient]:
+    """
+    LLM ファクトリの戻り値にキャッシュを付与するデコレータ。
+
+    - USE_LLM_CACHE が False の場合は何もしない
+    - DummyLLMClient は構造化出力を持たないため対象外
+    """
+
+    @wraps(factory)
+    def wrapper() -> LLMClient:
+        client = factory()
+        if not USE_LLM_CACHE or USE_DUMMY:
+            return client
+        return CachedLLMClient(client, get_llm_cache())
+
+    return wrapper
+
+
+def _purpose_of(factory: Callable[[], LLMClient]) -> str:
+    """ファクトリ名から用途名を返す（create_speak_llm → speak）"""
+    return factory.__name__.removeprefix("create_").removesuffix("_llm")
+
+
+def _registered(factory: Callable[[], LLMClient]) -> Callable[[], LLMClient]:
+    """
+    LLM ファクトリを用途名で共有レジストリに登録するデコレータ（ファクトリ自体は変更しない）。
+
+    - 最も外側に付け、レジストリからはキャッシュ・計測付きの LLMClient を生成する
+    """
+    llm_registry.register(_purpose_of(factory), factory)
+    return factory
+
+
+def get_llm(name: str) -> LazyLLMClient:
+    """
+    用途 name（speak / belief など）の共有 LLMClient を、初回使用時に生成するプロキシを返す。
+
+    Generator のシングルトンなど、import 時に LLM を受け取る箇所で使う。
+    """
+    if name not in llm_registry.names():
+        raise KeyError(f"LLM '{name}' is not registered")
+    return llm_registry.lazy(name)
+
+
+def _instrumented(factory: Callable[[], LLMClient]) -> Callable[[], LLMClient]:
+    """
+    LLM ファクトリの戻り値に計測（src.core.instrumentation）を付与するデコレータ。
+
+    - _cacheable より外側に付け、キャッシュヒットも 1 回の呼び出しとして記録する
+    - メトリクスのラベルは用途名（create_speak_llm → speak）
+    """
+    name = _purpose_of(factory)
+
+    @wraps(factory)
+    def wrapper() -> LLMClient:
+        return InstrumentedLLMClient(factory(), name=name)
+
+    return wrapper
+
+
+def create_simulated_llm(output_model) -> SimulatedLLMClient:
+    """環境変数の設定に従って SimulatedLLMClient を生成する"""
+    return SimulatedLLMClient(
+        output_model=output_model,
+        latency=SIMULATED_LATENCY,
+        failure_rate=SIMULATED_FAILURE_RATE,
+        seed=SIMULATED_SEED,
+        model_name=f"simulated-{SIMULATED_LATENCY.distribution}",
+    )
+
 
 # =========================================================
 # 内省（Reflection）用 LLM
 # =========================================================
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_reflection_llm() -> LLMClient[Reflection]:
     """
     プレイヤーの「内省（reflection）」を生成するための LLM を返す。
@@ -61,6 +336,9 @@ def create_reflection_llm() -> LLMClient[Reflection]:
     - 高性能・大きめモデル（nemotron-3-nano:30b）を使用する
     """
 
+    if USE_SIMULATED:
+        return create_simulated_llm(Reflection)
+
     if USE_DUMMY:
         # テスト・デバッグ用
         # 内省ロジックの流れだけを確認したい場合に使用
@@ -68,23 +346,28 @@ def create_reflection_llm() -> LLMClient[Reflection]:
 
     if USE_GEMINI:
         # Gemini API を使用
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=Reflection)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=Reflection)
 
     if USE_VLLM:
         # 実運用用
         # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=Reflection
         )
 
     # 実運用用
     # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Reflection)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Reflection)
 
 
 # =========================================================
 # 反応（Reaction / 即時応答）用 LLM
 # =========================================================
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_reaction_llm() -> LLMClient[Reaction]:
     """
     プレイヤーの「即時反応・発言・軽い判断」を生成するための LLM を返す。
@@ -98,302 +381,414 @@ def create_reaction_llm() -> LLMClient[Reaction]:
     - 軽量・高速モデル（nemotron-3-nano:30b）を使用する
     """
 
+    if USE_SIMULATED:
+        return create_simulated_llm(Reaction)
+
     if USE_DUMMY:
         # テスト・デバッグ用
         return DummyLLMClient()
 
     if USE_GEMINI:
         # Gemini API を使用
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=Reaction)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=Reaction)
 
     if USE_VLLM:
         # 実運用用
         # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-        return VLLMLangChainClient(model="google/gemma-3-12b-it", output_model=Reaction)
+        return backends.VLLMLangChainClient(model="google/gemma-3-12b-it", output_model=Reaction)
 
     # 実運用用
     # nemotron-3-nano:30b は軽量で応答が速く、リアクション用途に最適
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Reaction)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Reaction)
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_gm_comment_llm() -> LLMClient[GMComment]:
     """
     GM が観測した public_event から
     次の speaker と進行コメントを生成する。
     """
 
+    if USE_SIMULATED:
+        return create_simulated_llm(GMComment)
+
     if USE_DUMMY:
         # テスト・デバッグ用
         return DummyLLMClient()
 
     if USE_GEMINI:
         # Gemini API を使用
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMComment)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMComment)
 
     if USE_VLLM:
         # 実運用用
         # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=GMComment
         )
 
     # 実運用用
     # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=GMComment)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=GMComment)
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_gm_maturity_llm() -> LLMClient[GMMaturityDecision]:
     """
     GM が議論の成熟度を判定する。
     """
 
+    if USE_SIMULATED:
+        return create_simulated_llm(GMMaturityDecision)
+
     if USE_DUMMY:
         # テスト・デバッグ用
         return DummyLLMClient()
 
     if USE_GEMINI:
         # Gemini API を使用
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMMaturityDecision)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMMaturityDecision)
 
     if USE_VLLM:
         # 実運用用
         # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=GMMaturityDecision
         )
 
     # 実運用用
     # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-    return OllamaLangChainClient(
+    return backends.OllamaLangChainClient(
         model="nemotron-3-nano:30b", output_model=GMMaturityDecision
     )
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_speak_llm() -> LLMClient[Speak]:
     """
     GM が観測した public_event から
     次の speaker と進行コメントを生成する。
     """
 
+    if USE_SIMULATED:
+        return create_simulated_llm(Speak)
+
     if USE_DUMMY:
         # テスト・デバッグ用
         return DummyLLMClient()
 
     if USE_GEMINI:
         # Gemini API を使用
-        return GeminiLangChainClient(model=GEMINI_MODEL_2, output_model=Speak)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL_2, output_model=Speak)
 
     if USE_VLLM:
         # 実運用用
         # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-        return VLLMLangChainClient(model="google/gemma-3-12b-it", output_model=Speak)
+        return backends.VLLMLangChainClient(model="google/gemma-3-12b-it", output_model=Speak)
 
     # 実運用用
     # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Speak)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Speak)
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_belief_llm() -> LLMClient[RoleBeliefsOutput]:
+    if USE_SIMULATED:
+        return create_simulated_llm(RoleBeliefsOutput)
+
     if USE_DUMMY:
         return DummyLLMClient(output=RoleBeliefsOutput)
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=RoleBeliefsOutput)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=RoleBeliefsOutput)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it",
             output_model=RoleBeliefsOutput,
         )
 
-    return OllamaLangChainClient(
+    return backends.OllamaLangChainClient(
         model="nemotron-3-nano:30b",
         output_model=RoleBeliefsOutput,
     )
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_vote_llm() -> LLMClient[VoteOutput]:
+    if USE_SIMULATED:
+        return create_simulated_llm(VoteOutput)
+
     if USE_DUMMY:
         return DummyLLMClient(output=VoteOutput)
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=VoteOutput)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=VoteOutput)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it",
             output_model=VoteOutput,
         )
 
-    return OllamaLangChainClient(
+    return backends.OllamaLangChainClient(
         model="nemotron-3-nano:30b",
         output_model=VoteOutput,
     )
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_gm_comment_reviewer_llm() -> LLMClient[GMCommentReviewResult]:
+    if USE_SIMULATED:
+        return create_simulated_llm(GMCommentReviewResult)
+
     if USE_DUMMY:
         return DummyLLMClient(output=GMCommentReviewResult)
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMCommentReviewResult)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMCommentReviewResult)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it",
             output_model=GMCommentReviewResult,
         )
 
-    return OllamaLangChainClient(
+    return backends.OllamaLangChainClient(
         model="nemotron-3-nano:30b",
         output_model=GMCommentReviewResult,
     )
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_gm_comment_refiner_llm() -> LLMClient[GMComment]:
     """
     GM が観測した public_event から
     次の speaker と進行コメントを生成する。
     """
 
+    if USE_SIMULATED:
+        return create_simulated_llm(GMComment)
+
     if USE_DUMMY:
         # テスト・デバッグ用
         return DummyLLMClient()
 
     if USE_GEMINI:
         # Gemini API を使用
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMComment)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMComment)
 
     if USE_VLLM:
         # 実運用用
         # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=GMComment
         )
 
     # 実運用用
     # nemotron-3-nano:30b は推論能力が高く、内省用途に向いている
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=GMComment)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=GMComment)
 
 
 # =========================================================
 # 戦略（Strategy）生成用 LLM
 # =========================================================
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_strategy_llm() -> LLMClient[Strategy]:
     """
     プレイヤーの発言前戦略を生成するための LLM を返す。
     """
+    if USE_SIMULATED:
+        return create_simulated_llm(Strategy)
+
     if USE_DUMMY:
         return DummyLLMClient()
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=Strategy)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=Strategy)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=Strategy
         )
 
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Strategy)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Strategy)
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_strategy_plan_llm() -> LLMClient[StrategyPlan]:
     """
     プレイヤーの初期戦略計画（StrategyPlan）を生成するための LLM を返す。
     """
+    if USE_SIMULATED:
+        return create_simulated_llm(StrategyPlan)
+
     if USE_DUMMY:
         return DummyLLMClient()
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=StrategyPlan)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=StrategyPlan)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=StrategyPlan
         )
 
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=StrategyPlan)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=StrategyPlan)
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_strategy_reviewer_llm() -> LLMClient[StrategyReview]:
     """
     戦略をレビューするための LLM を返す。
     """
+    if USE_SIMULATED:
+        return create_simulated_llm(StrategyReview)
+
     if USE_DUMMY:
         return DummyLLMClient()
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=StrategyReview)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=StrategyReview)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=StrategyReview
         )
 
-    return OllamaLangChainClient(
+    return backends.OllamaLangChainClient(
         model="nemotron-3-nano:30b", output_model=StrategyReview
     )
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_strategy_refiner_llm() -> LLMClient[Strategy]:
     """
     戦略を修正するための LLM を返す。
     """
+    if USE_SIMULATED:
+        return create_simulated_llm(Strategy)
+
     if USE_DUMMY:
         return DummyLLMClient()
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=Strategy)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=Strategy)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=Strategy
         )
 
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Strategy)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Strategy)
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_speak_reviewer_llm() -> LLMClient[SpeakReview]:
     """
     発言をレビューするための LLM を返す。
     """
+    if USE_SIMULATED:
+        return create_simulated_llm(SpeakReview)
+
     if USE_DUMMY:
         return DummyLLMClient()
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=SpeakReview)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=SpeakReview)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=SpeakReview
         )
 
-    return OllamaLangChainClient(
+    return backends.OllamaLangChainClient(
         model="nemotron-3-nano:30b", output_model=SpeakReview
     )
 
 
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_speak_refiner_llm() -> LLMClient[Speak]:
     """
     発言を修正するための LLM を返す。
     """
+    if USE_SIMULATED:
+        return create_simulated_llm(Speak)
+
     if USE_DUMMY:
         return DummyLLMClient()
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=Speak)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=Speak)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=Speak
         )
 
-    return OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Speak)
+    return backends.OllamaLangChainClient(model="nemotron-3-nano:30b", output_model=Speak)
 
 
 # =========================================================
 # ログ要約（Log Summary）用 LLM
 # =========================================================
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_log_summarizer_llm() -> LLMClient[LogSummaryOutput]:
     """
     ゲームログの差分要約を行うための LLM を返す。
@@ -402,18 +797,21 @@ def create_log_summarizer_llm() -> LLMClient[LogSummaryOutput]:
     - 要約能力が重要
     - 情報の選別・圧縮が求められる
     """
+    if USE_SIMULATED:
+        return create_simulated_llm(LogSummaryOutput)
+
     if USE_DUMMY:
         return DummyLLMClient()
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=LogSummaryOutput)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=LogSummaryOutput)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=LogSummaryOutput
         )
 
-    return OllamaLangChainClient(
+    return backends.OllamaLangChainClient(
         model="nemotron-3-nano:30b", output_model=LogSummaryOutput
     )
 
@@ -421,21 +819,29 @@ def create_log_summarizer_llm() -> LLMClient[LogSummaryOutput]:
 # =========================================================
 # GM 進行計画（Progression Plan）用 LLM
 # =========================================================
+@_registered
+@_instrumented
+@_cacheable
+@_resilient
+@_rate_limited
 def create_gm_plan_llm() -> LLMClient[GMProgressionPlan]:
     """
     GM の進行計画（Progression Plan）を生成するための LLM を返す。
     """
+    if USE_SIMULATED:
+        return create_simulated_llm(GMProgressionPlan)
+
     if USE_DUMMY:
         return DummyLLMClient(output=GMProgressionPlan(content="Dummy Plan"))
 
     if USE_GEMINI:
-        return GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMProgressionPlan)
+        return backends.GeminiLangChainClient(model=GEMINI_MODEL, output_model=GMProgressionPlan)
 
     if USE_VLLM:
-        return VLLMLangChainClient(
+        return backends.VLLMLangChainClient(
             model="google/gemma-3-12b-it", output_model=GMProgressionPlan
         )
 
-    return OllamaLangChainClient(
+    return backends.OllamaLangChainClient(
         model="nemotron-3-nano:30b", output_model=GMProgressionPlan
     )
@@ -0,0 +1,25 @@
+"""
+LLM バックエンドの HTTP 接続プール設定
+
+責務:
+- バックエンド（Ollama / vLLM / Gemini）ごとの接続プールの上限・keep-alive の設定
+
+設定は src.core.llm.pool の import 時に反映される。
+"""
+
+import os
+
+# バックエンド × base_url ごとの同時接続数の上限。
+#
+# - すべての用途（speak / belief など）の LLMClient がこの上限を共有する
+# - ローカルの vLLM / Ollama サーバーに同時に投げるリクエスト数の上限になる
+#   （上限を超えたリクエストは空き接続を待つ）
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "16"))
+
+# keep-alive で保持するアイドル接続数の上限。
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", str(LLM_MAX_CONNECTIONS))
+)
+
+# アイドル接続を保持する秒数。
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
@@ -0,0 +1,29 @@
+"""
+ログ設定
+
+責務:
+- ログレベル・出力形式・サブシステムごとのサンプリング率の設定
+
+設定は configure_logging（src.core.log）を呼んだ時点で反映される。
+"""
+
+import os
+
+# 出力するログレベル（DEBUG / INFO / WARNING / ERROR）。
+#
+# - 本番環境では WARNING を推奨する
+#   → プレイヤーターンごとのログは DEBUG / INFO のため、整形・書き込みが行われない
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# 出力形式（text / json）。
+#
+# - text: 人が読む形式（構造化フィールドは key=value で末尾に付く）
+# - json: 1 行 1 レコードの JSON（ログ収集基盤向け）
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+# サブシステムごとのサンプリング率（WARNING 未満のレコードのみ対象）。
+#
+# 例: "player=0.1,metrics=0.01"
+# - サブシステム名は get_logger に渡した名前（"player.node" は "player" の設定も継承する）
+# - 指定の無いサブシステムは全件出力する
+LOG_SAMPLING = os.getenv("LOG_SAMPLING", "")
@@ -9,6 +9,10 @@ Redis 設定
 import os
 import redis
 from typing import Optional
+from src.core.log import get_logger
+
+logger = get_logger("redis")
+
 
 class RedisClient:
     """Redis クライアント管理"""
@@ -34,9 +38,9 @@ class RedisClient:
             # 接続確認
             try:
                 cls._instance.ping()
-                print(f"[Redis] Connected to {host}:{port}")
+                logger.info("Connected to %s:%s", host, port)
             except Exception as e:
-                print(f"[Redis] Connection failed: {e}")
+                logger.error("Connection failed: %s", e)
                 raise
 
         return cls._instance
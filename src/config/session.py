@@ -0,0 +1,41 @@
+"""
+GameSession 実行設定
+
+責務:
+- プレイヤーターンの並列実行（fan-out）に関する設定
+- プロセス内セッションキャッシュに関する設定
+- API からのゲームステップ実行（ワーカープール・タイムアウト）に関する設定
+- バックグラウンドジョブに関する設定
+"""
+
+import os
+
+# 1 つのイベントを全プレイヤーに配布する際の最大並列数。
+#
+# - 観測ターン（event の配布）はプレイヤー間で独立しているため、
+#   スレッドプールで並列に PlayerGraph を実行できる
+# - 1 を指定すると従来通りの逐次実行になる
+PLAYER_TURN_MAX_WORKERS = int(os.getenv("PLAYER_TURN_MAX_WORKERS", 5))
+
+# プロセス内に保持する GameSession の最大数（SessionCache）。
+#
+# - 同じワーカーで連続するステップは Redis からの復元（デシリアライズ）を省略できる
+# - 0 を指定するとキャッシュを無効化し、毎回 Redis から復元する
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", 64))
+
+# API から実行するゲームステップ（夜フェーズ / 昼ステップ / 発言追加）の同時実行数。
+#
+# - ゲームステップは同期処理のため、イベントループではなくワーカープールで実行する
+# - 上限を超えたリクエストは空きが出るまで待機する
+GAME_EXECUTOR_MAX_WORKERS = int(os.getenv("GAME_EXECUTOR_MAX_WORKERS", 8))
+
+# API リクエスト 1 件あたりのタイムアウト（秒）。
+# 超過した場合は中断要求を出し、ステップは次の区切りで打ち切られる。
+GAME_STEP_TIMEOUT = float(os.getenv("GAME_STEP_TIMEOUT", 120))
+
+# バックグラウンドジョブ 1 件あたりのタイムアウト（秒）。
+# ジョブは HTTP 接続を保持しないため、通常のリクエストより長く設定する。
+GAME_JOB_TIMEOUT = float(os.getenv("GAME_JOB_TIMEOUT", 1800))
+
+# 完了したジョブの結果を保持する時間（秒）。
+GAME_JOB_TTL = int(os.getenv("GAME_JOB_TTL", 3600))
@@ -16,7 +16,16 @@ from .types import (
     GameEvent,
     PlayerRequest,
 )
-from .session import GameSession
+
+# GameSession は Graph・LLM 設定を import するため、参照されたときに import する
+# （src.core.log などの軽量モジュールだけを使う場合に Graph 全体を読み込まない）
+def __getattr__(name):
+    if name == "GameSession":
+        from .session import GameSession
+
+        return GameSession
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "PlayerState",
@@ -0,0 +1,80 @@
+"""
+協調的キャンセル（cooperative cancellation）
+
+責務:
+- 実行中のゲームステップに「中断要求」を伝える
+- GameSession / GameService が安全な区切りで中断要求を確認する
+
+設計方針:
+- スレッドを外部から強制停止することはできないため、
+  実行側が区切り（プレイヤーターンの開始・昼ステップの開始など）で
+  raise_if_cancelled() を呼び、StepCancelled を送出して自ら終了する
+- 中断要求は contextvars で実行コンテキストに紐づける
+  （呼び出し側の関数シグネチャを変更せずに伝播できる）
+- 中断されたセッションは保存されない（途中状態は破棄される）
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class StepCancelled(Exception):
+    """ゲームステップが中断要求により打ち切られたことを表す例外"""
+
+
+class CancellationToken:
+    """
+    中断要求を表すトークン。
+
+    - cancel() は任意のスレッドから呼び出してよい
+    - 一度 cancel されたトークンは元に戻らない
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise StepCancelled("Game step was cancelled")
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "cancellation_token", default=None
+)
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """
+    with ブロック内の処理に token を紐づける。
+    """
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """現在の実行コンテキストに紐づくトークン（無ければ None）"""
+    return _current_token.get()
+
+
+def raise_if_cancelled() -> None:
+    """
+    現在の実行コンテキストに中断要求があれば StepCancelled を送出する。
+
+    トークンが紐づいていない場合（CLI 実行やテストなど）は何もしない。
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
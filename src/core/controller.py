@@ -1,6 +1,5 @@
 from typing import Protocol, TYPE_CHECKING
-from src.core.types.player import PlayerState
-from copy import deepcopy
+from src.core.types.player import PlayerState, fork_player_state
 
 if TYPE_CHECKING:
     from src.graphs.player.player_graph import PlayerGraph
@@ -60,12 +59,13 @@ class AIPlayerController:
 
         注意点:
         - Session が保持している state を直接変更しないため、
-          deepcopy により作業用の state（working_state）を作成する
+          fork_player_state により作業用の state（working_state）を作成する
+          （observed_events / history は構造共有されるため O(1)）
         - state の最終的な確定保存は Session の責務
         """
 
         # Session が所有する state を破壊しないための作業用コピー
-        working_state = deepcopy(state)
+        working_state = fork_player_state(state)
 
         # PlayerGraph による思考・行動の実行（state 遷移）
         new_state = self.player_graph.invoke(working_state)
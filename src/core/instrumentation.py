@@ -0,0 +1,293 @@
+"""
+Graph ノード・LLM 呼び出しの計測
+
+責務:
+- Graph のノード（およびルーター）ごとの実行時間・失敗を記録する
+- LLM 呼び出しごとの実行時間・prompt / 出力の文字数・トークン数・リトライ回数・
+  キャッシュヒットを記録する
+- 記録はノード × プレイヤー × セッション単位で集計し、
+  プロセス内メトリクスレジストリ（src.core.metrics）と構造化ログの両方に出力する
+
+設計方針:
+- 「どのセッションの・どのノードの・どのプレイヤーの処理か」は contextvars で
+  実行コンテキストに紐づける（Node / Generator のシグネチャは変更しない）
+  - セッション: session_scope（GameService / batch_runner が設定する）
+  - ノード・プレイヤー: instrument_node が、ノードの実行中だけ設定する
+- LLM 呼び出しの計測中は、LangChain のコールバック（configure hook）で
+  トークン使用量とリトライを収集する
+- キャッシュヒット・リトライは、LLMClient のラッパーから report_* で通知する
+  （計測中でなければ何もしない）
+- 構造化ログは src.core.log の "metrics" サブシステムに出力する
+  （出力しないレベルでは、ログ用のフィールドを組み立てない）
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+from pydantic import BaseModel
+
+from src.core.log import DEBUG, get_logger
+from src.core.metrics import metrics
+
+logger = get_logger("metrics")
+
+# GMGraph のノードに付けるプレイヤー名
+GM_PLAYER = "GM"
+# ノード外・セッション外の処理に付けるラベル
+UNKNOWN = "-"
+
+metrics.describe("graph_node_duration_seconds", "Wall time of a graph node or router")
+metrics.describe("graph_node_errors_total", "Graph node or router executions that raised")
+metrics.describe("llm_calls_total", "LLM client calls by outcome")
+metrics.describe("llm_call_duration_seconds", "Wall time of an LLM client call")
+metrics.describe("llm_prompt_chars_total", "Characters sent to the LLM (system + prompt)")
+metrics.describe("llm_output_chars_total", "Characters of structured LLM output (JSON)")
+metrics.describe("llm_input_tokens_total", "Input tokens reported by the LLM provider")
+metrics.describe("llm_output_tokens_total", "Output tokens reported by the LLM provider")
+metrics.describe("llm_retries_total", "Retries made while serving LLM calls")
+metrics.describe("llm_cache_lookups_total", "LLM response cache lookups by result")
+
+
+class NodeContext(NamedTuple):
+    """実行中のノード"""
+
+    graph: str
+    node: str
+    player: str
+
+
+class LLMCallStats(UsageMetadataCallbackHandler):
+    """
+    1 回の LLM 呼び出しの計測値。
+
+    LangChain のコールバックとして、呼び出し中のトークン使用量とリトライを収集する。
+    """
+
+    def __init__(self, llm: str, *, model: str = UNKNOWN, output: str = UNKNOWN):
+        super().__init__()
+        self.llm = llm
+        self.model = model
+        self.output = output
+        self.prompt_chars = 0
+        self.output_chars = 0
+        self.retries = 0
+        # None: キャッシュを使っていない / True: ヒット / False: ミス
+        self.cache_hit: Optional[bool] = None
+
+    def on_retry(self, retry_state: Any, **kwargs: Any) -> None:
+        self.retries += 1
+
+    def set_output(self, output: Any) -> None:
+        if isinstance(output, BaseModel):
+            self.output_chars = len(output.model_dump_json())
+        elif output is not None:
+            self.output_chars = len(str(output))
+
+    def tokens(self) -> tuple[int, int]:
+        """(input_tokens, output_tokens)"""
+        with self._lock:
+            usage = list(self.usage_metadata.values())
+        return (
+            sum(u.get("input_tokens", 0) for u in usage),
+            sum(u.get("output_tokens", 0) for u in usage),
+        )
+
+
+_session_id: ContextVar[Optional[str]] = ContextVar("instrumentation_session_id", default=None)
+_node_context: ContextVar[Optional[NodeContext]] = ContextVar(
+    "instrumentation_node_context", default=None
+)
+_llm_call: ContextVar[Optional[LLMCallStats]] = ContextVar("instrumentation_llm_call", default=None)
+# LLM 呼び出しの計測中に実行される Runnable に LLMCallStats をコールバックとして付与する
+register_configure_hook(_llm_call, inheritable=True)
+
+
+# =========================================================
+# スコープ
+# =========================================================
+@contextmanager
+def session_scope(session_id: str) -> Iterator[None]:
+    """with ブロック内の記録を session_id のセッションに集計する"""
+    reset = _session_id.set(session_id)
+    try:
+        yield
+    finally:
+        _session_id.reset(reset)
+
+
+def current_node() -> Optional[NodeContext]:
+    """実行中のノード（ノード外では None）"""
+    return _node_context.get()
+
+
+def _player_of(state: Any) -> str:
+    """Graph の state からプレイヤー名を取り出す（GMGraph の場合は GM）"""
+    try:
+        return state["memory"].self_name
+    except (KeyError, TypeError, AttributeError):
+        return GM_PLAYER
+
+
+# =========================================================
+# ノード
+# =========================================================
+def instrument_node(graph: str, node: str, fn: Callable) -> Callable:
+    """
+    ノード（またはルーター）関数を、実行時間を記録する関数でラップする。
+
+    functools.wraps によりシグネチャ・型注釈は元の関数のものが見える
+    （LangGraph の state / config の受け渡しや path_map の推論は変わらない）。
+    """
+
+    @wraps(fn)
+    def wrapper(state, *args, **kwargs):
+        context = NodeContext(graph=graph, node=node, player=_player_of(state))
+        reset = _node_context.set(context)
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            return fn(state, *args, **kwargs)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _node_context.reset(reset)
+            _record_node(context, time.perf_counter() - started, error)
+
+    return wrapper
+
+
+def _record_node(context: NodeContext, seconds: float, error: Optional[BaseException]) -> None:
+    labels = context._asdict()
+    metrics.observe("graph_node_duration_seconds", seconds, **labels)
+    if error is not None:
+        metrics.inc("graph_node_errors_total", graph=context.graph, node=context.node)
+
+    session_id = _session_id.get()
+    if session_id is not None:
+        metrics.add_session(
+            session_id,
+            {"calls": 1, "wall_sec": seconds, "errors": int(error is not None)},
+            **labels,
+        )
+
+    if logger.is_enabled(DEBUG):
+        logger.debug(
+            "graph_node",
+            **labels,
+            session_id=session_id,
+            wall_sec=round(seconds, 6),
+            error=None if error is None else type(error).__name__,
+        )
+
+
+# =========================================================
+# LLM 呼び出し
+# =========================================================
+@contextmanager
+def llm_call_scope(
+    llm: str,
+    *,
+    system: str,
+    prompt: str,
+    model: str = UNKNOWN,
+    output: str = UNKNOWN,
+) -> Iterator[LLMCallStats]:
+    """
+    with ブロックを 1 回の LLM 呼び出しとして計測する。
+
+    呼び出し側は結果を得たら stats.set_output(result) を呼ぶこと。
+    model / output はモデル名・出力スキーマ名として実行時間のラベルに使われる。
+    """
+    stats = LLMCallStats(llm, model=model, output=output)
+    stats.prompt_chars = len(system) + len(prompt)
+    reset = _llm_call.set(stats)
+    started = time.perf_counter()
+    error: Optional[BaseException] = None
+    try:
+        yield stats
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _llm_call.reset(reset)
+        _record_llm_call(stats, time.perf_counter() - started, error)
+
+
+def report_cache_lookup(hit: bool) -> None:
+    """計測中の LLM 呼び出しのキャッシュ参照結果を通知する"""
+    stats = _llm_call.get()
+    if stats is not None:
+        stats.cache_hit = hit
+
+
+def report_retry() -> None:
+    """計測中の LLM 呼び出しでリトライしたことを通知する"""
+    stats = _llm_call.get()
+    if stats is not None:
+        stats.retries += 1
+
+
+def _record_llm_call(stats: LLMCallStats, seconds: float, error: Optional[BaseException]) -> None:
+    node = current_node() or NodeContext(graph=UNKNOWN, node=UNKNOWN, player=UNKNOWN)
+    input_tokens, output_tokens = stats.tokens()
+    llm = stats.llm
+
+    metrics.inc("llm_calls_total", llm=llm, status="ok" if error is None else "error")
+    metrics.observe(
+        "llm_call_duration_seconds",
+        seconds,
+        llm=llm,
+        model=stats.model,
+        output=stats.output,
+        graph=node.graph,
+        node=node.node,
+    )
+    metrics.inc("llm_prompt_chars_total", stats.prompt_chars, llm=llm)
+    metrics.inc("llm_output_chars_total", stats.output_chars, llm=llm)
+    metrics.inc("llm_input_tokens_total", input_tokens, llm=llm)
+    metrics.inc("llm_output_tokens_total", output_tokens, llm=llm)
+    if stats.retries:
+        metrics.inc("llm_retries_total", stats.retries, llm=llm)
+    if stats.cache_hit is not None:
+        metrics.inc("llm_cache_lookups_total", llm=llm, result="hit" if stats.cache_hit else "miss")
+
+    session_id = _session_id.get()
+    if session_id is not None:
+        metrics.add_session(
+            session_id,
+            {
+                "llm_calls": 1,
+                "llm_sec": seconds,
+                "prompt_chars": stats.prompt_chars,
+                "output_chars": stats.output_chars,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "retries": stats.retries,
+                "cache_hits": int(stats.cache_hit is True),
+            },
+            **node._asdict(),
+        )
+
+    if logger.is_enabled(DEBUG):
+        logger.debug(
+            "llm_call",
+            llm=llm,
+            model=stats.model,
+            output=stats.output,
+            **node._asdict(),
+            session_id=session_id,
+            wall_sec=round(seconds, 6),
+            prompt_chars=stats.prompt_chars,
+            output_chars=stats.output_chars,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            retries=stats.retries,
+            cache_hit=stats.cache_hit,
+            error=None if error is None else type(error).__name__,
+        )
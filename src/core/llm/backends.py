@@ -0,0 +1,39 @@
+"""
+LLM バックエンド実装クラスの遅延 import
+
+責務:
+- Ollama / vLLM / Gemini の LLMClient 実装クラスを、初めて参照されたときに import する
+
+設計方針:
+- 各バックエンドは LangChain の連携パッケージ（langchain_ollama / langchain_openai /
+  langchain_google_genai）を import するため、import だけで数百 ms かかる
+- src.config.llm はこのモジュール経由でクラスを参照し（backends.GeminiLangChainClient）、
+  選択されなかったバックエンドは import しない
+- 参照されたクラスはモジュール属性としてキャッシュする（2 回目以降は通常の属性参照）
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.core.llm.gemini_client import GeminiLangChainClient
+    from src.core.llm.ollama_client import OllamaLangChainClient
+    from src.core.llm.vllm_client import VLLMLangChainClient
+
+# クラス名 → 定義モジュール
+_BACKENDS = {
+    "OllamaLangChainClient": "src.core.llm.ollama_client",
+    "VLLMLangChainClient": "src.core.llm.vllm_client",
+    "GeminiLangChainClient": "src.core.llm.gemini_client",
+}
+
+__all__ = list(_BACKENDS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _BACKENDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    backend = getattr(importlib.import_module(module_name), name)
+    globals()[name] = backend
+    return backend
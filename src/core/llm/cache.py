@@ -0,0 +1,349 @@
+"""
+LLM 応答の永続キャッシュ。
+
+設計方針:
+- 任意の LLMClient をラップする（LLMClient と同じインターフェース）
+- キーは (モデル名, 出力スキーマのハッシュ, system, prompt)
+- 値は検証済みの構造化出力（Pydantic Model）を JSON として保存する
+- 保存先は SQLite（単一ファイル・標準ライブラリのみ）
+- 合計サイズが上限を超えたら、最終アクセスが古い順に削除する（LRU）
+- ヒット時はディスクに書き込まない
+  （最終アクセス時刻はメモリに溜め、put / close 時などにまとめて反映する）
+
+用途:
+- リプレイ / 回帰テスト / tests/verify_* スクリプトなど、
+  同一 prompt を繰り返し送るケースで API 呼び出しを省略する
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Generic, Iterator, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from src.core.instrumentation import report_cache_lookup
+from src.core.llm.client import LLMClient
+
+T = TypeVar("T", bound=BaseModel)
+
+# メモリに溜める最終アクセス時刻の上限（超えたらまとめて反映する）
+ACCESS_FLUSH_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def schema_hash(output_model: Type[BaseModel]) -> str:
+    """
+    出力スキーマ（Pydantic Model）のハッシュを返す。
+
+    スキーマが変わればキャッシュキーも変わるため、
+    古い形式の応答が新しいコードに返ることはない。
+    """
+    schema = json.dumps(output_model.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(
+    *,
+    model_name: str,
+    output_model: Type[BaseModel],
+    system: str,
+    prompt: str,
+) -> str:
+    """
+    キャッシュキーを生成する。
+    """
+    h = hashlib.sha256()
+    for part in (model_name, schema_hash(output_model), system, prompt):
+        h.update(part.encode("utf-8"))
+        # 区切り（"ab" + "c" と "a" + "bc" を区別する）
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite を用いた LLM 応答のキー・バリューストア。
+
+    - 値は JSON 文字列で保存する
+    - 合計サイズ（バイト）が max_bytes を超えた場合、
+      最終アクセスが古いエントリから削除する
+    - hits / misses / evictions を計測する
+    - 複数スレッドから同時に呼び出してよい
+    - 合計サイズはメモリ上で管理する（起動時に 1 回だけ集計する）
+    """
+
+    def __init__(self, path: str, *, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_cache_last_access ON llm_cache(last_access)"
+        )
+        self._conn.commit()
+
+        (self._total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        # 未反映の最終アクセス時刻（key -> time）
+        self._pending_access: Dict[str, float] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        キーに対応する値を返す。存在しなければ None。
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._pending_access[key] = time.time()
+            if len(self._pending_access) >= ACCESS_FLUSH_SIZE:
+                self._flush_access()
+                self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        """
+        値を保存し、必要であれば LRU 削除を行う。
+        """
+        size = len(value.encode("utf-8"))
+
+        with self._lock:
+            self._total += size - self._size_of(key)
+            self._pending_access.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()),
+            )
+            # 削除の順序に最新のアクセスを反映してから削除する
+            self._flush_access()
+            self._evict()
+            self._conn.commit()
+
+    def discard(self, key: str) -> None:
+        """
+        エントリを削除する（壊れた値を検出した場合など）。
+        """
+        with self._lock:
+            self._total -= self._size_of(key)
+            self._pending_access.pop(key, None)
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """
+        計測値と現在の使用量を返す。
+        """
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            total = self._total
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+            self._conn.close()
+
+    def _size_of(self, key: str) -> int:
+        """
+        既存エントリのサイズ（なければ 0）。
+
+        呼び出し側で self._lock を保持していること。
+        """
+        row = self._conn.execute(
+            "SELECT size FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _flush_access(self) -> None:
+        """
+        メモリに溜めた最終アクセス時刻をテーブルに反映する（commit は呼び出し側で行う）。
+
+        呼び出し側で self._lock を保持していること。
+        """
+        if not self._pending_access:
+            return
+        self._conn.executemany(
+            "UPDATE llm_cache SET last_access = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in self._pending_access.items()],
+        )
+        self._pending_access.clear()
+
+    def _evict(self) -> None:
+        """
+        合計サイズが上限以下になるまで、最終アクセスが古い順に削除する。
+
+        呼び出し側で self._lock を保持していること。
+        """
+        if self._total <= self.max_bytes:
+            return
+
+        total = self._total
+        rows = self._conn.execute(
+            "SELECT key, size FROM llm_cache ORDER BY last_access ASC"
+        )
+        victims = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", victims)
+        self.evictions += len(victims)
+        self._total = total
+
+
+class CachedLLMClient(Generic[T]):
+    """
+    LLMClient に永続キャッシュを付与するラッパー。
+
+    - キャッシュにあれば LLM を呼ばずに復元した値を返す
+    - なければ LLM を呼び出し、結果を保存してから返す
+    - LLM の例外はそのまま送出する（失敗はキャッシュしない）
+    """
+
+    def __init__(
+        self,
+        client: LLMClient[T],
+        cache: LLMResponseCache,
+        *,
+        model_name: Optional[str] = None,
+        output_model: Optional[Type[T]] = None,
+    ):
+        """
+        Args:
+            client: ラップ対象の LLMClient
+            cache: 保存先のストア
+            model_name: キーに含めるモデル名（省略時は client.model_name）
+            output_model: 出力の Pydantic Model（省略時は client.output_model）
+        """
+        self.client = client
+        self.cache = cache
+        self.model_name = model_name or getattr(
+            client, "model_name", type(client).__name__
+        )
+        self.output_model = output_model or client.output_model
+
+    def generate(self, *, system: str, prompt: str) -> T:
+        key = self._key(system, prompt)
+
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+
+        result = self.client.generate(system=system, prompt=prompt)
+        self._store(key, result)
+        return result
+
+    async def agenerate(self, *, system: str, prompt: str) -> T:
+        key = self._key(system, prompt)
+
+        # SQLite の読み書きはブロッキングのため、イベントループの外で行う
+        cached = await asyncio.to_thread(self._load, key)
+        if cached is not None:
+            return cached
+
+        result = await self.client.agenerate(system=system, prompt=prompt)
+        await asyncio.to_thread(self._store, key, result)
+        return result
+
+    def stream(self, *, system: str, prompt: str) -> Iterator[Any]:
+        """
+        キャッシュにあれば完全な結果を 1 件だけ返し、
+        なければラップ対象のストリームをそのまま返して最後の結果を保存する。
+        """
+        key = self._key(system, prompt)
+
+        cached = self._load(key)
+        if cached is not None:
+            yield cached
+            return
+
+        if not hasattr(self.client, "stream"):
+            result = self.client.generate(system=system, prompt=prompt)
+            self._store(key, result)
+            yield result
+            return
+
+        last = None
+        for chunk in self.client.stream(system=system, prompt=prompt):
+            last = chunk
+            yield chunk
+
+        if isinstance(last, dict):
+            try:
+                last = self.output_model.model_validate(last)
+            except ValidationError:
+                return
+        self._store(key, last)
+
+    def _key(self, system: str, prompt: str) -> str:
+        return make_cache_key(
+            model_name=self.model_name,
+            output_model=self.output_model,
+            system=system,
+            prompt=prompt,
+        )
+
+    def _load(self, key: str) -> Optional[T]:
+        value = self.cache.get(key)
+        if value is None:
+            report_cache_lookup(hit=False)
+            return None
+
+        try:
+            result = self.output_model.model_validate_json(value)
+        except ValidationError:
+            # 壊れた値は削除して、LLM を呼び直す
+            self.cache.discard(key)
+            report_cache_lookup(hit=False)
+            return None
+
+        report_cache_lookup(hit=True)
+        return result
+
+    def _store(self, key: str, result: T) -> None:
+        # 構造化出力以外（None など）は保存しない
+        if isinstance(result, self.output_model):
+            self.cache.put(key, result.model_dump_json())
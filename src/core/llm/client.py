@@ -21,14 +21,26 @@ class LLMClient(Protocol[T]):
     - LangChain / Ollama / 自作クライアントを混在させても破綻しない
 
     このインターフェースが保証すること:
-    - 同期的に 1 回の生成を行う
+    - 1 回の生成を行う（同期版 generate / 非同期版 agenerate の両方を提供する）
     - system / prompt を明示的に分離して受け取る
     - 生成結果は純粋な str として返す
-      （ストリーミング・トークン列・メタ情報は扱わない）
+      （トークン列・メタ情報は扱わない）
 
     想定する実装例:
     - OllamaLangChainClient（Ollama のラッパ）
+    - VLLMLangChainClient / GeminiLangChainClient
     - DummyLLMClient（テスト・デバッグ用の固定応答）
+
+    非同期版について:
+    - agenerate はイベントループをブロックせずに LLM I/O を待つ
+    - ラッパ（キャッシュ・レート制限・リトライ）は generate と同じ制御を agenerate にもかける
+    - Generator 層は同期版のみを使う（Graph ノードは同期で実行されるため）
+    - 入出力の契約は generate と完全に同一
+
+    ストリーミングについて（任意）:
+    - stream / astream を持つ実装は、部分的な生成結果を順に返す
+      （最後の要素が generate と同じ完全な結果）
+    - 持たない実装（DummyLLMClient など）では、呼び出し側が generate にフォールバックする
     """
 
     def generate(self, *, system: str, prompt: str) -> T:
@@ -59,3 +71,19 @@ class LLMClient(Protocol[T]):
             )
         """
         ...
+
+    async def agenerate(self, *, system: str, prompt: str) -> T:
+        """
+        generate の非同期版。
+
+        引数・戻り値・例外の扱いは generate と同一。
+        呼び出し中はイベントループを占有しないため、
+        asyncio.gather などで複数の生成を並行実行できる。
+
+        使用例:
+            results = await asyncio.gather(
+                client.agenerate(system=system, prompt=prompt_a),
+                client.agenerate(system=system, prompt=prompt_b),
+            )
+        """
+        ...
@@ -13,3 +13,6 @@ class DummyLLMClient:
             "text": "新しい情報を得たが、まだ判断には慎重になる必要がある。"
         }
         """
+
+    async def agenerate(self, *, system: str, prompt: str) -> str:
+        return self.generate(system=system, prompt=prompt)
@@ -10,12 +10,17 @@ Gemini API を LangChain 経由で利用する LLMClient 実装。
 """
 
 import os
-from typing import TypeVar, Generic, Type
+from typing import Any, AsyncIterator, Iterator, TypeVar, Generic, Type
 from pydantic import BaseModel
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from src.core.llm.pool import backend_pool
+from src.core.log import get_logger
+
 T = TypeVar("T", bound=BaseModel)
 
+logger = get_logger("llm.gemini")
+
 
 class GeminiLangChainClient(Generic[T]):
     """
@@ -43,6 +48,7 @@ class GeminiLangChainClient(Generic[T]):
             temperature: 生成温度（デフォルト 0.3）
         """
 
+        self.model_name = model
         self.output_model = output_model
 
         # API キーの取得
@@ -56,11 +62,20 @@ class GeminiLangChainClient(Generic[T]):
                 "Set GOOGLE_API_KEY environment variable or pass api_key argument."
             )
 
-        self.llm = ChatGoogleGenerativeAI(
-            model=model,
-            google_api_key=resolved_api_key,
-            temperature=temperature,
-            timeout=60,  # タイムアウト60秒
+        # ChatModel（google-genai の Client）は同じモデル・設定の LLMClient 間で共有する
+        #
+        # - google-genai は transport を直接受け取れないため、
+        #   httpx クライアントに同時接続数の上限（limits）のみを指定する
+        #   （aiohttp を使う非同期呼び出しには適用されない）
+        self.llm = backend_pool.chat_model(
+            ("gemini", model, temperature, resolved_api_key),
+            lambda: ChatGoogleGenerativeAI(
+                model=model,
+                google_api_key=resolved_api_key,
+                temperature=temperature,
+                timeout=60,  # タイムアウト60秒
+                client_args={"limits": backend_pool.limits.to_httpx()},
+            ),
         )
 
         # LLM の出力を指定された型（構造化データ）として強制的に構造化するラッパー
@@ -82,8 +97,8 @@ class GeminiLangChainClient(Generic[T]):
             ("human", prompt),
         ]
 
-        print(f"[GeminiClient] Invoking structured_llm for {self.output_model.__name__}...")
-        
+        logger.debug("Invoking structured_llm for %s", self.output_model.__name__)
+
         try:
             # 構造化 LLM を実行
             # - LLM 呼び出し
@@ -91,12 +106,12 @@ class GeminiLangChainClient(Generic[T]):
             # - 指定された型へのパース
             # をまとめて行う
             result = self.structured_llm.invoke(messages)
-            
-            print(f"[GeminiClient] structured_llm.invoke returned for {self.output_model.__name__}")
+
+            logger.debug("structured_llm.invoke returned for %s", self.output_model.__name__)
 
             return result
         except Exception as e:
-            print(f"[GeminiClient] Error invoking structured_llm for {self.output_model.__name__}: {e}")
+            logger.warning("Error invoking structured_llm for %s: %s", self.output_model.__name__, e)
             raise
 
     async def agenerate(self, *, system: str, prompt: str) -> T:
@@ -113,3 +128,31 @@ class GeminiLangChainClient(Generic[T]):
         result = await self.structured_llm.ainvoke(messages)
 
         return result
+
+    def stream(self, *, system: str, prompt: str) -> Iterator[Any]:
+        """
+        generate のストリーミング版。
+
+        部分的な生成結果（構造化データ、または dict）を順に返す。
+        最後の要素が完全な生成結果となる。
+        """
+
+        messages = [
+            ("system", system),
+            ("human", prompt),
+        ]
+
+        yield from self.structured_llm.stream(messages)
+
+    async def astream(self, *, system: str, prompt: str) -> AsyncIterator[Any]:
+        """
+        stream の非同期版。
+        """
+
+        messages = [
+            ("system", system),
+            ("human", prompt),
+        ]
+
+        async for chunk in self.structured_llm.astream(messages):
+            yield chunk
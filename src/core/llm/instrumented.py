@@ -0,0 +1,72 @@
+"""
+LLM 呼び出しを計測する LLMClient ラッパー。
+
+設計方針:
+- 任意の LLMClient をラップする（LLMClient と同じインターフェース）
+- 呼び出しごとに実行時間・文字数・トークン数・リトライ・キャッシュヒットを
+  src.core.instrumentation に記録する
+- CachedLLMClient より外側に置き、キャッシュヒットも 1 回の呼び出しとして数える
+"""
+
+from typing import Any, Generic, Iterator, TypeVar
+
+from pydantic import BaseModel
+
+from src.core.instrumentation import UNKNOWN, llm_call_scope
+from src.core.llm.client import LLMClient
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class InstrumentedLLMClient(Generic[T]):
+    """
+    LLMClient に計測を付与するラッパー。
+
+    - 結果・例外はラップ対象のものをそのまま返す
+    """
+
+    def __init__(self, client: LLMClient[T], *, name: str):
+        """
+        Args:
+            client: ラップ対象の LLMClient
+            name: メトリクスのラベル（用途名。例: speak / belief）
+        """
+        self.client = client
+        self.name = name
+        self.model_name = getattr(client, "model_name", type(client).__name__)
+        self.output_model = getattr(client, "output_model", None)
+        self._labels = {
+            "model": str(self.model_name),
+            "output": getattr(self.output_model, "__name__", UNKNOWN),
+        }
+
+    def generate(self, *, system: str, prompt: str) -> T:
+        with llm_call_scope(self.name, system=system, prompt=prompt, **self._labels) as call:
+            result = self.client.generate(system=system, prompt=prompt)
+            call.set_output(result)
+            return result
+
+    async def agenerate(self, *, system: str, prompt: str) -> T:
+        with llm_call_scope(self.name, system=system, prompt=prompt, **self._labels) as call:
+            result = await self.client.agenerate(system=system, prompt=prompt)
+            call.set_output(result)
+            return result
+
+    def stream(self, *, system: str, prompt: str) -> Iterator[Any]:
+        """
+        ラップ対象のストリームをそのまま返す（最後の要素を出力として記録する）。
+
+        ラップ対象がストリーミングに対応していない場合は generate の結果を 1 件返す。
+        """
+        with llm_call_scope(self.name, system=system, prompt=prompt, **self._labels) as call:
+            if not hasattr(self.client, "stream"):
+                result = self.client.generate(system=system, prompt=prompt)
+                call.set_output(result)
+                yield result
+                return
+
+            last = None
+            for chunk in self.client.stream(system=system, prompt=prompt):
+                last = chunk
+                yield chunk
+            call.set_output(last)
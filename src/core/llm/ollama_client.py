@@ -1,6 +1,8 @@
 from langchain_ollama import ChatOllama
 from pydantic import BaseModel
-from typing import TypeVar, Generic, Type
+from typing import Any, AsyncIterator, Iterator, TypeVar, Generic, Type
+
+from src.core.llm.pool import backend_pool
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -29,11 +31,22 @@ class OllamaLangChainClient(Generic[T]):
                    例: "gemma3:1b", "gemma3:4b", "qwen2.5" など
         """
 
+        self.model_name = model
+        self.output_model = output_model
+
         # Ollama をバックエンドとする ChatModel
         # temperature は「揺らぎ」を抑え、内省の再現性を高めるため低めに設定
-        self.llm = ChatOllama(
-            model=model,
-            temperature=0.3,
+        #
+        # ChatModel は同じモデルの LLMClient 間で共有し、
+        # HTTP 接続は Ollama サーバーごとの接続プール（src.core.llm.pool）を使う
+        self.llm = backend_pool.chat_model(
+            ("ollama", model),
+            lambda: ChatOllama(
+                model=model,
+                temperature=0.3,
+                sync_client_kwargs={"transport": backend_pool.transport("ollama")},
+                async_client_kwargs={"transport": backend_pool.async_transport("ollama")},
+            ),
         )
 
         # LLM の出力を指定された型（構造化データ）として強制的に構造化するラッパー
@@ -76,3 +89,46 @@ class OllamaLangChainClient(Generic[T]):
         result = self.structured_llm.invoke(messages)
 
         return result
+
+    async def agenerate(self, *, system: str, prompt: str) -> T:
+        """
+        非同期版の generate メソッド。
+        system / prompt を渡し、構造化データを生成する。
+        """
+
+        messages = [
+            ("system", system),
+            ("human", prompt),
+        ]
+
+        result = await self.structured_llm.ainvoke(messages)
+
+        return result
+
+    def stream(self, *, system: str, prompt: str) -> Iterator[Any]:
+        """
+        generate のストリーミング版。
+
+        部分的な生成結果（構造化データ、または dict）を順に返す。
+        最後の要素が完全な生成結果となる。
+        """
+
+        messages = [
+            ("system", system),
+            ("human", prompt),
+        ]
+
+        yield from self.structured_llm.stream(messages)
+
+    async def astream(self, *, system: str, prompt: str) -> AsyncIterator[Any]:
+        """
+        stream の非同期版。
+        """
+
+        messages = [
+            ("system", system),
+            ("human", prompt),
+        ]
+
+        async for chunk in self.structured_llm.astream(messages):
+            yield chunk
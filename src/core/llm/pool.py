@@ -0,0 +1,171 @@
+"""
+LLM バックエンドの接続プールと ChatModel の共有
+
+責務:
+- バックエンド × base_url ごとに 1 つの HTTP 接続プール（httpx transport）を保持する
+- 同じモデル設定の ChatModel（ChatOpenAI / ChatOllama / ChatGoogleGenerativeAI）を
+  出力スキーマの異なる LLMClient 間で共有する
+
+設計方針:
+- LLMClient は用途（出力スキーマ）ごとに作られるが、HTTP 接続・ChatModel は
+  バックエンドのエンドポイント・モデル単位で共有する
+  → TLS / TCP の接続確立を繰り返さず、ローカルサーバーへの同時接続数も上限で抑えられる
+- 接続数の上限・keep-alive は src.config.llm_pool で設定する
+- 出力スキーマごとの差分は with_structured_output で作るラッパーだけに閉じ込める
+- 非同期の transport も 1 つを共有する
+  （langchain_openai の既定の httpx クライアントと同じく、イベントループをまたいで共有される）
+"""
+
+import threading
+from typing import Callable, Dict, Hashable, NamedTuple, Optional, Tuple, TypeVar
+
+import httpx
+
+from src.config.llm_pool import (
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+)
+from src.core.metrics import metrics
+
+M = TypeVar("M")
+
+# base_url を指定しない（ライブラリ既定のエンドポイントを使う）場合のキー
+DEFAULT_BASE_URL = "default"
+
+
+class PoolLimits(NamedTuple):
+    """接続プールの上限"""
+
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+
+    def to_httpx(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class BackendPool:
+    """
+    バックエンドごとの HTTP 接続プールと、共有 ChatModel を保持する。
+
+    いずれも初回要求時に生成し、以降は同じインスタンスを返す（スレッドセーフ）。
+    """
+
+    def __init__(self, limits: PoolLimits):
+        self.limits = limits
+        # chat_model の factory が transport / http_client を呼ぶため再入可能なロックを使う
+        self._lock = threading.RLock()
+        self._transports: Dict[Tuple[str, str], httpx.HTTPTransport] = {}
+        self._async_transports: Dict[Tuple[str, str], httpx.AsyncHTTPTransport] = {}
+        self._clients: Dict[Tuple[str, str], httpx.Client] = {}
+        self._async_clients: Dict[Tuple[str, str], httpx.AsyncClient] = {}
+        self._chat_models: Dict[Hashable, object] = {}
+
+    # =========================================================
+    # HTTP
+    # =========================================================
+    def transport(self, backend: str, base_url: Optional[str] = None) -> httpx.HTTPTransport:
+        """backend × base_url の同期 transport（接続プール）"""
+        key = (backend, base_url or DEFAULT_BASE_URL)
+        with self._lock:
+            transport = self._transports.get(key)
+            if transport is None:
+                transport = self._transports[key] = httpx.HTTPTransport(
+                    limits=self.limits.to_httpx()
+                )
+            return transport
+
+    def async_transport(
+        self, backend: str, base_url: Optional[str] = None
+    ) -> httpx.AsyncHTTPTransport:
+        """backend × base_url の非同期 transport（接続プール）"""
+        key = (backend, base_url or DEFAULT_BASE_URL)
+        with self._lock:
+            transport = self._async_transports.get(key)
+            if transport is None:
+                transport = self._async_transports[key] = httpx.AsyncHTTPTransport(
+                    limits=self.limits.to_httpx()
+                )
+            return transport
+
+    def http_client(self, backend: str, base_url: Optional[str] = None) -> httpx.Client:
+        """backend × base_url の接続プールを使う共有 httpx.Client"""
+        transport = self.transport(backend, base_url)
+        key = (backend, base_url or DEFAULT_BASE_URL)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = httpx.Client(transport=transport)
+            return client
+
+    def async_http_client(
+        self, backend: str, base_url: Optional[str] = None
+    ) -> httpx.AsyncClient:
+        """backend × base_url の接続プールを使う共有 httpx.AsyncClient"""
+        transport = self.async_transport(backend, base_url)
+        key = (backend, base_url or DEFAULT_BASE_URL)
+        with self._lock:
+            client = self._async_clients.get(key)
+            if client is None:
+                client = self._async_clients[key] = httpx.AsyncClient(transport=transport)
+            return client
+
+    # =========================================================
+    # ChatModel
+    # =========================================================
+    def chat_model(self, key: Hashable, factory: Callable[[], M]) -> M:
+        """
+        key（バックエンド・モデル名・エンドポイントなど）に対応する共有 ChatModel を返す。
+
+        初回のみ factory() で生成する。
+        """
+        with self._lock:
+            model = self._chat_models.get(key)
+            if model is None:
+                model = self._chat_models[key] = factory()
+            return model
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pools": len(self._transports) + len(self._async_transports),
+                "chat_models": len(self._chat_models),
+            }
+
+    def close(self) -> None:
+        """
+        同期の接続をすべて閉じ、共有 ChatModel を破棄する（テスト・シャットダウン用）。
+
+        非同期の transport は、それを使ったイベントループ上でしか閉じられないため破棄のみ行う。
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            transports = list(self._transports.values())
+            self._clients.clear()
+            self._transports.clear()
+            self._async_clients.clear()
+            self._async_transports.clear()
+            self._chat_models.clear()
+        for client in clients:
+            client.close()
+        for transport in transports:
+            transport.close()
+
+
+# アプリケーション全体で共有するプール（src.core.llm の各バックエンドが使う）
+backend_pool = BackendPool(
+    PoolLimits(
+        max_connections=LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+    )
+)
+metrics.describe("llm_backend_pools", "HTTP connection pools shared by LLM backends")
+metrics.describe("llm_shared_chat_models", "Chat models shared across LLM clients")
+metrics.gauge_function("llm_backend_pools", lambda: backend_pool.stats()["pools"])
+metrics.gauge_function("llm_shared_chat_models", lambda: backend_pool.stats()["chat_models"])
@@ -0,0 +1,258 @@
+"""
+LLM 呼び出しのレート制限と同時実行数の適応制御。
+
+責務:
+- モデルごとに 1 秒あたりのリクエスト数を制限する（トークンバケット）
+- モデルごとの同時実行数を、応答時間と 429（レート制限）応答に応じて増減する（AIMD）
+- 任意の LLMClient をラップし、すべての呼び出しに上記を適用する
+
+設計方針:
+- 任意の LLMClient をラップする（LLMClient と同じインターフェース）
+- 制限はモデル単位で共有する（用途の異なる LLMClient が同じモデルを使う場合も 1 つ）
+  → 共有の RateGovernor は src.config.llm の get_rate_governor が保持する
+- 並行ファンアウト（全プレイヤーの発言生成など）の急な呼び出しは、
+  失敗させずに待たせて平滑化する
+- 同時実行数の制御は AIMD:
+  - 成功かつ応答時間が目標以内 → 上限を少しずつ増やす（1 / 上限 ずつ）
+  - 429 応答 → 上限を半分にする
+  - 応答時間が目標を超えた → 上限を少し減らす
+- 例外は握りつぶさずにそのまま送出する（リトライは行わない）
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Generic, Iterator, NamedTuple, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from src.core.llm.client import LLMClient
+from src.core.metrics import metrics
+
+T = TypeVar("T", bound=BaseModel)
+
+# 非同期呼び出しが空きを待つときのポーリング間隔（秒）
+ASYNC_POLL_INTERVAL_SEC = 0.05
+
+metrics.describe("llm_rate_limit_wait_seconds", "Time an LLM call waited for the rate limiter")
+metrics.describe("llm_concurrency_limit", "Current adaptive concurrency limit per model")
+metrics.describe("llm_rate_limited_total", "LLM calls rejected by the provider with 429")
+
+
+class RateLimitSettings(NamedTuple):
+    """モデルごとのレート制限の設定"""
+
+    # 1 秒あたりのリクエスト数と、瞬間的に許すリクエスト数
+    requests_per_sec: float
+    burst: int
+    # 同時実行数の初期値・下限・上限
+    initial_concurrency: int
+    min_concurrency: int
+    max_concurrency: int
+    # これを超える応答時間（秒）は混雑とみなして同時実行数を減らす
+    latency_target_sec: float
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    プロバイダのレート制限（HTTP 429 / RESOURCE_EXHAUSTED）による例外かどうか。
+
+    バックエンドごとに例外の型が異なるため、ステータスコードの属性と型名で判定する
+    （openai: status_code / google-genai: code / ollama: status_code）。
+    """
+    for attr in ("status_code", "code"):
+        if getattr(error, attr, None) == 429:
+            return True
+    name = type(error).__name__
+    return "RateLimit" in name or "ResourceExhausted" in name
+
+
+class TokenBucket:
+    """
+    トークンバケット。
+
+    reserve() はトークンを 1 つ予約し、使えるようになるまでの待ち時間を返す
+    （トークンは負にもなる＝予約順に待ち時間が積み上がる）。
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    応答時間と 429 応答に応じて上限を増減する同時実行数リミッタ（AIMD）。
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        latency_target_sec: float,
+        decrease_factor: float = 0.5,
+        slow_decrease_factor: float = 0.9,
+        on_change: Optional[Callable[[float], None]] = None,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target_sec = latency_target_sec
+        self.decrease_factor = decrease_factor
+        self.slow_decrease_factor = slow_decrease_factor
+        self._on_change = on_change
+        self._condition = threading.Condition()
+        self._limit = float(min(max(initial, minimum), maximum))
+        self._in_flight = 0
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        with self._condition:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self) -> None:
+        # イベントループをブロックしないよう、空きが出るまでポーリングする
+        while not self.try_acquire():
+            await asyncio.sleep(ASYNC_POLL_INTERVAL_SEC)
+
+    def release(self, *, latency_sec: Optional[float], rate_limited: bool = False) -> None:
+        """
+        実行枠を返し、結果に応じて上限を更新する。
+
+        Args:
+            latency_sec: 応答時間（失敗時は None。上限は 429 の場合のみ更新する）
+            rate_limited: 429 応答で失敗した場合 True
+        """
+        with self._condition:
+            self._in_flight -= 1
+            previous = self._limit
+            if rate_limited:
+                self._limit = max(self.minimum, self._limit * self.decrease_factor)
+            elif latency_sec is not None and latency_sec > self.latency_target_sec:
+                self._limit = max(self.minimum, self._limit * self.slow_decrease_factor)
+            elif latency_sec is not None:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+            changed = self._limit != previous
+        if changed and self._on_change is not None:
+            self._on_change(self._limit)
+
+
+class RateGovernor:
+    """
+    1 つのモデルに対するトークンバケットと同時実行数リミッタの組。
+    """
+
+    def __init__(self, model: str, settings: RateLimitSettings):
+        self.model = model
+        self.settings = settings
+        self.bucket = TokenBucket(settings.requests_per_sec, settings.burst)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=settings.initial_concurrency,
+            minimum=settings.min_concurrency,
+            maximum=settings.max_concurrency,
+            latency_target_sec=settings.latency_target_sec,
+            on_change=lambda limit: metrics.set_gauge("llm_concurrency_limit", limit, model=model),
+        )
+        metrics.set_gauge("llm_concurrency_limit", self.limiter.limit, model=model)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """with ブロックを、レート制限・同時実行数の制限内で実行する"""
+        started = time.perf_counter()
+        time.sleep(self.bucket.reserve())
+        self.limiter.acquire()
+        metrics.observe("llm_rate_limit_wait_seconds", time.perf_counter() - started, model=self.model)
+        with self._release_on_exit():
+            yield
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """slot の非同期版（待機中にイベントループをブロックしない）"""
+        started = time.perf_counter()
+        await asyncio.sleep(self.bucket.reserve())
+        await self.limiter.acquire_async()
+        metrics.observe("llm_rate_limit_wait_seconds", time.perf_counter() - started, model=self.model)
+        with self._release_on_exit():
+            yield
+
+    @contextmanager
+    def _release_on_exit(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            rate_limited = is_rate_limit_error(e)
+            if rate_limited:
+                metrics.inc("llm_rate_limited_total", model=self.model)
+            self.limiter.release(latency_sec=None, rate_limited=rate_limited)
+            raise
+        self.limiter.release(latency_sec=time.perf_counter() - started)
+
+
+class RateLimitedLLMClient(Generic[T]):
+    """
+    LLMClient にモデル単位のレート制限・同時実行数制御を付与するラッパー。
+
+    - 結果・例外はラップ対象のものをそのまま返す
+    - ストリーミングは、最後の要素を受け取るまで実行枠を保持する
+    """
+
+    def __init__(self, client: LLMClient[T], governor: RateGovernor):
+        self.client = client
+        self.governor = governor
+        self.model_name = getattr(client, "model_name", type(client).__name__)
+        self.output_model = getattr(client, "output_model", None)
+
+    def generate(self, *, system: str, prompt: str) -> T:
+        with self.governor.slot():
+            return self.client.generate(system=system, prompt=prompt)
+
+    async def agenerate(self, *, system: str, prompt: str) -> T:
+        async with self.governor.aslot():
+            return await self.client.agenerate(system=system, prompt=prompt)
+
+    def stream(self, *, system: str, prompt: str) -> Iterator[Any]:
+        with self.governor.slot():
+            if not hasattr(self.client, "stream"):
+                yield self.client.generate(system=system, prompt=prompt)
+                return
+            yield from self.client.stream(system=system, prompt=prompt)
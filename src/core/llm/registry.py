@@ -0,0 +1,115 @@
+"""
+用途ごとの LLMClient を共有するレジストリ
+
+責務:
+- 用途名（speak / belief / gm_plan など）→ LLM ファクトリ を登録する
+- 各用途の LLMClient を初回使用時に 1 度だけ生成し、プロセス内で共有する
+- 生成前の LLMClient の代わりに渡せるプロキシ（LazyLLMClient）を返す
+
+設計方針:
+- Generator のシングルトンはモジュールの import 時に作られるため、
+  そこで LLMClient を生成すると、import だけでバックエンド（LangChain / SDK）の
+  import・API キーの検証が走る
+  → Generator には LazyLLMClient を渡し、最初の generate / agenerate / stream で生成する
+- 生成は複数スレッドから同時に要求されてもよい（用途ごとに 1 回だけ生成する）
+- 生成に失敗した場合はキャッシュせず、次の使用時に再度生成を試みる
+"""
+
+import threading
+from typing import Any, Callable, Dict, List
+
+from src.core.llm.client import LLMClient
+
+LLMFactory = Callable[[], LLMClient]
+
+
+class LLMRegistry:
+    """
+    用途名ごとの LLM ファクトリと、生成済みの LLMClient を保持する。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._factories: Dict[str, LLMFactory] = {}
+        self._clients: Dict[str, LLMClient] = {}
+
+    def register(self, name: str, factory: LLMFactory) -> None:
+        """
+        用途 name のファクトリを登録する。
+
+        同じ name で再登録した場合は後勝ち（生成済みの LLMClient は破棄する）。
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._clients.pop(name, None)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._factories)
+
+    def get(self, name: str) -> LLMClient:
+        """
+        用途 name の LLMClient を返す（初回のみファクトリで生成する）。
+
+        Raises:
+            KeyError: name が登録されていない場合
+        """
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(name)
+            if client is None:
+                factory = self._factories.get(name)
+                if factory is None:
+                    raise KeyError(f"LLM '{name}' is not registered")
+                client = self._clients[name] = factory()
+            return client
+
+    def lazy(self, name: str) -> "LazyLLMClient":
+        """用途 name の LLMClient を初回使用時に生成するプロキシを返す"""
+        return LazyLLMClient(self, name)
+
+    def is_built(self, name: str) -> bool:
+        with self._lock:
+            return name in self._clients
+
+    def reset(self) -> None:
+        """生成済みの LLMClient を破棄する（設定の切り替え・テスト用。登録は残す）"""
+        with self._lock:
+            self._clients.clear()
+
+
+class LazyLLMClient:
+    """
+    LLMRegistry の LLMClient へのプロキシ。
+
+    - 属性を参照したとき（generate / agenerate / stream / model_name など）に
+      レジストリから LLMClient を取得し、その属性を返す
+    - LLMClient 自体はレジストリ側で共有される（reset 後は新しい LLMClient を使う）
+    - "_" で始まる属性では生成しない（LangGraph などが hasattr(obj, "__self__") のように
+      モジュール変数を調べるだけで LLMClient が生成されないようにする）
+    """
+
+    __slots__ = ("_registry", "_name")
+
+    def __init__(self, registry: LLMRegistry, name: str):
+        self._registry = registry
+        self._name = name
+
+    def resolve(self) -> LLMClient:
+        """プロキシ先の LLMClient を返す（未生成なら生成する）"""
+        return self._registry.get(self._name)
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"LazyLLMClient({self._name!r})"
+
+
+# アプリケーション全体で共有するレジストリ（src.config.llm のファクトリが登録される）
+llm_registry = LLMRegistry()
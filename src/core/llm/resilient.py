@@ -0,0 +1,347 @@
+"""
+LLM 呼び出しのリトライ・ヘッジ・フォールバック。
+
+責務:
+- 一時的な失敗（タイムアウト・接続エラー・429・5xx・シミュレーションの失敗）を、
+  指数バックオフ（ジッター付き）で上限回数までリトライする
+  （認証エラーなどの 4xx はリトライせず、すぐに次のモデルへ切り替える）
+- 応答が直近の p95 を超えても返らない場合に、同じ呼び出しをもう 1 つ並行して投げ（ヘッジ）、
+  先に成功した結果を使う
+- 主モデルでリトライし尽くしたら、フォールバックのモデルを順に試す
+  （例: gemini-2.5-flash-lite → ローカル vLLM → Ollama）
+
+設計方針:
+- 任意の LLMClient をラップする（LLMClient と同じインターフェース）
+- リトライは src.core.instrumentation の report_retry で通知する
+  （InstrumentedLLMClient の内側に置き、リトライ込みで 1 回の呼び出しとして記録される）
+- フォールバックの LLMClient は初めて必要になったときに生成する
+  （使われないバックエンドを import・接続しない）
+- すべて失敗した場合は最後の呼び出しの例外を送出する（呼び出し側の扱いは変わらない）
+  （フォールバックの生成に失敗した場合の例外は、ログに残すだけで送出しない）
+- ヘッジは負荷を増やすため既定では無効。同期呼び出しのヘッジはスレッドプールで実行する
+"""
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from src.core.instrumentation import report_retry
+from src.core.llm.client import LLMClient
+from src.core.llm.rate_limit import is_rate_limit_error
+from src.core.llm.simulated import SimulatedLLMError
+from src.core.log import get_logger
+from src.core.metrics import metrics
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = get_logger("llm.resilient")
+
+metrics.describe("llm_hedged_requests_total", "Duplicate LLM requests sent after p95 latency")
+metrics.describe("llm_fallbacks_total", "LLM calls that switched to a fallback model")
+
+# 同期呼び出しのヘッジに使うスレッド数
+HEDGE_MAX_WORKERS = 32
+
+
+class RetryPolicy(NamedTuple):
+    """リトライ・ヘッジの設定"""
+
+    # 1 つのモデルに対する試行回数（1 ならリトライしない）
+    max_attempts: int = 3
+    # バックオフの基準値・上限（秒）。n 回目のリトライは 0〜min(上限, 基準値 * 2^n) の一様乱数
+    base_delay_sec: float = 0.5
+    max_delay_sec: float = 8.0
+    # ヘッジを行うか・判定に使う応答時間の分位点・必要なサンプル数
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+
+    def backoff(self, retry: int) -> float:
+        return random.uniform(0, min(self.max_delay_sec, self.base_delay_sec * 2**retry))
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    リトライで回復しうる一時的な失敗かどうか。
+
+    - タイムアウト・接続エラー
+    - レート制限（429）・サーバーエラー（5xx）
+    - シミュレーションで注入された失敗
+
+    バックエンドごとに例外の型が異なるため、is_rate_limit_error と同じく
+    ステータスコードの属性と型名で判定する。
+    """
+    if isinstance(error, (TimeoutError, ConnectionError, SimulatedLLMError)):
+        return True
+    if is_rate_limit_error(error):
+        return True
+    for attr in ("status_code", "code"):
+        status = getattr(error, attr, None)
+        if isinstance(status, int) and 500 <= status < 600:
+            return True
+    name = type(error).__name__
+    return "Timeout" in name or "Connection" in name
+
+
+class LatencyWindow:
+    """直近の応答時間を保持し、分位点を返す"""
+
+    def __init__(self, size: int = 200):
+        self._lock = threading.Lock()
+        self._values: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._values.append(seconds)
+
+    def quantile(self, q: float, *, min_samples: int) -> Optional[float]:
+        with self._lock:
+            if len(self._values) < min_samples:
+                return None
+            values = sorted(self._values)
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="llm-hedge"
+            )
+        return _hedge_executor
+
+
+class ResilientLLMClient(Generic[T]):
+    """
+    LLMClient にリトライ・ヘッジ・フォールバックを付与するラッパー。
+
+    - 主モデル → フォールバックの順に、それぞれ policy.max_attempts 回まで試す
+      （一時的でない失敗は、そのモデルではリトライしない）
+    - 結果は最初に成功したモデルのものをそのまま返す
+    """
+
+    def __init__(
+        self,
+        client: LLMClient[T],
+        *,
+        policy: RetryPolicy = RetryPolicy(),
+        fallbacks: Sequence[Callable[[], LLMClient[T]]] = (),
+    ):
+        """
+        Args:
+            client: 主モデルの LLMClient
+            policy: リトライ・ヘッジの設定
+            fallbacks: フォールバックの LLMClient を生成する関数（試す順）
+        """
+        self.client = client
+        self.policy = policy
+        self.model_name = getattr(client, "model_name", type(client).__name__)
+        self.output_model = getattr(client, "output_model", None)
+        self._fallback_factories = list(fallbacks)
+        self._fallbacks: List[Optional[LLMClient[T]]] = [None] * len(self._fallback_factories)
+        self._lock = threading.Lock()
+        # モデルごと（主モデル = 0、フォールバック = 1..）の応答時間
+        self._latencies = [LatencyWindow() for _ in range(len(self._fallback_factories) + 1)]
+
+    # =========================================================
+    # LLMClient
+    # =========================================================
+    def generate(self, *, system: str, prompt: str) -> T:
+        last_error: Optional[Exception] = None
+        for index in range(len(self._latencies)):
+            client, last_error = self._try_client_at(index, last_error)
+            for attempt in range(self.policy.max_attempts if client is not None else 0):
+                if last_error is not None:
+                    self._before_retry(index, attempt, last_error)
+                try:
+                    return self._call(index, client, system, prompt)
+                except Exception as e:
+                    last_error = e
+                    if not is_transient_error(e):
+                        break
+        raise last_error
+
+    async def agenerate(self, *, system: str, prompt: str) -> T:
+        last_error: Optional[Exception] = None
+        for index in range(len(self._latencies)):
+            client, last_error = self._try_client_at(index, last_error)
+            for attempt in range(self.policy.max_attempts if client is not None else 0):
+                if last_error is not None:
+                    await asyncio.sleep(self._before_retry(index, attempt, last_error, sleep=False))
+                try:
+                    return await self._acall(index, client, system, prompt)
+                except Exception as e:
+                    last_error = e
+                    if not is_transient_error(e):
+                        break
+        raise last_error
+
+    def stream(self, *, system: str, prompt: str) -> Iterator[Any]:
+        """
+        主モデルのストリームをそのまま返す。
+
+        最初の要素を受け取る前に失敗した場合は、generate（リトライ・フォールバック込み）の
+        結果を 1 件返す。途中まで返した後の失敗はそのまま送出する。
+        """
+        if not hasattr(self.client, "stream"):
+            yield self.generate(system=system, prompt=prompt)
+            return
+
+        started = False
+        try:
+            for chunk in self.client.stream(system=system, prompt=prompt):
+                started = True
+                yield chunk
+        except Exception as e:
+            if started:
+                raise
+            logger.warning("stream failed before first chunk, retrying: %s", e)
+            report_retry()
+            yield self.generate(system=system, prompt=prompt)
+
+    # =========================================================
+    # 内部処理
+    # =========================================================
+    def _client_at(self, index: int) -> LLMClient[T]:
+        if index == 0:
+            return self.client
+        with self._lock:
+            client = self._fallbacks[index - 1]
+            if client is None:
+                client = self._fallbacks[index - 1] = self._fallback_factories[index - 1]()
+            return client
+
+    def _try_client_at(
+        self, index: int, last_error: Optional[Exception]
+    ) -> Tuple[Optional[LLMClient[T]], Optional[Exception]]:
+        """
+        index 番目の LLMClient を返す。
+
+        フォールバックの生成に失敗した場合（API キー未設定など）は (None, last_error) を返し、
+        そのモデルは飛ばす（送出するのは呼び出しの失敗で、生成時の例外はログのみ）。
+        """
+        try:
+            return self._client_at(index), last_error
+        except Exception as e:
+            logger.warning("skipping fallback #%d: %s", index, e)
+            return None, last_error
+
+    def _before_retry(
+        self, index: int, attempt: int, error: Exception, *, sleep: bool = True
+    ) -> float:
+        """リトライ（またはフォールバック）を通知し、バックオフ時間を返す（sleep=True なら待つ）"""
+        report_retry()
+        if attempt == 0:
+            # 次のモデルへの切り替え（待たずに試す）
+            model = getattr(self._client_at(index), "model_name", index)
+            metrics.inc("llm_fallbacks_total", model=str(model))
+            logger.warning("falling back to %s after: %s", model, error)
+            return 0.0
+
+        delay = self.policy.backoff(attempt - 1)
+        logger.info(
+            "retrying LLM call (attempt %d) after: %s", attempt + 1, error, delay_sec=round(delay, 3)
+        )
+        if sleep:
+            time.sleep(delay)
+        return delay
+
+    def _hedge_delay(self, index: int) -> Optional[float]:
+        if not self.policy.hedge:
+            return None
+        return self._latencies[index].quantile(
+            self.policy.hedge_quantile, min_samples=self.policy.hedge_min_samples
+        )
+
+    def _call(self, index: int, client: LLMClient[T], system: str, prompt: str) -> T:
+        started = time.perf_counter()
+        delay = self._hedge_delay(index)
+        if delay is None:
+            result = client.generate(system=system, prompt=prompt)
+        else:
+            result = self._call_hedged(client, system, prompt, delay)
+        self._latencies[index].add(time.perf_counter() - started)
+        return result
+
+    def _call_hedged(self, client: LLMClient[T], system: str, prompt: str, delay: float) -> T:
+        executor = _get_hedge_executor()
+
+        def submit():
+            # 呼び出しごとにコンテキスト（計測中の LLM 呼び出しなど）を引き継ぐ
+            context = contextvars.copy_context()
+            return executor.submit(context.run, client.generate, system=system, prompt=prompt)
+
+        pending = {submit()}
+        done, pending = wait(pending, timeout=delay)
+        if not done:
+            metrics.inc("llm_hedged_requests_total", model=str(self.model_name))
+            pending.add(submit())
+
+        last_error: Optional[BaseException] = None
+        while done or pending:
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                last_error = future.exception()
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        raise last_error
+
+    async def _acall(self, index: int, client: LLMClient[T], system: str, prompt: str) -> T:
+        started = time.perf_counter()
+        delay = self._hedge_delay(index)
+        if delay is None:
+            result = await client.agenerate(system=system, prompt=prompt)
+        else:
+            result = await self._acall_hedged(client, system, prompt, delay)
+        self._latencies[index].add(time.perf_counter() - started)
+        return result
+
+    async def _acall_hedged(
+        self, client: LLMClient[T], system: str, prompt: str, delay: float
+    ) -> T:
+        pending = {asyncio.ensure_future(client.agenerate(system=system, prompt=prompt))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                metrics.inc("llm_hedged_requests_total", model=str(self.model_name))
+                pending.add(asyncio.ensure_future(client.agenerate(system=system, prompt=prompt)))
+
+            last_error: Optional[BaseException] = None
+            while done or pending:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,332 @@
+# src/core/llm/simulated.py
+"""
+ベンチマーク用のシミュレーション LLMClient。
+
+目的:
+- ネットワーク・GPU なしで Graph を最後まで実行できるようにする
+- 実際の LLM に近い「待ち時間」と「失敗」を再現し、
+  並行実行・キャッシュ・スケジューリングの効果をローカルで計測できるようにする
+
+設計方針:
+- 出力スキーマ（Pydantic Model）を解析し、型・制約を満たすインスタンスを生成する
+  - str / int / float / bool / Literal / Optional / Union / List / Dict / ネストした Model
+  - ge / le / gt / lt / min_length / max_length などの制約を守る
+- プレイヤー名を表すフィールド（target / speaker / player など）には、
+  prompt に含まれるプレイヤー名から選んだ値を入れる
+- 待ち時間は分布（固定 / 一様 / 対数正規）から 1 回ごとにサンプリングする
+- failure_rate の確率で SimulatedLLMError を送出する
+- seed を指定した場合、同じ呼び出し順で同じ出力・待ち時間・失敗が再現される
+
+DummyLLMClient との違い:
+- DummyLLMClient は出力スキーマに関係なく固定の文字列を返す（単体テスト用）
+- SimulatedLLMClient は output_model の妥当なインスタンスを返す（E2E / ベンチマーク用）
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+import types
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, Field
+from pydantic.fields import FieldInfo
+
+from src.game.setup.players import DEFAULT_PLAYER_POOL
+
+T = TypeVar("T", bound=BaseModel)
+
+# プレイヤー名が入るフィールド名
+PLAYER_FIELD_NAMES = frozenset(
+    {"player", "target", "speaker", "target_player", "focus_player"}
+)
+
+# str フィールドに入れる文の候補
+_SENTENCES = (
+    "まだ情報が少ないので慎重に考えたい。",
+    "占い結果の内容に矛盾がないか確認したい。",
+    "発言のタイミングが少し不自然に感じる。",
+    "ここまでの議論を整理すると、怪しいのは一人に絞られる。",
+    "役職を明かすかどうかは、もう少し様子を見てから決める。",
+    "今の発言には根拠が足りないと思う。",
+    "村にとって最善の選択を優先したい。",
+    "対抗が出ていないことは重要な手がかりになる。",
+)
+
+
+class SimulatedLLMError(RuntimeError):
+    """シミュレーションで注入された LLM 呼び出しの失敗"""
+
+
+class SimulatedLatency(BaseModel):
+    """
+    1 回の LLM 呼び出しにかかる待ち時間の分布。
+
+    - fixed     : 常に mean_sec
+    - uniform   : mean_sec ± jitter の一様分布
+    - lognormal : 平均 mean_sec、対数の標準偏差 jitter の対数正規分布
+                  （実際の LLM API に近い、右に裾の長い分布）
+    """
+
+    distribution: Literal["fixed", "uniform", "lognormal"] = "lognormal"
+    mean_sec: float = Field(default=1.0, ge=0.0)
+    jitter: float = Field(default=0.5, ge=0.0)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean_sec == 0.0 or self.distribution == "fixed":
+            return self.mean_sec
+        if self.distribution == "uniform":
+            return max(0.0, rng.uniform(self.mean_sec - self.jitter, self.mean_sec + self.jitter))
+        # 平均が mean_sec になるように対数の平均を調整する
+        mu = math.log(self.mean_sec) - self.jitter**2 / 2
+        return rng.lognormvariate(mu, self.jitter)
+
+
+class SimulatedLLMClient(Generic[T]):
+    """
+    出力スキーマから妥当な構造化データを生成する LLMClient 実装。
+
+    - 同じインスタンスを複数スレッドから同時に呼び出してよい
+      （待ち時間の sleep 中はロックを保持しない）
+    """
+
+    def __init__(
+        self,
+        *,
+        output_model: Type[T],
+        latency: Optional[SimulatedLatency] = None,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        player_names: Sequence[str] = DEFAULT_PLAYER_POOL,
+        model_name: str = "simulated",
+    ):
+        """
+        Args:
+            output_model: 生成する出力の Pydantic Model
+            latency: 待ち時間の分布（省略時は待ち時間なし）
+            failure_rate: SimulatedLLMError を送出する確率（0.0 〜 1.0）
+            seed: 乱数シード（省略時は毎回異なる出力）
+            player_names: prompt から探すプレイヤー名の候補
+            model_name: モデル名（キャッシュキーなどに使われる）
+        """
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError(f"failure_rate must be between 0 and 1: {failure_rate}")
+
+        self.model_name = model_name
+        self.output_model = output_model
+        self.latency = latency or SimulatedLatency(distribution="fixed", mean_sec=0.0)
+        self.failure_rate = failure_rate
+        self.player_names = list(player_names)
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    # =========================================================
+    # LLMClient インターフェース
+    # =========================================================
+    def generate(self, *, system: str, prompt: str) -> T:
+        delay, failed, result = self._plan(prompt)
+        time.sleep(delay)
+        return self._finish(failed, result)
+
+    async def agenerate(self, *, system: str, prompt: str) -> T:
+        delay, failed, result = self._plan(prompt)
+        await asyncio.sleep(delay)
+        return self._finish(failed, result)
+
+    def stream(self, *, system: str, prompt: str) -> Iterator[Any]:
+        """
+        部分的な生成結果（dict）を順に返し、最後に完全な結果を返す。
+
+        待ち時間の 3 割を最初のチャンクまでの時間、残りをチャンク間に配分する。
+        """
+        delay, failed, result = self._plan(prompt)
+        chunks = list(_partial_dicts(result))
+        time.sleep(delay * 0.3)
+        for chunk in chunks:
+            time.sleep(delay * 0.7 / (len(chunks) + 1))
+            yield chunk
+        time.sleep(delay * 0.7 / (len(chunks) + 1))
+        yield self._finish(failed, result)
+
+    async def astream(self, *, system: str, prompt: str) -> AsyncIterator[Any]:
+        """
+        stream の非同期版。
+        """
+        delay, failed, result = self._plan(prompt)
+        chunks = list(_partial_dicts(result))
+        await asyncio.sleep(delay * 0.3)
+        for chunk in chunks:
+            await asyncio.sleep(delay * 0.7 / (len(chunks) + 1))
+            yield chunk
+        await asyncio.sleep(delay * 0.7 / (len(chunks) + 1))
+        yield self._finish(failed, result)
+
+    # =========================================================
+    # 内部処理
+    # =========================================================
+    def _plan(self, prompt: str) -> tuple[float, bool, T]:
+        """
+        1 回の呼び出しの待ち時間・失敗有無・出力をまとめて決める。
+
+        乱数の消費をロック内で完結させ、seed 指定時の再現性を保つ。
+        """
+        players = [name for name in self.player_names if name in prompt] or self.player_names
+        with self._lock:
+            delay = self.latency.sample(self._rng)
+            failed = self._rng.random() < self.failure_rate
+            result = _SchemaSampler(self._rng, players).model(self.output_model)
+        return delay, failed, result
+
+    def _finish(self, failed: bool, result: T) -> T:
+        if failed:
+            raise SimulatedLLMError(
+                f"Simulated failure for {self.output_model.__name__} ({self.model_name})"
+            )
+        return result
+
+
+class _SchemaSampler:
+    """型注釈と制約から値を生成する"""
+
+    def __init__(self, rng: random.Random, players: List[str]):
+        self.rng = rng
+        self.players = players
+
+    def model(self, model: Type[BaseModel]) -> BaseModel:
+        values = {
+            name: self.field(name, field)
+            for name, field in model.model_fields.items()
+        }
+        return model.model_validate(values)
+
+    def field(self, name: str, field: FieldInfo) -> Any:
+        # kind などのタグとして使われる str の既定値はそのまま使う
+        if isinstance(field.default, str) and field.annotation is str:
+            return field.default
+        return self.value(field.annotation, name, _constraints(field.metadata))
+
+    def value(self, annotation: Any, name: str, constraints: dict) -> Any:
+        origin = get_origin(annotation)
+        args = get_args(annotation)
+
+        if origin is Literal:
+            return self.rng.choice(args)
+
+        if origin in (Union, types.UnionType):
+            # Optional は値がある側を生成する
+            candidates = [arg for arg in args if arg is not type(None)]
+            return self.value(self.rng.choice(candidates), name, constraints)
+
+        if origin in (list, List):
+            return self.sequence(args[0] if args else str, name, constraints)
+
+        if origin is dict:
+            value_type = args[1] if args else str
+            return {
+                f"{name}_{i + 1}": self.value(value_type, name, {})
+                for i in range(self.rng.randint(1, 3))
+            }
+
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return self.model(annotation)
+
+        if annotation is bool:
+            return self.rng.random() < 0.5
+
+        if annotation is int:
+            low, high = _bounds(constraints, 0, 10, step=1)
+            return self.rng.randint(int(math.ceil(low)), int(math.floor(high)))
+
+        if annotation is float:
+            low, high = _bounds(constraints, 0.0, 1.0, step=0.0)
+            return round(self.rng.uniform(low, high), 3)
+
+        if annotation is str or annotation is Any:
+            return self.text(name, constraints)
+
+        raise TypeError(f"Unsupported annotation for simulated output: {annotation!r}")
+
+    def sequence(self, item_type: Any, name: str, constraints: dict) -> list:
+        # プレイヤーごとの項目（例: beliefs）は、登場する全プレイヤー分を生成する
+        if isinstance(item_type, type) and issubclass(item_type, BaseModel) and (
+            PLAYER_FIELD_NAMES & item_type.model_fields.keys()
+        ):
+            items = [self.model(item_type) for _ in self.players]
+            for player, item in zip(self.players, items):
+                for field_name in PLAYER_FIELD_NAMES & item_type.model_fields.keys():
+                    setattr(item, field_name, player)
+            return items
+
+        min_length = constraints.get("min_length", 1)
+        max_length = constraints.get("max_length", max(min_length, 3))
+        count = self.rng.randint(min_length, max(min_length, max_length))
+        return [self.value(item_type, name, {}) for _ in range(count)]
+
+    def text(self, name: str, constraints: dict) -> str:
+        if name in PLAYER_FIELD_NAMES:
+            return self.rng.choice(self.players)
+
+        sentences = [self.rng.choice(_SENTENCES) for _ in range(self.rng.randint(1, 3))]
+        text = "".join(sentences)
+        if "max_length" in constraints:
+            text = text[: constraints["max_length"]]
+        return text.ljust(constraints.get("min_length", 0), "。")
+
+
+def _constraints(metadata: list) -> dict:
+    """Field のメタデータ（annotated_types）から制約を取り出す"""
+    constraints = {}
+    for item in metadata:
+        for key in ("ge", "gt", "le", "lt", "min_length", "max_length"):
+            value = getattr(item, key, None)
+            if value is not None:
+                constraints[key] = value
+    return constraints
+
+
+def _bounds(constraints: dict, low: float, high: float, *, step: float) -> tuple[float, float]:
+    """制約から値の範囲を求める（gt / lt は step だけ内側にする）"""
+    if "ge" in constraints:
+        low = constraints["ge"]
+    elif "gt" in constraints:
+        low = constraints["gt"] + step
+    if "le" in constraints:
+        high = constraints["le"]
+    elif "lt" in constraints:
+        high = constraints["lt"] - step
+    # 片側だけ制約がある場合も範囲が空にならないようにする
+    if low > high:
+        low, high = (low, low + 10) if "ge" in constraints or "gt" in constraints else (high - 10, high)
+    return low, high
+
+
+def _partial_dicts(result: BaseModel) -> Iterator[dict]:
+    """
+    LangChain の構造化出力のストリーミングと同様に、
+    str フィールドが少しずつ伸びていく部分的な dict を順に返す。
+    """
+    data = result.model_dump()
+    partial: dict = {}
+    for key, value in data.items():
+        if isinstance(value, str) and value and type(result).model_fields[key].default != value:
+            for end in range(8, len(value), 8):
+                partial[key] = value[:end]
+                yield dict(partial)
+        partial[key] = value
+        yield dict(partial)
@@ -1,7 +1,9 @@
-from typing import TypeVar, Generic, Type
+from typing import Any, AsyncIterator, Iterator, TypeVar, Generic, Type
 from pydantic import BaseModel
 from langchain_openai import ChatOpenAI
 
+from src.core.llm.pool import backend_pool
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -30,16 +32,25 @@ class VLLMLangChainClient(Generic[T]):
             base_url: vLLM の OpenAI 互換エンドポイント
         """
 
+        self.model_name = model
         self.output_model = output_model
 
-        self.llm = ChatOpenAI(
-            model=model,
-            base_url=base_url,
-            api_key=api_key,
-            temperature=0.3,
-            # extra_body={
-            #     "guided_json": self.output_model.model_json_schema(),
-            # },
+        # ChatModel は同じモデル・エンドポイントの LLMClient 間で共有し、
+        # HTTP 接続は vLLM サーバー（base_url）ごとの接続プール（src.core.llm.pool）を使う
+        # → 同時接続数の上限がサーバー全体への負荷の上限になる
+        self.llm = backend_pool.chat_model(
+            ("vllm", model, base_url, api_key),
+            lambda: ChatOpenAI(
+                model=model,
+                base_url=base_url,
+                api_key=api_key,
+                temperature=0.3,
+                http_client=backend_pool.http_client("vllm", base_url),
+                http_async_client=backend_pool.async_http_client("vllm", base_url),
+                # extra_body={
+                #     "guided_json": self.output_model.model_json_schema(),
+                # },
+            ),
         )
         # LLM の出力を指定された型（構造化データ）として強制的に構造化するラッパー
         #
@@ -68,3 +79,46 @@ class VLLMLangChainClient(Generic[T]):
         result = self.structured_llm.invoke(messages)
 
         return result
+
+    async def agenerate(self, *, system: str, prompt: str) -> T:
+        """
+        非同期版の generate メソッド。
+        system / prompt を渡し、構造化データを生成する。
+        """
+
+        messages = [
+            ("system", system),
+            ("human", prompt),
+        ]
+
+        result = await self.structured_llm.ainvoke(messages)
+
+        return result
+
+    def stream(self, *, system: str, prompt: str) -> Iterator[Any]:
+        """
+        generate のストリーミング版。
+
+        部分的な生成結果（構造化データ、または dict）を順に返す。
+        最後の要素が完全な生成結果となる。
+        """
+
+        messages = [
+            ("system", system),
+            ("human", prompt),
+        ]
+
+        yield from self.structured_llm.stream(messages)
+
+    async def astream(self, *, system: str, prompt: str) -> AsyncIterator[Any]:
+        """
+        stream の非同期版。
+        """
+
+        messages = [
+            ("system", system),
+            ("human", prompt),
+        ]
+
+        async for chunk in self.structured_llm.astream(messages):
+            yield chunk
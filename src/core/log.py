@@ -0,0 +1,221 @@
+"""
+構造化ロガー
+
+責務:
+- サブシステムごとのロガー（get_logger）を提供する
+- レベル・サンプリングの判定を、レコードの組み立てより前に行う
+- 出力形式（text / json）とハンドラを設定する（configure_logging）
+
+設計方針:
+- 標準 logging の上に薄く載せる（レベル・ハンドラは logging の仕組みをそのまま使う）
+- メッセージは %-形式の引数で渡し、出力されるレコードだけを整形する
+  （f-string は呼び出し時点で整形されるため使わない）
+- 構造化フィールドは keyword 引数で渡す。値は出力時にのみ文字列化する
+- サンプリングは WARNING 未満のレコードにのみ適用する（警告・エラーは必ず出力する）
+
+使い方:
+    logger = get_logger("player.speak")
+    logger.debug("Generated speech for %s", player, speak=speak)
+"""
+
+import json
+import logging
+import random
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from src.config.log import LOG_FORMAT, LOG_LEVEL, LOG_SAMPLING
+
+# すべてのロガーの親（標準 logging のロガー名）
+ROOT_LOGGER_NAME = "werewolf"
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+
+def parse_sampling(spec: str) -> Dict[str, float]:
+    """
+    "player=0.1,metrics=0.01" 形式のサンプリング率を辞書にする。
+
+    不正な要素は無視する。
+    """
+    rates: Dict[str, float] = {}
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        if not sep:
+            continue
+        try:
+            rates[name.strip()] = min(max(float(value), 0.0), 1.0)
+        except ValueError:
+            continue
+    return rates
+
+
+def _sample_rate(subsystem: str, rates: Dict[str, float]) -> float:
+    """subsystem 自身、なければ最も近い親のサンプリング率（指定なしは 1.0）"""
+    name = subsystem
+    while name:
+        if name in rates:
+            return rates[name]
+        name = name.rpartition(".")[0]
+    return 1.0
+
+
+class StructuredLogger:
+    """
+    サブシステム単位のロガー。
+
+    - 出力されないレコード（レベル不足・サンプリング対象外）は、
+      標準 logging のレコードを作らずに戻る
+    """
+
+    __slots__ = ("subsystem", "sample_rate", "_logger")
+
+    def __init__(self, subsystem: str, sample_rate: float = 1.0):
+        self.subsystem = subsystem
+        self.sample_rate = sample_rate
+        self._logger = logging.getLogger(f"{ROOT_LOGGER_NAME}.{subsystem}")
+
+    def is_enabled(self, level: int) -> bool:
+        """level のレコードを出力するか（サンプリングは含まない）"""
+        return self._logger.isEnabledFor(level)
+
+    def debug(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(DEBUG, msg, args, fields)
+
+    def info(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(INFO, msg, args, fields)
+
+    def warning(self, msg: str, *args: Any, exc_info: bool = False, **fields: Any) -> None:
+        self._log(WARNING, msg, args, fields, exc_info)
+
+    def error(self, msg: str, *args: Any, exc_info: bool = False, **fields: Any) -> None:
+        self._log(ERROR, msg, args, fields, exc_info)
+
+    def exception(self, msg: str, *args: Any, **fields: Any) -> None:
+        """ERROR レベルで、処理中の例外のトレースバックを付けて出力する"""
+        self._log(ERROR, msg, args, fields, True)
+
+    def _log(
+        self,
+        level: int,
+        msg: str,
+        args: tuple,
+        fields: Dict[str, Any],
+        exc_info: bool = False,
+    ) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        if level < WARNING and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        # stacklevel: _log → debug などの公開メソッド → 呼び出し元
+        self._logger.log(
+            level,
+            msg,
+            *args,
+            exc_info=exc_info,
+            extra={"subsystem": self.subsystem, "fields": fields},
+            stacklevel=3,
+        )
+
+
+_loggers: Dict[str, StructuredLogger] = {}
+_sampling: Dict[str, float] = parse_sampling(LOG_SAMPLING)
+_lock = threading.Lock()
+
+
+def get_logger(subsystem: str) -> StructuredLogger:
+    """
+    サブシステムのロガーを返す（同じ名前には同じインスタンスを返す）。
+
+    subsystem は "." 区切りの名前（例: "player.node" / "app.repository"）。
+    """
+    with _lock:
+        logger = _loggers.get(subsystem)
+        if logger is None:
+            logger = _loggers[subsystem] = StructuredLogger(
+                subsystem, _sample_rate(subsystem, _sampling)
+            )
+        return logger
+
+
+# =========================================================
+# 出力形式
+# =========================================================
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return value
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(_jsonable(value), ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """人が読む形式。構造化フィールドは key=value として末尾に付ける"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s [%(subsystem)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "subsystem"):
+            record.subsystem = record.name
+        text = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            text += " " + " ".join(f"{key}={_dumps(value)}" for key, value in fields.items())
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    """1 行 1 レコードの JSON 形式"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "subsystem": getattr(record, "subsystem", record.name),
+            "msg": record.getMessage(),
+        }
+        for key, value in (getattr(record, "fields", None) or {}).items():
+            data.setdefault(key, _jsonable(value))
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    fmt: Optional[str] = None,
+    sampling: Optional[str] = None,
+    *,
+    stream=None,
+) -> None:
+    """
+    ログの出力先・レベル・形式・サンプリング率を設定する。
+
+    アプリケーション（API サーバー / CLI）の起動時に 1 回呼ぶ。
+    再度呼んだ場合は設定を置き換える。省略した項目は src.config.log の値を使う。
+    """
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel((level or LOG_LEVEL).upper())
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if (fmt or LOG_FORMAT) == "json" else TextFormatter())
+    for old in list(root.handlers):
+        root.removeHandler(old)
+    root.addHandler(handler)
+    # uvicorn などが root ロガーに設定したハンドラで二重に出力しない
+    root.propagate = False
+
+    global _sampling
+    with _lock:
+        _sampling = parse_sampling(LOG_SAMPLING if sampling is None else sampling)
+        for logger in _loggers.values():
+            logger.sample_rate = _sample_rate(logger.subsystem, _sampling)
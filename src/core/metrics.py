@@ -0,0 +1,302 @@
+"""
+プロセス内メトリクスレジストリ
+
+責務:
+- カウンタ（累積値）・ゲージ（現在値）・ヒストグラム（分布）をラベル付きで保持する
+- セッションごとの集計（ノード × プレイヤー単位）を、直近のセッション分だけ保持する
+- 現在値をスナップショット（dict）として返す
+- スナップショットを Prometheus のテキスト形式に変換する（/metrics エンドポイント用）
+
+設計方針:
+- 外部ライブラリに依存しない（標準ライブラリのみ）
+- 複数スレッドから同時に記録してよい（1 つのロックで保護する）
+- ラベルの組み合わせ数が増えすぎないよう、session_id はメトリクスのラベルには使わず、
+  セッションごとの集計として別に保持する
+- ヒストグラムのバケットは Prometheus の既定値に合わせる
+- キャッシュ件数のように「参照時点の値」で十分なゲージは、
+  値を返す関数を登録しておき、スナップショット時に評価する
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# ラベルは (名前, 値) の組をソートしたタプルで表す
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Prometheus の既定のバケット（秒）
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# セッションごとの集計を保持するセッション数の上限（古いものから削除する）
+MAX_SESSIONS = 256
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Histogram:
+    """
+    値の分布（バケットごとの件数・合計・件数）を保持する。
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # 各バケット以下の値の件数（累積ではない。snapshot で累積にする）
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.counts[i] += 1
+                break
+
+    def snapshot(self) -> dict:
+        cumulative = []
+        total = 0
+        for upper, count in zip(self.buckets, self.counts):
+            total += count
+            cumulative.append((upper, total))
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class MetricsRegistry:
+    """
+    ラベル付きのカウンタ・ヒストグラムと、セッションごとの集計を保持するレジストリ。
+    """
+
+    def __init__(self, *, max_sessions: int = MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = defaultdict(dict)
+        self._gauges: Dict[str, Dict[LabelKey, float]] = defaultdict(dict)
+        self._gauge_functions: Dict[str, Callable[[], float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = defaultdict(dict)
+        self._help: Dict[str, str] = {}
+        # session_id → (ラベル → 集計値)
+        self._sessions: "OrderedDict[str, Dict[LabelKey, Dict[str, float]]]" = OrderedDict()
+
+    # =========================================================
+    # 記録
+    # =========================================================
+    def describe(self, name: str, help_text: str) -> None:
+        """メトリクスの説明を登録する（エクスポート時に使われる）"""
+        with self._lock:
+            self._help[name] = help_text
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        """カウンタを value だけ増やす"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """ゲージを value に設定する"""
+        key = _label_key(labels)
+        with self._lock:
+            self._gauges[name][key] = value
+
+    def add_gauge(self, name: str, value: float, **labels) -> None:
+        """ゲージを value だけ増減する"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._gauges[name]
+            series[key] = series.get(key, 0.0) + value
+
+    def gauge_function(self, name: str, fn: Callable[[], float]) -> None:
+        """
+        スナップショット時に fn() を評価するゲージ（ラベルなし）を登録する。
+
+        同じ name で再登録した場合は後勝ち。
+        """
+        with self._lock:
+            self._gauge_functions[name] = fn
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """ヒストグラムに値を 1 件記録する"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms[name]
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def time(self, name: str, **labels) -> Iterator[None]:
+        """with ブロックの実行時間（秒）をヒストグラムに記録する（例外時も記録する）"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def add_session(self, session_id: str, amounts: Dict[str, float], **labels) -> None:
+        """
+        セッションごとの集計に amounts を加算する。
+
+        直近 max_sessions 件のセッションのみ保持する。
+        """
+        key = _label_key(labels)
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = {}
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session_id)
+
+            totals = session.setdefault(key, {})
+            for field, value in amounts.items():
+                totals[field] = totals.get(field, 0.0) + value
+
+    # =========================================================
+    # 参照
+    # =========================================================
+    def counter_value(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def gauge_value(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._gauges.get(name, {}).get(_label_key(labels), 0.0)
+
+    def session_summary(self, session_id: str) -> Optional[List[dict]]:
+        """
+        セッションごとの集計を返す（記録が無い場合は None）。
+
+        例: [{"labels": {"graph": "player_graph", "node": "speak_generate", "player": "太郎"},
+              "values": {"calls": 2, "wall_sec": 1.3}}]
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            return [
+                {"labels": dict(key), "values": dict(values)}
+                for key, values in session.items()
+            ]
+
+    def snapshot(self) -> dict:
+        """
+        全メトリクスの現在値を返す。
+
+        {"counters": {name: [{"labels": ..., "value": ...}]},
+         "gauges": {name: [{"labels": ..., "value": ...}]},
+         "histograms": {name: [{"labels": ..., "count": ..., "sum": ..., "buckets": [...]}]},
+         "help": {name: 説明}}
+        """
+        with self._lock:
+            gauge_functions = dict(self._gauge_functions)
+
+        # 登録された関数はロックの外で評価する（関数側が別のロックを取ってもよい）
+        computed = {}
+        for name, fn in gauge_functions.items():
+            try:
+                computed[name] = [{"labels": {}, "value": float(fn())}]
+            except Exception:
+                continue
+
+        with self._lock:
+            return {
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    **{
+                        name: [
+                            {"labels": dict(key), "value": value}
+                            for key, value in series.items()
+                        ]
+                        for name, series in self._gauges.items()
+                    },
+                    **computed,
+                },
+                "histograms": {
+                    name: [
+                        {"labels": dict(key), **histogram.snapshot()}
+                        for key, histogram in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+                "help": dict(self._help),
+            }
+
+    def reset(self) -> None:
+        """すべての記録を削除する（テスト用）"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self._sessions.clear()
+
+
+# =========================================================
+# Prometheus テキスト形式
+# =========================================================
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items())
+    return "{" + inner + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def format_prometheus(snapshot: dict) -> str:
+    """
+    snapshot() の結果を Prometheus のテキスト形式（version 0.0.4）に変換する。
+
+    セッションごとの集計は含めない（session_id をラベルにすると系列数が増え続けるため）。
+    """
+    help_texts = snapshot.get("help", {})
+    lines: List[str] = []
+
+    def header(name: str, kind: str) -> None:
+        if name in help_texts:
+            lines.append(f"# HELP {name} {help_texts[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    for kind in ("counters", "gauges"):
+        for name, series in sorted(snapshot.get(kind, {}).items()):
+            header(name, kind[:-1])
+            for item in series:
+                lines.append(f"{name}{_format_labels(item['labels'])} {_format_value(item['value'])}")
+
+    for name, series in sorted(snapshot.get("histograms", {}).items()):
+        header(name, "histogram")
+        for item in series:
+            labels = item["labels"]
+            for upper, count in item["buckets"]:
+                bucket_labels = _format_labels({**labels, "le": repr(float(upper))})
+                lines.append(f"{name}_bucket{bucket_labels} {count}")
+            inf_labels = _format_labels({**labels, "le": "+Inf"})
+            lines.append(f"{name}_bucket{inf_labels} {item['count']}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(item['sum'])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {item['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+# アプリケーション全体で共有するレジストリ
+metrics = MetricsRegistry()
@@ -20,6 +20,7 @@ ActionResolver - PlayerOutput を解釈し、副作用を決定するクラス
 from __future__ import annotations
 from typing import TYPE_CHECKING, Dict
 
+from src.core.log import get_logger
 from src.core.types import (
     PlayerName,
     RoleName,
@@ -36,6 +37,8 @@ from src.core.types import (
 if TYPE_CHECKING:
     from src.core.session.game_session import GameSession
 
+logger = get_logger("session.action")
+
 
 class ActionResolver:
     """
@@ -170,13 +173,17 @@ class ActionResolver:
                 thief_role = self.assigned_roles[player]
                 target_role = self.assigned_roles[target]
                 
-                print(f"[DEBUG] ActionResolver ThiefAbility: {player}(was {thief_role}) swaps with {target}(was {target_role})")
-                
                 # assigned_roles を更新（GM の真実情報）
                 self.assigned_roles[player] = target_role
                 self.assigned_roles[target] = thief_role
                 
-                print(f"[DEBUG] ActionResolver: After swap - {player} is now {target_role}, {target} is now {thief_role}")
+                logger.debug(
+                    "Thief %s swapped roles with %s",
+                    player,
+                    target,
+                    thief_role=thief_role,
+                    target_role=target_role,
+                )
                 
                 # 怪盗本人に役職交換結果を通知
                 # （対象プレイヤーは自分の役職が変わったことを知らない）
@@ -188,6 +195,7 @@ class ActionResolver:
                             payload={
                                 "target": target,
                                 "new_role": target_role,
+                                "old_role": thief_role,
                             },
                         )
                     ),
@@ -225,6 +233,10 @@ class ActionResolver:
     ) -> None:
         """
         投票アクションを解釈する。
+
+        投票は Dispatcher により全員分が並列に収集された後、
+        request の順序（= vote_pending の順序）で 1 件ずつ呼ばれる。
+        そのため votes / vote イベントの反映順序は実行タイミングに依存しない。
         """
         target = output.payload["target"]
         session.gm_internal.votes[player] = target
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING
 
 from src.core.types import (
     GameDecision,
+    GameEvent,
     PlayerInput,
 )
 
@@ -29,6 +30,15 @@ if TYPE_CHECKING:
     from src.core.session.game_session import GameSession
 
 
+# 他プレイヤーの行動結果に依存しない request の種類。
+# これらは全員分の出力を並列に収集してから、要求順にまとめて解決する。
+#
+# - vote: 投票先の決定は互いに独立している
+#         （投票結果は全員の投票完了後に result フェーズで集計される）
+# - use_ability は占い → 役職交換の順序制御が必要なため含めない
+PARALLEL_REQUEST_TYPES = {"vote"}
+
+
 class Dispatcher:
     """
     GameDecision を解釈し、ゲーム世界に反映する処理を制御するクラス。
@@ -57,19 +67,18 @@ class Dispatcher:
         - この dispatch が state を更新する唯一の場所（state の所有者）
         - event と request は同時には来ない運用とする
           （= 観測フェーズと行動フェーズは明確に分離される）
+        - 1 つの event に対する各プレイヤーの観測ターンは互いに独立しているため、
+          session.run_player_turns により並列に実行する
+          （確定順序はプレイヤー順で決定的）
         """
         # =========================================================
         # 1. pending_events の配布（Player 行動の内省）
         # =========================================================
         if session.world_state.pending_events:
             for event in session.world_state.pending_events:
-                for player in session.player_states:
-                    session.run_player_turn(
-                        player=player,
-                        input=PlayerInput(event=event),
-                    )
+                self._broadcast_event(event, session)
             # 配布が終わったら「過去の事実」に昇格
-            session.world_state.public_events.extend(session.world_state.pending_events)
+            session.commit_public_events(session.world_state.pending_events)
             session.world_state.pending_events.clear()
 
         # =========================================================
@@ -80,15 +89,11 @@ class Dispatcher:
         # - request と同一 step で同時に存在してよい
         if decision.events:
             for event in decision.events:
-                for player in session.player_states:
-                    # event は「観測情報」なので全員に配布する
-                    session.run_player_turn(
-                        player=player,
-                        input=PlayerInput(event=event),
-                    )
+                # event は「観測情報」なので全員に配布する
+                self._broadcast_event(event, session)
             # event は全員に配布し終えた後で、
             # 公開ログ（WorldState）として確定させる
-            session.world_state.public_events.extend(decision.events)
+            session.commit_public_events(decision.events)
             # GM がどこまで event を配布し終えたかを示すカーソル
             # （LangGraph 実装や再実行・再開時の安全装置として有用）
             session.gm_internal.gm_event_cursor = len(session.world_state.public_events)
@@ -109,21 +114,29 @@ class Dispatcher:
             if requests_list and requests_list[0][1].request_type == "use_ability":
                 requests_list = self._sort_by_ability_priority(requests_list, session)
             
-            for player, request in requests_list:
-                output = session.run_player_turn(
-                    player=player,
-                    input=PlayerInput(
-                        request=request,
-                    ),
-                )
-                # Player の出力（発言・投票・能力使用など）を
-                # GM 視点で解釈・確定させ、世界状態に反映する
-                #
-                # ここで初めて「行動の結果」が事実になる
-                session.resolve_player_output(
-                    player=player,
-                    output=output,
-                )
+            # 互いに依存しない行動要求（投票など）は、
+            # 全員分の出力を並列にまとめて収集してから解決する
+            if all(
+                request.request_type in PARALLEL_REQUEST_TYPES
+                for _player, request in requests_list
+            ):
+                self._collect_and_resolve(requests_list, session)
+            else:
+                for player, request in requests_list:
+                    output = session.run_player_turn(
+                        player=player,
+                        input=PlayerInput(
+                            request=request,
+                        ),
+                    )
+                    # Player の出力（発言・投票・能力使用など）を
+                    # GM 視点で解釈・確定させ、世界状態に反映する
+                    #
+                    # ここで初めて「行動の結果」が事実になる
+                    session.resolve_player_output(
+                        player=player,
+                        output=output,
+                    )
 
         # =========================================================
         # 3. フェーズ遷移
@@ -134,6 +147,49 @@ class Dispatcher:
         if decision.next_phase is not None:
             session.world_state.phase = decision.next_phase
 
+    def _collect_and_resolve(
+        self,
+        requests_list: list,
+        session: "GameSession",
+    ) -> None:
+        """
+        独立した行動要求の出力を並列に収集し、要求順に解決する。
+
+        - 各プレイヤーの行動決定（LLM 呼び出しを含む）は並列に実行される
+        - 出力の解決（副作用の確定）は requests_list の順序で逐次行うため、
+          votes / public_events への反映順序は常に安定する
+
+        Args:
+            requests_list: (player_name, request) のタプルリスト
+            session: GameSession
+        """
+        outputs = session.run_player_turns(
+            {player: PlayerInput(request=request) for player, request in requests_list}
+        )
+
+        for player, _request in requests_list:
+            session.resolve_player_output(
+                player=player,
+                output=outputs[player],
+            )
+
+    def _broadcast_event(
+        self,
+        event: GameEvent,
+        session: "GameSession",
+    ) -> None:
+        """
+        1 つの event を全プレイヤーに配布する。
+
+        - 各プレイヤーの観測ターンは互いに依存しないため並列に実行される
+        - event の順序は呼び出し側で保証する
+          （プレイヤーごとの記憶に積まれる順序が変わらないよう、
+          次の event の配布は前の event の配布完了後に行う）
+        """
+        session.run_player_turns(
+            {player: PlayerInput(event=event) for player in session.player_states}
+        )
+
     def _sort_by_ability_priority(
         self,
         requests_list: list,
@@ -30,16 +30,22 @@ from src.core.types import (
     PlayerState,
     PlayerName,
     RoleName,
+    GameEvent,
     PlayerInput,
     PlayerOutput,
     GMGraphState,
     GameDecision,
     GMInternalState,
+    fork_player_state,
 )
-from typing import Dict
+from typing import Callable, Dict, Iterable, Optional
+import contextvars
+import random
+from concurrent.futures import ThreadPoolExecutor
 from src.core.controller import PlayerController
 from src.graphs.gm.gm_graph import GMGraph, gm_graph
-from copy import deepcopy
+from src.config.session import PLAYER_TURN_MAX_WORKERS
+from src.core.cancellation import raise_if_cancelled
 
 from src.core.session.action_resolver import ActionResolver
 from src.core.session.dispatcher import Dispatcher
@@ -75,6 +81,7 @@ class GameSession:
         assigned_roles: Dict[PlayerName, RoleName],
         gm_graph: GMGraph,
         gm_internal: GMInternalState,
+        max_workers: int = PLAYER_TURN_MAX_WORKERS,
     ):
         self.definition = definition
         # このゲームのルール定義。
@@ -132,6 +139,16 @@ class GameSession:
         #
         # WorldState には含められない、
         # 「進行管理のためだけに必要な非公開情報」を保持する。
+        self.max_workers = max_workers
+        # 複数プレイヤーの独立したターンを並列実行する際の最大並列数。
+        #
+        # 1 の場合は run_player_turns も逐次実行となる。
+        self._event_listeners: list[Callable[[GameEvent], None]] = []
+        # public_events に確定したイベントの通知先。
+        #
+        # ストリーミング配信など、ステップ完了を待たずに
+        # 公開イベントを受け取りたい呼び出し側が登録する。
+        # 永続化の対象ではない（セッション復元時は空）。
 
         # --- 責務委譲先のインスタンス ---
         self._action_resolver = ActionResolver(assigned_roles=assigned_roles)
@@ -139,7 +156,13 @@ class GameSession:
         self._phase_runner = PhaseRunner()
 
     @classmethod
-    def create(cls, definition: GameDefinition) -> "GameSession":
+    def create(
+        cls,
+        definition: GameDefinition,
+        *,
+        max_workers: int = PLAYER_TURN_MAX_WORKERS,
+        seed: Optional[int] = None,
+    ) -> "GameSession":
         """
         ゲーム開始時の GameSession を生成するファクトリメソッド。
 
@@ -149,13 +172,17 @@ class GameSession:
         - PlayerState の初期化
         - WorldState の初期化
 
+        seed を指定した場合、役職配布はシードのみで決まる（再現可能）。
+        他のゲームと並行実行しても互いの乱数列には影響しない。
+
         重要な設計意図：
         ・GameSession はこのメソッド経由でのみ生成する
         ・初期化手順を 1 箇所に集約する
         ・外部から GameSession を直接 new させない
         """
 
-        players, assigned_roles, player_memories, controllers = setup_game(definition)
+        rng = random.Random(seed) if seed is not None else None
+        players, assigned_roles, player_memories, controllers = setup_game(definition, rng)
         # ゲーム定義に基づいて初期セットアップを行う。
         #
         # - players: プレイヤー一覧
@@ -211,6 +238,7 @@ class GameSession:
             assigned_roles=assigned_roles,
             gm_graph=gm_graph,
             gm_internal=gm_internal,
+            max_workers=max_workers,
         )
 
     def run_player_turn(
@@ -227,6 +255,97 @@ class GameSession:
         - output はターン限定の結果（次ターンには持ち越さない）
         - state の所有・永続的な更新は GameSession の責務
         """
+        new_state = self._compute_player_turn(player=player, input=input)
+
+        # --- 待機ターン ---
+        # state を一切変更せず終了する
+        if new_state is None:
+            return None
+
+        # --- 結果の確定保存 ---
+        # 計算された state を正式な状態として保存
+        # （state の確定・永続化は GameSession の責務）
+        self.player_states[player] = new_state
+
+        # このターンで生成された出力のみを返す
+        # （無い場合は None）
+        return new_state["output"]
+
+    def run_player_turns(
+        self,
+        inputs: Dict[PlayerName, PlayerInput],
+    ) -> Dict[PlayerName, PlayerOutput | None]:
+        """
+        互いに独立した複数プレイヤーのターンをまとめて実行する。
+
+        - 各プレイヤーの次の state の計算（PlayerGraph の実行）は
+          max_workers を上限としてスレッドプールで並列に行う
+        - 計算結果の確定保存は inputs の順序どおりに逐次行うため、
+          実行タイミングに関わらず結果は決定的になる
+        - いずれかのターンが例外を送出した場合、それより前の
+          プレイヤーの結果は確定済みとなり、最初の例外が再送出される
+          （逐次実行した場合と同じ振る舞い）
+
+        Returns
+        -------
+        Dict[PlayerName, PlayerOutput | None]
+            inputs と同じ順序の、各プレイヤーのこのターンの出力
+        """
+        players = list(inputs)
+
+        if self.max_workers <= 1 or len(players) <= 1:
+            return {
+                player: self.run_player_turn(player=player, input=inputs[player])
+                for player in players
+            }
+
+        # --- 計算フェーズ（並列）---
+        # 各 working state はプレイヤーごとに独立しているため、
+        # 計算中に他プレイヤーの state と干渉することはない
+        # contextvars（キャンセル要求など）はワーカースレッドに引き継がれないため、
+        # submit ごとに呼び出し元のコンテキストを複製して実行する
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(players)),
+            thread_name_prefix="player-turn",
+        ) as executor:
+            futures = {
+                player: executor.submit(
+                    contextvars.copy_context().run,
+                    self._compute_player_turn,
+                    player=player,
+                    input=inputs[player],
+                )
+                for player in players
+            }
+
+        # --- 確定フェーズ（逐次・決定的な順序）---
+        outputs: Dict[PlayerName, PlayerOutput | None] = {}
+        for player in players:
+            new_state = futures[player].result()
+            if new_state is None:
+                outputs[player] = None
+                continue
+            self.player_states[player] = new_state
+            outputs[player] = new_state["output"]
+
+        return outputs
+
+    def _compute_player_turn(
+        self,
+        *,
+        player: PlayerName,
+        input: PlayerInput,
+    ) -> PlayerState | None:
+        """
+        対象プレイヤーの次の state を計算して返す（確定保存はしない）。
+
+        - self.player_states は読み取るだけで変更しない
+        - そのため、異なるプレイヤーに対しては並列に呼び出してよい
+        - 待機ターン（request も event も無い）の場合は None を返す
+        - 中断要求があれば LLM を呼ぶ前に StepCancelled を送出する
+        """
+
+        raise_if_cancelled()
 
         # 現在のプレイヤー状態（確定済み・永続）
         old_state = self.player_states[player]
@@ -238,14 +357,14 @@ class GameSession:
         # --- 待機ターン判定 ---
         # request も event も無い場合は
         # 「このターンは何も観測も行動も発生しない」
-        # ため、state を一切変更せず終了する
         if input.request is None and input.event is None:
             return None
 
         # --- Controller 用の working state を作成 ---
         # Controller / PlayerGraph は state の所有者ではないため、
         # 既存 state を直接渡さず、必ずコピーを渡す
-        working_state = deepcopy(old_state)
+        # （構造共有による fork のため、ログ長に比例するコピーは発生しない）
+        working_state = fork_player_state(old_state)
 
         # 今ターンに GM から与えられた入力を注入
         # （イベント通知 / 行動要求）
@@ -262,16 +381,7 @@ class GameSession:
         # --- 次の状態を計算 ---
         # Controller（内部で PlayerGraph を使用）が
         # working_state をもとに次の状態を生成する
-        new_state = controller.act(state=working_state)
-
-        # --- 結果の確定保存 ---
-        # 計算された state を正式な状態として保存
-        # （state の確定・永続化は GameSession の責務）
-        self.player_states[player] = new_state
-
-        # このターンで生成された出力のみを返す
-        # （無い場合は None）
-        return new_state["output"]
+        return controller.act(state=working_state)
 
     def run_gm_step(self) -> GMGraphState:
         """
@@ -280,8 +390,11 @@ class GameSession:
         - GMGraph が正しく invoke できるかを確認する目的
         - この時点では Player への dispatch（行動要求の配布）は行わない
         - world_state の確定保存は GameSession の責務
+        - 中断要求があれば GMGraph を実行する前に StepCancelled を送出する
         """
 
+        raise_if_cancelled()
+
         # --- GMGraph に渡す state を構築 ---
         # world_state:
         #   現在のゲームの公開状態（事実）
@@ -326,6 +439,37 @@ class GameSession:
         """
         self._dispatcher.dispatch(decision, session=self)
 
+    # =========================================================
+    # 公開イベントの確定と通知
+    # =========================================================
+
+    def add_event_listener(self, listener: Callable[[GameEvent], None]) -> None:
+        """
+        public_events に確定したイベントを受け取る通知先を登録する。
+
+        通知はイベントを確定したスレッドから同期的に呼び出されるため、
+        listener は重い処理を行わず、速やかに返ること。
+        """
+        self._event_listeners.append(listener)
+
+    def remove_event_listener(self, listener: Callable[[GameEvent], None]) -> None:
+        """登録済みの通知先を解除する（未登録の場合は何もしない）"""
+        if listener in self._event_listeners:
+            self._event_listeners.remove(listener)
+
+    def commit_public_events(self, events: Iterable[GameEvent]) -> None:
+        """
+        イベントを公開ログ（WorldState.public_events）として確定させ、
+        登録済みの通知先へ順に通知する。
+
+        public_events への追加はこのメソッドに集約する。
+        """
+        events = list(events)
+        self.world_state.public_events.extend(events)
+        for event in events:
+            for listener in list(self._event_listeners):
+                listener(event)
+
     # =========================================================
     # 委譲メソッド（ActionResolver）
     # =========================================================
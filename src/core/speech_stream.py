@@ -0,0 +1,74 @@
+"""
+発言のストリーミング通知
+
+責務:
+- AI プレイヤーの発言テキストを、生成途中から呼び出し元（API など）へ通知する
+
+設計方針:
+- 通知先は contextvars で実行コンテキストに紐づける
+  （Graph / Node のシグネチャを変更せずに、ストリーミング配信時のみ有効になる）
+- 通知先が無い場合（通常の実行）は、発言は従来どおり一括で生成される
+- 通知するのは生成途中の差分のみ。確定した発言は従来どおり speak イベントとして公開される
+- 通知済みの下書きがレビューで差し替えられた場合は、取り消し（discard）を通知する
+  （差し替え後の発言は、確定した speak イベントでのみ公開する）
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+# (player, delta) を受け取る通知先
+SpeechDeltaCallback = Callable[[str, str], None]
+# 下書きを取り消した player を受け取る通知先
+SpeechDiscardCallback = Callable[[str], None]
+
+_current_callback: ContextVar[Optional[SpeechDeltaCallback]] = ContextVar(
+    "speech_delta_callback", default=None
+)
+_current_discard_callback: ContextVar[Optional[SpeechDiscardCallback]] = ContextVar(
+    "speech_discard_callback", default=None
+)
+
+
+@contextmanager
+def speech_stream_scope(
+    callback: SpeechDeltaCallback,
+    on_discard: Optional[SpeechDiscardCallback] = None,
+) -> Iterator[None]:
+    """
+    with ブロック内の発言生成をストリーミングモードにし、差分を callback に通知する。
+
+    on_discard を指定した場合、通知済みの下書きの取り消しを受け取る。
+    """
+    reset = _current_callback.set(callback)
+    reset_discard = _current_discard_callback.set(on_discard)
+    try:
+        yield
+    finally:
+        _current_discard_callback.reset(reset_discard)
+        _current_callback.reset(reset)
+
+
+def is_speech_streaming() -> bool:
+    """現在の実行コンテキストがストリーミングモードかどうか"""
+    return _current_callback.get() is not None
+
+
+def report_speech_delta(player: str, delta: str) -> None:
+    """
+    生成途中の発言テキストの差分を通知する。
+    """
+    callback = _current_callback.get()
+    if callback is not None and delta:
+        callback(player, delta)
+
+
+def report_speech_discard(player: str) -> None:
+    """
+    通知済みの発言の下書きが採用されなかったことを通知する。
+
+    受け取った側は、それまでの差分の表示を破棄し、確定した speak イベントを待つ。
+    """
+    callback = _current_discard_callback.get()
+    if callback is not None:
+        callback(player)
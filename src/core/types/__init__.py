@@ -10,6 +10,7 @@ types パッケージ - 全ての型定義を再エクスポート
 - player.py  : プレイヤー関連
 - events.py  : イベント・リクエスト
 - gm.py      : GM 進行管理
+- append_only.py : 追記専用リスト（構造共有）
 """
 
 # 役職・陣営
@@ -44,8 +45,12 @@ from src.core.types.player import (
     ThiefAbility,
     AbilityResult,
     Vote,
+    fork_player_state,
 )
 
+# 追記専用リスト
+from src.core.types.append_only import AppendOnlyList
+
 # フェーズ・ゲーム定義・ワールド状態
 from src.core.types.phases import (
     Phase,
@@ -87,6 +92,9 @@ __all__ = [
     "ThiefAbility",
     "AbilityResult",
     "Vote",
+    "fork_player_state",
+    # append_only
+    "AppendOnlyList",
     # phases
     "Phase",
     "GameDefinition",
@@ -0,0 +1,171 @@
+"""
+追記専用リスト（構造共有）の型定義
+
+責務:
+- observed_events / history のような「追記のみ」のログを
+  複製コストなしで分岐（fork）できるシーケンスを提供する
+
+設計方針:
+- 複数のビューが 1 つのバッファを共有し、各ビューは自分の長さだけを持つ
+- fork は O(1)（バッファを共有し、長さだけをコピーする）
+- 末尾に追記できるのは「バッファの末尾 = 自分の末尾」であるビューのみ
+- 他のビューが先に追記していた場合は、自分の範囲だけを複製してから追記する
+  （copy-on-divergence）
+
+これにより、GameSession が確定済み state を保持したまま
+Controller に作業用 state を渡しても、ログ長に比例したコピーは発生しない。
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from copy import deepcopy
+from itertools import islice
+from typing import Any, Generic, TypeVar, get_args
+
+from pydantic_core import core_schema
+
+__all__ = [
+    "AppendOnlyList",
+]
+
+T = TypeVar("T")
+
+
+class AppendOnlyList(Sequence[T], Generic[T]):
+    """
+    fork を O(1) で行える追記専用リスト。
+
+    - 読み取りは通常の list と同様（len / index / slice / iter）
+    - 書き込みは append / extend のみ（要素の置換・削除は不可）
+    - slice は通常の list を返す
+
+    使用例:
+        events = AppendOnlyList([e1, e2])
+        working = events.fork()   # O(1)
+        working.append(e3)        # events からは見えない
+        assert len(events) == 2
+    """
+
+    __slots__ = ("_items", "_length", "_lock")
+
+    def __init__(self, values: Iterable[T] = ()):
+        self._items: list[T] = list(values)
+        self._length = len(self._items)
+        # 同じバッファを共有するビュー間で共有されるロック
+        self._lock = threading.Lock()
+
+    @classmethod
+    def snapshot(cls, values: Iterable[T]) -> "AppendOnlyList[T]":
+        """
+        values の独立したビューを返す。
+
+        - AppendOnlyList の場合は fork（O(1)）
+        - それ以外（通常の list など）の場合は複製して包む
+        """
+        if isinstance(values, AppendOnlyList):
+            return values.fork()
+        return cls(values)
+
+    def fork(self) -> "AppendOnlyList[T]":
+        """
+        現在の内容を共有する新しいビューを返す。
+
+        以降の append は互いに影響しない。
+        """
+        forked = object.__new__(type(self))
+        forked._items = self._items
+        forked._length = self._length
+        forked._lock = self._lock
+        return forked
+
+    # =========================
+    # 書き込み
+    # =========================
+    def append(self, item: T) -> None:
+        with self._lock:
+            if self._length != len(self._items):
+                # 他のビューが同じバッファに先に追記している
+                # → 自分の範囲だけを複製して分岐する
+                self._items = self._items[: self._length]
+                self._lock = threading.Lock()
+            self._items.append(item)
+            self._length += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        for item in values:
+            self.append(item)
+
+    # =========================
+    # 読み取り
+    # =========================
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            return self._items[start:stop:step]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("AppendOnlyList index out of range")
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return islice(self._items, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (AppendOnlyList, list, tuple)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"AppendOnlyList({list(self)!r})"
+
+    # =========================
+    # copy / pickle
+    # =========================
+    def __copy__(self) -> "AppendOnlyList[T]":
+        return self.fork()
+
+    def __deepcopy__(self, memo: dict) -> "AppendOnlyList[T]":
+        return type(self)(deepcopy(list(self), memo))
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    # =========================
+    # pydantic 連携
+    # =========================
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler) -> core_schema.CoreSchema:
+        """
+        AppendOnlyList[X] を pydantic のフィールド型として使えるようにする。
+
+        - 入力: list[X] として検証した後 AppendOnlyList に包む
+          （AppendOnlyList が渡された場合は fork して共有する）
+        - 出力: list[X] としてシリアライズする
+        """
+        args = get_args(source)
+        item_schema = (
+            handler.generate_schema(args[0]) if args else core_schema.any_schema()
+        )
+        list_schema = core_schema.list_schema(item_schema)
+
+        return core_schema.union_schema(
+            [
+                core_schema.no_info_after_validator_function(
+                    lambda value: value.fork(),
+                    core_schema.is_instance_schema(cls),
+                ),
+                core_schema.no_info_after_validator_function(cls, list_schema),
+            ],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list,
+                return_schema=list_schema,
+            ),
+        )
@@ -9,8 +9,9 @@
 """
 
 from typing import List, Dict, Optional, Literal, TypeAlias, TypedDict, Union, Any
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from src.core.types.append_only import AppendOnlyList
 from src.core.types.roles import RoleName
 from src.core.types.events import GameEvent, PlayerRequest, PlayerRequestType
 from src.core.memory import (
@@ -39,6 +40,7 @@ __all__ = [
     "ThiefAbility",
     "AbilityResult",
     "Vote",
+    "fork_player_state",
 ]
 
 
@@ -58,8 +60,15 @@ class RoleProb(BaseModel):
     - key   : RoleName
     - value : 確率（0.0〜1.0）
     - 合計は 1.0 でなければならない
+
+    不変（frozen）:
+    - 一度生成した RoleProb は変更しない
+    - 更新する場合は新しい RoleProb を生成して role_beliefs に代入する
+    - これにより、state の fork 時に RoleProb を共有できる
     """
 
+    model_config = ConfigDict(frozen=True)
+
     probs: Dict[RoleName, float] = Field(default_factory=dict)
     # 役職ごとの確率分布
     # 例: {"villager": 0.5, "seer": 0.2, "werewolf": 0.3}
@@ -105,9 +114,10 @@ class PlayerMemory(BaseModel):
     # =========================
     # 観測した事実（公開情報）
     # =========================
-    observed_events: list[GameEvent]
+    observed_events: AppendOnlyList[GameEvent]
     # public_event を「そのまま」保存
     # 事実のみ・改変禁止
+    # 追記専用（AppendOnlyList）のため、state の fork 時もコピーは発生しない
 
     role_beliefs: Dict[PlayerName, RoleProb]
     """
@@ -132,8 +142,10 @@ class PlayerMemory(BaseModel):
     - 不確実性を含んだ信念表現が可能になる
     """
 
-    history: List[Reaction | Reflection] = Field(default_factory=list)
-    # 観測・推論・内省の履歴ログ
+    history: AppendOnlyList[Reaction | Reflection] = Field(
+        default_factory=AppendOnlyList
+    )
+    # 観測・推論・内省の履歴ログ（追記専用）
     # - 基本的には GameEvent 相当の dict（発言・投票結果など）
     # - 将来的に自己思考や推論ログも混在する想定
 
@@ -149,6 +161,10 @@ class PlayerMemory(BaseModel):
     # 最後に要約したイベントのインデックス
     # 次回は observed_events[last_summarized_event_index:] を対象とする
 
+    last_belief_event_index: int = 0
+    # 最後に belief を更新した時点の observed_events の長さ
+    # 次回は observed_events[last_belief_event_index:] の発言を対象とする
+
     # =========================
     # 可変情報（毎ターン更新）
     # =========================
@@ -346,3 +362,32 @@ class PlayerState(TypedDict):
     # GameSession から動的に注入される GameDefinition
     # 循環参照回避のために Any としているが、実体は GameDefinition
     # プレイヤーロジックがルールを参照するために使用する
+
+
+def fork_player_state(state: PlayerState) -> PlayerState:
+    """
+    PlayerState から作業用の state を作成する。
+
+    deepcopy の代わりに使用する構造共有コピー:
+    - observed_events / history: AppendOnlyList.fork（O(1)）
+    - role_beliefs: dict のみ複製し、RoleProb（frozen）は共有する
+    - memory / internal: 浅いコピー（フィールドは代入でのみ更新される）
+    - input / output / game_def: 共有（ターンごとに差し替えられる）
+
+    作業用 state に対する更新は、元の state からは見えない。
+    そのため「state の所有者は GameSession のみ」という原則を
+    ログ長に比例するコピーなしで維持できる。
+    """
+    memory = state["memory"]
+
+    working_state = dict(state)
+    working_state["memory"] = memory.model_copy(
+        update={
+            "observed_events": AppendOnlyList.snapshot(memory.observed_events),
+            "history": AppendOnlyList.snapshot(memory.history),
+            "role_beliefs": dict(memory.role_beliefs),
+        }
+    )
+    working_state["internal"] = state["internal"].model_copy()
+
+    return working_state
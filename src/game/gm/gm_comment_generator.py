@@ -12,7 +12,10 @@ from src.core.memory.gm_plan import (
     GMPolicyWeights,
 )
 from src.core.types import PlayerName, GameEvent
-from src.config.llm import create_gm_comment_llm
+from src.config.llm import get_llm
+from src.core.log import get_logger
+
+logger = get_logger("gm.comment")
 
 
 
@@ -50,6 +53,48 @@ class GMCommentGenerator:
         """
         直近の public_event をもとに GM コメントを生成する。
         """
+        prompt = self._prepare_prompt(
+            public_events=public_events,
+            players=players,
+            log_summary=log_summary,
+            strategy_plan=strategy_plan,
+            milestone_plan=milestone_plan,
+            milestone_status=milestone_status,
+            policy_weights=policy_weights,
+            progression_plan=progression_plan,
+        )
+
+        try:
+            response = self.llm.generate(
+                system=GM_COMMENT_SYSTEM_PROMPT,
+                prompt=prompt,
+            )
+            logger.debug("Generated GM comment", comment=response)
+            return response
+        except Exception as e:
+            # GMコメント生成に失敗しても進行は止めない
+            logger.warning("Failed to generate GM comment: %s", e)
+            return None
+
+    def _prepare_prompt(
+        self,
+        *,
+        public_events: list[GameEvent],
+        players: list[PlayerName],
+        log_summary: str = "",
+
+        # New decomposed inputs
+        strategy_plan: Optional["GMStrategyPlan"] = None,
+        milestone_plan: Optional["GMMilestonePlan"] = None,
+        milestone_status: Optional["GMMilestoneStatus"] = None,
+        policy_weights: Optional["GMPolicyWeights"] = None,
+        
+        # Legacy support (optional)
+        progression_plan: Optional[GMProgressionPlan] = None,
+    ) -> str:
+        """
+        発言状況の集計・次の発言者の選定を行い、user prompt を返す。
+        """
         # 互換性維持: progression_plan が渡された場合、そこから値を取り出す
         if progression_plan:
             strategy_plan = progression_plan.strategy_plan
@@ -97,16 +142,7 @@ class GMCommentGenerator:
             policy_weights=policy_weights,
         )
 
-        try:
-            response = self.llm.generate(
-                system=GM_COMMENT_SYSTEM_PROMPT,
-                prompt=prompt,
-            )
-            print(response)
-            return response
-        except Exception:
-            # GMコメント生成に失敗しても進行は止めない
-            return None
+        return prompt
 
     def _get_next_speaker(
         self,
@@ -277,4 +313,4 @@ class GMCommentGenerator:
 
 
 # --- グローバルに1つだけ ---
-gm_comment_generator = GMCommentGenerator(llm=create_gm_comment_llm())
+gm_comment_generator = GMCommentGenerator(llm=get_llm("gm_comment"))
@@ -1,12 +1,14 @@
 from typing import Optional
-import traceback
 
 from src.core.llm.client import LLMClient
 from src.core.llm.prompts import GM_COMMENT_REFINE_SYSTEM_PROMPT
 from src.core.memory.gm_comment import GMComment
 from src.core.memory.gm_comment_review import GMCommentReviewResult
 from src.core.types import GameEvent, PlayerName
-from src.config.llm import create_gm_comment_refiner_llm
+from src.config.llm import get_llm
+from src.core.log import get_logger
+
+logger = get_logger("gm.comment")
 
 
 def format_events(events: list[GameEvent]) -> str:
@@ -57,12 +59,12 @@ Please refine the GM comment based on the feedback.
                 system=GM_COMMENT_REFINE_SYSTEM_PROMPT,
                 prompt=user_prompt,
             )
-            print(response)
+            logger.debug("Refined GM comment", comment=response)
             return response
         except Exception:
-            traceback.print_exc()
+            logger.warning("Failed to refine GM comment", exc_info=True)
             return None
 
 
 # singleton
-gm_comment_refiner = GMCommentRefiner(llm=create_gm_comment_refiner_llm())
+gm_comment_refiner = GMCommentRefiner(llm=get_llm("gm_comment_refiner"))
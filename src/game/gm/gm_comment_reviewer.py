@@ -3,7 +3,7 @@ from src.core.llm.client import LLMClient
 from src.core.llm.prompts import GM_COMMENT_REVIEW_SYSTEM_PROMPT
 from src.core.memory.gm_comment import GMComment
 from src.core.types import GameEvent
-from src.config.llm import create_gm_comment_reviewer_llm
+from src.config.llm import get_llm
 from src.core.memory.gm_comment_review import GMCommentReviewResult
 
 
@@ -88,4 +88,4 @@ Recent public events:
 
 
 # --- グローバルに1つだけ ---
-gm_comment_reviewer = GMCommentReviewer(llm=create_gm_comment_reviewer_llm())
+gm_comment_reviewer = GMCommentReviewer(llm=get_llm("gm_comment_reviewer"))
@@ -4,7 +4,7 @@ from src.core.llm.client import LLMClient
 from src.core.llm.prompts import GM_MATURITY_SYSTEM_PROMPT
 from src.core.memory.gm_maturity import GMMaturityDecision
 from src.core.types import GameEvent
-from src.config.llm import create_gm_maturity_llm
+from src.config.llm import get_llm
 
 
 def format_events_for_maturity(events: list[GameEvent]) -> str:
@@ -58,4 +58,4 @@ Output JSON with:
 """
 
 
-gm_maturity_judge = GMMaturityJudge(llm=create_gm_maturity_llm())
+gm_maturity_judge = GMMaturityJudge(llm=get_llm("gm_maturity"))
@@ -14,6 +14,9 @@ from src.core.llm.prompts.roles import get_role_name_ja
 from src.core.llm.client import LLMClient
 from src.core.memory.log_summary import LogSummaryOutput
 from src.core.types import GameEvent
+from src.core.log import get_logger
+
+logger = get_logger("game.summary")
 
 
 LOG_SUMMARY_SYSTEM_PROMPT = """あなたは人狼ゲームのログ要約システムです。
@@ -116,33 +119,49 @@ class LogSummarizer:
         if not new_events:
             return previous_summary, last_index
         
-        # プロンプトを構築
-        new_events_text = _format_events_for_summary(new_events)
-        
-        prompt = self._build_prompt(
-            previous_summary=previous_summary,
-            new_events_text=new_events_text,
-            new_event_count=len(new_events),
-        )
+        prompt = self._build_incremental_prompt(previous_summary, new_events)
         
         try:
             result: LogSummaryOutput = self.llm.generate(
                 system=LOG_SUMMARY_SYSTEM_PROMPT,
                 prompt=prompt,
             )
-            
-            new_cursor = len(events)
-            
-            print(f"[LogSummarizer] Summarized {len(new_events)} new events")
-            print(f"[LogSummarizer] Key events: {result.key_events}")
-            
-            return result.updated_summary, new_cursor
+            return self._apply_result(result, events, new_events)
             
         except Exception as e:
-            print(f"[LogSummarizer] Failed to summarize: {e}")
+            logger.warning("Failed to summarize: %s", e)
             # 失敗した場合は前回の要約をそのまま返す
             return previous_summary, last_index
     
+    def _build_incremental_prompt(
+        self,
+        previous_summary: str,
+        new_events: list[GameEvent],
+    ) -> str:
+        """差分イベントから要約用プロンプトを構築する"""
+        new_events_text = _format_events_for_summary(new_events)
+        
+        return self._build_prompt(
+            previous_summary=previous_summary,
+            new_events_text=new_events_text,
+            new_event_count=len(new_events),
+        )
+    
+    def _apply_result(
+        self,
+        result: LogSummaryOutput,
+        events: list[GameEvent],
+        new_events: list[GameEvent],
+    ) -> tuple[str, int]:
+        """LLM の出力から (更新された要約, 新しいカーソル位置) を返す"""
+        new_cursor = len(events)
+        
+        logger.debug(
+            "Summarized %d new events", len(new_events), key_events=result.key_events
+        )
+        
+        return result.updated_summary, new_cursor
+    
     def _build_prompt(
         self,
         *,
@@ -179,8 +198,8 @@ class LogSummarizer:
 # --- ファクトリ関数 ---
 def create_log_summarizer() -> LogSummarizer:
     """LogSummarizerのインスタンスを作成する"""
-    from src.config.llm import create_log_summarizer_llm
-    return LogSummarizer(llm=create_log_summarizer_llm())
+    from src.config.llm import get_llm
+    return LogSummarizer(llm=get_llm("log_summarizer"))
 
 
 # --- グローバルインスタンス（遅延初期化） ---
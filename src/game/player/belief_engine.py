@@ -0,0 +1,307 @@
+"""
+役職推定（role_beliefs）を LLM を使わずに更新するベイズ推定エンジン。
+
+責務:
+- 確定情報（自分の役職・占い結果・役職交換）を role_beliefs に反映する
+- 発言中の CO（役職の名乗り）を尤度として role_beliefs に反映する
+- 役職の配布数（role_distribution）と矛盾しないよう、
+  プレイヤー × 役職の同時分布として正規化する
+- 発言の解釈に LLM が必要かどうかを判定する
+
+設計方針:
+- 決定的な計算のみ（NumPy の行列演算。LLM は呼ばない）
+- role_beliefs を「プレイヤー × 役職」の行列として扱い、
+  - 各行（プレイヤー）の和 = 1
+  - 各列（役職）の和 = その役職の配布数
+  を満たすよう、行と列を交互に正規化する（Sinkhorn / IPF）
+- 確定情報は memory.observed_events から毎回作り直す
+  （冪等。LLM の出力で上書きされても確定情報は失われない）
+- 役職が 1 つに確定した行は正規化の対象から外し、その分を配布数から差し引く
+- 配布数よりプレイヤーが少ない場合（使われない役職がある場合）は、
+  配布数をプレイヤー数に合わせて按分した期待値を列の和とする
+- CO は発言テキスト中の定型表現（「占い師CO」など）のみを拾う。
+  それ以外の内容を含む発言の解釈は LLM（BeliefGenerator）に任せる
+"""
+
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.roles import get_role_config
+from src.core.types import GameDefinition, GameEvent, PlayerMemory, PlayerName, RoleName, RoleProb
+
+# Sinkhorn の最大反復回数と収束判定（要素ごとの変化量の最大値）
+SINKHORN_MAX_ITER = 100
+SINKHORN_TOL = 1e-6
+
+# CO の尤度 P(役職 c を名乗る | 実際の役職 r)
+# - r == c: 本物の名乗り
+# - r が人狼陣営（win_side == "werewolf"）: 騙り
+# - r がその他の村人陣営の役職: 村人陣営の騙り（まれ）
+CLAIM_LIKELIHOOD_TRUE = 1.0
+CLAIM_LIKELIHOOD_FAKE = 0.5
+CLAIM_LIKELIHOOD_OTHER = 0.1
+
+# CO 部分を除いた残りがこの文字数以下で、プレイヤー名・役職名を含まない発言は
+# 解釈の必要がない（挨拶・CO のみ）とみなす
+TRIVIAL_SPEECH_MAX_CHARS = 15
+
+# 保持するエンジンの上限（ゲーム定義の種類数。超えたら最も古く使われたものから削除する）
+MAX_CACHED_ENGINES = 16
+
+# 文字数の判定から除く記号・空白
+_PUNCTUATION = re.compile(r"[\s、。，．,.!?！？「」『』（）()・…ー〜~]+")
+
+
+class Claim(NamedTuple):
+    """発言から読み取った役職の名乗り（CO）"""
+
+    player: PlayerName
+    role: RoleName
+
+
+class BayesianBeliefEngine:
+    """
+    1 つの GameDefinition に対する役職推定エンジン。
+
+    - 状態を持たない（入力の PlayerMemory から毎回計算する）ため、スレッドセーフ
+    """
+
+    def __init__(self, definition: GameDefinition):
+        self.definition = definition
+        self.roles: List[RoleName] = list(definition.roles)
+        self._index = {role: i for i, role in enumerate(self.roles)}
+
+        counts = Counter(definition.role_distribution)
+        self.counts = np.array([counts.get(role, 0) for role in self.roles], dtype=float)
+        self.prior = self.counts / max(self.counts.sum(), 1.0)
+
+        # 占われたときの見え方（狂人 → 村人 など）
+        self._divine_as = {
+            name: role.divine_result_as_role or name for name, role in definition.roles.items()
+        }
+        self._claim_patterns = {role: self._claim_pattern(role) for role in self.roles}
+        self._role_words = [word for role in self.roles for word in self._role_names(role)]
+
+    # =========================================================
+    # 公開 API
+    # =========================================================
+    def update(
+        self,
+        memory: PlayerMemory,
+        *,
+        claims: Sequence[Claim] = (),
+    ) -> Dict[PlayerName, RoleProb]:
+        """
+        memory.role_beliefs に CO・確定情報・配布数の制約を反映した新しい role_beliefs を返す。
+
+        memory は変更しない。
+        """
+        beliefs = self.to_matrix(memory)
+        rows = {player: i for i, player in enumerate(memory.players)}
+        for claim in claims:
+            if claim.player in rows and claim.player != memory.self_name:
+                beliefs[rows[claim.player]] *= self.claim_likelihood(claim.role)
+
+        beliefs = self.normalize(beliefs, self.evidence_mask(memory))
+        return self.to_beliefs(memory.players, beliefs)
+
+    def extract_claims(self, event: GameEvent) -> List[Claim]:
+        """speak イベントから CO を読み取る（同じ発言に複数ある場合は最後のもの）"""
+        if event.event_type != "speak":
+            return []
+        text = event.payload.get("text", "")
+        found = [
+            (match.start(), role)
+            for role, pattern in self._claim_patterns.items()
+            for match in pattern.finditer(text)
+        ]
+        if not found:
+            return []
+        return [Claim(player=event.payload.get("player"), role=max(found)[1])]
+
+    def needs_interpretation(self, event: GameEvent, players: Sequence[PlayerName]) -> bool:
+        """
+        発言の解釈に LLM が必要かどうか。
+
+        CO を除いた残りが短く、プレイヤー名・役職名を含まない発言（挨拶・CO のみ）は不要。
+        """
+        text = event.payload.get("text", "")
+        for pattern in self._claim_patterns.values():
+            text = pattern.sub("", text)
+        if any(word in text for word in (*players, *self._role_words)):
+            return True
+        return len(_PUNCTUATION.sub("", text)) > TRIVIAL_SPEECH_MAX_CHARS
+
+    # =========================================================
+    # 行列との変換
+    # =========================================================
+    def to_matrix(self, memory: PlayerMemory) -> np.ndarray:
+        """role_beliefs を プレイヤー × 役職 の行列にする（未知のプレイヤーは事前分布）"""
+        beliefs = np.tile(self.prior, (len(memory.players), 1))
+        for i, player in enumerate(memory.players):
+            belief = memory.role_beliefs.get(player)
+            if belief is not None:
+                beliefs[i] = [belief.probs.get(role, 0.0) for role in self.roles]
+        return beliefs
+
+    def to_beliefs(
+        self, players: Sequence[PlayerName], beliefs: np.ndarray
+    ) -> Dict[PlayerName, RoleProb]:
+        return {
+            player: RoleProb(probs={role: float(p) for role, p in zip(self.roles, row)})
+            for player, row in zip(players, beliefs)
+        }
+
+    # =========================================================
+    # 確定情報・尤度
+    # =========================================================
+    def evidence_mask(self, memory: PlayerMemory) -> np.ndarray:
+        """
+        確定情報から、各プレイヤーが取りうる役職を 1、取りえない役職を 0 とした行列を作る。
+
+        - 自分: self_role のみ
+        - 占い結果の対象: 占われたときの見え方が結果と一致する役職のみ
+        - 役職交換の相手: 交換前の自分の役職のみ
+        """
+        mask = np.ones((len(memory.players), len(self.roles)))
+        rows = {player: i for i, player in enumerate(memory.players)}
+
+        for event in memory.observed_events:
+            target = event.payload.get("target")
+            if target not in rows or target == memory.self_name:
+                continue
+            if event.event_type == "divine_result":
+                revealed = event.payload.get("role")
+                mask[rows[target]] *= [self._divine_as[role] == revealed for role in self.roles]
+            elif event.event_type == "role_swapped" and "old_role" in event.payload:
+                mask[rows[target]] *= self._one_hot(event.payload["old_role"])
+
+        if memory.self_name in rows:
+            mask[rows[memory.self_name]] = self._one_hot(memory.self_role)
+        return mask
+
+    def claim_likelihood(self, claimed: RoleName) -> np.ndarray:
+        """役職 claimed を名乗ったときの、実際の役職ごとの尤度"""
+        likelihood = np.array(
+            [
+                CLAIM_LIKELIHOOD_FAKE
+                if self.definition.roles[role].win_side == "werewolf"
+                else CLAIM_LIKELIHOOD_OTHER
+                for role in self.roles
+            ]
+        )
+        if claimed in self._index:
+            likelihood[self._index[claimed]] = CLAIM_LIKELIHOOD_TRUE
+        return likelihood
+
+    # =========================================================
+    # 正規化
+    # =========================================================
+    def normalize(self, beliefs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        確定情報で絞り込んだうえで、行の和 = 1・列の和 = 配布数 となるよう正規化する。
+
+        - 確定情報と矛盾する（取りうる役職の確率がすべて 0 の）行は、取りうる役職の一様分布にする
+        - 配布数と両立しない場合は、行の和 = 1 のみを満たす
+        """
+        beliefs = np.clip(beliefs, 0.0, None) * mask
+        empty = beliefs.sum(axis=1) <= 0
+        beliefs[empty] = mask[empty]
+        beliefs /= beliefs.sum(axis=1, keepdims=True)
+
+        fixed = mask.sum(axis=1) == 1
+        free = ~fixed
+        if not free.any():
+            return beliefs
+
+        # 確定した行の分を配布数から差し引き、残りのプレイヤー数に按分する
+        targets = np.clip(self.counts - beliefs[fixed].sum(axis=0), 0.0, None)
+        if targets.sum() <= 0:
+            return beliefs
+        targets *= free.sum() / targets.sum()
+
+        beliefs[free] = _sinkhorn(beliefs[free], targets)
+        return beliefs
+
+    # =========================================================
+    # 内部処理
+    # =========================================================
+    def _one_hot(self, role: RoleName) -> np.ndarray:
+        row = np.zeros(len(self.roles))
+        if role in self._index:
+            row[self._index[role]] = 1.0
+        return row
+
+    def _role_names(self, role: RoleName) -> List[str]:
+        config = get_role_config(role)
+        names = [role, *(config.display_name.values() if config else ())]
+        return sorted(set(names), key=len, reverse=True)
+
+    def _claim_pattern(self, role: RoleName) -> re.Pattern:
+        # 「占い師CO」「占い師 ＣＯ」「seer CO」「私は占い師です」など
+        names = "|".join(re.escape(name) for name in self._role_names(role))
+        return re.compile(
+            rf"(?:{names})\s*(?:CO|ＣＯ)|(?:私|僕|俺|わたし|ぼく|おれ)は(?:{names})(?:です|だ)",
+            re.IGNORECASE,
+        )
+
+
+def _sinkhorn(beliefs: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    各行の和 = 1・各列の和 = targets となるよう、列と行を交互に正規化する。
+
+    0 の要素は 0 のまま保たれる。
+    途中で和が 0 になる行が出た場合（両立しない制約）は、その直前の行列を返す。
+    """
+    for _ in range(SINKHORN_MAX_ITER):
+        columns = beliefs.sum(axis=0)
+        scale = np.divide(targets, columns, out=np.zeros_like(columns), where=columns > 0)
+        scaled = beliefs * scale
+        rows = scaled.sum(axis=1, keepdims=True)
+        if (rows <= 0).any():
+            break
+        scaled /= rows
+        converged = np.abs(scaled - beliefs).max() < SINKHORN_TOL
+        beliefs = scaled
+        if converged:
+            break
+    return beliefs
+
+
+_engines: "OrderedDict[Hashable, BayesianBeliefEngine]" = OrderedDict()
+_engines_lock = threading.Lock()
+
+
+def _definition_key(definition: GameDefinition) -> Tuple[Hashable, ...]:
+    """エンジンの計算に使う GameDefinition の内容（同じ内容なら同じエンジンを使う）"""
+    roles = tuple(
+        (name, role.win_side, role.divine_result_as_role)
+        for name, role in definition.roles.items()
+    )
+    return roles, tuple(definition.role_distribution)
+
+
+def get_belief_engine(definition: Optional[GameDefinition]) -> Optional[BayesianBeliefEngine]:
+    """
+    GameDefinition ごとのエンジンを返す（definition が None の場合は None）。
+
+    - 内容が同じ GameDefinition には同じエンジンを使い回す
+      （セッションの復元のたびに GameDefinition が作り直されても増えない）
+    - 保持数は MAX_CACHED_ENGINES までに制限する（LRU）
+    """
+    if definition is None:
+        return None
+    key = _definition_key(definition)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = BayesianBeliefEngine(definition)
+            while len(_engines) > MAX_CACHED_ENGINES:
+                _engines.popitem(last=False)
+        else:
+            _engines.move_to_end(key)
+        return engine
@@ -9,7 +9,10 @@ from src.core.types import (
     PlayerName,
     RoleProb,
 )
-from src.config.llm import create_belief_llm
+from src.config.llm import get_llm
+from src.core.log import get_logger
+
+logger = get_logger("player.belief")
 
 
 Observed = Union[GameEvent, PlayerRequest]
@@ -42,59 +45,60 @@ class BeliefGenerator:
         失敗した場合は None を返す。
         """
         system, user = self._build_prompts(memory, observed)
-        
-        print("[BeliefGenerator] Building prompts completed")
-        print(f"[BeliefGenerator] System prompt length: {len(system)}")
-        print(f"[BeliefGenerator] User prompt length: {len(user)}")
 
         try:
-            print("[BeliefGenerator] Calling LLM.generate()...")
             result: RoleBeliefsOutput = self.llm.generate(
                 system=system,
                 prompt=user,
             )
-            print("[BeliefGenerator] LLM.generate() returned")
-
-            beliefs: Dict[PlayerName, RoleProb] = {}
-
-            for item in result.beliefs:
-                # RoleProbOutput -> RoleProb convert
-                # 動的に全役職の確率を抽出
-                from src.core.roles import get_all_role_names
-                
-                probs = {}
-                for role_name in get_all_role_names():
-                    # Pydanticモデルのフィールドから動的に取得を試みる
-                    # getattr(item.belief, role_name, 0.0)
-                    # NOTE: item.belief は RoleProbOutput (Pydantic) なので、
-                    # 固定フィールドしか持っていない場合は、動的役職に対応するために
-                    # RoleProbOutput 自体の定義変更も必要になる可能性がある。
-                    # 現状は RoleProbOutput が Dict[str, float] または全役職フィールドを持つと仮定
-                    
-                    val = getattr(item.belief, role_name, None)
-                    if val is None:
-                        # item.belief が辞書型のように振る舞う場合、あるいは extra fields
-                        val = 0.0
-                    probs[role_name] = val
-                
-                # Normalize manually since RoleProb.normalize doesn't exist
-                total = sum(probs.values())
-                if total > 0:
-                    probs = {k: v / total for k, v in probs.items()}
-                else:
-                    # Fallback uniform distribution
-                    probs = {k: 0.25 for k in probs}
-
-                beliefs[item.player] = RoleProb(probs=probs)
+            return self._to_beliefs(result)
 
-            return beliefs
-
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
+        except Exception:
             # 推論に失敗してもゲーム進行は止めない
+            logger.warning("Failed to update beliefs for %s", memory.self_name, exc_info=True)
             return None
 
+    def _to_beliefs(
+        self,
+        result: RoleBeliefsOutput,
+    ) -> Dict[PlayerName, RoleProb]:
+        """
+        LLM の構造化出力を正規化済みの role_beliefs に変換する。
+        """
+        beliefs: Dict[PlayerName, RoleProb] = {}
+
+        for item in result.beliefs:
+            # RoleProbOutput -> RoleProb convert
+            # 動的に全役職の確率を抽出
+            from src.core.roles import get_all_role_names
+            
+            probs = {}
+            for role_name in get_all_role_names():
+                # Pydanticモデルのフィールドから動的に取得を試みる
+                # getattr(item.belief, role_name, 0.0)
+                # NOTE: item.belief は RoleProbOutput (Pydantic) なので、
+                # 固定フィールドしか持っていない場合は、動的役職に対応するために
+                # RoleProbOutput 自体の定義変更も必要になる可能性がある。
+                # 現状は RoleProbOutput が Dict[str, float] または全役職フィールドを持つと仮定
+                
+                val = getattr(item.belief, role_name, None)
+                if val is None:
+                    # item.belief が辞書型のように振る舞う場合、あるいは extra fields
+                    val = 0.0
+                probs[role_name] = val
+            
+            # Normalize manually since RoleProb.normalize doesn't exist
+            total = sum(probs.values())
+            if total > 0:
+                probs = {k: v / total for k, v in probs.items()}
+            else:
+                # Fallback uniform distribution
+                probs = {k: 0.25 for k in probs}
+
+            beliefs[item.player] = RoleProb(probs=probs)
+
+        return beliefs
+
     def _build_prompts(
         self,
         memory: PlayerMemory,
@@ -167,4 +171,4 @@ Details:
 
 
 # --- グローバルに1つだけ ---
-believe_generator = BeliefGenerator(llm=create_belief_llm())
+believe_generator = BeliefGenerator(llm=get_llm("belief"))
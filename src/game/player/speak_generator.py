@@ -1,17 +1,29 @@
 # src/game/player/speak_generator.py
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from src.core.llm.client import LLMClient
 from src.core.llm.prompts import SPEAK_SYSTEM_PROMPT
 from src.core.memory.speak import Speak
 from src.core.memory.strategy import Strategy, PlayerPolicyWeights
 from src.core.types import PlayerMemory, GameEvent, PlayerRequest
-from src.config.llm import create_speak_llm
+from src.config.llm import get_llm
 from src.game.player.belief_utils import build_belief_analysis_section
+from src.core.log import get_logger
+
+logger = get_logger("player.speak")
 
 Observed = Union[GameEvent, PlayerRequest]
 
 
+def _partial_text(chunk: Any) -> Optional[str]:
+    """ストリーミング中の部分的な生成結果から text フィールドを取り出す"""
+    if isinstance(chunk, dict):
+        text = chunk.get("text")
+    else:
+        text = getattr(chunk, "text", None)
+    return text if isinstance(text, str) else None
+
+
 class SpeakGenerator:
     """
     PlayerMemory と新しく観測した GameEvent / PlayerRequest から
@@ -53,7 +65,10 @@ class SpeakGenerator:
         """
         # Strategy が存在しない場合は警告（本来は strategy_generator.py から渡されるべき）
         if strategy is None:
-            print(f"[SpeakGenerator] WARNING: No Strategy provided for {memory.self_name}. Generating without strategic guidance.")
+            logger.warning(
+                "No Strategy provided for %s. Generating without strategic guidance.",
+                memory.self_name,
+            )
         
         prompt = self._build_prompt(memory, observed, game_def, strategy, policy_weights)
 
@@ -63,7 +78,74 @@ class SpeakGenerator:
                 prompt=prompt,
             )
 
-            print(speak)
+            logger.debug("Generated speech for %s", memory.self_name, speak=speak)
+
+            return speak
+
+        except Exception:
+            # 発言生成に失敗してもゲーム進行は止めない
+            return None
+
+    def generate_stream(
+        self,
+        *,
+        memory: PlayerMemory,
+        observed: Observed,
+        game_def: "GameDefinition",
+        on_delta: Callable[[str], None],
+        strategy: Optional[Strategy] = None,
+        policy_weights: Optional[PlayerPolicyWeights] = None,
+    ) -> Optional[Speak]:
+        """
+        generate のストリーミング版。
+
+        text フィールドの生成途中の差分を on_delta に通知し、
+        最後に generate と同じ完全な Speak を返す。
+        LLM がストリーミングに対応していない場合は generate にフォールバックし、
+        全文を 1 回で通知する。
+        失敗した場合は None を返す。
+        """
+        if not hasattr(self.llm, "stream"):
+            speak = self.generate(
+                memory=memory,
+                observed=observed,
+                game_def=game_def,
+                strategy=strategy,
+                policy_weights=policy_weights,
+            )
+            if speak is not None:
+                on_delta(speak.text)
+            return speak
+
+        if strategy is None:
+            logger.warning(
+                "No Strategy provided for %s. Generating without strategic guidance.",
+                memory.self_name,
+            )
+
+        prompt = self._build_prompt(memory, observed, game_def, strategy, policy_weights)
+
+        try:
+            emitted = ""
+            last = None
+            for chunk in self.llm.stream(
+                system=SPEAK_SYSTEM_PROMPT,
+                prompt=prompt,
+            ):
+                last = chunk
+                text = _partial_text(chunk)
+                # 通知済みの部分と矛盾しない伸長のみを差分として通知する
+                if text and len(text) > len(emitted) and text.startswith(emitted):
+                    on_delta(text[len(emitted):])
+                    emitted = text
+
+            speak = last if isinstance(last, Speak) else Speak.model_validate(last)
+
+            # 最終結果が確定版（speak イベントとして公開される内容）
+            if speak.text.startswith(emitted):
+                on_delta(speak.text[len(emitted):])
+
+            logger.debug("Generated speech for %s", memory.self_name, speak=speak)
 
             return speak
 
@@ -221,4 +303,4 @@ STYLE & TONE
 
 
 # --- グローバルに1つだけ ---
-speak_generator = SpeakGenerator(llm=create_speak_llm())
+speak_generator = SpeakGenerator(llm=get_llm("speak"))
@@ -6,9 +6,12 @@ from src.core.llm.prompts import SPEAK_REFINE_SYSTEM_PROMPT
 from src.core.memory.strategy import Strategy, SpeakReview
 from src.core.memory.speak import Speak
 from src.core.types.player import PlayerMemory
-from src.config.llm import create_speak_refiner_llm
+from src.config.llm import get_llm
+from src.core.log import get_logger
 from src.game.player.belief_utils import build_belief_analysis_section
 
+logger = get_logger("player.speak")
+
 
 class SpeakRefiner:
     """
@@ -44,12 +47,11 @@ class SpeakRefiner:
                 system=SPEAK_REFINE_SYSTEM_PROMPT,
                 prompt=prompt,
             )
-            print(f"[SpeakRefiner] Refined speech for {memory.self_name}")
-            print(refined)
+            logger.debug("Refined speech for %s", memory.self_name, speak=refined)
             return refined
 
         except Exception as e:
-            print(f"[SpeakRefiner] Failed to refine speech: {e}")
+            logger.warning("Failed to refine speech: %s", e)
             return None
 
     def _build_prompt(
@@ -159,4 +161,4 @@ Output JSON only.
 
 
 # --- グローバルインスタンス ---
-speak_refiner = SpeakRefiner(llm=create_speak_refiner_llm())
+speak_refiner = SpeakRefiner(llm=get_llm("speak_refiner"))
@@ -6,9 +6,12 @@ from src.core.llm.prompts import SPEAK_REVIEW_SYSTEM_PROMPT
 from src.core.memory.strategy import Strategy, SpeakReview
 from src.core.memory.speak import Speak
 from src.core.types.player import PlayerMemory
-from src.config.llm import create_speak_reviewer_llm
+from src.config.llm import get_llm
+from src.core.log import get_logger
 from src.game.player.belief_utils import build_belief_analysis_section
 
+logger = get_logger("player.speak")
+
 
 class SpeakReviewer:
     """
@@ -43,12 +46,11 @@ class SpeakReviewer:
                 system=SPEAK_REVIEW_SYSTEM_PROMPT,
                 prompt=prompt,
             )
-            print(f"[SpeakReviewer] Review result: needs_fix={result.needs_fix}")
-            print(result)
+            logger.debug("Review result: needs_fix=%s", result.needs_fix, review=result)
             return result
 
         except Exception as e:
-            print(f"[SpeakReviewer] Failed to review speak: {e}")
+            logger.warning("Failed to review speak: %s", e)
             return None
 
     def _build_prompt(
@@ -134,4 +136,4 @@ Output JSON only.
 
 
 # --- グローバルインスタンス ---
-speak_reviewer = SpeakReviewer(llm=create_speak_reviewer_llm())
+speak_reviewer = SpeakReviewer(llm=get_llm("speak_reviewer"))
@@ -5,7 +5,10 @@ from src.core.llm.client import LLMClient
 from src.core.llm.prompts.strategy import get_strategy_system_prompt
 from src.core.memory.strategy import Strategy, StrategyPlan
 from src.core.types.player import PlayerMemory
-from src.config.llm import create_strategy_llm
+from src.config.llm import get_llm
+from src.core.log import get_logger
+
+logger = get_logger("player.strategy")
 
 
 class StrategyGenerator:
@@ -42,7 +45,9 @@ class StrategyGenerator:
         
         # StrategyPlan が存在しない場合は警告（本来はNight Phaseで生成されているべき）
         if plan is None:
-            print(f"[StrategyGenerator] WARNING: No StrategyPlan available for {memory.self_name}. Acting with degraded strategy.")
+            logger.warning(
+                "No StrategyPlan available for %s. Acting with degraded strategy.", memory.self_name
+            )
         
         role = memory.self_role
         system_prompt = get_strategy_system_prompt(role)
@@ -54,12 +59,11 @@ class StrategyGenerator:
                 system=system_prompt,
                 prompt=prompt,
             )
-            print(f"[StrategyGenerator] Generated Action Guideline for {memory.self_name}")
-            print(strategy)
+            logger.debug("Generated action guideline for %s", memory.self_name, strategy=strategy)
             return strategy
 
         except Exception as e:
-            print(f"[StrategyGenerator] Failed to generate action guideline: {e}")
+            logger.warning("Failed to generate action guideline: %s", e)
             return None
 
     def _build_guideline_prompt(self, memory: PlayerMemory, plan: Optional[StrategyPlan]) -> str:
@@ -151,5 +155,5 @@ Output JSON only conforming to the Strategy schema.
 
 # --- グローバルインスタンス ---
 strategy_generator = StrategyGenerator(
-    llm=create_strategy_llm()
+    llm=get_llm("strategy")
 )
@@ -3,6 +3,9 @@ from src.core.llm.client import LLMClient
 from src.core.llm.prompts import INITIAL_STRATEGY_SYSTEM_PROMPT
 from src.core.memory.strategy import StrategyPlan
 from src.core.types.player import PlayerMemory
+from src.core.log import get_logger
+
+logger = get_logger("player.strategy")
 
 class StrategyPlanGenerator:
     """
@@ -24,11 +27,10 @@ class StrategyPlanGenerator:
                 ),
                 prompt=prompt,
             )
-            print(f"[StrategyPlanGenerator] Generated Plan for {memory.self_name}")
-            print(plan)
+            logger.debug("Generated plan for %s", memory.self_name, plan=plan)
             return plan
         except Exception as e:
-            print(f"[StrategyPlanGenerator] Failed to generate plan: {e}")
+            logger.warning("Failed to generate plan: %s", e)
             return None
 
     def _build_prompt(self, memory: PlayerMemory) -> str:
@@ -61,8 +63,8 @@ Consider your victory conditions, what actions you must avoid, and what actions
 
 
 # --- Global Instance ---
-from src.config.llm import create_strategy_plan_llm
+from src.config.llm import get_llm
 
 strategy_plan_generator = StrategyPlanGenerator(
-    llm=create_strategy_plan_llm()
+    llm=get_llm("strategy_plan")
 )
@@ -9,7 +9,7 @@ from src.core.types import (
     PlayerRequest,
     Vote,
 )
-from src.config.llm import create_vote_llm
+from src.config.llm import get_llm
 
 
 Observed = Union[GameEvent, PlayerRequest]
@@ -45,6 +45,7 @@ class VoteGenerator:
 
         try:
             result: VoteOutput = self.llm.generate(
+                system=ONE_NIGHT_WEREWOLF_RULES,
                 prompt=prompt,
             )
 
@@ -67,6 +68,7 @@ class VoteGenerator:
 
         - belief / 発言履歴 / 確定情報を総合して判断させる
         - 理由は出力させない（純粋な行動のみ）
+        - ゲームルールは system prompt 側で渡す
         """
         observed_type = observed.__class__.__name__
 
@@ -82,8 +84,6 @@ class VoteGenerator:
         role_goal = get_role_goal(memory.self_role)
 
         return f"""
-{ONE_NIGHT_WEREWOLF_RULES}
-
 Your task is to decide **who to vote for**.
 
 Current players:
@@ -124,4 +124,4 @@ Output format:
 
 
 # --- グローバルに1つだけ ---
-vote_generator = VoteGenerator(llm=create_vote_llm())
+vote_generator = VoteGenerator(llm=get_llm("vote"))
@@ -4,7 +4,10 @@ from src.core.llm.client import LLMClient
 from src.core.llm.prompts import REACTION_SYSTEM_PROMPT
 from src.core.memory.reaction import Reaction
 from src.core.types import PlayerMemory, GameEvent, PlayerRequest
-from src.config.llm import create_reaction_llm
+from src.config.llm import get_llm
+from src.core.log import get_logger
+
+logger = get_logger("player.reaction")
 
 Observed = Union[GameEvent, PlayerRequest]
 
@@ -43,13 +46,13 @@ class ReactionGenerator:
                 prompt=prompt,
             )
 
-            print(reaction)
+            logger.debug("Generated reaction for %s", memory.self_name, reaction=reaction)
 
             return reaction
 
-        except Exception:
+        except Exception as e:
             # LLM / validation が壊れてもゲームは止めない
-            # 必要なら logging.debug(e)
+            logger.debug("Failed to generate reaction: %s", e)
             return None
 
     def _build_prompt(
@@ -95,4 +98,4 @@ Write a new reflection in JSON.
 
 
 # --- グローバルに1つだけ ---
-reaction_generator = ReactionGenerator(llm=create_reaction_llm())
+reaction_generator = ReactionGenerator(llm=get_llm("reaction"))
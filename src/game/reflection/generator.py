@@ -4,7 +4,10 @@ from src.core.llm.client import LLMClient
 from src.core.llm.prompts import REFLECTION_SYSTEM_PROMPT
 from src.core.memory.reflection import Reflection
 from src.core.types import PlayerMemory, GameEvent, PlayerRequest
-from src.config.llm import create_reflection_llm
+from src.config.llm import get_llm
+from src.core.log import get_logger
+
+logger = get_logger("player.reflection")
 
 Observed = Union[GameEvent, PlayerRequest]
 
@@ -43,13 +46,13 @@ class ReflectionGenerator:
                 prompt=prompt,
             )
 
-            print(reflection)
+            logger.debug("Generated reflection for %s", memory.self_name, reflection=reflection)
 
             return reflection
 
-        except Exception:
+        except Exception as e:
             # LLM / validation が壊れてもゲームは止めない
-            # 必要なら logging.debug(e)
+            logger.debug("Failed to generate reflection: %s", e)
             return None
 
     def _build_prompt(
@@ -123,4 +126,4 @@ Output JSON only.
 
 
 # --- グローバルに1つだけ ---
-reflection_generator = ReflectionGenerator(llm=create_reflection_llm())
+reflection_generator = ReflectionGenerator(llm=get_llm("reflection"))
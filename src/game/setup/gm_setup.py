@@ -14,7 +14,8 @@
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Tuple
+import random
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from src.game.setup.players import create_players
 from src.game.setup.roles import assign_roles
@@ -29,6 +30,7 @@ if TYPE_CHECKING:
 
 def setup_game(
     definition: GameDefinition,
+    rng: Optional[random.Random] = None,
 ) -> Tuple[
     List[PlayerName],
     Dict[PlayerName, RoleName],
@@ -47,6 +49,7 @@ def setup_game(
     - GameDefinition.role_distribution を Single Source of Truth として使用
     - プレイヤー人数は role_distribution から自動決定
     - role_distribution の内容に応じて任意の役職構成に対応
+    - rng を渡した場合、役職配布はその乱数列のみで決まる（再現可能）
     """
     # Lazy import to avoid circular import
     from src.graphs.player.player_graph import player_graph
@@ -57,7 +60,7 @@ def setup_game(
     players = create_players(player_count)
 
     # 2. 役職配布（GameDefinition を使用）
-    assigned_roles = assign_roles(players, definition)
+    assigned_roles = assign_roles(players, definition, rng)
 
     # 3. PlayerMemory 初期化
     player_memories = {
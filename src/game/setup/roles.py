@@ -13,7 +13,7 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 if TYPE_CHECKING:
     from src.core.types.phases import GameDefinition
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
 def assign_roles(
     players: List[str],
     definition: GameDefinition,
+    rng: Optional[random.Random] = None,
 ) -> Dict[str, str]:
     """
     プレイヤーに役職をランダムに割り当てる。
@@ -32,6 +33,7 @@ def assign_roles(
     Args:
         players: プレイヤー名のリスト
         definition: ゲーム定義（役職構成を含む）
+        rng: 乱数生成器（省略時はモジュールの random を使用）
 
     Returns:
         プレイヤー名 → 役職名 の辞書
@@ -42,7 +44,8 @@ def assign_roles(
     設計方針:
     - GameDefinition.role_distribution を使用して任意の人数・役職構成に対応
     - シャッフルによりランダム配布を実現
-    - テスト用に random.seed() で再現性を確保可能
+    - rng にシード付きの random.Random を渡すと、ゲームごとに再現可能な配布になる
+      （複数ゲームを並行実行しても互いの乱数列に影響しない）
     """
     if len(players) != len(definition.role_distribution):
         raise ValueError(
@@ -51,6 +54,6 @@ def assign_roles(
         )
 
     roles = list(definition.role_distribution)
-    random.shuffle(roles)
+    (rng or random).shuffle(roles)
 
     return {player: role for player, role in zip(players, roles)}
@@ -5,7 +5,9 @@ from src.core.types import (
     GameEvent,
 )
 from typing import Protocol
-from langgraph.graph import StateGraph, START, END
+from langgraph.graph import START, END
+
+from src.graphs.instrumented_graph import InstrumentedStateGraph
 from src.graphs.gm.node.gm_plan import gm_plan_node
 
 from src.graphs.gm.node.night_phase import night_phase_node
@@ -19,7 +21,9 @@ from src.graphs.gm.node.gm_commit import gm_commit_node
 from src.graphs.gm.node.gm_comment_review_router import gm_comment_review_router_node
 from src.graphs.gm.node.gm_refine import gm_refine_node
 from src.graphs.gm.node.log_summarize_node import gm_log_summarize_node
+from src.core.log import get_logger
 
+logger = get_logger("gm.graph")
 
 
 class GMGraph(Protocol):
@@ -59,7 +63,8 @@ class LangGraphGMAdapter:
 
 
 def build_gm_graph():
-    graph = StateGraph(GMGraphState)
+    # ノード・ルーターの実行時間を計測する（src.core.instrumentation）
+    graph = InstrumentedStateGraph(GMGraphState, name="gm_graph")
 
     # ノード登録
     # "night" ノードを gm_plan_node に割り当て（入口）
@@ -116,7 +121,8 @@ def build_gm_graph():
     graph.add_edge("result", END)
     graph.add_edge("gm_commit", END)
 
-    return graph.compile()
+    # name はトレース・ベンチマークでのグラフの識別に使われる
+    return graph.compile(name="gm_graph")
 
 
 
@@ -173,7 +179,7 @@ class DummyGMGraph:
         # =========================
         elif phase == "day":
             # デバッグ用ログ
-            print("昼フェーズ")
+            logger.debug("昼フェーズ")
 
             # 議論・投票などがまだ続く想定
             decision.next_phase = "vote"
@@ -183,7 +189,7 @@ class DummyGMGraph:
         # =========================
         elif phase == "vote":
             # デバッグ用ログ
-            print("投票フェーズ")
+            logger.debug("投票フェーズ")
 
             # 議論・投票などがまだ続く想定
             decision.next_phase = "result"
@@ -193,7 +199,7 @@ class DummyGMGraph:
         # =========================
         elif phase == "result":
             # デバッグ用ログ
-            print("結果フェーズ")
+            logger.debug("結果フェーズ")
 
             # 明示的にフェーズが終わった場合は結果公開へ
             decision.next_phase = None
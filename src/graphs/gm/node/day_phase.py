@@ -1,6 +1,9 @@
 from src.core.types import GMGraphState, GameEvent, PlayerRequest
 from src.game.gm.gm_comment_generator import gm_comment_generator
 from src.game.gm.gm_maturity_judge import gm_maturity_judge
+from src.core.log import get_logger
+
+logger = get_logger("gm.node")
 
 
 def day_phase_node(state: GMGraphState) -> GMGraphState:
@@ -50,8 +53,7 @@ def day_phase_node(state: GMGraphState) -> GMGraphState:
             public_events=context,
         )
 
-        print(maturity)
-        print(decision.next_phase)
+        logger.debug("day_phase: maturity judged", maturity=maturity)
 
         if maturity and maturity.is_mature:
             decision.events.append(
@@ -63,7 +65,6 @@ def day_phase_node(state: GMGraphState) -> GMGraphState:
                     },
                 )
             )
-            print("mature")
             decision.next_phase = "vote"
             return state
 
@@ -2,6 +2,9 @@
 
 from src.core.types import GMGraphState
 from src.game.gm.gm_comment_reviewer import gm_comment_reviewer
+from src.core.log import get_logger
+
+logger = get_logger("gm.node")
 
 MAX_REVIEW_COUNT = 3
 
@@ -35,7 +38,7 @@ def gm_comment_review_router_node(state: GMGraphState) -> str:
         players=world.players,
     )
 
-    print(review_result)
+    logger.debug("gm_comment_review_router: needs_fix=%s", review_result.needs_fix, review=review_result)
 
     internal.last_gm_review = review_result
     internal.gm_comment_review_count += 1
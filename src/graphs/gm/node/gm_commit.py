@@ -41,6 +41,9 @@ def gm_commit_node(state: GMGraphState) -> GMGraphState:
         )
     }
 
+    # 指名 1 回 = 議論 1 ターン（day_phase_router の上限・下限判定に使われる）
+    internal.discussion_turn += 1
+
     # --- commit 後のクリーンアップ ---
     internal.pending_gm_comment = None
     internal.last_gm_review = None
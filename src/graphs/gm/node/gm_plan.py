@@ -1,6 +1,12 @@
 from src.core.types import GMGraphState
 from src.game.gm.gm_plan_generator import GMPlanGenerator
-from src.config.llm import create_gm_plan_llm
+from src.config.llm import get_llm
+from src.core.log import DEBUG, get_logger
+
+logger = get_logger("gm.node")
+
+# 進行計画用の共有 LLMClient（初回の計画生成時に生成する）
+gm_plan_llm = get_llm("gm_plan")
 
 
 def gm_plan_node(state: GMGraphState) -> GMGraphState:
@@ -20,8 +26,7 @@ def gm_plan_node(state: GMGraphState) -> GMGraphState:
         return state
 
     # LLMコントローラの初期化
-    llm = create_gm_plan_llm()
-    generator = GMPlanGenerator(llm)
+    generator = GMPlanGenerator(gm_plan_llm)
 
     # 計画生成
     plan = generator.generate(world_state, game_def)
@@ -29,7 +34,8 @@ def gm_plan_node(state: GMGraphState) -> GMGraphState:
     # State 更新
     internal.progression_plan = plan
     
-    # デバッグログ
-    print(f"--- GM Progression Plan Generated ---\n{plan.get_summary_markdown()}\n-------------------------------------")
+    # デバッグログ（要約の組み立てを省略できるよう、出力する場合のみ整形する）
+    if logger.is_enabled(DEBUG):
+        logger.debug("gm_plan: Progression plan generated\n%s", plan.get_summary_markdown())
 
     return state
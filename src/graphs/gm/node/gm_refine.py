@@ -14,8 +14,6 @@ def gm_refine_node(state: GMGraphState) -> GMGraphState:
     - 再生成したコメントを internal.pending_gm_comment に上書きする
     - commit / 判定 / フェーズ遷移は行わない
     """
-    print("gm_refine_node")
-
     world = state["world_state"]
     internal = state["internal"]
 
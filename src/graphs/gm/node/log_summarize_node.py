@@ -9,6 +9,9 @@ GM用ログ要約ノード
 """
 
 from src.core.types import GMGraphState
+from src.core.log import get_logger
+
+logger = get_logger("gm.node")
 
 
 def gm_log_summarize_node(state: GMGraphState) -> GMGraphState:
@@ -21,7 +24,7 @@ def gm_log_summarize_node(state: GMGraphState) -> GMGraphState:
     # Lazy import to avoid circular import
     from src.game.log_summarizer import get_log_summarizer
     
-    print("[gm_log_summarize_node] Starting log summarization...")
+    logger.debug("gm_log_summarize: Starting log summarization...")
     
     world = state["world_state"]
     internal = state["internal"]
@@ -41,6 +44,6 @@ def gm_log_summarize_node(state: GMGraphState) -> GMGraphState:
     internal.log_summary = new_summary
     internal.last_summarized_event_index = new_cursor
     
-    print(f"[gm_log_summarize_node] Summary updated (cursor: {new_cursor})")
+    logger.debug("gm_log_summarize: Summary updated (cursor: %s)", new_cursor)
     
     return state
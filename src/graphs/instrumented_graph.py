@@ -0,0 +1,47 @@
+"""
+計測付きの StateGraph
+
+責務:
+- add_node / add_conditional_edges で登録された関数を instrument_node でラップし、
+  ノード・ルーターごとの実行時間を記録する
+
+設計方針:
+- 各ノードの実装・Graph の組み立て方は変えない
+  （StateGraph の代わりにこのクラスを使うだけで計測される）
+- 関数以外（Runnable など）はラップせずにそのまま登録する
+"""
+
+import inspect
+
+from langgraph.graph import StateGraph
+
+from src.core.instrumentation import instrument_node
+
+
+def _is_plain_function(fn) -> bool:
+    return (inspect.isfunction(fn) or inspect.ismethod(fn)) and not inspect.iscoroutinefunction(fn)
+
+
+class InstrumentedStateGraph(StateGraph):
+    """
+    ノードとルーターの実行時間を記録する StateGraph。
+
+    name はメトリクスのラベル（graph）として使われる。
+    compile(name=...) にも同じ名前を渡すこと。
+    """
+
+    def __init__(self, state_schema, *, name: str, **kwargs):
+        super().__init__(state_schema, **kwargs)
+        self.graph_name = name
+
+    def add_node(self, node, action=None, **kwargs):
+        if action is None and _is_plain_function(node):
+            node, action = node.__name__, node
+        if _is_plain_function(action):
+            action = instrument_node(self.graph_name, node, action)
+        return super().add_node(node, action, **kwargs)
+
+    def add_conditional_edges(self, source, path, path_map=None):
+        if _is_plain_function(path):
+            path = instrument_node(self.graph_name, path.__name__, path)
+        return super().add_conditional_edges(source, path, path_map)
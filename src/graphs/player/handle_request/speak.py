@@ -1,13 +1,14 @@
 from src.core.types import PlayerOutput, PlayerState
 from src.game.player.speak_generator import speak_generator
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 
 def handle_speak(state: PlayerState) -> PlayerState:
     """
     話すことを受け取り、話す内容を決定するノード。
     """
-    print("handle_speak")
-
     request = state["input"].request
     memory = state["memory"]
 
@@ -26,5 +27,5 @@ def handle_speak(state: PlayerState) -> PlayerState:
             "text": speak.text,
         },
     )
-    print(state)
+    logger.debug("handle_speak: %s spoke", memory.self_name, output=state["output"])
     return state
@@ -8,6 +8,10 @@ from src.core.types import (
 )
 import random
 
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
+
 
 def handle_use_ability(state: PlayerState) -> PlayerState:
     req = state["input"].request
@@ -93,5 +97,5 @@ def handle_thief_ability(state: PlayerState) -> PlayerState:
         action="use_ability",
         payload=ThiefAbility(kind="thief", target=target),
     )
-    print(f"[DEBUG] handle_thief_ability: {state['memory'].self_name} selected target={target}")
+    logger.debug("handle_thief_ability: %s selected target=%s", self_name, target)
     return state
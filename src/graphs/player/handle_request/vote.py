@@ -1,13 +1,14 @@
 from src.core.types import PlayerOutput, PlayerState
 from src.game.player.vote_generator import vote_generator
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 
 def handle_vote(state: PlayerState) -> PlayerState:
     """
     投票要求を受け取り、投票先を決定するノード。
     """
-    print("handle_vote")
-
     request = state["input"].request
     memory = state["memory"]
 
@@ -29,5 +30,5 @@ def handle_vote(state: PlayerState) -> PlayerState:
         },
     )
 
-    print(state)
+    logger.debug("handle_vote: %s voted for %s", memory.self_name, state["output"].payload["target"])
     return state
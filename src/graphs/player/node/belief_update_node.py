@@ -1,6 +1,13 @@
 from src.core.types import PlayerState, RoleProb
 from src.game.player.belief_generator import believe_generator
+from src.game.player.belief_engine import get_belief_engine
 from src.core.roles import get_all_role_names
+from src.core.log import get_logger
+from src.core.metrics import metrics
+
+logger = get_logger("player.node")
+
+metrics.describe("belief_updates_total", "Belief updates by path (llm / engine / skipped)")
 
 
 def belief_update_node(state: PlayerState) -> PlayerState:
@@ -16,20 +23,46 @@ def belief_update_node(state: PlayerState) -> PlayerState:
     - interpret_speech では発言を観測イベントとして記録するのみ
     - このノードで、自分が発言するタイミングで belief を一括更新
     - これにより LLM 呼び出しを削減し、責務を明確に分離
+
+    LLM を使わない経路（BayesianBeliefEngine。GameDefinition がある場合）:
+    - 前回の更新以降に他プレイヤーの発言がなければ、何もしない
+    - 新しい発言がすべて挨拶・CO のみであれば、CO を尤度として反映するだけで済ませる
+    - LLM で更新した場合も、結果に確定情報（占い結果など）と役職の配布数の制約をかけ直し、
+      LLM に渡していない（最新より前の）発言の CO を反映する
+    - LLM が失敗した場合は、CO のみを反映する
     """
     memory = state["memory"]
+    engine = get_belief_engine(state.get("game_def"))
 
-    # 未処理の speak イベントを取得
+    # 前回の更新以降の、他プレイヤーの speak イベントを取得
     unprocessed_events = [
-        e for e in memory.observed_events
-        if e.event_type == "speak"
+        e for e in memory.observed_events[memory.last_belief_event_index:]
+        if e.event_type == "speak" and e.payload.get("player") != memory.self_name
     ]
 
     if not unprocessed_events:
-        print("[belief_update_node] No unprocessed speak events, skipping belief update")
+        logger.debug("belief_update: No unprocessed speak events, skipping belief update")
+        metrics.inc("belief_updates_total", path="skipped")
+        return state
+
+    claims = (
+        [claim for e in unprocessed_events for claim in engine.extract_claims(e)]
+        if engine is not None
+        else []
+    )
+
+    if engine is not None and not any(
+        engine.needs_interpretation(e, memory.players) for e in unprocessed_events
+    ):
+        memory.role_beliefs = engine.update(memory, claims=claims)
+        memory.last_belief_event_index = len(memory.observed_events)
+        logger.debug("belief_update: Beliefs updated without LLM (%d claims)", len(claims))
+        metrics.inc("belief_updates_total", path="engine")
         return state
 
-    print(f"[belief_update_node] Updating beliefs based on {len(unprocessed_events)} observed events")
+    logger.debug(
+        "belief_update: Updating beliefs based on %d observed events", len(unprocessed_events)
+    )
 
     # 最新の観測イベントを使って belief を更新
     # （複数イベントがある場合は最新のものをコンテキストとして渡す）
@@ -40,7 +73,19 @@ def belief_update_node(state: PlayerState) -> PlayerState:
         observed=latest_event,
     )
 
-    if new_beliefs is not None:
+    if new_beliefs is not None and engine is not None:
+        # 自分の役職・占い結果などの確定情報と配布数の制約をかけ直す
+        # LLM が解釈したのは最新の発言のみのため、それより前の未処理の発言の CO はここで反映する
+        # （最新の発言の CO は LLM の結果に含まれるため、重ねて反映しない）
+        earlier_claims = [
+            claim for e in unprocessed_events[:-1] for claim in engine.extract_claims(e)
+        ]
+        memory.role_beliefs = new_beliefs
+        memory.role_beliefs = engine.update(memory, claims=earlier_claims)
+        memory.last_belief_event_index = len(memory.observed_events)
+        logger.debug("belief_update: Beliefs updated successfully")
+        metrics.inc("belief_updates_total", path="llm")
+    elif new_beliefs is not None:
         # 自分自身の役職は固定（安全装置）
         # LLM が自分自身を含めなかった場合に備え、安全にロールリストを取得
         if memory.self_name in new_beliefs:
@@ -51,15 +96,22 @@ def belief_update_node(state: PlayerState) -> PlayerState:
         else:
             # フォールバック: デフォルトの役職リスト
             available_roles = get_all_role_names()
-        
+
         self_probs = {
             role: (1.0 if role == memory.self_role else 0.0)
             for role in available_roles
         }
         new_beliefs[memory.self_name] = RoleProb(probs=self_probs)
         memory.role_beliefs = new_beliefs
-        print("[belief_update_node] Beliefs updated successfully")
+        memory.last_belief_event_index = len(memory.observed_events)
+        logger.debug("belief_update: Beliefs updated successfully")
+        metrics.inc("belief_updates_total", path="llm")
+    elif engine is not None:
+        logger.warning("belief_update: LLM returned None, applying claims only")
+        memory.role_beliefs = engine.update(memory, claims=claims)
+        memory.last_belief_event_index = len(memory.observed_events)
+        metrics.inc("belief_updates_total", path="engine")
     else:
-        print("[belief_update_node] Failed to update beliefs (LLM returned None)")
+        logger.warning("belief_update: Failed to update beliefs (LLM returned None)")
 
     return state
@@ -9,6 +9,9 @@
 """
 
 from src.core.types.player import PlayerState
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 
 def log_summarize_node(state: PlayerState) -> PlayerState:
@@ -21,7 +24,7 @@ def log_summarize_node(state: PlayerState) -> PlayerState:
     # Lazy import to avoid circular import
     from src.game.log_summarizer import get_log_summarizer
     
-    print("[log_summarize_node] Starting log summarization...")
+    logger.debug("log_summarize: Starting log summarization...")
     
     memory = state["memory"]
     
@@ -37,6 +40,6 @@ def log_summarize_node(state: PlayerState) -> PlayerState:
     memory.log_summary = new_summary
     memory.last_summarized_event_index = new_cursor
     
-    print(f"[log_summarize_node] Summary updated (cursor: {new_cursor})")
+    logger.debug("log_summarize: Summary updated (cursor: %s)", new_cursor)
     
     return state
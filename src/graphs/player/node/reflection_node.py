@@ -7,8 +7,6 @@ def reflection_node(state: PlayerState) -> PlayerState:
     request = state["input"].request
     memory = state["memory"]
 
-    print("reflection_node")
-
     if event is not None:
         reflection = reflection_generator.generate(
             memory=memory,
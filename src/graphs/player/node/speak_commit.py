@@ -1,5 +1,8 @@
 # src/graphs/player/node/speak_commit.py
 from src.core.types.player import PlayerState, PlayerOutput
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 
 def speak_commit_node(state: PlayerState) -> PlayerState:
@@ -11,14 +14,14 @@ def speak_commit_node(state: PlayerState) -> PlayerState:
     - memory.history に発言を追加
     - state["output"] を設定
     """
-    print("[speak_commit_node] Committing speech...")
+    logger.debug("speak_commit: Committing speech...")
 
     memory = state["memory"]
     internal = state["internal"]
     pending_speak = internal.pending_speak
 
     if pending_speak is None:
-        print("[speak_commit_node] No pending speech to commit")
+        logger.debug("speak_commit: No pending speech to commit")
         state["output"] = None
         return state
 
@@ -33,6 +36,6 @@ def speak_commit_node(state: PlayerState) -> PlayerState:
         },
     )
 
-    print(f"[speak_commit_node] Speech committed: {pending_speak.text[:50]}...")
+    logger.debug("speak_commit: Speech committed: %s...", pending_speak.text[:50])
 
     return state
@@ -1,5 +1,9 @@
 # src/graphs/player/node/speak_generate.py
 from src.core.types.player import PlayerState
+from src.core.speech_stream import is_speech_streaming, report_speech_delta
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 
 def speak_generate_node(state: PlayerState) -> PlayerState:
@@ -14,34 +18,50 @@ def speak_generate_node(state: PlayerState) -> PlayerState:
     # Lazy import to avoid circular import
     from src.game.player.speak_generator import speak_generator
 
-    print("[speak_generate_node] Generating speech...")
+    logger.debug("speak_generate: Generating speech...")
 
     memory = state["memory"]
     internal = state["internal"]
     request = state["input"].request
 
     if request is None:
-        print("[speak_generate_node] No request found, skipping")
+        logger.debug("speak_generate: No request found, skipping")
         return state
 
     # 戦略が存在するか確認（本来は strategy_generate_node で生成されているべき）
     if internal.pending_strategy is None:
-        print(f"[speak_generate_node] WARNING: No strategy available for speech generation. Strategy consistency may be compromised.")
+        logger.warning(
+            "speak_generate: No strategy available for speech generation. "
+            "Strategy consistency may be compromised."
+        )
 
     # 戦略を発言生成に渡す
     # Strategy が渡されることで、strategy_plan_generator.py → strategy_generator.py の
     # 戦略フローが speak_generator.py まで一貫して適用される
     # policy_weights はマイルストーン状態から算出された発言方針調整パラメータ
-    speak = speak_generator.generate(
-        memory=memory,
-        observed=request,
-        game_def=state.get("game_def"),
-        strategy=internal.pending_strategy,
-        policy_weights=memory.policy_weights,
-    )
+    #
+    # ストリーミング配信中は、生成途中の発言テキストを逐次通知する
+    # （確定した発言は従来どおり speak_commit_node で pending_events に積まれる）
+    if is_speech_streaming():
+        speak = speak_generator.generate_stream(
+            memory=memory,
+            observed=request,
+            game_def=state.get("game_def"),
+            strategy=internal.pending_strategy,
+            policy_weights=memory.policy_weights,
+            on_delta=lambda delta: report_speech_delta(memory.self_name, delta),
+        )
+    else:
+        speak = speak_generator.generate(
+            memory=memory,
+            observed=request,
+            game_def=state.get("game_def"),
+            strategy=internal.pending_strategy,
+            policy_weights=memory.policy_weights,
+        )
 
     if speak is None:
-        print("[speak_generate_node] Failed to generate speech")
+        logger.warning("speak_generate: Failed to generate speech")
         return state
 
     internal.pending_speak = speak
@@ -1,5 +1,9 @@
 # src/graphs/player/node/speak_refine.py
 from src.core.types.player import PlayerState
+from src.core.speech_stream import report_speech_discard
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 
 def speak_refine_node(state: PlayerState) -> PlayerState:
@@ -10,28 +14,30 @@ def speak_refine_node(state: PlayerState) -> PlayerState:
     - 直前の SpeakReview（internal.last_speak_review）を反映する
     - 戦略（internal.pending_strategy）との整合性を保つ
     - 再生成した発言を internal.pending_speak に上書きする
+    - ストリーミング配信中は、配信済みの下書きの取り消しを通知する
+      （再生成した発言は speak_commit_node で確定してから公開される）
     """
     # Lazy import to avoid circular import
     from src.game.player.speak_refiner import speak_refiner
 
-    print("[speak_refine_node] Refining speech...")
+    logger.debug("speak_refine: Refining speech...")
 
     memory = state["memory"]
     internal = state["internal"]
 
     # レビューが存在しない場合は何もしない（安全装置）
     if internal.last_speak_review is None:
-        print("[speak_refine_node] No review found, skipping")
+        logger.debug("speak_refine: No review found, skipping")
         return state
 
     # 発言が存在しない場合は何もしない
     if internal.pending_speak is None:
-        print("[speak_refine_node] No pending speech, skipping")
+        logger.debug("speak_refine: No pending speech, skipping")
         return state
 
     # 戦略が存在しない場合は何もしない
     if internal.pending_strategy is None:
-        print("[speak_refine_node] No strategy found, skipping")
+        logger.debug("speak_refine: No strategy found, skipping")
         return state
 
     refined_speak = speak_refiner.refine(
@@ -43,9 +49,12 @@ def speak_refine_node(state: PlayerState) -> PlayerState:
     )
 
     if refined_speak is None:
-        print("[speak_refine_node] Failed to refine speech")
+        logger.warning("speak_refine: Failed to refine speech")
         return state
 
+    if refined_speak.text != internal.pending_speak.text:
+        report_speech_discard(memory.self_name)
+
     # pending を上書き
     internal.pending_speak = refined_speak
 
@@ -1,5 +1,8 @@
 # src/graphs/player/node/speak_review_router.py
 from src.core.types.player import PlayerState
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 MAX_SPEAK_REVIEW_COUNT = 3
 
@@ -16,7 +19,7 @@ def speak_review_router_node(state: PlayerState) -> str:
     # Lazy import to avoid circular import
     from src.game.player.speak_reviewer import speak_reviewer
 
-    print("[speak_review_router_node] Reviewing speech...")
+    logger.debug("speak_review_router: Reviewing speech...")
 
     memory = state["memory"]
     internal = state["internal"]
@@ -25,19 +28,20 @@ def speak_review_router_node(state: PlayerState) -> str:
 
     # 最大レビュー回数を超えた場合は強制的に commit
     if internal.speak_review_count >= MAX_SPEAK_REVIEW_COUNT:
-        print(
-            f"[speak_review_router_node] Max review count ({MAX_SPEAK_REVIEW_COUNT}) reached, forcing commit"
+        logger.debug(
+            "speak_review_router: Max review count (%d) reached, forcing commit",
+            MAX_SPEAK_REVIEW_COUNT,
         )
         return "commit"
 
     # 発言が存在しない場合は安全側に倒す
     if pending_speak is None:
-        print("[speak_review_router_node] No pending speech, forcing commit")
+        logger.debug("speak_review_router: No pending speech, forcing commit")
         return "commit"
 
     # 戦略が存在しない場合もレビューをスキップ
     if pending_strategy is None:
-        print("[speak_review_router_node] No strategy found, forcing commit")
+        logger.debug("speak_review_router: No strategy found, forcing commit")
         return "commit"
 
     review_result = speak_reviewer.review(
@@ -49,16 +53,16 @@ def speak_review_router_node(state: PlayerState) -> str:
 
     # レビューに失敗した場合は安全側に倒す
     if review_result is None:
-        print("[speak_review_router_node] Review failed, forcing commit")
+        logger.debug("speak_review_router: Review failed, forcing commit")
         return "commit"
 
     internal.last_speak_review = review_result
     internal.speak_review_count += 1
 
     if review_result.needs_fix:
-        print(f"[speak_review_router_node] Speech needs fix: {review_result.reason}")
+        logger.debug("speak_review_router: Speech needs fix: %s", review_result.reason)
         return "refine"
 
-    print("[speak_review_router_node] Speech approved")
+    logger.debug("speak_review_router: Speech approved")
     return "commit"
 
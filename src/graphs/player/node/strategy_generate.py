@@ -1,5 +1,8 @@
 # src/graphs/player/node/strategy_generate.py
 from src.core.types.player import PlayerState
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 
 def strategy_generate_node(state: PlayerState) -> PlayerState:
@@ -20,7 +23,7 @@ def strategy_generate_node(state: PlayerState) -> PlayerState:
     from src.game.player.policy_weights_calculator import policy_weights_calculator
     from src.core.memory.strategy import PlayerMilestoneStatus
 
-    print("[strategy_generate_node] Generating strategy...")
+    logger.debug("strategy_generate: Generating strategy...")
 
     memory = state["memory"]
     internal = state["internal"]
@@ -28,7 +31,7 @@ def strategy_generate_node(state: PlayerState) -> PlayerState:
     # 1. 初期戦略計画（Night Phase）が未生成なら生成する
     #    本来は夜フェーズでやるべきだが、現状のグラフ構造上、初回の発言機会に生成する
     if memory.strategy_plan is None:
-        print("[strategy_generate_node] generating initial strategy plan...")
+        logger.debug("strategy_generate: generating initial strategy plan...")
         plan = strategy_plan_generator.generate(memory)
         if plan:
             memory.strategy_plan = plan
@@ -38,7 +41,7 @@ def strategy_generate_node(state: PlayerState) -> PlayerState:
                     plan.milestone_plan
                 )
         else:
-            print("[strategy_generate_node] Failed to generate initial strategy plan")
+            logger.warning("strategy_generate: Failed to generate initial strategy plan")
             # 失敗してもAction Guideline生成は試みる（Planなしで）
 
     # 2. マイルストーン状態を更新（新しいイベントに基づく）
@@ -72,7 +75,7 @@ def strategy_generate_node(state: PlayerState) -> PlayerState:
     )
 
     if strategy is None:
-        print("[strategy_generate_node] Failed to generate strategy")
+        logger.warning("strategy_generate: Failed to generate strategy")
         return state
 
     internal.pending_strategy = strategy
@@ -1,4 +1,7 @@
 from src.core.types.player import PlayerState
+from src.core.log import get_logger
+
+logger = get_logger("player.node")
 
 
 def strategy_plan_generate_node(state: PlayerState) -> PlayerState:
@@ -17,7 +20,7 @@ def strategy_plan_generate_node(state: PlayerState) -> PlayerState:
     memory = state["memory"]
 
     if memory.strategy_plan is None:
-        print("[strategy_plan_generate_node] generating initial strategy plan...")
+        logger.debug("strategy_plan_generate: generating initial strategy plan...")
         plan = strategy_plan_generator.generate(memory)
         if plan:
             memory.strategy_plan = plan
@@ -26,10 +29,13 @@ def strategy_plan_generate_node(state: PlayerState) -> PlayerState:
                 memory.milestone_status = milestone_status_updater.initialize_status(
                     plan.milestone_plan
                 )
-                print(f"[strategy_plan_generate_node] Initialized milestone_status with {len(plan.milestone_plan.milestones)} milestones")
+                logger.debug(
+                    "strategy_plan_generate: Initialized milestone_status with %d milestones",
+                    len(plan.milestone_plan.milestones),
+                )
         else:
-            print("[strategy_plan_generate_node] Failed to generate initial strategy plan")
+            logger.warning("strategy_plan_generate: Failed to generate initial strategy plan")
     else:
-        print("[strategy_plan_generate_node] Strategy plan already exists. Skipping.")
+        logger.debug("strategy_plan_generate: Strategy plan already exists. Skipping.")
 
     return state
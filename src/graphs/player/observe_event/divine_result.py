@@ -1,4 +1,5 @@
 from src.core.types import PlayerState, RoleName, PlayerName, RoleProb
+from src.game.player.belief_engine import get_belief_engine
 
 
 def handle_divine_result(state: PlayerState) -> PlayerState:
@@ -9,6 +10,7 @@ def handle_divine_result(state: PlayerState) -> PlayerState:
     - divine_result は占い師本人にのみ届く「確定情報」
     - beliefs / suspicion のような単純ラベルは使わない
     - role_beliefs（確率分布）を直接更新する
+      （BayesianBeliefEngine。LLM は使わない）
     - 行動は発生しない（output は None）
     """
 
@@ -22,24 +24,32 @@ def handle_divine_result(state: PlayerState) -> PlayerState:
     memory = state["memory"]
 
     # -------------------------
-    # 1. 役職確率分布の確定更新
-    # -------------------------
-    # 占いは「確定情報」なので、
-    # 対象プレイヤーの役職確率を 100% / 0% にする
-    probs: dict[RoleName, float] = {}
-
-    for role in memory.role_beliefs[target].probs.keys():
-        probs[role] = 1.0 if role == revealed_role else 0.0
-
-    memory.role_beliefs[target] = RoleProb(probs=probs)
-
-    # -------------------------
-    # 2. 観測イベントの保存
+    # 1. 観測イベントの保存
     # -------------------------
     # divine_result は private event だが、
     # 「自分が観測した事実」としては保存してよい
+    # （belief の更新時に確定情報として毎回反映される）
     memory.observed_events.append(event)
 
+    # -------------------------
+    # 2. 役職確率分布の確定更新
+    # -------------------------
+    # 占いは「確定情報」なので、対象プレイヤーは
+    # 占われたときの見え方が結果と一致する役職のみに絞り込み、
+    # 役職の配布数と矛盾しないよう全プレイヤーの分布を正規化する
+    # （例: 「村人」と出た場合、狂人の可能性も残る）
+    engine = get_belief_engine(state.get("game_def"))
+    if engine is not None:
+        memory.role_beliefs = engine.update(memory)
+    else:
+        # GameDefinition がない場合は対象プレイヤーの役職確率を 100% / 0% にする
+        probs: dict[RoleName, float] = {}
+
+        for role in memory.role_beliefs[target].probs.keys():
+            probs[role] = 1.0 if role == revealed_role else 0.0
+
+        memory.role_beliefs[target] = RoleProb(probs=probs)
+
     # 行動はしない
     state["output"] = None
     return state
@@ -0,0 +1,15 @@
+from src.core.types import PlayerState
+
+
+def handle_observe_only(state: PlayerState) -> PlayerState:
+    """
+    行動を伴わない通知イベント（投票・役職公開・ゲーム終了など）を
+    記憶に記録するだけのノード。
+    """
+    event = state["input"].event
+    memory = state["memory"]
+    memory.observed_events.append(event)
+
+    # 行動はしない
+    state["output"] = None
+    return state
@@ -2,10 +2,14 @@
 役職交換イベントのハンドラ
 
 怪盗が役職交換を行った際に、GM から送信される role_swapped イベントを処理し、
-怪盗自身の memory.self_role を更新する。
+怪盗自身の memory.self_role と role_beliefs を更新する。
 """
 
 from src.core.types import PlayerState, RoleName
+from src.core.log import get_logger
+from src.game.player.belief_engine import get_belief_engine
+
+logger = get_logger("player.node")
 
 
 def handle_role_swapped(state: PlayerState) -> PlayerState:
@@ -15,6 +19,7 @@ def handle_role_swapped(state: PlayerState) -> PlayerState:
     設計方針:
     - role_swapped は怪盗本人にのみ届く「確定情報」
     - memory.self_role を新しい役職に更新する
+    - role_beliefs を BayesianBeliefEngine で更新する（LLM は使わない）
     - 行動は発生しない（output は None）
     
     注意:
@@ -39,7 +44,13 @@ def handle_role_swapped(state: PlayerState) -> PlayerState:
     old_role = memory.self_role
     memory.self_role = new_role
     
-    print(f"[DEBUG] handle_role_swapped: {memory.self_name} role changed from {old_role} to {new_role} (swapped with {target})")
+    logger.debug(
+        "handle_role_swapped: %s role changed from %s to %s (swapped with %s)",
+        memory.self_name,
+        old_role,
+        new_role,
+        target,
+    )
 
     # -------------------------
     # 2. 観測イベントの保存
@@ -49,15 +60,14 @@ def handle_role_swapped(state: PlayerState) -> PlayerState:
     memory.observed_events.append(event)
 
     # -------------------------
-    # 3. 役職確率分布の更新（オプション）
+    # 3. 役職確率分布の更新
     # -------------------------
-    # 自分の役職は確定しているので role_beliefs[self_name] は更新不要
-    # （self_role が真実情報として PlayerMemory に保持されているため）
-    # 
-    # 交換相手の役職は「怪盗（旧：自分）」になったことを知っている
-    # しかし「怪盗」という役職は交換後に存在しなくなるため、
-    # 単純に確率分布を更新するのは複雑になる。
-    # ここでは最小限の実装として、イベント保存のみとする。
+    # 自分の行は新しい役職に、交換相手の行は交換前の自分の役職（怪盗）に確定し、
+    # 役職の配布数と矛盾しないよう全プレイヤーの分布を正規化する
+    # （交換しても配られた役職の組み合わせは変わらない）
+    engine = get_belief_engine(state.get("game_def"))
+    if engine is not None:
+        memory.role_beliefs = engine.update(memory)
 
     # 行動はしない
     state["output"] = None
@@ -30,6 +30,13 @@ def phase_router(state: PlayerState) -> str:
         if player_input.event.event_type == "role_swapped":
             return "role_swapped"
 
+        if player_input.event.event_type == "vote_started":
+            return "vote_started"
+
+        # 投票・役職公開・ゲーム終了は記録するだけ
+        if player_input.event.event_type in ("vote", "reveal", "game_end"):
+            return "observe_only"
+
     # request が来ている場合（Player の行動ターン）
     if player_input.request is not None:
         if player_input.request.request_type == "use_ability":
@@ -1,12 +1,15 @@
 from src.core.types.player import PlayerState, PlayerOutput
 from typing import Protocol
-from langgraph.graph import StateGraph, START, END
+from langgraph.graph import START, END
+
+from src.graphs.instrumented_graph import InstrumentedStateGraph
 from src.graphs.player.observe_event.night_started import handle_night_started
 from src.graphs.player.handle_request.use_ability import handle_use_ability
 from src.graphs.player.observe_event.gm_comment import handle_gm_comment
 from src.graphs.player.observe_event.divine_result import handle_divine_result
 from src.graphs.player.observe_event.day_started import handle_day_started
 from src.graphs.player.observe_event.vote_started import handle_vote_started
+from src.graphs.player.observe_event.observe_only import handle_observe_only
 from src.graphs.player.observe_event.interpret_speech import handle_interpret_speech
 from src.graphs.player.observe_event.role_swapped import handle_role_swapped
 from src.graphs.player.node.reflection_node import reflection_node
@@ -62,7 +65,8 @@ def build_player_graph():
     from src.graphs.player.node.belief_update_node import belief_update_node
     from src.graphs.player.node.log_summarize_node import log_summarize_node
 
-    graph = StateGraph(PlayerState)
+    # ノード・ルーターの実行時間を計測する（src.core.instrumentation）
+    graph = InstrumentedStateGraph(PlayerState, name="player_graph")
 
     # === 既存のノード ===
     graph.add_node("night_started", handle_night_started)
@@ -72,6 +76,7 @@ def build_player_graph():
     graph.add_node("gm_comment", handle_gm_comment)
     graph.add_node("interpret_speech", handle_interpret_speech)
     graph.add_node("vote_started", handle_vote_started)
+    graph.add_node("observe_only", handle_observe_only)
     graph.add_node("vote", handle_vote)
     graph.add_node("role_swapped", handle_role_swapped)
     graph.add_node("reflection", reflection_node)
@@ -91,6 +96,7 @@ def build_player_graph():
     graph.add_edge("strategy_plan_generate", END)
     # graph.add_edge("day_started", END)  <-- Changed to go to strategy_plan_generate
     graph.add_edge("vote_started", END)
+    graph.add_edge("observe_only", END)
     graph.add_edge("use_ability", END)
     graph.add_edge("divine_result", END)
     graph.add_edge("gm_comment", END)
@@ -142,7 +148,8 @@ def build_player_graph():
     graph.add_conditional_edges(START, phase_router)
     graph.add_conditional_edges("reflection", post_reflection_action_router)
 
-    return graph.compile()
+    # name はトレース・ベンチマークでのグラフの識別に使われる
+    return graph.compile(name="player_graph")
 
 
 class DummyPlayerGraph:
@@ -16,7 +16,11 @@ load_dotenv()
 
 from fastapi import FastAPI
 
-from src.app.controllers import game_router
+from src.core.log import configure_logging
+from src.app.controllers import game_router, metrics_router
+
+# ログ出力の設定（レベル・形式は LOG_LEVEL / LOG_FORMAT で指定）
+configure_logging()
 
 
 # =========================================================
@@ -32,6 +36,7 @@ app = FastAPI(
 # ルーター登録
 # =========================================================
 app.include_router(game_router)
+app.include_router(metrics_router)
 
 # =========================================================
 # サーバー起動用（開発用）
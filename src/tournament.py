@@ -0,0 +1,229 @@
+"""
+プロセスプール型トーナメントエンジン
+
+責務:
+- 複数の戦略設定（StrategyConfig）× シード付きゲームをプロセスプールで実行する
+- 役職ごと・戦略設定ごとの勝率を集計する
+
+設計方針:
+- ゲームはシードで再現可能にする
+  - 役職配布は GameSession.create(seed=...) の専用乱数列で決まる
+  - 夜行動の対象選択などモジュールの random を使う処理は、
+    ゲーム開始前にワーカープロセス内で random.seed(seed) する
+    （1 プロセスで同時に実行するゲームは 1 つのため、他のゲームの影響を受けない）
+- 戦略設定は環境変数の組として表す
+  - 設定はモジュール読み込み時に参照されるため、設定ごとに spawn したプロセスで
+    環境変数を適用してから player_graph / gm_graph を遅延構築する
+- 同じシード列を全設定で共有し、設定間で同一の役職配布を比較する
+
+使い方:
+    python -m src.tournament --games 100 --processes 8 --seed 0 \\
+        --config baseline --config "cached:LLM_CACHE=1"
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+# NOTE: src.batch_runner（→ GameSession / Graph）はワーカープロセス内で遅延 import する。
+# 親プロセスでは Graph を構築しない。
+
+DEFAULT_MAX_STEPS = 60
+
+
+class StrategyConfig(BaseModel):
+    """戦略設定（ワーカープロセスに適用する環境変数の組）"""
+
+    name: str
+    env: Dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, spec: str) -> "StrategyConfig":
+        """
+        "name" または "name:KEY=VALUE,KEY=VALUE" 形式の文字列から生成する。
+        """
+        name, _, assignments = spec.partition(":")
+        env = {}
+        for assignment in filter(None, assignments.split(",")):
+            key, sep, value = assignment.partition("=")
+            if not sep:
+                raise ValueError(f"Invalid assignment '{assignment}' in config '{spec}'")
+            env[key.strip()] = value.strip()
+        return cls(name=name.strip(), env=env)
+
+
+def _init_worker(env: Dict[str, str]) -> None:
+    """ワーカープロセスの初期化（Graph 構築より前に設定を適用する）"""
+    os.environ.update(env)
+
+    from src.core.log import configure_logging
+
+    configure_logging()
+
+
+def _play(game_id: str, seed: int, max_steps: int) -> dict:
+    """
+    ワーカープロセスで 1 ゲームを実行する。
+
+    初回呼び出し時にこのプロセスの player_graph / gm_graph が構築され、
+    以降のゲームでは再利用される。
+    """
+    from src.batch_runner import run_game
+
+    random.seed(seed)
+    return run_game(game_id, seed=seed, max_steps=max_steps).model_dump()
+
+
+def run_tournament(
+    games_per_config: int,
+    configs: List[StrategyConfig],
+    *,
+    processes: Optional[int] = None,
+    base_seed: int = 0,
+    max_steps: int = DEFAULT_MAX_STEPS,
+    play: Callable[[str, int, int], dict] = _play,
+    on_record: Optional[Callable[[dict], None]] = None,
+) -> List[dict]:
+    """
+    各戦略設定で games_per_config ゲームずつ実行し、全ゲームの結果を返す。
+
+    - i 番目のゲームのシードは base_seed + i（全設定で共通）
+    - 各結果には "config" キーに設定名が付与される
+
+    Parameters
+    ----------
+    processes : Optional[int]
+        プロセス数（省略時は CPU コア数）
+    play : Callable
+        ワーカーで実行する関数（テスト用に差し替え可能。pickle 可能であること）
+    """
+    processes = processes or os.cpu_count() or 1
+    # fork では親プロセスの読み込み済みモジュール（設定）が引き継がれてしまうため spawn を使う
+    context = multiprocessing.get_context("spawn")
+    records: List[dict] = []
+
+    for config in configs:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(config.env,),
+        ) as pool:
+            futures = [
+                pool.submit(play, f"{config.name}-{i:04d}", base_seed + i, max_steps)
+                for i in range(games_per_config)
+            ]
+            for future in as_completed(futures):
+                record = {"config": config.name, **future.result()}
+                records.append(record)
+                if on_record is not None:
+                    on_record(record)
+
+    records.sort(key=lambda r: (r["config"], r["game_id"]))
+    return records
+
+
+def aggregate(records: List[dict], definition=None) -> Dict[str, dict]:
+    """
+    戦略設定ごとに、陣営別・役職別の勝率を集計する。
+
+    役職の勝敗は、最終的な役職（怪盗の交換後）の win_side が勝者と一致するかで判定する。
+    """
+    if definition is None:
+        from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
+
+        definition = ONE_NIGHT_GAME_DEFINITION
+
+    by_config: Dict[str, List[dict]] = defaultdict(list)
+    for record in records:
+        by_config[record["config"]].append(record)
+
+    summary = {}
+    for name, config_records in by_config.items():
+        finished = [r for r in config_records if r.get("error") is None]
+        side_wins: Dict[str, int] = defaultdict(int)
+        role_games: Dict[str, int] = defaultdict(int)
+        role_wins: Dict[str, int] = defaultdict(int)
+
+        for record in finished:
+            side_wins[record["winner"]] += 1
+            for role in record["roles"].values():
+                role_games[role] += 1
+                role_def = definition.roles.get(role)
+                if role_def is not None and role_def.win_side == record["winner"]:
+                    role_wins[role] += 1
+
+        summary[name] = {
+            "games": len(config_records),
+            "finished": len(finished),
+            "side_win_rate": {
+                side: round(wins / len(finished), 4) for side, wins in sorted(side_wins.items())
+            },
+            "role_win_rate": {
+                role: {
+                    "games": role_games[role],
+                    "wins": role_wins[role],
+                    "win_rate": round(role_wins[role] / role_games[role], 4),
+                }
+                for role in sorted(role_games)
+            },
+            "total_tokens": sum(r["tokens"]["total_tokens"] for r in config_records),
+        }
+
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a seeded werewolf tournament on a process pool.")
+    parser.add_argument("--games", type=int, default=10, help="games per strategy config")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed (game i uses seed + i)")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS, help="GM step limit per game")
+    parser.add_argument(
+        "--config",
+        action="append",
+        default=None,
+        help='strategy config "name" or "name:KEY=VALUE,..." (repeatable)',
+    )
+    parser.add_argument("--output", default="tournament_results.jsonl", help="results file (JSON Lines)")
+    parser.add_argument("--log-level", default="WARNING", help="log level (DEBUG / INFO / WARNING)")
+    args = parser.parse_args(argv)
+
+    # ログ設定はワーカープロセスで適用する（spawn のため環境変数で引き継ぐ）
+    os.environ["LOG_LEVEL"] = args.log_level
+
+    configs = [StrategyConfig.parse(spec) for spec in (args.config or ["baseline"])]
+    started = time.perf_counter()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+
+        def write_record(record: dict) -> None:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+
+        records = run_tournament(
+            args.games,
+            configs,
+            processes=args.processes,
+            base_seed=args.seed,
+            max_steps=args.max_steps,
+            on_record=write_record,
+        )
+
+    summary = {
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+        "configs": aggregate(records),
+    }
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -48,8 +48,8 @@ def test_gm_plan_node():
         "game_def": game_def
     }
     
-    # Patch create_gm_plan_llm
-    with patch("src.graphs.gm.node.gm_plan.create_gm_plan_llm", return_value=mock_llm):
+    # Patch gm_plan_llm
+    with patch("src.graphs.gm.node.gm_plan.gm_plan_llm", mock_llm):
         # 1. First run: Should generate plan
         new_state = gm_plan_node(state)
         # Verify internal state updated
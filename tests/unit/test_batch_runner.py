@@ -0,0 +1,129 @@
+"""
+ヘッドレス一括対戦ランナーのユニットテスト
+
+テスト項目:
+- ゲームが結果フェーズまで進み、勝者・処刑者・ステップ数が記録されるか
+- 同時実行数の上限が守られるか
+- 失敗したゲームがエラーとして記録され、他のゲームは続行されるか
+- CLI が 1 ゲーム 1 行の結果ファイルを出力するか
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src import batch_runner
+from src.core.types import GameEvent, GameResult, WorldState
+
+PLAYERS = ["p1", "p2", "p3"]
+
+
+class FakeGameSession:
+    """night → day ×2 → vote → result と進むテスト用セッション"""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    fail = False
+
+    def __init__(self):
+        self.world_state = WorldState(phase="night", players=PLAYERS, public_events=[])
+        self.day_steps = 0
+
+    @classmethod
+    def create(cls, definition, seed=None):
+        if cls.fail:
+            raise RuntimeError("setup failed")
+        return cls()
+
+    def _step(self):
+        with FakeGameSession.lock:
+            FakeGameSession.active += 1
+            FakeGameSession.peak = max(FakeGameSession.peak, FakeGameSession.active)
+        time.sleep(0.01)
+        with FakeGameSession.lock:
+            FakeGameSession.active -= 1
+
+    def run_night_phase(self):
+        self._step()
+        self.world_state.phase = "day"
+
+    def run_day_step(self):
+        self._step()
+        self.world_state.public_events.append(
+            GameEvent(event_type="speak", payload={"player": "p1", "text": "..."})
+        )
+        self.day_steps += 1
+        if self.day_steps == 2:
+            self.world_state.phase = "vote"
+
+    def run_vote_step(self):
+        self._step()
+        self.world_state.phase = "result"
+
+    def run_result_step(self):
+        self._step()
+        self.world_state.result = GameResult(
+            winner="village",
+            executed_players=["p2"],
+            roles={"p1": "seer", "p2": "werewolf", "p3": "villager"},
+        )
+
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        FakeGameSession.active = 0
+        FakeGameSession.peak = 0
+        FakeGameSession.fail = False
+        patcher = patch.object(batch_runner, "GameSession", FakeGameSession)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_run_game_records_result(self):
+        record = batch_runner.run_game("g1")
+
+        self.assertIsNone(record.error)
+        self.assertEqual(record.winner, "village")
+        self.assertEqual(record.executed_players, ["p2"])
+        self.assertEqual(record.turns, {"night": 1, "day": 2, "vote": 1, "result": 1})
+        self.assertEqual(record.speeches, 2)
+        self.assertEqual(record.tokens.total_tokens, 0)
+        self.assertGreater(record.latency_sec, 0)
+
+    def test_concurrency_limit(self):
+        records = batch_runner.run_games(6, concurrency=2)
+
+        self.assertEqual([r.game_id for r in records], [f"game-{i:04d}" for i in range(6)])
+        self.assertTrue(all(r.winner == "village" for r in records))
+        self.assertEqual(FakeGameSession.peak, 2)
+
+    def test_failures_and_step_limit_are_recorded(self):
+        record = batch_runner.run_game("g1", max_steps=3)
+        self.assertIn("did not finish", record.error)
+        self.assertEqual(sum(record.turns.values()), 3)
+
+        FakeGameSession.fail = True
+        records = batch_runner.run_games(2, concurrency=2)
+        self.assertTrue(all("setup failed" in r.error for r in records))
+        summary = batch_runner.summarize(records, elapsed_sec=1.0)
+        self.assertEqual((summary["finished"], summary["failed"]), (0, 2))
+
+    def test_cli_writes_one_line_per_game(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.jsonl")
+            with patch("builtins.print"):
+                batch_runner.main(["--games", "3", "--concurrency", "3", "--output", output])
+
+            with open(output, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual(len(lines), 3)
+        self.assertEqual({line["winner"] for line in lines}, {"village"})
+
+
+if __name__ == "__main__":
+    unittest.main()
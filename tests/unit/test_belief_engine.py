@@ -0,0 +1,221 @@
+"""
+BayesianBeliefEngine（LLM を使わない役職推定）のユニットテスト
+
+テスト項目:
+- 占い結果が「見え方」の一致する役職に絞り込まれ、配布数と整合するよう正規化されるか
+  （村人と出た場合、狂人の可能性が残るか）
+- 役職交換の相手が交換前の自分の役職に確定するか
+- CO の読み取りと、解釈に LLM が必要な発言の判定
+- belief_update_node が挨拶・CO のみの発言では LLM を呼ばないか
+- LLM の結果に確定情報がかけ直されるか
+- LLM に渡さなかった、それより前の発言の CO が反映されるか
+- 内容が同じ GameDefinition でエンジンが使い回され、保持数が増え続けないか
+"""
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.core.types import (
+    GameDefinition,
+    GameEvent,
+    PlayerInput,
+    PlayerMemory,
+    RoleProb,
+)
+from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
+from src.game.player import belief_engine
+from src.game.player.belief_engine import BayesianBeliefEngine, Claim, get_belief_engine
+from src.game.setup.memory import create_initial_player_memory
+from src.graphs.player.node.belief_update_node import belief_update_node
+
+PLAYERS = ["太郎", "花子", "次郎", "三郎", "四郎"]
+
+
+def memory(self_role: str = "seer", definition: GameDefinition = ONE_NIGHT_GAME_DEFINITION):
+    return create_initial_player_memory(
+        definition=definition,
+        self_name="太郎",
+        self_role=self_role,
+        players=PLAYERS,
+    )
+
+
+def speak(player: str, text: str) -> GameEvent:
+    return GameEvent(event_type="speak", payload={"player": player, "text": text})
+
+
+def matrix(engine: BayesianBeliefEngine, beliefs: dict) -> np.ndarray:
+    return np.array([[beliefs[p].probs[r] for r in engine.roles] for p in PLAYERS])
+
+
+class TestBayesianBeliefEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = BayesianBeliefEngine(ONE_NIGHT_GAME_DEFINITION)
+
+    def assert_consistent(self, beliefs: dict, counts: np.ndarray):
+        table = matrix(self.engine, beliefs)
+        np.testing.assert_allclose(table.sum(axis=1), 1.0, atol=1e-6)
+        np.testing.assert_allclose(table.sum(axis=0), counts, atol=1e-4)
+
+    def test_divine_result_keeps_roles_that_look_the_same(self):
+        mem = memory("seer")
+        mem.observed_events.append(
+            GameEvent(event_type="divine_result", payload={"target": "花子", "role": "villager"})
+        )
+
+        beliefs = self.engine.update(mem)
+
+        hanako = beliefs["花子"].probs
+        self.assertEqual((hanako["werewolf"], hanako["seer"]), (0.0, 0.0))
+        # 狂人も占うと村人に見える
+        self.assertGreater(hanako["madman"], 0.0)
+        self.assertAlmostEqual(hanako["villager"] + hanako["madman"], 1.0)
+        # 他のプレイヤーの人狼確率は 1/3 に上がる（人狼は 花子 以外の 3 人のうち 1 人）
+        self.assertAlmostEqual(beliefs["次郎"].probs["werewolf"], 1 / 3, places=4)
+        self.assertEqual(beliefs["太郎"].probs["seer"], 1.0)
+        self.assert_consistent(beliefs, self.engine.counts)
+
+    def test_role_swap_fixes_target_to_old_role(self):
+        definition = GameDefinition(
+            roles=ONE_NIGHT_GAME_DEFINITION.roles,
+            role_distribution=["villager", "villager", "seer", "werewolf", "thief"],
+            phases=["night", "day", "vote"],
+        )
+        engine = BayesianBeliefEngine(definition)
+        mem = memory("thief", definition)
+        mem.self_role = "werewolf"
+        mem.observed_events.append(
+            GameEvent(
+                event_type="role_swapped",
+                payload={"target": "花子", "new_role": "werewolf", "old_role": "thief"},
+            )
+        )
+
+        beliefs = engine.update(mem)
+
+        self.assertEqual(beliefs["花子"].probs["thief"], 1.0)
+        self.assertEqual(beliefs["太郎"].probs["werewolf"], 1.0)
+        self.assertEqual(beliefs["次郎"].probs["werewolf"], 0.0)
+        self.assertAlmostEqual(beliefs["次郎"].probs["seer"], 1 / 3, places=4)
+
+    def test_claims(self):
+        claims = self.engine.extract_claims(speak("花子", "占い師COします。よろしく"))
+        self.assertEqual(claims, [Claim(player="花子", role="seer")])
+        self.assertEqual(self.engine.extract_claims(speak("花子", "おはようございます")), [])
+
+        self.assertFalse(
+            self.engine.needs_interpretation(speak("花子", "占い師COします。"), PLAYERS)
+        )
+        self.assertTrue(
+            self.engine.needs_interpretation(speak("花子", "占い師CO。次郎は人狼でした"), PLAYERS)
+        )
+
+        beliefs = self.engine.update(memory("villager"), claims=claims)
+        # 本物の占い師か、人狼陣営の騙りのどちらか
+        hanako = beliefs["花子"].probs
+        self.assertGreater(hanako["seer"], beliefs["次郎"].probs["seer"])
+        self.assertGreater(hanako["werewolf"], hanako["villager"])
+        self.assert_consistent(beliefs, self.engine.counts)
+
+
+class TestGetBeliefEngine(unittest.TestCase):
+    def test_engines_are_shared_by_content(self):
+        def restored():
+            # セッションの復元と同じく、毎回新しい GameDefinition を作る
+            return GameDefinition.model_validate(ONE_NIGHT_GAME_DEFINITION.model_dump())
+
+        engines = {id(get_belief_engine(restored())) for _ in range(50)}
+
+        self.assertEqual(len(engines), 1)
+        self.assertLessEqual(len(belief_engine._engines), belief_engine.MAX_CACHED_ENGINES)
+        self.assertIsNone(get_belief_engine(None))
+
+
+class FailingGenerator:
+    def generate(self, **kwargs):
+        raise AssertionError("LLM should not be called")
+
+
+class FixedGenerator:
+    """花子 を 90% 占い師とする（自分が占い師であることと矛盾する）結果を返す"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, *, memory: PlayerMemory, observed: GameEvent):
+        self.calls += 1
+        beliefs = dict(memory.role_beliefs)
+        beliefs["花子"] = RoleProb(
+            probs={"villager": 0.05, "seer": 0.9, "werewolf": 0.05, "madman": 0.0, "thief": 0.0}
+        )
+        return beliefs
+
+
+class EchoGenerator:
+    """現在の role_beliefs をそのまま返す（最新の発言から何も読み取らない）"""
+
+    def __init__(self):
+        self.observed = []
+
+    def generate(self, *, memory: PlayerMemory, observed: GameEvent):
+        self.observed.append(observed)
+        return dict(memory.role_beliefs)
+
+
+class TestBeliefUpdateNode(unittest.TestCase):
+    def state(self, mem: PlayerMemory) -> dict:
+        return {
+            "memory": mem,
+            "input": PlayerInput(),
+            "output": None,
+            "game_def": ONE_NIGHT_GAME_DEFINITION,
+        }
+
+    def test_trivial_speech_skips_llm(self):
+        mem = memory("villager")
+        mem.observed_events.append(speak("花子", "占い師CO"))
+
+        with patch(
+            "src.graphs.player.node.belief_update_node.believe_generator", FailingGenerator()
+        ):
+            state = belief_update_node(self.state(mem))
+            # 新しい発言がなければ何もしない
+            belief_update_node(state)
+
+        self.assertGreater(mem.role_beliefs["花子"].probs["seer"], 0.2)
+        self.assertEqual(mem.last_belief_event_index, 1)
+
+    def test_llm_result_is_constrained(self):
+        mem = memory("seer")
+        mem.observed_events.append(speak("花子", "私が占い師です。次郎が怪しいと思います"))
+        generator = FixedGenerator()
+
+        with patch("src.graphs.player.node.belief_update_node.believe_generator", generator):
+            belief_update_node(self.state(mem))
+
+        self.assertEqual(generator.calls, 1)
+        # 占い師は自分だけなので、花子 は占い師ではありえない
+        self.assertEqual(mem.role_beliefs["花子"].probs["seer"], 0.0)
+        self.assertEqual(mem.role_beliefs["太郎"].probs["seer"], 1.0)
+
+    def test_earlier_claims_are_kept_with_llm(self):
+        mem = memory("villager")
+        mem.observed_events.append(speak("花子", "占い師CO"))
+        mem.observed_events.append(speak("次郎", "花子さんの占い結果を聞かせてください"))
+        generator = EchoGenerator()
+
+        with patch("src.graphs.player.node.belief_update_node.believe_generator", generator):
+            belief_update_node(self.state(mem))
+
+        # LLM には最新の発言のみを渡すが、花子 の CO は反映される
+        self.assertEqual(generator.observed, [mem.observed_events[-1]])
+        self.assertGreater(
+            mem.role_beliefs["花子"].probs["seer"], mem.role_beliefs["三郎"].probs["seer"]
+        )
+        self.assertEqual(mem.last_belief_event_index, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
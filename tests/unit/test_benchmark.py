@@ -0,0 +1,100 @@
+"""
+ベンチマークのユニットテスト
+
+テスト項目:
+- パーセンタイルの計算
+- Graph のノードごとの実行時間が、ルーターを含めずに記録されるか
+- フェーズごとの待ち時間が集計され、結果を比較できるか
+"""
+
+import time
+import unittest
+from typing import TypedDict
+from unittest.mock import patch
+
+from langgraph.graph import END, START, StateGraph
+
+from src import batch_runner, benchmark
+from tests.unit.test_batch_runner import FakeGameSession
+
+
+class ToyState(TypedDict):
+    value: int
+
+
+def build_toy_graph():
+    def slow(state: ToyState) -> ToyState:
+        time.sleep(0.01)
+        return {"value": state["value"] + 1}
+
+    def route(state: ToyState) -> str:
+        return "fast"
+
+    graph = StateGraph(ToyState)
+    graph.add_node("slow", slow)
+    graph.add_node("fast", lambda state: state)
+    graph.add_edge(START, "slow")
+    graph.add_conditional_edges("slow", route, {"fast": "fast"})
+    graph.add_edge("fast", END)
+    return graph.compile(name="toy_graph")
+
+
+class TestStatistics(unittest.TestCase):
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+        self.assertAlmostEqual(benchmark.percentile(values, 50), 50.5)
+        self.assertAlmostEqual(benchmark.percentile(values, 95), 95.05)
+        self.assertIsNone(benchmark.percentile([], 50))
+        self.assertEqual(benchmark.latency_stats([])["count"], 0)
+
+
+class TestNodeTimer(unittest.TestCase):
+    def test_records_nodes_inside_scope_only(self):
+        graph = build_toy_graph()
+        timer = benchmark.NodeTimer()
+
+        with benchmark.node_timing_scope(timer):
+            graph.invoke({"value": 0})
+            graph.invoke({"value": 0})
+        graph.invoke({"value": 0})
+
+        summary = timer.summary()["toy_graph"]
+        self.assertEqual(summary["slow"]["count"], 2)
+        self.assertEqual(summary["fast"]["count"], 2)
+        self.assertGreaterEqual(summary["slow"]["p50"], 0.01)
+        # ルーター（route）はノードとして数えない
+        self.assertNotIn("route", summary)
+
+
+class TestRunBenchmark(unittest.TestCase):
+    def setUp(self):
+        FakeGameSession.fail = False
+        patcher = patch.object(batch_runner, "GameSession", FakeGameSession)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_phase_latencies_and_compare(self):
+        results = benchmark.run_benchmark(3, concurrency=3, overhead_repeat=0)
+
+        self.assertEqual((results["finished"], results["failed"]), (3, 0))
+        self.assertEqual(results["phase_latency_sec"]["day"]["count"], 6)
+        self.assertEqual(results["phase_latency_sec"]["night"]["count"], 3)
+        self.assertGreater(results["phase_latency_sec"]["vote"]["p50"], 0)
+        self.assertGreater(results["games_per_min"], 0)
+        self.assertGreater(results["peak_rss_mb"], 0)
+
+        slower = {"results": {**results, "peak_rss_mb": results["peak_rss_mb"] * 2}}
+        comparison = benchmark.compare({"results": results}, slower)
+        self.assertEqual(comparison["peak_rss_mb"]["change_pct"], 100.0)
+        self.assertEqual(comparison["phase_latency_sec.day.p50"]["change_pct"], 0.0)
+
+    def test_failures_are_reported(self):
+        FakeGameSession.fail = True
+        results = benchmark.run_benchmark(2, overhead_repeat=0)
+
+        self.assertEqual(results["failed"], 2)
+        self.assertEqual(results["errors"], ["RuntimeError: setup failed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+"""
+Dispatcher の並列 fan-out のユニットテスト
+
+テスト項目:
+- event の観測ターンが複数プレイヤーで並列に実行されるか
+- 実行完了順に関わらず、確定結果が決定的か
+- event の配布順序がプレイヤーごとに保たれるか
+- 投票が並列に収集され、要求順に解決されるか
+- 公開ログに確定したイベントが通知先へ順に届くか
+"""
+
+import threading
+import time
+import unittest
+
+from src.core.session import GameSession
+from src.core.types import (
+    GameDecision,
+    GameEvent,
+    GMInternalState,
+    PlayerInput,
+    PlayerOutput,
+    PlayerRequest,
+    PlayerInternalState,
+    PlayerState,
+    WorldState,
+)
+from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
+from src.game.setup.memory import create_initial_player_memory
+
+
+PLAYERS = ["p1", "p2", "p3", "p4", "p5"]
+
+
+class RecordingController:
+    """観測イベントを記録するだけのテスト用 Controller"""
+
+    def __init__(self, delay: float, tracker: "ConcurrencyTracker"):
+        self.delay = delay
+        self.tracker = tracker
+
+    def act(self, *, state: PlayerState) -> PlayerState:
+        with self.tracker:
+            time.sleep(self.delay)
+            request = state["input"].request
+            if request is not None and request.request_type == "vote":
+                # 自分の次のプレイヤーに投票する
+                me = state["memory"].self_name
+                target = PLAYERS[(PLAYERS.index(me) + 1) % len(PLAYERS)]
+                state["output"] = PlayerOutput(action="vote", payload={"target": target})
+                return state
+            state["memory"].observed_events.append(state["input"].event)
+            state["output"] = None
+            return state
+
+
+class ConcurrencyTracker:
+    """同時実行数の最大値を記録する"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self.current -= 1
+
+
+def create_session(max_workers: int, tracker: ConcurrencyTracker) -> GameSession:
+    definition = ONE_NIGHT_GAME_DEFINITION
+    roles = dict(zip(PLAYERS, definition.role_distribution))
+    player_states = {
+        player: PlayerState(
+            memory=create_initial_player_memory(
+                definition=definition,
+                self_name=player,
+                self_role=roles[player],
+                players=PLAYERS,
+            ),
+            input=PlayerInput(),
+            output=None,
+            internal=PlayerInternalState(),
+        )
+        for player in PLAYERS
+    }
+    # 後のプレイヤーほど早く終わるようにして、完了順を入れ替える
+    controllers = {
+        player: RecordingController(delay=0.02 * (len(PLAYERS) - i), tracker=tracker)
+        for i, player in enumerate(PLAYERS)
+    }
+    return GameSession(
+        definition=definition,
+        world_state=WorldState(phase="day", players=PLAYERS, public_events=[]),
+        player_states=player_states,
+        controllers=controllers,
+        assigned_roles=roles,
+        gm_graph=None,
+        gm_internal=GMInternalState(night_pending=[], vote_pending=list(PLAYERS)),
+        max_workers=max_workers,
+    )
+
+
+class TestDispatcherFanOut(unittest.TestCase):
+    def test_event_turns_run_concurrently(self):
+        tracker = ConcurrencyTracker()
+        session = create_session(max_workers=5, tracker=tracker)
+
+        session.dispatch(
+            GameDecision(events=[GameEvent(event_type="day_started", payload={})])
+        )
+
+        self.assertGreater(tracker.peak, 1)
+        for player in PLAYERS:
+            events = session.player_states[player]["memory"].observed_events
+            self.assertEqual([e.event_type for e in events], ["day_started"])
+
+    def test_sequential_mode(self):
+        tracker = ConcurrencyTracker()
+        session = create_session(max_workers=1, tracker=tracker)
+
+        session.dispatch(
+            GameDecision(events=[GameEvent(event_type="day_started", payload={})])
+        )
+
+        self.assertEqual(tracker.peak, 1)
+
+    def test_event_order_is_preserved_per_player(self):
+        tracker = ConcurrencyTracker()
+        session = create_session(max_workers=5, tracker=tracker)
+        events = [
+            GameEvent(event_type="gm_comment", payload={"text": str(i), "speaker": "p1"})
+            for i in range(3)
+        ]
+
+        session.dispatch(GameDecision(events=events))
+
+        for player in PLAYERS:
+            observed = session.player_states[player]["memory"].observed_events
+            self.assertEqual([e.payload["text"] for e in observed], ["0", "1", "2"])
+        self.assertEqual(session.world_state.public_events, events)
+        self.assertEqual(list(session.player_states), PLAYERS)
+
+    def test_votes_are_collected_in_parallel_and_resolved_in_order(self):
+        tracker = ConcurrencyTracker()
+        session = create_session(max_workers=5, tracker=tracker)
+        session.world_state.phase = "vote"
+
+        session.dispatch(
+            GameDecision(
+                requests={
+                    player: PlayerRequest(request_type="vote", payload={})
+                    for player in PLAYERS
+                }
+            )
+        )
+
+        self.assertGreater(tracker.peak, 1)
+        self.assertEqual(session.gm_internal.vote_pending, [])
+        self.assertEqual(list(session.gm_internal.votes), PLAYERS)
+        self.assertEqual(session.gm_internal.votes["p5"], "p1")
+        vote_events = session.world_state.pending_events
+        self.assertEqual([e.payload["voter"] for e in vote_events], PLAYERS)
+
+    def test_listeners_receive_events_as_they_are_committed(self):
+        tracker = ConcurrencyTracker()
+        session = create_session(max_workers=5, tracker=tracker)
+        received = []
+        session.add_event_listener(received.append)
+
+        # 投票は pending_events に積まれ、次の dispatch で公開ログに確定する
+        session.world_state.phase = "vote"
+        session.dispatch(
+            GameDecision(
+                requests={
+                    player: PlayerRequest(request_type="vote", payload={})
+                    for player in PLAYERS
+                }
+            )
+        )
+        self.assertEqual(received, [])
+
+        session.dispatch(
+            GameDecision(events=[GameEvent(event_type="gm_comment", payload={"text": "..."})])
+        )
+        self.assertEqual(
+            [e.event_type for e in received],
+            ["vote"] * len(PLAYERS) + ["gm_comment"],
+        )
+        self.assertEqual(received, session.world_state.public_events)
+
+        session.remove_event_listener(received.append)
+        session.commit_public_events([GameEvent(event_type="game_end", payload={})])
+        self.assertEqual(len(received), len(PLAYERS) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
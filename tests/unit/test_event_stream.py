@@ -0,0 +1,171 @@
+"""
+ゲームイベントのストリーミング配信のユニットテスト
+
+テスト項目:
+- ステップ完了を待たずに、確定したイベントが順に送出されるか
+- ステップ完了後に done が送出されるか
+- 発言の差分が speech_delta として送出されるか
+- 下書きの取り消しが speech_discard として送出されるか
+- 失敗 / セッション無しの場合に error が送出されるか
+- クライアント切断時に実行中のステップへ中断要求が伝わるか
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+
+from src.app.executor import GameExecutor
+from src.app.progress import report_event
+from src.app.streaming import format_sse, stream_game_step
+from src.core.cancellation import raise_if_cancelled
+from src.core.speech_stream import report_speech_delta, report_speech_discard
+from src.core.types import GameEvent
+
+
+def parse_sse(message: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in message.strip().split("\n"))
+    return {"event": fields["event"], "data": json.loads(fields["data"]), "id": fields.get("id")}
+
+
+def speaking_step(session_id: str, gate: threading.Event, day_steps: int = 2):
+    """1 件目のイベントを確定させた後、gate が開くまで待つ疑似ステップ"""
+    for i in range(day_steps):
+        report_event(GameEvent(event_type="speak", payload={"player": "p1", "text": str(i)}))
+        gate.wait(timeout=2.0)
+    report_event(GameEvent(event_type="game_end", payload={}))
+    return {"definition": {}, "world_state": {"phase": "result"}, "player_states": {}}
+
+
+def streaming_speech_step(session_id: str):
+    """発言の差分を通知してから発言を確定させる疑似ステップ"""
+    for delta in ("私は", "村人です"):
+        report_speech_delta("p1", delta)
+    report_event(GameEvent(event_type="speak", payload={"player": "p1", "text": "私は村人です"}))
+    return {"definition": {}, "world_state": {"phase": "day"}, "player_states": {}}
+
+
+def refined_speech_step(session_id: str):
+    """下書きを通知した後、差し替えた発言を確定させる疑似ステップ"""
+    report_speech_delta("p1", "私は人狼")
+    report_speech_discard("p1")
+    report_event(GameEvent(event_type="speak", payload={"player": "p1", "text": "私は村人です"}))
+    return {"definition": {}, "world_state": {"phase": "day"}, "player_states": {}}
+
+
+def missing_session_step(session_id: str):
+    return None
+
+
+def failing_step(session_id: str):
+    raise RuntimeError("boom")
+
+
+def endless_step(session_id: str, stopped: threading.Event):
+    try:
+        report_event(GameEvent(event_type="day_started", payload={}))
+        while True:
+            raise_if_cancelled()
+            time.sleep(0.01)
+    finally:
+        stopped.set()
+
+
+class TestEventStream(unittest.TestCase):
+    def setUp(self):
+        self.executor = GameExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+
+    def collect(self, fn, **kwargs):
+        async def scenario():
+            return [
+                parse_sse(message)
+                async for message in stream_game_step(
+                    fn, session_id="s1", executor=self.executor, **kwargs
+                )
+            ]
+
+        return asyncio.run(scenario())
+
+    def test_events_are_streamed_before_step_completes(self):
+        gate = threading.Event()
+
+        async def scenario():
+            stream = stream_game_step(
+                speaking_step, session_id="s1", executor=self.executor, gate=gate
+            )
+            # ステップはまだ完了していないが、1 件目は受け取れる
+            first = parse_sse(await stream.__anext__())
+            gate.set()
+            rest = [parse_sse(message) async for message in stream]
+            return [first] + rest
+
+        messages = asyncio.run(scenario())
+        self.assertEqual(
+            [m["event"] for m in messages], ["speak", "speak", "game_end", "done"]
+        )
+        self.assertEqual([m["id"] for m in messages[:3]], ["1", "2", "3"])
+        self.assertEqual(messages[0]["data"]["payload"]["text"], "0")
+        self.assertEqual(messages[-1]["data"], {"session_id": "s1", "phase": "result"})
+
+    def test_speech_deltas_precede_committed_speak(self):
+        messages = self.collect(streaming_speech_step)
+        self.assertEqual(
+            [m["event"] for m in messages],
+            ["speech_delta", "speech_delta", "speak", "done"],
+        )
+        self.assertIsNone(messages[0]["id"])
+        self.assertEqual(messages[2]["id"], "1")
+        self.assertEqual(
+            "".join(m["data"]["delta"] for m in messages[:2]),
+            messages[2]["data"]["payload"]["text"],
+        )
+
+        # stream_speech=False の場合は確定したイベントのみ
+        messages = self.collect(streaming_speech_step, stream_speech=False)
+        self.assertEqual([m["event"] for m in messages], ["speak", "done"])
+
+    def test_discarded_draft_is_announced_before_speak(self):
+        messages = self.collect(refined_speech_step)
+        self.assertEqual(
+            [m["event"] for m in messages],
+            ["speech_delta", "speech_discard", "speak", "done"],
+        )
+        self.assertEqual(messages[1]["data"], {"player": "p1"})
+        self.assertIsNone(messages[1]["id"])
+
+        messages = self.collect(refined_speech_step, stream_speech=False)
+        self.assertEqual([m["event"] for m in messages], ["speak", "done"])
+
+    def test_errors_are_sent_as_terminal_event(self):
+        missing = self.collect(missing_session_step)
+        self.assertEqual([m["event"] for m in missing], ["error"])
+        self.assertEqual(missing[0]["data"]["error"], "Session not found")
+
+        failed = self.collect(failing_step)
+        self.assertEqual(failed[0]["data"]["detail"], "boom")
+
+    def test_disconnect_cancels_running_step(self):
+        stopped = threading.Event()
+
+        async def scenario():
+            stream = stream_game_step(
+                endless_step, session_id="s1", executor=self.executor, stopped=stopped
+            )
+            first = parse_sse(await stream.__anext__())
+            # クライアント切断（StreamingResponse がジェネレータを閉じる）
+            await stream.aclose()
+            return first
+
+        first = asyncio.run(scenario())
+        self.assertEqual(first["event"], "day_started")
+        self.assertTrue(stopped.wait(timeout=1.0))
+
+    def test_format_sse(self):
+        message = format_sse("speak", {"text": "こんにちは"}, 3)
+        self.assertEqual(message, 'id: 3\nevent: speak\ndata: {"text": "こんにちは"}\n\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
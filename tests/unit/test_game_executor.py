@@ -0,0 +1,90 @@
+"""
+GameExecutor のユニットテスト
+
+テスト項目:
+- 同期処理の実行中もイベントループが塞がれないか
+- タイムアウト時に中断要求が実行中の処理へ伝わるか
+- 中断要求がプレイヤーターンのワーカースレッドにも伝わるか
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.app.executor import GameExecutor
+from src.core.cancellation import (
+    CancellationToken,
+    StepCancelled,
+    cancellation_scope,
+    raise_if_cancelled,
+)
+
+
+def cancellable_work(stopped: threading.Event, steps: int = 100) -> int:
+    """区切りごとに中断要求を確認する疑似ゲームステップ"""
+    try:
+        for i in range(steps):
+            raise_if_cancelled()
+            time.sleep(0.01)
+        return steps
+    finally:
+        stopped.set()
+
+
+class TestGameExecutor(unittest.TestCase):
+    def test_event_loop_is_not_blocked(self):
+        executor = GameExecutor(max_workers=2)
+
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            result = await executor.run(time.sleep, 0.2)
+            task.cancel()
+            return result, ticks
+
+        result, ticks = asyncio.run(scenario())
+        self.assertIsNone(result)
+        self.assertGreater(ticks, 5)
+        executor.shutdown()
+
+    def test_timeout_cancels_running_step(self):
+        executor = GameExecutor(max_workers=1)
+        stopped = threading.Event()
+
+        async def scenario():
+            with self.assertRaises(asyncio.TimeoutError):
+                await executor.run(cancellable_work, stopped, timeout=0.05)
+
+        asyncio.run(scenario())
+
+        # 打ち切られたステップは最後まで実行されずに終了する
+        self.assertTrue(stopped.wait(timeout=1.0))
+        executor.shutdown()
+
+    def test_token_propagates_to_worker_threads(self):
+        import contextvars
+
+        token = CancellationToken()
+        token.cancel()
+
+        with cancellation_scope(token):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                future = pool.submit(contextvars.copy_context().run, raise_if_cancelled)
+                with self.assertRaises(StepCancelled):
+                    future.result()
+
+        # スコープ外では何もしない
+        raise_if_cancelled()
+
+
+if __name__ == "__main__":
+    unittest.main()
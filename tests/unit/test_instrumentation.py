@@ -0,0 +1,176 @@
+"""
+ノード・LLM 呼び出しの計測のユニットテスト
+
+テスト項目:
+- メトリクスレジストリのカウンタ・ヒストグラム・セッション集計
+- 計測付き StateGraph がノード・ルーターの実行時間をプレイヤー別に記録するか
+- LLM 呼び出しの文字数・トークン数・キャッシュヒット・失敗が記録されるか
+"""
+
+import os
+import tempfile
+import unittest
+from typing import Any, TypedDict
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START
+
+from src.core.instrumentation import GM_PLAYER, session_scope
+from src.core.llm.cache import CachedLLMClient, LLMResponseCache
+from src.core.llm.instrumented import InstrumentedLLMClient
+from src.core.memory.speak import Speak
+from src.core.metrics import MetricsRegistry, metrics
+from src.graphs.instrumented_graph import InstrumentedStateGraph
+
+
+class FakeMemory:
+    def __init__(self, self_name: str):
+        self.self_name = self_name
+
+
+class ToyState(TypedDict):
+    memory: Any
+    value: int
+
+
+class FakeLLM:
+    """トークン使用量を報告するチャットモデルを呼び出すテスト用 LLMClient"""
+
+    model_name = "fake"
+    output_model = Speak
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+
+    def generate(self, *, system: str, prompt: str) -> Speak:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        message = AIMessage(
+            content="ok",
+            usage_metadata={"input_tokens": 7, "output_tokens": 3, "total_tokens": 10},
+            response_metadata={"model_name": "fake"},
+        )
+        GenericFakeChatModel(messages=iter([message])).invoke(prompt)
+        return Speak(text="こんにちは")
+
+
+def counter(name: str, **labels) -> float:
+    return metrics.counter_value(name, **labels)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_counters_histograms_and_sessions(self):
+        registry = MetricsRegistry(max_sessions=2)
+        registry.inc("calls_total", llm="speak")
+        registry.inc("calls_total", 2, llm="speak")
+        registry.observe("duration_seconds", 0.02, node="a")
+        registry.observe("duration_seconds", 3.0, node="a")
+
+        self.assertEqual(registry.counter_value("calls_total", llm="speak"), 3.0)
+        (histogram,) = registry.snapshot()["histograms"]["duration_seconds"]
+        self.assertEqual(histogram["count"], 2)
+        buckets = dict(histogram["buckets"])
+        self.assertEqual((buckets[0.01], buckets[0.025], buckets[5.0]), (0, 1, 2))
+
+        for session_id in ("s1", "s2", "s3"):
+            registry.add_session(session_id, {"calls": 1}, node="a")
+        registry.add_session("s3", {"calls": 1}, node="a")
+        self.assertIsNone(registry.session_summary("s1"))
+        self.assertEqual(registry.session_summary("s3")[0]["values"], {"calls": 2})
+
+
+class TestNodeInstrumentation(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def build_graph(self):
+        def think(state: ToyState) -> ToyState:
+            if state["value"] < 0:
+                raise ValueError("negative")
+            return {"value": state["value"] + 1}
+
+        def route(state: ToyState) -> str:
+            return "finish"
+
+        graph = InstrumentedStateGraph(ToyState, name="toy_graph")
+        graph.add_node("think", think)
+        graph.add_node("finish", lambda state: state)
+        graph.add_edge(START, "think")
+        graph.add_conditional_edges("think", route, {"finish": "finish"})
+        graph.add_edge("finish", END)
+        return graph.compile(name="toy_graph")
+
+    def test_records_nodes_and_routers_per_player(self):
+        graph = self.build_graph()
+
+        with session_scope("session-1"):
+            result = graph.invoke({"memory": FakeMemory("太郎"), "value": 0})
+        graph.invoke({"memory": None, "value": 0})
+
+        self.assertEqual(result["value"], 1)
+        histograms = metrics.snapshot()["histograms"]["graph_node_duration_seconds"]
+        recorded = {(h["labels"]["node"], h["labels"]["player"]) for h in histograms}
+        self.assertIn(("think", "太郎"), recorded)
+        self.assertIn(("route", "太郎"), recorded)
+        self.assertIn(("think", GM_PLAYER), recorded)
+
+        summary = metrics.session_summary("session-1")
+        nodes = {item["labels"]["node"]: item["values"] for item in summary}
+        self.assertEqual(nodes["think"]["calls"], 1)
+        self.assertNotIn(GM_PLAYER, {item["labels"]["player"] for item in summary})
+
+    def test_records_errors(self):
+        graph = self.build_graph()
+
+        with self.assertRaises(ValueError):
+            graph.invoke({"memory": FakeMemory("花子"), "value": -1})
+
+        self.assertEqual(counter("graph_node_errors_total", graph="toy_graph", node="think"), 1)
+
+
+class TestLLMInstrumentation(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_records_chars_tokens_and_cache_hits(self):
+        inner = FakeLLM()
+        cache = LLMResponseCache(os.path.join(self.tmp.name, "cache.sqlite3"), max_bytes=1 << 20)
+        self.addCleanup(cache.close)
+        client = InstrumentedLLMClient(CachedLLMClient(inner, cache), name="speak")
+
+        with session_scope("session-2"):
+            client.generate(system="sys", prompt="hello")
+            client.generate(system="sys", prompt="hello")
+
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(counter("llm_calls_total", llm="speak", status="ok"), 2)
+        self.assertEqual(counter("llm_cache_lookups_total", llm="speak", result="hit"), 1)
+        self.assertEqual(counter("llm_cache_lookups_total", llm="speak", result="miss"), 1)
+        self.assertEqual(counter("llm_prompt_chars_total", llm="speak"), 16)
+        self.assertEqual(counter("llm_input_tokens_total", llm="speak"), 7)
+        self.assertEqual(counter("llm_output_tokens_total", llm="speak"), 3)
+
+        (item,) = metrics.session_summary("session-2")
+        self.assertEqual(item["labels"], {"graph": "-", "node": "-", "player": "-"})
+        self.assertEqual(item["values"]["llm_calls"], 2)
+        self.assertEqual(item["values"]["cache_hits"], 1)
+
+    def test_records_failures_and_stream_fallback(self):
+        failing = InstrumentedLLMClient(FakeLLM(fail=True), name="vote")
+        with self.assertRaises(RuntimeError):
+            failing.generate(system="", prompt="x")
+        self.assertEqual(counter("llm_calls_total", llm="vote", status="error"), 1)
+
+        client = InstrumentedLLMClient(FakeLLM(), name="speak")
+        chunks = list(client.stream(system="", prompt="x"))
+        self.assertEqual(chunks, [Speak(text="こんにちは")])
+        self.assertGreater(counter("llm_output_chars_total", llm="speak"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+JobService のユニットテスト
+
+テスト項目:
+- 投入直後に queued で返り、完了後に結果が取得できるか
+- 進捗通知がジョブ状態に反映されるか
+- 中断要求でジョブが cancelled になるか
+- 失敗 / セッション無しの場合に failed になるか
+- Redis への保存がイベントループのスレッドで行われないか
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.app.executor import GameExecutor
+from src.app.progress import report_progress
+from src.app.services.job_service import JobService
+from src.core.cancellation import raise_if_cancelled
+
+
+def fake_step(session_id: str, day_steps: int = 3):
+    """GameService.run_day 相当の疑似処理"""
+    for i in range(day_steps):
+        raise_if_cancelled()
+        time.sleep(0.01)
+        report_progress(i + 1, day_steps)
+    return {"definition": {}, "world_state": {"day": day_steps}, "player_states": {}}
+
+
+def slow_step(session_id: str):
+    for _ in range(200):
+        raise_if_cancelled()
+        time.sleep(0.01)
+    return {"definition": {}, "world_state": {}, "player_states": {}}
+
+
+def failing_step(session_id: str):
+    raise RuntimeError("boom")
+
+
+def missing_session_step(session_id: str):
+    return None
+
+
+async def wait_until_finished(service: JobService, job_id: str, timeout: float = 3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = service.get(job_id)
+        if job.status not in ("queued", "running"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+class TestJobService(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("src.app.services.job_service.JobRepository")
+        self.repository = patcher.start()
+        self.repository.get.return_value = None
+        self.addCleanup(patcher.stop)
+
+        self.executor = GameExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+        self.service = JobService(self.executor, timeout=5.0, ttl=60)
+
+    def test_submit_returns_queued_and_finishes_with_result(self):
+        async def scenario():
+            job = self.service.submit(kind="day", session_id="s1", fn=fake_step, day_steps=3)
+            self.assertEqual(job.status, "queued")
+            return await wait_until_finished(self.service, job.job_id)
+
+        job = asyncio.run(scenario())
+        self.assertEqual(job.status, "succeeded")
+        self.assertEqual(job.result.session_id, "s1")
+        self.assertEqual(job.result.world_state, {"day": 3})
+        self.assertEqual((job.progress_done, job.progress_total), (3, 3))
+        # 状態遷移ごとに Redis へ保存される
+        saved = [call.args[0].status for call in self.repository.save.call_args_list]
+        self.assertEqual(saved[0], "queued")
+        self.assertIn("running", saved)
+        self.assertEqual(saved[-1], "succeeded")
+
+    def test_cancel_stops_running_job(self):
+        async def scenario():
+            job = self.service.submit(kind="day", session_id="s1", fn=slow_step)
+            await asyncio.sleep(0.05)
+            self.service.cancel(job.job_id)
+            return await wait_until_finished(self.service, job.job_id)
+
+        job = asyncio.run(scenario())
+        self.assertEqual(job.status, "cancelled")
+        self.assertIsNone(job.result)
+
+    def test_failures_are_reported(self):
+        async def scenario():
+            failed = self.service.submit(kind="day", session_id="s1", fn=failing_step)
+            missing = self.service.submit(kind="day", session_id="s2", fn=missing_session_step)
+            return (
+                await wait_until_finished(self.service, failed.job_id),
+                await wait_until_finished(self.service, missing.job_id),
+            )
+
+        failed, missing = asyncio.run(scenario())
+        self.assertEqual(failed.status, "failed")
+        self.assertEqual(failed.error, "boom")
+        self.assertEqual(missing.status, "failed")
+        self.assertIn("s2", missing.error)
+
+    def test_repository_is_not_called_on_event_loop(self):
+        threads = []
+        self.repository.save.side_effect = lambda job, ttl: threads.append(
+            threading.current_thread()
+        )
+
+        async def scenario():
+            job = self.service.submit(kind="day", session_id="s1", fn=fake_step, day_steps=1)
+            await wait_until_finished(self.service, job.job_id)
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(scenario())
+        self.assertTrue(threads)
+        self.assertNotIn(loop_thread, threads)
+
+    def test_unknown_job_falls_back_to_repository(self):
+        self.assertIsNone(self.service.get("unknown"))
+        self.repository.get.assert_called_once_with("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+LLM 応答キャッシュのユニットテスト
+
+テスト項目:
+- 同一の (model, schema, system, prompt) で LLM が再度呼ばれないか
+- キーの構成要素が変わると別エントリになるか
+- サイズ上限を超えたときに最終アクセスが古い順に削除されるか
+- 合計サイズが上書き・削除・再オープン後も正しく保たれるか
+- 永続化され、別インスタンスからも読めるか
+"""
+
+import asyncio
+
+from src.core.llm.cache import CachedLLMClient, LLMResponseCache, make_cache_key
+from src.core.memory.log_summary import LogSummaryOutput
+from src.core.memory.vote import VoteOutput
+
+
+class CountingLLM:
+    """呼び出し回数を記録するテスト用 LLMClient"""
+
+    def __init__(self, output_model=VoteOutput, model_name="test-model"):
+        self.model_name = model_name
+        self.output_model = output_model
+        self.calls = 0
+
+    def generate(self, *, system: str, prompt: str):
+        self.calls += 1
+        return VoteOutput(target=f"p{self.calls}")
+
+    async def agenerate(self, *, system: str, prompt: str):
+        return self.generate(system=system, prompt=prompt)
+
+
+def create_cache(tmp_path, max_bytes=1024 * 1024):
+    return LLMResponseCache(str(tmp_path / "cache.sqlite3"), max_bytes=max_bytes)
+
+
+def test_repeated_prompt_hits_cache(tmp_path):
+    llm = CountingLLM()
+    cache = create_cache(tmp_path)
+    client = CachedLLMClient(llm, cache)
+
+    first = client.generate(system="s", prompt="p")
+    second = client.generate(system="s", prompt="p")
+    third = asyncio.run(client.agenerate(system="s", prompt="p"))
+
+    assert llm.calls == 1
+    assert first == second == third
+    assert isinstance(second, VoteOutput)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+
+
+def test_key_components_are_distinguished():
+    base = dict(model_name="m", output_model=VoteOutput, system="s", prompt="p")
+    key = make_cache_key(**base)
+
+    assert key == make_cache_key(**base)
+    assert key != make_cache_key(**{**base, "model_name": "m2"})
+    assert key != make_cache_key(**{**base, "output_model": LogSummaryOutput})
+    assert key != make_cache_key(**{**base, "system": "s2"})
+    assert key != make_cache_key(**{**base, "prompt": "p2"})
+    # 区切りにより、連結結果が同じでも別キーになる
+    assert make_cache_key(**{**base, "system": "ab", "prompt": "c"}) != make_cache_key(
+        **{**base, "system": "a", "prompt": "bc"}
+    )
+
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = create_cache(tmp_path, max_bytes=25)
+
+    cache.put("a", "x" * 10)
+    cache.put("b", "x" * 10)
+    # a にアクセスして b を最も古いエントリにする
+    assert cache.get("a") is not None
+    cache.put("c", "x" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= 25
+
+
+def test_total_bytes_are_tracked(tmp_path):
+    cache = create_cache(tmp_path)
+
+    cache.put("a", "x" * 10)
+    cache.put("b", "x" * 10)
+    cache.put("a", "x" * 4)
+    cache.discard("b")
+    assert cache.get("a") is not None
+    assert cache.stats()["bytes"] == 4
+    cache.close()
+
+    assert create_cache(tmp_path).stats()["bytes"] == 4
+
+
+def test_cache_is_persistent(tmp_path):
+    llm = CountingLLM()
+    CachedLLMClient(llm, create_cache(tmp_path)).generate(system="s", prompt="p")
+
+    reopened = CachedLLMClient(llm, create_cache(tmp_path))
+    result = reopened.generate(system="s", prompt="p")
+
+    assert llm.calls == 1
+    assert result.target == "p1"
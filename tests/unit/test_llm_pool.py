@@ -0,0 +1,61 @@
+"""
+LLM バックエンドの接続プール共有のユニットテスト
+
+テスト項目:
+- 接続プールがバックエンド × base_url ごとに 1 つだけ作られるか
+- ChatModel が 1 度だけ生成されるか
+- 出力スキーマの異なる vLLM クライアントが ChatModel・HTTP クライアントを共有するか
+"""
+
+import unittest
+
+from src.core.llm.pool import BackendPool, PoolLimits, backend_pool
+from src.core.llm.vllm_client import VLLMLangChainClient
+from src.core.memory.speak import Speak
+from src.core.memory.vote import VoteOutput
+
+
+class TestBackendPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = BackendPool(
+            PoolLimits(max_connections=2, max_keepalive_connections=1, keepalive_expiry=5.0)
+        )
+        self.addCleanup(self.pool.close)
+
+    def test_pools_are_shared_per_backend_and_base_url(self):
+        client = self.pool.http_client("vllm", "http://a/v1")
+
+        self.assertIs(self.pool.http_client("vllm", "http://a/v1"), client)
+        self.assertIs(client._transport, self.pool.transport("vllm", "http://a/v1"))
+        self.assertIsNot(self.pool.transport("vllm", "http://b/v1"), client._transport)
+        self.assertIs(self.pool.transport("ollama"), self.pool.transport("ollama", None))
+        self.assertEqual(client._transport._pool._max_connections, 2)
+
+    def test_chat_model_is_built_once(self):
+        built = []
+
+        def factory():
+            built.append(object())
+            return built[-1]
+
+        first = self.pool.chat_model(("vllm", "m"), factory)
+
+        self.assertIs(self.pool.chat_model(("vllm", "m"), factory), first)
+        self.assertEqual(len(built), 1)
+        self.assertEqual(self.pool.stats()["chat_models"], 1)
+
+
+class TestSharedBackendClients(unittest.TestCase):
+    def test_vllm_clients_share_chat_model_and_http_client(self):
+        self.addCleanup(backend_pool.close)
+        base_url = "http://pool-test:8000/v1"
+        speak = VLLMLangChainClient(model="m", output_model=Speak, base_url=base_url)
+        vote = VLLMLangChainClient(model="m", output_model=VoteOutput, base_url=base_url)
+
+        self.assertIs(speak.llm, vote.llm)
+        self.assertIsNot(speak.structured_llm, vote.structured_llm)
+        self.assertIs(speak.llm.root_client._client, backend_pool.http_client("vllm", base_url))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+LLMClient の共有レジストリ・遅延生成のユニットテスト
+
+テスト項目:
+- 用途ごとの LLMClient が初回使用時に 1 度だけ生成され、共有されるか
+- LazyLLMClient が属性参照まで生成を遅らせるか
+- src.main の import でバックエンド（LangChain 連携パッケージ）が import されず、
+  API キーが無くても失敗しないか
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import unittest
+
+from src.core.llm.registry import LLMRegistry
+from src.core.memory.speak import Speak
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeLLM:
+    def generate(self, *, system: str, prompt: str) -> Speak:
+        return Speak(text="こんにちは")
+
+
+class TestLLMRegistry(unittest.TestCase):
+    def setUp(self):
+        self.built = 0
+        self.registry = LLMRegistry()
+        self.registry.register("speak", self.factory)
+
+    def factory(self):
+        self.built += 1
+        return FakeLLM()
+
+    def test_builds_once_and_shares(self):
+        threads = [threading.Thread(target=self.registry.get, args=("speak",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.built, 1)
+        self.assertIs(self.registry.get("speak"), self.registry.get("speak"))
+        with self.assertRaises(KeyError):
+            self.registry.get("vote")
+
+        self.registry.reset()
+        self.registry.get("speak")
+        self.assertEqual(self.built, 2)
+
+    def test_lazy_client_resolves_on_first_use(self):
+        lazy = self.registry.lazy("speak")
+        # LangGraph などによる "_" 始まりの属性の検査では生成しない
+        self.assertFalse(hasattr(lazy, "__self__"))
+        self.assertFalse(self.registry.is_built("speak"))
+
+        result = lazy.generate(system="", prompt="x")
+
+        self.assertEqual(result.text, "こんにちは")
+        self.assertEqual(self.built, 1)
+        self.assertIs(lazy.resolve(), self.registry.get("speak"))
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_main_does_not_build_backends(self):
+        env = {k: v for k, v in os.environ.items() if k != "GOOGLE_API_KEY"}
+        code = (
+            "import sys\n"
+            "import src.main\n"
+            "from src.core.llm.registry import llm_registry\n"
+            "backends = ('langchain_google_genai', 'langchain_openai', 'langchain_ollama')\n"
+            "assert not [m for m in backends if m in sys.modules], sys.modules.keys()\n"
+            "assert not [n for n in llm_registry.names() if llm_registry.is_built(n)]\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+構造化ロガーのユニットテスト
+
+テスト項目:
+- 出力しないレベルのレコードでは、引数・フィールドが文字列化されないか
+- サブシステムごとのサンプリング率が親から継承され、警告には適用されないか
+- JSON 形式でメッセージと構造化フィールドが出力されるか
+"""
+
+import io
+import json
+import logging
+import unittest
+
+from src.core import log
+from src.core.memory.speak import Speak
+
+
+class Exploding:
+    """文字列化されたら失敗するオブジェクト"""
+
+    def __str__(self) -> str:
+        raise AssertionError("formatted")
+
+    __repr__ = __str__
+
+
+class TestStructuredLogger(unittest.TestCase):
+    def setUp(self):
+        root = logging.getLogger(log.ROOT_LOGGER_NAME)
+        saved = (root.level, list(root.handlers), root.propagate)
+
+        def restore():
+            log.configure_logging(sampling="")
+            root.setLevel(saved[0])
+            root.handlers[:] = saved[1]
+            root.propagate = saved[2]
+
+        self.addCleanup(restore)
+        self.stream = io.StringIO()
+
+    def lines(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_disabled_records_are_not_formatted(self):
+        log.configure_logging("WARNING", "json", "", stream=self.stream)
+        logger = log.get_logger("test.lazy")
+
+        logger.debug("value: %s", Exploding(), payload=Exploding())
+        logger.info("value: %s", Exploding())
+
+        self.assertFalse(logger.is_enabled(log.INFO))
+        self.assertEqual(self.stream.getvalue(), "")
+
+    def test_sampling_per_subsystem(self):
+        log.configure_logging("DEBUG", "json", "test.sampled=0", stream=self.stream)
+        sampled = log.get_logger("test.sampled.child")
+        other = log.get_logger("test.other")
+
+        for _ in range(20):
+            sampled.debug("dropped")
+        sampled.warning("kept")
+        other.info("also kept")
+
+        self.assertEqual(sampled.sample_rate, 0.0)
+        self.assertEqual([line["msg"] for line in self.lines()], ["kept", "also kept"])
+
+    def test_json_fields(self):
+        log.configure_logging("DEBUG", "json", "", stream=self.stream)
+        logger = log.get_logger("test.json")
+
+        logger.debug("Generated speech for %s", "太郎", speak=Speak(text="こんにちは"), turn=3)
+
+        (line,) = self.lines()
+        self.assertEqual(line["level"], "DEBUG")
+        self.assertEqual(line["subsystem"], "test.json")
+        self.assertEqual(line["msg"], "Generated speech for 太郎")
+        self.assertEqual(line["speak"], {"kind": "speak", "text": "こんにちは"})
+        self.assertEqual(line["turn"], 3)
+
+    def test_parse_sampling(self):
+        self.assertEqual(
+            log.parse_sampling("player=0.1, metrics=2,broken,bad=x"),
+            {"player": 0.1, "metrics": 1.0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
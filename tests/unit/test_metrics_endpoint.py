@@ -0,0 +1,110 @@
+"""
+/metrics エンドポイントのユニットテスト
+
+テスト項目:
+- ゲージ・ヒストグラムが Prometheus のテキスト形式で出力されるか
+- ステップの所要時間・実行中セッション数・タイムアウト回数が記録されるか
+- /metrics がテキスト形式で応答するか
+"""
+
+import asyncio
+import threading
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.app.controllers import metrics_router
+from src.app.executor import GameExecutor
+from src.app.services.game_service import GameService
+from src.core.cancellation import StepCancelled, raise_if_cancelled
+from src.core.metrics import MetricsRegistry, format_prometheus, metrics
+
+
+class FakeWorldState:
+    phase = "day"
+
+
+class FakeSession:
+    world_state = FakeWorldState()
+
+
+def wait_until_cancelled(stopped: threading.Event) -> None:
+    try:
+        while True:
+            raise_if_cancelled()
+            stopped.wait(0.01)
+    finally:
+        stopped.set()
+
+
+class TestPrometheusFormat(unittest.TestCase):
+    def test_format(self):
+        registry = MetricsRegistry()
+        registry.describe("jobs_total", "Jobs")
+        registry.inc("jobs_total", 2, kind='say "hi"')
+        registry.add_gauge("active", 1)
+        registry.add_gauge("active", 1)
+        registry.gauge_function("cached", lambda: 3)
+        with registry.time("step_seconds", phase="day"):
+            pass
+
+        text = format_prometheus(registry.snapshot())
+
+        self.assertIn("# HELP jobs_total Jobs\n# TYPE jobs_total counter\n", text)
+        self.assertIn('jobs_total{kind="say \\"hi\\""} 2\n', text)
+        self.assertIn("active 2\n", text)
+        self.assertIn("cached 3\n", text)
+        self.assertIn('step_seconds_bucket{phase="day",le="0.005"} 1\n', text)
+        self.assertIn('step_seconds_bucket{phase="day",le="+Inf"} 1\n', text)
+        self.assertIn('step_seconds_count{phase="day"} 1\n', text)
+
+
+class TestGameMetrics(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def test_step_duration_and_active_sessions(self):
+        with GameService._active_session("s1"):
+            self.assertEqual(metrics.gauge_value("game_active_sessions"), 1)
+            with GameService._timed_step(FakeSession()):
+                pass
+            with self.assertRaises(StepCancelled):
+                with GameService._timed_step(FakeSession()):
+                    raise StepCancelled("stop")
+        self.assertEqual(metrics.gauge_value("game_active_sessions"), 0)
+
+        steps = {
+            item["labels"]["status"]: item["count"]
+            for item in metrics.snapshot()["histograms"]["game_step_duration_seconds"]
+        }
+        self.assertEqual(steps, {"ok": 1, "cancelled": 1})
+
+    def test_executor_timeout_is_counted(self):
+        executor = GameExecutor(max_workers=1)
+        stopped = threading.Event()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(executor.run(wait_until_cancelled, stopped, timeout=0.05))
+
+        self.assertTrue(stopped.wait(1))
+        self.assertEqual(
+            metrics.counter_value("game_step_timeouts_total", operation="wait_until_cancelled"), 1
+        )
+        executor.shutdown()
+
+    def test_endpoint(self):
+        app = FastAPI()
+        app.include_router(metrics_router)
+        metrics.inc("game_step_timeouts_total", operation="run_day")
+
+        response = TestClient(app).get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn('game_step_timeouts_total{operation="run_day"} 1\n', response.text)
+        self.assertIn("# TYPE session_cache_entries gauge\n", response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+PlayerState の構造共有コピー（fork）のユニットテスト
+
+テスト項目:
+- AppendOnlyList の fork が互いに独立しているか
+- 分岐したビューへの追記が元のビューから見えないか
+- fork_player_state で作業用 state の更新が元の state に漏れないか
+- pydantic のシリアライズ / 検証が list と同様に動作するか
+"""
+
+import pickle
+from copy import deepcopy
+
+import pytest
+from pydantic import ValidationError
+
+from src.core.types import (
+    AppendOnlyList,
+    GameEvent,
+    PlayerInput,
+    PlayerInternalState,
+    PlayerMemory,
+    PlayerState,
+    RoleProb,
+    fork_player_state,
+)
+from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
+from src.game.setup.memory import create_initial_player_memory
+
+
+def make_event(i: int) -> GameEvent:
+    return GameEvent(event_type="speak", payload={"player": "p1", "text": str(i)})
+
+
+def make_state() -> PlayerState:
+    return PlayerState(
+        memory=create_initial_player_memory(
+            definition=ONE_NIGHT_GAME_DEFINITION,
+            self_name="p1",
+            self_role="villager",
+            players=["p1", "p2", "p3", "p4", "p5"],
+        ),
+        input=PlayerInput(),
+        output=None,
+        internal=PlayerInternalState(),
+    )
+
+
+def test_fork_shares_prefix_and_isolates_appends():
+    base = AppendOnlyList([1, 2])
+    left = base.fork()
+    right = base.fork()
+
+    left.append(3)
+    right.append(4)
+    base.append(5)
+
+    assert list(base) == [1, 2, 5]
+    assert list(left) == [1, 2, 3]
+    assert list(right) == [1, 2, 4]
+
+
+def test_sequence_behaviour():
+    values = AppendOnlyList(range(5))
+    values.fork().append(99)
+
+    assert len(values) == 5
+    assert values[-1] == 4
+    assert values[1:3] == [1, 2]
+    assert values[3:] == [3, 4]
+    assert list(reversed(values)) == [4, 3, 2, 1, 0]
+    assert values == [0, 1, 2, 3, 4]
+    with pytest.raises(IndexError):
+        values[5]
+
+
+def test_copy_and_pickle():
+    values = AppendOnlyList([make_event(0)])
+
+    copied = deepcopy(values)
+    copied.append(make_event(1))
+    assert len(values) == 1
+
+    restored = pickle.loads(pickle.dumps(values))
+    assert restored == values
+
+
+def test_fork_player_state_isolates_working_state():
+    state = make_state()
+    state["memory"].observed_events.append(make_event(0))
+
+    working = fork_player_state(state)
+    memory = working["memory"]
+    memory.observed_events.append(make_event(1))
+    memory.history.append(make_event(2))
+    memory.role_beliefs["p2"] = RoleProb(probs={"werewolf": 1.0})
+    memory.log_summary = "updated"
+    working["internal"].speak_review_count = 3
+
+    original = state["memory"]
+    assert len(original.observed_events) == 1
+    assert len(original.history) == 0
+    assert original.role_beliefs["p2"] != memory.role_beliefs["p2"]
+    assert original.log_summary == ""
+    assert state["internal"].speak_review_count == 0
+
+
+def test_role_prob_is_frozen():
+    prob = RoleProb(probs={"villager": 1.0})
+    with pytest.raises(ValidationError):
+        prob.probs = {"werewolf": 1.0}
+
+
+def test_memory_serialization_round_trip():
+    memory = make_state()["memory"]
+    memory.observed_events.append(make_event(0))
+
+    dumped = memory.model_dump()
+    assert isinstance(dumped["observed_events"], list)
+    assert dumped["observed_events"][0]["payload"]["text"] == "0"
+
+    restored = PlayerMemory.model_validate_json(memory.model_dump_json())
+    assert isinstance(restored.observed_events, AppendOnlyList)
+    assert restored.observed_events == memory.observed_events
@@ -0,0 +1,167 @@
+"""
+LLM 呼び出しのレート制限・同時実行数制御のユニットテスト
+
+テスト項目:
+- トークンバケットがバースト分を超えた呼び出しに待ち時間を返すか
+- 同時実行数の上限が成功・応答時間超過・429 応答に応じて増減するか（AIMD）
+- RateLimitedLLMClient が同時実行数を上限以内に抑え、429 応答を記録するか
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from src.core.llm.rate_limit import (
+    AdaptiveConcurrencyLimiter,
+    RateGovernor,
+    RateLimitedLLMClient,
+    RateLimitSettings,
+    TokenBucket,
+    is_rate_limit_error,
+)
+from src.core.memory.speak import Speak
+from src.core.metrics import metrics
+
+
+class TooManyRequests(Exception):
+    status_code = 429
+
+
+class SlowLLM:
+    """同時実行数の最大値を記録するテスト用 LLMClient"""
+
+    model_name = "slow"
+    output_model = Speak
+
+    def __init__(self, delay: float = 0.02, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def _enter(self):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def _exit(self):
+        with self.lock:
+            self.running -= 1
+
+    def generate(self, *, system: str, prompt: str) -> Speak:
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise TooManyRequests("quota exceeded")
+            return Speak(text=prompt)
+        finally:
+            self._exit()
+
+    async def agenerate(self, *, system: str, prompt: str) -> Speak:
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+            return Speak(text=prompt)
+        finally:
+            self._exit()
+
+
+def settings(**overrides) -> RateLimitSettings:
+    values = dict(
+        requests_per_sec=1000.0,
+        burst=1000,
+        initial_concurrency=2,
+        min_concurrency=1,
+        max_concurrency=8,
+        latency_target_sec=10.0,
+    )
+    values.update(overrides)
+    return RateLimitSettings(**values)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_waits_after_burst(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2.0, burst=2, clock=lambda: now[0])
+
+        self.assertEqual([bucket.reserve(), bucket.reserve()], [0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+        now[0] = 10.0
+        self.assertEqual(bucket.reserve(), 0.0)
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    def test_aimd(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=4, minimum=1, maximum=5, latency_target_sec=1.0
+        )
+
+        self.assertTrue(all(limiter.try_acquire() for _ in range(4)))
+        self.assertFalse(limiter.try_acquire())
+
+        limiter.release(latency_sec=0.1)
+        self.assertAlmostEqual(limiter.limit, 4.25)
+        limiter.release(latency_sec=None, rate_limited=True)
+        self.assertAlmostEqual(limiter.limit, 2.125)
+        limiter.release(latency_sec=5.0)
+        self.assertAlmostEqual(limiter.limit, 2.125 * 0.9)
+        limiter.release(latency_sec=None)
+        self.assertAlmostEqual(limiter.limit, 2.125 * 0.9)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+class TestRateLimitedLLMClient(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def test_bounds_concurrency_across_threads(self):
+        inner = SlowLLM()
+        client = RateLimitedLLMClient(inner, RateGovernor("slow", settings(max_concurrency=2)))
+
+        threads = [
+            threading.Thread(target=client.generate, kwargs={"system": "", "prompt": str(i)})
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(inner.peak, 2)
+        self.assertEqual(client.model_name, "slow")
+
+    def test_async_calls_share_the_limit(self):
+        inner = SlowLLM()
+        client = RateLimitedLLMClient(inner, RateGovernor("slow", settings(max_concurrency=3)))
+
+        async def fan_out():
+            return await asyncio.gather(
+                *(client.agenerate(system="", prompt=str(i)) for i in range(9))
+            )
+
+        results = asyncio.run(fan_out())
+
+        self.assertEqual([r.text for r in results], [str(i) for i in range(9)])
+        self.assertLessEqual(inner.peak, 3)
+
+    def test_rate_limit_errors_shrink_the_limit(self):
+        governor = RateGovernor("slow", settings(initial_concurrency=4))
+        client = RateLimitedLLMClient(SlowLLM(delay=0, fail=True), governor)
+
+        with self.assertRaises(TooManyRequests):
+            client.generate(system="", prompt="x")
+
+        self.assertEqual(governor.limiter.limit, 2.0)
+        self.assertEqual(metrics.counter_value("llm_rate_limited_total", model="slow"), 1)
+        self.assertEqual(metrics.gauge_value("llm_concurrency_limit", model="slow"), 2.0)
+        self.assertTrue(is_rate_limit_error(TooManyRequests()))
+        self.assertFalse(is_rate_limit_error(ValueError()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+LLM 呼び出しのリトライ・ヘッジ・フォールバックのユニットテスト
+
+テスト項目:
+- 一時的な失敗がリトライされ、リトライ回数が計測に記録されるか
+- 一時的でない失敗（認証エラーなど）はリトライせずに次のモデルへ切り替えるか
+- 主モデルで失敗し尽くしたらフォールバックのモデルを順に試すか
+  （生成に失敗したフォールバックは飛ばし、その例外ではなく呼び出しの例外を送出するか）
+- 応答が p95 を超えたときにヘッジした呼び出しの結果が使われるか（同期・非同期）
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from src.core.llm.instrumented import InstrumentedLLMClient
+from src.core.llm.resilient import ResilientLLMClient, RetryPolicy, is_transient_error
+from src.core.llm.simulated import SimulatedLLMError
+from src.core.memory.speak import Speak
+from src.core.metrics import metrics
+
+NO_WAIT = RetryPolicy(max_attempts=3, base_delay_sec=0.0, max_delay_sec=0.0)
+
+
+class FlakyLLM:
+    """最初の failures 回は失敗し、以降は text を返すテスト用 LLMClient"""
+
+    output_model = Speak
+
+    def __init__(self, text: str, failures: int = 0, delays=(), error=TimeoutError):
+        self.model_name = text
+        self.text = text
+        self.failures = failures
+        self.error = error
+        self.delays = list(delays)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _next(self) -> float:
+        with self.lock:
+            self.calls += 1
+            if self.calls <= self.failures:
+                raise self.error(f"{self.text} failed")
+            return self.delays.pop(0) if self.delays else 0.0
+
+    def generate(self, *, system: str, prompt: str) -> Speak:
+        time.sleep(self._next())
+        return Speak(text=self.text)
+
+    async def agenerate(self, *, system: str, prompt: str) -> Speak:
+        await asyncio.sleep(self._next())
+        return Speak(text=self.text)
+
+
+class TestRetryAndFallback(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def test_retries_are_reported(self):
+        primary = FlakyLLM("primary", failures=2)
+        client = InstrumentedLLMClient(ResilientLLMClient(primary, policy=NO_WAIT), name="speak")
+
+        result = client.generate(system="", prompt="x")
+
+        self.assertEqual(result.text, "primary")
+        self.assertEqual(primary.calls, 3)
+        self.assertEqual(metrics.counter_value("llm_retries_total", llm="speak"), 2)
+        self.assertEqual(metrics.counter_value("llm_calls_total", llm="speak", status="ok"), 1)
+
+    def test_falls_back_in_order_and_skips_broken_fallbacks(self):
+        primary = FlakyLLM("primary", failures=10)
+        local = FlakyLLM("local", failures=10)
+        last = FlakyLLM("last")
+
+        def broken():
+            raise ValueError("API key is required")
+
+        client = ResilientLLMClient(
+            primary, policy=NO_WAIT, fallbacks=[lambda: local, broken, lambda: last]
+        )
+
+        self.assertEqual(client.generate(system="", prompt="x").text, "last")
+        self.assertEqual((primary.calls, local.calls, last.calls), (3, 3, 1))
+        self.assertEqual(metrics.counter_value("llm_fallbacks_total", model="last"), 1)
+
+        self.assertEqual(asyncio.run(client.agenerate(system="", prompt="x")).text, "last")
+
+    def test_raises_last_error_when_everything_fails(self):
+        def broken():
+            raise ValueError("API key is required")
+
+        client = ResilientLLMClient(
+            FlakyLLM("primary", failures=10), policy=NO_WAIT, fallbacks=[broken]
+        )
+
+        # フォールバックの生成時の例外ではなく、主モデルの失敗を送出する
+        with self.assertRaisesRegex(TimeoutError, "primary failed"):
+            client.generate(system="", prompt="x")
+
+    def test_permanent_errors_are_not_retried(self):
+        primary = FlakyLLM("primary", failures=10, error=PermissionError)
+        fallback = FlakyLLM("fallback")
+        client = ResilientLLMClient(primary, policy=NO_WAIT, fallbacks=[lambda: fallback])
+
+        self.assertEqual(client.generate(system="", prompt="x").text, "fallback")
+        self.assertEqual(primary.calls, 1)
+
+    def test_transient_errors(self):
+        class ServerError(Exception):
+            status_code = 503
+
+        class AuthError(Exception):
+            status_code = 401
+
+        self.assertTrue(is_transient_error(ServerError()))
+        self.assertTrue(is_transient_error(SimulatedLLMError()))
+        self.assertFalse(is_transient_error(AuthError()))
+        self.assertFalse(is_transient_error(ValueError()))
+
+
+class TestHedging(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.policy = RetryPolicy(max_attempts=1, hedge=True, hedge_min_samples=3)
+
+    def warm_up(self, client: ResilientLLMClient) -> None:
+        for _ in range(3):
+            client.generate(system="", prompt="x")
+
+    def test_sync_hedge_returns_first_success(self):
+        # 3 回の計測（約 0 秒）の後、1 回目は遅く、ヘッジした 2 回目は速い
+        inner = FlakyLLM("primary", delays=[0, 0, 0, 1.0, 0])
+        client = ResilientLLMClient(inner, policy=self.policy)
+        self.warm_up(client)
+
+        started = time.perf_counter()
+        client.generate(system="", prompt="x")
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(inner.calls, 5)
+        self.assertEqual(metrics.counter_value("llm_hedged_requests_total", model="primary"), 1)
+
+    def test_async_hedge_returns_first_success(self):
+        inner = FlakyLLM("primary", delays=[0, 0, 0, 1.0, 0])
+        client = ResilientLLMClient(inner, policy=self.policy)
+        self.warm_up(client)
+
+        started = time.perf_counter()
+        asyncio.run(client.agenerate(system="", prompt="x"))
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(inner.calls, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
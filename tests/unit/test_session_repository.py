@@ -0,0 +1,245 @@
+"""
+SessionRepository のユニットテスト
+
+テスト項目:
+- save / get の往復でスナップショットが復元されるか
+- save / get がそれぞれ 1 往復で完了するか
+- 全キーが TTL を共有するか
+- cursors を渡した場合、イベントログの差分のみが書き込まれるか
+  （JSON へのシリアライズも差分のみに行われるか）
+- 保存のたびに version が増加するか
+- SessionCache が version 一致時のみ GameSession を再利用するか
+"""
+
+import copy
+import json
+
+import pytest
+
+from src.app.repositories import SessionCache, SessionRepository
+from src.config.redis import RedisClient
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def __len__(self):
+        return len(self.commands)
+
+    def execute(self):
+        self.redis.round_trips += 1
+        self.redis.executed.append([name for name, _, _ in self.commands])
+        return [
+            getattr(self.redis, "_" + name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class FakeRedis:
+    """テストに必要なコマンドだけを実装したインメモリ Redis"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.round_trips = 0
+        self.executed = []
+        self.pushed = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def __getattr__(self, name):
+        # パイプラインを経由しない呼び出しは 1 往復として数える
+        impl = getattr(self, "_" + name)
+
+        def call(*args, **kwargs):
+            self.round_trips += 1
+            return impl(*args, **kwargs)
+
+        return call
+
+    # --- コマンド実装 ---
+    def _hset(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def _hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def _hincrby(self, key, field, amount):
+        fields = self.data.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+    def _hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def _expire(self, key, ttl):
+        self.ttls[key] = ttl
+        return True
+
+    def _delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+        return len(keys)
+
+    def _rpush(self, key, *values):
+        self.pushed += len(values)
+        self.data.setdefault(key, []).extend(values)
+        return len(self.data[key])
+
+    def _ltrim(self, key, start, end):
+        self.data[key] = self.data.get(key, [])[start : end + 1]
+        return True
+
+    def _lrange(self, key, start, end):
+        values = self.data.get(key, [])
+        return list(values[start:] if end == -1 else values[start : end + 1])
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(RedisClient, "_instance", redis)
+    return redis
+
+
+def make_event(text):
+    return {"event_type": "speak", "payload": {"player": "p1", "text": text}}
+
+
+def make_snapshot(n_events):
+    events = [make_event(str(i)) for i in range(n_events)]
+    return {
+        "definition": {"roles": {}, "phases": ["night", "day"]},
+        "world_state": {"phase": "day", "players": ["p1", "p2"], "public_events": events},
+        "player_states": {
+            player: {
+                "memory": {
+                    "self_name": player,
+                    "observed_events": list(events),
+                    "history": [{"type": "Speak", "content": {"text": player}}],
+                }
+            }
+            for player in ["p1", "p2"]
+        },
+        "assigned_roles": {"p1": "villager", "p2": "werewolf"},
+        "gm_internal": {"night_pending": [], "vote_pending": []},
+    }
+
+
+def without_cursors(snapshot):
+    return {k: v for k, v in snapshot.items() if k != "cursors"}
+
+
+def test_save_and_get_round_trip(fake_redis):
+    snapshot = make_snapshot(2)
+    SessionRepository.save("s1", snapshot, ttl=60)
+    assert fake_redis.round_trips == 1
+
+    restored = SessionRepository.get("s1")
+    assert fake_redis.round_trips == 2
+    assert without_cursors(restored) == snapshot
+    assert restored["cursors"] == {
+        "version": 1,
+        "public_events": 2,
+        "observed_events": {"p1": 2, "p2": 2},
+        "history": {"p1": 1, "p2": 1},
+    }
+
+    # 全キーが同じ TTL を持つ
+    assert set(fake_redis.ttls.values()) == {60}
+
+
+def test_delta_save_appends_only_new_events(fake_redis):
+    cursors = SessionRepository.save("s1", make_snapshot(10))
+
+    for n in range(11, 16):
+        fake_redis.pushed = 0
+        cursors = SessionRepository.save("s1", make_snapshot(n), cursors=cursors)
+        # public_events 1 件 + 各プレイヤーの observed_events 1 件ずつ
+        assert fake_redis.pushed == 3
+        # 全体の書き直し（DEL）は行わない
+        assert "delete" not in fake_redis.executed[-1]
+
+    restored = SessionRepository.get("s1")
+    assert without_cursors(restored) == make_snapshot(15)
+
+
+def test_delta_save_encodes_only_new_items(fake_redis, monkeypatch):
+    cursors = SessionRepository.save("s1", make_snapshot(50))
+
+    encoded = []
+    dumps = json.dumps
+
+    def counting_dumps(obj, **kwargs):
+        encoded.append(obj)
+        return dumps(obj, **kwargs)
+
+    monkeypatch.setattr(json, "dumps", counting_dumps)
+    SessionRepository.save("s1", make_snapshot(51), cursors=cursors)
+
+    public = [obj for obj in encoded if isinstance(obj, dict) and "event_type" in obj]
+    player = [obj for obj in encoded if isinstance(obj, dict) and "item" in obj]
+    assert public == [make_event("50")]
+    assert [obj["player"] for obj in player] == ["p1", "p2"]
+
+
+def test_stale_cursors_do_not_duplicate_events(fake_redis):
+    base = SessionRepository.save("s1", make_snapshot(3))
+
+    # 同じ base から 2 回保存しても（後勝ち）重複しない
+    SessionRepository.save("s1", make_snapshot(5), cursors=copy.deepcopy(base))
+    SessionRepository.save("s1", make_snapshot(4), cursors=copy.deepcopy(base))
+
+    restored = SessionRepository.get("s1")
+    assert without_cursors(restored) == make_snapshot(4)
+
+
+def test_get_missing_session(fake_redis):
+    assert SessionRepository.get("missing") is None
+
+
+def test_version_increments_on_save(fake_redis):
+    cursors = SessionRepository.save("s1", make_snapshot(1))
+    assert cursors["version"] == 1
+
+    cursors = SessionRepository.save("s1", make_snapshot(2), cursors=cursors)
+    assert cursors["version"] == 2
+    assert SessionRepository.get_version("s1") == 2
+    assert SessionRepository.get_version("missing") is None
+
+
+def test_session_cache_checks_version():
+    cache = SessionCache(max_size=2)
+    session = object()
+
+    cache.put("s1", session, {"version": 3})
+    # version が一致しなければ破棄される
+    assert cache.take("s1", version=4) is None
+    assert len(cache) == 0
+
+    cache.put("s1", session, {"version": 3})
+    entry = cache.take("s1", version=3)
+    assert entry.session is session
+    # 取り出したエントリはキャッシュから外れる
+    assert cache.take("s1", version=3) is None
+
+
+def test_session_cache_evicts_least_recently_used():
+    cache = SessionCache(max_size=2)
+    for i in range(3):
+        cache.put(f"s{i}", object(), {"version": 1})
+
+    assert len(cache) == 2
+    assert cache.take("s0", version=1) is None
+    assert cache.take("s2", version=1) is not None
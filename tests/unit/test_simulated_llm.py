@@ -0,0 +1,141 @@
+"""
+シミュレーション LLMClient のユニットテスト
+
+テスト項目:
+- 各用途の出力スキーマについて妥当なインスタンスが生成されるか
+- プレイヤー名のフィールドに prompt 中のプレイヤーが入るか
+- 待ち時間・失敗率が設定どおりに注入されるか
+- seed を指定した場合に出力が再現されるか
+- ストリーミングの最後の要素が完全な結果になるか
+"""
+
+import asyncio
+import random
+import time
+import unittest
+
+from src.core.llm.simulated import (
+    SimulatedLatency,
+    SimulatedLLMClient,
+    SimulatedLLMError,
+)
+from src.core.memory.belief import RoleBeliefsOutput
+from src.core.memory.gm_comment import GMComment
+from src.core.memory.gm_plan import GMProgressionPlan
+from src.core.memory.log_summary import LogSummaryOutput
+from src.core.memory.speak import Speak
+from src.core.memory.strategy import Strategy, StrategyPlan
+from src.core.memory.vote import VoteOutput
+
+PLAYERS = ["太郎", "花子", "次郎"]
+PROMPT = "参加者: 太郎, 花子, 次郎"
+
+
+class TestSimulatedLLMClient(unittest.TestCase):
+    def test_generates_valid_instances_for_output_models(self):
+        for model in (
+            Speak,
+            VoteOutput,
+            GMComment,
+            RoleBeliefsOutput,
+            StrategyPlan,
+            Strategy,
+            GMProgressionPlan,
+            LogSummaryOutput,
+        ):
+            with self.subTest(model=model.__name__):
+                client = SimulatedLLMClient(output_model=model, seed=0)
+                result = client.generate(system="", prompt=PROMPT)
+                self.assertIsInstance(result, model)
+                model.model_validate(result.model_dump())
+
+    def test_player_fields_use_players_in_prompt(self):
+        vote = SimulatedLLMClient(output_model=VoteOutput, seed=1)
+        self.assertTrue(
+            all(vote.generate(system="", prompt=PROMPT).target in PLAYERS for _ in range(20))
+        )
+
+        beliefs = SimulatedLLMClient(output_model=RoleBeliefsOutput, seed=1).generate(
+            system="", prompt=PROMPT
+        )
+        self.assertEqual([item.player for item in beliefs.beliefs], PLAYERS)
+
+    def test_constraints_and_defaults(self):
+        client = SimulatedLLMClient(output_model=Strategy, seed=2)
+        for _ in range(20):
+            strategy = client.generate(system="", prompt=PROMPT)
+            self.assertEqual(strategy.kind, "strategy")
+            self.assertTrue(1 <= strategy.main_action.pressure <= 10)
+
+        self.assertEqual(
+            SimulatedLLMClient(output_model=Speak).generate(system="", prompt=PROMPT).kind,
+            "speak",
+        )
+
+    def test_seed_reproduces_outputs(self):
+        first = SimulatedLLMClient(output_model=StrategyPlan, seed=7)
+        second = SimulatedLLMClient(output_model=StrategyPlan, seed=7)
+        for _ in range(3):
+            self.assertEqual(
+                first.generate(system="", prompt=PROMPT),
+                second.generate(system="", prompt=PROMPT),
+            )
+
+    def test_latency_is_applied(self):
+        latency = SimulatedLatency(distribution="fixed", mean_sec=0.05)
+        client = SimulatedLLMClient(output_model=Speak, latency=latency)
+
+        started = time.perf_counter()
+        client.generate(system="", prompt=PROMPT)
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+        async def run_concurrently():
+            await asyncio.gather(
+                *(client.agenerate(system="", prompt=PROMPT) for _ in range(5))
+            )
+
+        # 非同期版はイベントループを占有しないため、待ち時間が重ならない
+        started = time.perf_counter()
+        asyncio.run(run_concurrently())
+        self.assertLess(time.perf_counter() - started, 0.2)
+
+    def test_latency_distributions(self):
+        rng = random.Random(0)
+        lognormal = SimulatedLatency(distribution="lognormal", mean_sec=1.0, jitter=0.5)
+        samples = [lognormal.sample(rng) for _ in range(5000)]
+        self.assertAlmostEqual(sum(samples) / len(samples), 1.0, delta=0.05)
+        self.assertTrue(all(s > 0 for s in samples))
+
+        uniform = SimulatedLatency(distribution="uniform", mean_sec=0.2, jitter=0.5)
+        self.assertTrue(all(uniform.sample(rng) >= 0.0 for _ in range(100)))
+
+    def test_failure_rate(self):
+        client = SimulatedLLMClient(output_model=Speak, failure_rate=0.3, seed=3)
+        failures = 0
+        for _ in range(1000):
+            try:
+                client.generate(system="", prompt=PROMPT)
+            except SimulatedLLMError:
+                failures += 1
+        self.assertAlmostEqual(failures / 1000, 0.3, delta=0.05)
+
+        always = SimulatedLLMClient(output_model=Speak, failure_rate=1.0)
+        with self.assertRaises(SimulatedLLMError):
+            list(always.stream(system="", prompt=PROMPT))
+        with self.assertRaises(ValueError):
+            SimulatedLLMClient(output_model=Speak, failure_rate=1.5)
+
+    def test_stream_ends_with_full_result(self):
+        client = SimulatedLLMClient(output_model=Speak, seed=4)
+        chunks = list(client.stream(system="", prompt=PROMPT))
+
+        final = chunks[-1]
+        self.assertIsInstance(final, Speak)
+        partial_texts = [c["text"] for c in chunks[:-1] if "text" in c]
+        self.assertGreater(len(partial_texts), 1)
+        self.assertEqual(partial_texts[-1], final.text)
+        self.assertTrue(all(final.text.startswith(t) for t in partial_texts))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+発言のストリーミング生成のユニットテスト
+
+テスト項目:
+- text の生成途中の差分が順に通知され、連結結果が確定した発言と一致するか
+- ストリーミング非対応の LLM では generate にフォールバックするか
+- ストリーミング配信中のみ speak_generate_node が差分を通知するか
+- レビューで発言が差し替えられた場合、配信済みの下書きの取り消しが通知されるか
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.core.memory.speak import Speak
+from src.core.speech_stream import is_speech_streaming, speech_stream_scope
+from src.core.types import PlayerInput, PlayerRequest
+from src.core.types.player import PlayerInternalState, PlayerState
+from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
+from src.game.player.speak_generator import SpeakGenerator
+from src.game.setup.memory import create_initial_player_memory
+from src.graphs.player.node.speak_generate import speak_generate_node
+from src.graphs.player.node.speak_refine import speak_refine_node
+
+
+PLAYERS = ["p1", "p2", "p3"]
+TEXT = "私は占い師です。p2 は村人でした。"
+
+
+class FakeStreamingLLM:
+    """部分的な JSON（dict）を順に返し、最後に完全な Speak を返すテスト用 LLMClient"""
+
+    def __init__(self, text: str = TEXT):
+        self.text = text
+        self.generate_calls = 0
+
+    def generate(self, *, system: str, prompt: str):
+        self.generate_calls += 1
+        return Speak(text=self.text)
+
+    def stream(self, *, system: str, prompt: str):
+        yield {"kind": "speak"}
+        for end in range(4, len(self.text), 4):
+            yield {"kind": "speak", "text": self.text[:end]}
+        yield Speak(text=self.text)
+
+
+class FakeBlockingLLM:
+    """ストリーミングに対応していないテスト用 LLMClient"""
+
+    def generate(self, *, system: str, prompt: str):
+        return Speak(text=TEXT)
+
+
+class FakeRefiner:
+    """固定の発言に差し替えるテスト用 SpeakRefiner"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def refine(self, **kwargs):
+        return Speak(text=self.text)
+
+
+def create_memory():
+    return create_initial_player_memory(
+        definition=ONE_NIGHT_GAME_DEFINITION,
+        self_name="p1",
+        self_role="seer",
+        players=PLAYERS,
+    )
+
+
+class TestSpeechStreaming(unittest.TestCase):
+    def setUp(self):
+        self.request = PlayerRequest(request_type="speak", payload={})
+
+    def test_deltas_join_to_final_text(self):
+        llm = FakeStreamingLLM()
+        deltas = []
+
+        speak = SpeakGenerator(llm=llm).generate_stream(
+            memory=create_memory(),
+            observed=self.request,
+            game_def=ONE_NIGHT_GAME_DEFINITION,
+            on_delta=deltas.append,
+        )
+
+        self.assertEqual(speak, Speak(text=TEXT))
+        self.assertGreater(len(deltas), 1)
+        self.assertEqual("".join(deltas), TEXT)
+        self.assertEqual(llm.generate_calls, 0)
+
+    def test_falls_back_to_generate_without_stream(self):
+        deltas = []
+
+        speak = SpeakGenerator(llm=FakeBlockingLLM()).generate_stream(
+            memory=create_memory(),
+            observed=self.request,
+            game_def=ONE_NIGHT_GAME_DEFINITION,
+            on_delta=deltas.append,
+        )
+
+        self.assertEqual(speak.text, TEXT)
+        self.assertEqual(deltas, [TEXT])
+
+    def test_node_streams_only_inside_scope(self):
+        llm = FakeStreamingLLM()
+        generator = SpeakGenerator(llm=llm)
+
+        def new_state():
+            return PlayerState(
+                memory=create_memory(),
+                input=PlayerInput(request=self.request),
+                output=None,
+                internal=PlayerInternalState(),
+                game_def=ONE_NIGHT_GAME_DEFINITION,
+            )
+
+        received = []
+        with patch("src.game.player.speak_generator.speak_generator", generator):
+            state = speak_generate_node(new_state())
+            self.assertEqual(llm.generate_calls, 1)
+            self.assertEqual(received, [])
+
+            with speech_stream_scope(lambda player, delta: received.append((player, delta))):
+                self.assertTrue(is_speech_streaming())
+                streamed = speak_generate_node(new_state())
+
+        self.assertFalse(is_speech_streaming())
+        self.assertEqual(llm.generate_calls, 1)
+        self.assertEqual({player for player, _ in received}, {"p1"})
+        self.assertEqual("".join(delta for _, delta in received), TEXT)
+        # 確定する発言はストリーミングの有無で変わらない
+        self.assertEqual(
+            streamed["internal"].pending_speak, state["internal"].pending_speak
+        )
+
+    def test_refined_speech_discards_streamed_draft(self):
+        state = PlayerState(
+            memory=create_memory(),
+            input=PlayerInput(request=self.request),
+            output=None,
+            internal=PlayerInternalState.model_validate(
+                {
+                    "pending_strategy": {
+                        "main_action": {
+                            "action_type": "co",
+                            "trigger": "immediate",
+                            "description": "CO",
+                        },
+                        "text_style": "冷静に",
+                        "current_priority": "占い結果を伝える",
+                    },
+                    "last_speak_review": {"needs_fix": True, "reason": "断定しすぎ"},
+                }
+            ),
+            game_def=ONE_NIGHT_GAME_DEFINITION,
+        )
+        received = []
+
+        with patch(
+            "src.game.player.speak_generator.speak_generator",
+            SpeakGenerator(llm=FakeStreamingLLM()),
+        ), patch(
+            "src.game.player.speak_refiner.speak_refiner", FakeRefiner("p2 は村人でした。")
+        ), speech_stream_scope(
+            lambda player, delta: received.append(("delta", player)),
+            on_discard=lambda player: received.append(("discard", player)),
+        ):
+            state = speak_generate_node(state)
+            state = speak_refine_node(state)
+
+        # 下書きの差分の後に、取り消しが 1 回だけ通知される
+        self.assertEqual(received[-1], ("discard", "p1"))
+        self.assertEqual(received.count(("discard", "p1")), 1)
+        self.assertGreater(len(received), 1)
+        self.assertEqual(state["internal"].pending_speak.text, "p2 は村人でした。")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+トーナメントエンジンのユニットテスト
+
+テスト項目:
+- シード付きの役職配布が再現可能で、モジュールの random に影響されないか
+- 戦略設定の環境変数がワーカープロセスに適用されるか
+- 陣営別・役職別の勝率が集計されるか
+"""
+
+import os
+import random
+import unittest
+
+from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
+from src.game.setup.roles import assign_roles
+from src.tournament import StrategyConfig, aggregate, run_tournament
+
+PLAYERS = [f"p{i}" for i in range(len(ONE_NIGHT_GAME_DEFINITION.role_distribution))]
+
+
+def fake_play(game_id: str, seed: int, max_steps: int) -> dict:
+    """設定（環境変数）とシードから結果を決めるテスト用のワーカー関数"""
+    roles = assign_roles(PLAYERS, ONE_NIGHT_GAME_DEFINITION, random.Random(seed))
+    return {
+        "game_id": game_id,
+        "seed": seed,
+        "winner": os.environ.get("TOURNAMENT_TEST_WINNER", "village"),
+        "roles": roles,
+        "tokens": {"total_tokens": 10},
+        "error": None,
+        "pid": os.getpid(),
+    }
+
+
+class TestSeededRoles(unittest.TestCase):
+    def test_same_seed_gives_same_roles(self):
+        first = assign_roles(PLAYERS, ONE_NIGHT_GAME_DEFINITION, random.Random(42))
+        random.seed(0)
+        random.random()
+        second = assign_roles(PLAYERS, ONE_NIGHT_GAME_DEFINITION, random.Random(42))
+
+        self.assertEqual(first, second)
+        self.assertEqual(sorted(first.values()), sorted(ONE_NIGHT_GAME_DEFINITION.role_distribution))
+
+    def test_different_seeds_vary(self):
+        deals = {
+            tuple(assign_roles(PLAYERS, ONE_NIGHT_GAME_DEFINITION, random.Random(seed)).values())
+            for seed in range(20)
+        }
+        self.assertGreater(len(deals), 1)
+
+
+class TestTournament(unittest.TestCase):
+    def test_parse_config(self):
+        config = StrategyConfig.parse("cached:LLM_CACHE=1, PLAYER_TURN_MAX_WORKERS=2")
+        self.assertEqual(config.name, "cached")
+        self.assertEqual(config.env, {"LLM_CACHE": "1", "PLAYER_TURN_MAX_WORKERS": "2"})
+        self.assertEqual(StrategyConfig.parse("baseline").env, {})
+        with self.assertRaises(ValueError):
+            StrategyConfig.parse("broken:LLM_CACHE")
+
+    def test_configs_run_in_worker_processes(self):
+        configs = [
+            StrategyConfig(name="village_bias"),
+            StrategyConfig(name="wolf_bias", env={"TOURNAMENT_TEST_WINNER": "werewolf"}),
+        ]
+
+        records = run_tournament(4, configs, processes=2, base_seed=100, play=fake_play)
+
+        self.assertEqual(len(records), 8)
+        self.assertTrue(all(r["pid"] != os.getpid() for r in records))
+        # 同じシード列が全設定で共有される
+        by_config = {}
+        for record in records:
+            by_config.setdefault(record["config"], []).append((record["seed"], record["roles"]))
+        self.assertEqual(by_config["village_bias"], by_config["wolf_bias"])
+        self.assertEqual([seed for seed, _ in by_config["wolf_bias"]], [100, 101, 102, 103])
+
+        summary = aggregate(records)
+        self.assertEqual(summary["village_bias"]["side_win_rate"], {"village": 1.0})
+        self.assertEqual(summary["wolf_bias"]["side_win_rate"], {"werewolf": 1.0})
+        werewolf = summary["wolf_bias"]["role_win_rate"]["werewolf"]
+        self.assertEqual(werewolf["win_rate"], 1.0)
+        self.assertEqual(summary["village_bias"]["role_win_rate"]["werewolf"]["wins"], 0)
+        self.assertEqual(summary["wolf_bias"]["total_tokens"], 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
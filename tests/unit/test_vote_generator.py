@@ -0,0 +1,53 @@
+"""
+投票生成のユニットテスト
+
+テスト項目:
+- 投票生成で system prompt が渡されるか
+"""
+
+import unittest
+
+from src.core.memory.vote import VoteOutput
+from src.core.types import PlayerRequest
+from src.game.one_night import ONE_NIGHT_GAME_DEFINITION
+from src.game.player.vote_generator import VoteGenerator
+from src.game.setup.memory import create_initial_player_memory
+
+
+PLAYERS = ["p1", "p2", "p3", "p4", "p5"]
+
+
+class FakeLLM:
+    """固定の出力を返し、呼び出し内容を記録するテスト用 LLMClient"""
+
+    def __init__(self, output):
+        self.output = output
+        self.calls = []
+
+    def generate(self, *, system: str, prompt: str):
+        self.calls.append((system, prompt))
+        return self.output
+
+
+class TestVoteGenerator(unittest.TestCase):
+    def test_rules_are_passed_as_system_prompt(self):
+        llm = FakeLLM(VoteOutput(target="p2"))
+        generator = VoteGenerator(llm=llm)
+        memory = create_initial_player_memory(
+            definition=ONE_NIGHT_GAME_DEFINITION,
+            self_name="p1",
+            self_role="villager",
+            players=PLAYERS,
+        )
+
+        vote = generator.generate(
+            memory=memory, observed=PlayerRequest(request_type="vote", payload={})
+        )
+
+        self.assertEqual((vote.voter, vote.target), ("p1", "p2"))
+        system, _ = llm.calls[0]
+        self.assertTrue(system)
+
+
+if __name__ == "__main__":
+    unittest.main()